@@ -0,0 +1,132 @@
+// Mirrors heart.device.beats.frame_codec: the server picks the richest codec every
+// connected client offered through the websocket subprotocol header.
+export const FRAME_CODEC_SUBPROTOCOLS = [
+  "heart.frames.delta.v1",
+  "heart.frames.raw.v1",
+  "heart.frames.png.v1",
+];
+
+export const FRAME_ENCODING_PNG = 0;
+export const FRAME_ENCODING_RGB888_KEYFRAME = 1;
+export const FRAME_ENCODING_RGB888_DELTA = 2;
+
+const RGB_CHANNELS = 3;
+const RGBA_CHANNELS = 4;
+const OPAQUE_ALPHA = 255;
+
+export type DecodedFrameRect = {
+  x?: number;
+  y?: number;
+  width?: number;
+  height?: number;
+  xor_rgb_data?: Uint8Array;
+  xorRgbData?: Uint8Array;
+};
+
+export type DecodedRgbFrame = {
+  encoding?: number;
+  width?: number;
+  height?: number;
+  display_scale?: number;
+  displayScale?: number;
+  keyframe_id?: number | { toNumber(): number };
+  keyframeId?: number | { toNumber(): number };
+  rgb_data?: Uint8Array;
+  rgbData?: Uint8Array;
+  delta_rects?: DecodedFrameRect[];
+  deltaRects?: DecodedFrameRect[];
+};
+
+export type RgbaFrame = {
+  width: number;
+  height: number;
+  displayScale: number;
+  rgba: Uint8ClampedArray<ArrayBuffer>;
+};
+
+function toNumber(value: number | { toNumber(): number } | undefined) {
+  if (value === undefined) {
+    return 0;
+  }
+  return typeof value === "number" ? value : value.toNumber();
+}
+
+/**
+ * Rebuilds RGB888 keyframe and XOR-delta frames into RGBA pixels.
+ *
+ * Deltas are applied to the latest keyframe, so a delta that references a keyframe
+ * this client never saw (for example because the server queue dropped it) is ignored
+ * until the next keyframe arrives.
+ */
+export class RgbFrameDecoder {
+  private keyframe: Uint8Array | null = null;
+  private keyframeId: number | null = null;
+
+  decode(frame: DecodedRgbFrame): RgbaFrame | null {
+    const width = frame.width ?? 0;
+    const height = frame.height ?? 0;
+    const displayScale = frame.displayScale ?? frame.display_scale ?? 1;
+    const keyframeId = toNumber(frame.keyframeId ?? frame.keyframe_id);
+
+    if (frame.encoding === FRAME_ENCODING_RGB888_KEYFRAME) {
+      const rgb = frame.rgbData ?? frame.rgb_data;
+      if (!rgb || rgb.byteLength !== width * height * RGB_CHANNELS) {
+        return null;
+      }
+      this.keyframe = new Uint8Array(rgb);
+      this.keyframeId = keyframeId;
+      return { width, height, displayScale, rgba: rgbToRgba(this.keyframe) };
+    }
+
+    if (frame.encoding !== FRAME_ENCODING_RGB888_DELTA) {
+      return null;
+    }
+    if (
+      !this.keyframe ||
+      this.keyframeId !== keyframeId ||
+      this.keyframe.byteLength !== width * height * RGB_CHANNELS
+    ) {
+      return null;
+    }
+
+    const rgb = new Uint8Array(this.keyframe);
+    for (const rect of frame.deltaRects ?? frame.delta_rects ?? []) {
+      const xor = rect.xorRgbData ?? rect.xor_rgb_data;
+      const rectX = rect.x ?? 0;
+      const rectY = rect.y ?? 0;
+      const rectWidth = rect.width ?? 0;
+      const rectHeight = rect.height ?? 0;
+      if (!xor || xor.byteLength !== rectWidth * rectHeight * RGB_CHANNELS) {
+        return null;
+      }
+      const rowBytes = rectWidth * RGB_CHANNELS;
+      for (let row = 0; row < rectHeight; row += 1) {
+        const target = ((rectY + row) * width + rectX) * RGB_CHANNELS;
+        const source = row * rowBytes;
+        for (let offset = 0; offset < rowBytes; offset += 1) {
+          rgb[target + offset] ^= xor[source + offset];
+        }
+      }
+    }
+    return { width, height, displayScale, rgba: rgbToRgba(rgb) };
+  }
+
+  reset() {
+    this.keyframe = null;
+    this.keyframeId = null;
+  }
+}
+
+function rgbToRgba(rgb: Uint8Array) {
+  const pixels = rgb.byteLength / RGB_CHANNELS;
+  const rgba = new Uint8ClampedArray(pixels * RGBA_CHANNELS);
+  for (let pixel = 0; pixel < pixels; pixel += 1) {
+    const source = pixel * RGB_CHANNELS;
+    const target = pixel * RGBA_CHANNELS;
+    rgba[target] = rgb[source];
+    rgba[target + 1] = rgb[source + 1];
+    rgba[target + 2] = rgb[source + 2];
+    rgba[target + 3] = OPAQUE_ALPHA;
+  }
+  return rgba;
+}
@@ -1,6 +1,12 @@
 import { parse } from "protobufjs";
 
 import protoSchema from "../../../../../src/heart/device/beats/proto/beats_streaming.proto?raw";
+import {
+  DecodedRgbFrame,
+  FRAME_ENCODING_PNG,
+  RgbaFrame,
+  RgbFrameDecoder,
+} from "./frame_codec";
 
 type PeripheralTag = {
   name: string;
@@ -27,9 +33,7 @@ type PeripheralPayload = {
   payloadEncoding: number | null;
 };
 
-type FramePayload = {
-  pngData: Uint8Array;
-};
+type FramePayload = { pngData: Uint8Array } | { rgbaFrame: RgbaFrame };
 
 export type StreamEvent =
   | { type: "frame"; payload: FramePayload }
@@ -38,8 +42,9 @@ export type StreamEvent =
 const root = parse(protoSchema, { keepCase: true }).root;
 const StreamEnvelope = root.lookupType("heart.beats.streaming.StreamEnvelope");
 const textDecoder = new TextDecoder("utf-8");
+const rgbFrameDecoder = new RgbFrameDecoder();
 
-type DecodedFrameEnvelope = {
+type DecodedFrameEnvelope = DecodedRgbFrame & {
   png_data?: Uint8Array;
   pngData?: Uint8Array;
 };
@@ -93,11 +98,20 @@ function getPayloadEncoding(
   return peripheral?.payloadEncoding ?? peripheral?.payload_encoding ?? null;
 }
 
+export function resetFrameDecoder() {
+  rgbFrameDecoder.reset();
+}
+
 export function decodeStreamEvent(buffer: ArrayBuffer): StreamEvent | null {
   const envelope = StreamEnvelope.decode(new Uint8Array(buffer)) as {
     frame?: DecodedFrameEnvelope | null;
     peripheral?: DecodedPeripheralEnvelope | null;
   };
+  const encoding = envelope.frame?.encoding ?? FRAME_ENCODING_PNG;
+  if (envelope.frame && encoding !== FRAME_ENCODING_PNG) {
+    const rgbaFrame = rgbFrameDecoder.decode(envelope.frame);
+    return rgbaFrame ? { type: "frame", payload: { rgbaFrame } } : null;
+  }
   const pngData = getFrameBytes(envelope.frame);
 
   if (pngData) {
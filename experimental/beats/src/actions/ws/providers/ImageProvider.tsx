@@ -1,6 +1,7 @@
 import { createContext, useContext, useEffect, useState } from "react";
 
 import { useRef } from "react";
+import { RgbaFrame } from "../frame_codec";
 import { frameStream } from "../streams";
 
 const ACTIVE_STATUS_POLL_INTERVAL_MS = 200;
@@ -39,6 +40,7 @@ export function ImageProvider({
   const lastFrameRef = useRef<number>(0);
   const frameTimesRef = useRef<number[]>([]);
   const revokeTimeoutsRef = useRef<number[]>([]);
+  const frameSequenceRef = useRef<number>(0);
 
   const clearPendingRevocations = () => {
     revokeTimeoutsRef.current.forEach((timeoutId) => {
@@ -57,6 +59,20 @@ export function ImageProvider({
     revokeTimeoutsRef.current.push(timeoutId);
   };
 
+  const publishBlob = (blob: Blob) => {
+    const newURL = URL.createObjectURL(blob);
+    setFrameBlob(blob);
+
+    setImgURL((old) => {
+      if (old) {
+        scheduleUrlRevocation(old);
+      }
+      return newURL;
+    });
+
+    setIsActive(true);
+  };
+
   useEffect(() => {
     const sub = frameStream.subscribe((msg) => {
       const now = performance.now();
@@ -89,18 +105,17 @@ export function ImageProvider({
 
       setFps(Number(computedFPS.toFixed(0)));
 
-      const blob = bytesToBlob(msg.payload.pngData);
-      const newURL = URL.createObjectURL(blob);
-      setFrameBlob(blob);
-
-      setImgURL((old) => {
-        if (old) {
-          scheduleUrlRevocation(old);
+      const sequence = ++frameSequenceRef.current;
+      if ("pngData" in msg.payload) {
+        publishBlob(bytesToBlob(msg.payload.pngData));
+        return;
+      }
+      void rgbaFrameToBlob(msg.payload.rgbaFrame).then((blob) => {
+        // Canvas encoding is async; drop frames that a newer frame overtook.
+        if (blob && sequence === frameSequenceRef.current) {
+          publishBlob(blob);
         }
-        return newURL;
       });
-
-      setIsActive(true);
     });
 
     // Active/inactive updater
@@ -152,3 +167,29 @@ function bytesToBlob(data: Uint8Array) {
   copy.set(data);
   return new Blob([copy], { type: "image/png" });
 }
+
+// Raw frames arrive at the native LED resolution; scale them up with nearest-neighbour
+// sampling so the preview keeps crisp pixel edges.
+function rgbaFrameToBlob(frame: RgbaFrame): Promise<Blob | null> {
+  const source = document.createElement("canvas");
+  source.width = frame.width;
+  source.height = frame.height;
+  const sourceContext = source.getContext("2d");
+  const target = document.createElement("canvas");
+  target.width = frame.width * frame.displayScale;
+  target.height = frame.height * frame.displayScale;
+  const targetContext = target.getContext("2d");
+  if (!sourceContext || !targetContext) {
+    return Promise.resolve(null);
+  }
+  sourceContext.putImageData(
+    new ImageData(frame.rgba, frame.width, frame.height),
+    0,
+    0,
+  );
+  targetContext.imageSmoothingEnabled = false;
+  targetContext.drawImage(source, 0, 0, target.width, target.height);
+  return new Promise((resolve) => {
+    target.toBlob(resolve, "image/png");
+  });
+}
@@ -8,7 +8,8 @@ import {
 } from "react";
 import { Subject } from "rxjs";
 
-import { decodeStreamEvent, StreamEvent } from "./protocol";
+import { FRAME_CODEC_SUBPROTOCOLS } from "./frame_codec";
+import { decodeStreamEvent, resetFrameDecoder, StreamEvent } from "./protocol";
 
 export const stream = new Subject<StreamEvent>();
 
@@ -125,7 +126,8 @@ export function WSProvider({
         return;
       }
 
-      const ws = new WebSocket(url);
+      resetFrameDecoder();
+      const ws = new WebSocket(url, FRAME_CODEC_SUBPROTOCOLS);
       ws.binaryType = "arraybuffer";
       socketRef.current = ws;
       setSocket(ws);
@@ -0,0 +1,79 @@
+import { describe, expect, it } from "vitest";
+
+import {
+  FRAME_ENCODING_RGB888_DELTA,
+  FRAME_ENCODING_RGB888_KEYFRAME,
+  RgbFrameDecoder,
+} from "@/actions/ws/frame_codec";
+
+// 2x2 frame: red, green / blue, white.
+const KEYFRAME_RGB = new Uint8Array([
+  255, 0, 0, 0, 255, 0, 0, 0, 255, 255, 255, 255,
+]);
+
+function keyframe(keyframeId: number) {
+  return {
+    encoding: FRAME_ENCODING_RGB888_KEYFRAME,
+    width: 2,
+    height: 2,
+    display_scale: 4,
+    keyframe_id: keyframeId,
+    rgb_data: KEYFRAME_RGB,
+  };
+}
+
+describe("RgbFrameDecoder", () => {
+  it("expands keyframes to opaque rgba so canvases can draw them directly", () => {
+    const decoder = new RgbFrameDecoder();
+
+    const frame = decoder.decode(keyframe(1));
+
+    expect(frame?.width).toBe(2);
+    expect(frame?.height).toBe(2);
+    expect(frame?.displayScale).toBe(4);
+    expect(Array.from(frame?.rgba ?? [])).toEqual([
+      255, 0, 0, 255, 0, 255, 0, 255, 0, 0, 255, 255, 255, 255, 255, 255,
+    ]);
+  });
+
+  it("applies xor rects against the latest keyframe so deltas only carry changed tiles", () => {
+    const decoder = new RgbFrameDecoder();
+    decoder.decode(keyframe(7));
+
+    // Turn the bottom-right pixel black: white XOR white.
+    const frame = decoder.decode({
+      encoding: FRAME_ENCODING_RGB888_DELTA,
+      width: 2,
+      height: 2,
+      display_scale: 4,
+      keyframe_id: 7,
+      delta_rects: [
+        {
+          x: 1,
+          y: 1,
+          width: 1,
+          height: 1,
+          xor_rgb_data: new Uint8Array([255, 255, 255]),
+        },
+      ],
+    });
+
+    expect(Array.from(frame?.rgba.slice(12) ?? [])).toEqual([0, 0, 0, 255]);
+    expect(Array.from(frame?.rgba.slice(0, 4) ?? [])).toEqual([255, 0, 0, 255]);
+  });
+
+  it("ignores deltas for an unseen keyframe so dropped keyframes never produce corrupt frames", () => {
+    const decoder = new RgbFrameDecoder();
+    decoder.decode(keyframe(1));
+
+    const frame = decoder.decode({
+      encoding: FRAME_ENCODING_RGB888_DELTA,
+      width: 2,
+      height: 2,
+      keyframe_id: 2,
+      delta_rects: [],
+    });
+
+    expect(frame).toBeNull();
+  });
+});
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Compare synchronous and PBO framebuffer readback stalls on a headless GL context.
+
+The shader renderers are drawn through ``FullscreenShaderRuntime`` on an EGL
+pbuffer, which Mesa backs with llvmpipe when no GPU is present. For each readback
+strategy the script reports how long ``read_surface`` blocks per frame, which is the
+stall the game loop sees before it can present.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import json
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from heart.utilities.env import GlReadbackStrategy
+from heart.utilities.logging import get_logger
+
+if TYPE_CHECKING:
+    from heart.display.shaders.fullscreen import UniformValue
+
+logger = get_logger(__name__)
+
+SHADER_TEMPLATE_ROOT = (
+    Path(__file__).resolve().parents[1]
+    / "src"
+    / "heart"
+    / "display"
+    / "shaders"
+    / "shader_templates"
+)
+EGL_UNAVAILABLE_EXIT = 77
+FRAME_SECONDS = 1.0 / 60.0
+
+
+def _mandelbulb_uniforms(
+    size: tuple[int, int], elapsed: float
+) -> dict[str, UniformValue]:
+    return {
+        "iResolution": size,
+        "iTime": elapsed,
+        "uCameraYaw": 0.4 * elapsed,
+        "uCameraPitch": 0.2,
+        "uCameraDistance": 2.6,
+        "uPower": 8.0,
+        "uColorPhase": elapsed,
+        "uColorVector": (0.0, 0.0),
+        "uColorMode": 0.0,
+        "uPhaseTime": elapsed,
+        "uAutoYaw": 1.0,
+    }
+
+
+def _palette_tunnel_uniforms(
+    size: tuple[int, int], elapsed: float
+) -> dict[str, UniformValue]:
+    return {
+        "iResolution": size,
+        "iMouse": (0.0, 0.0),
+        "iMouseScale": (2.0, 1.5),
+        "iViewportOrigin": (0.0, 0.0),
+        "iTime": elapsed,
+    }
+
+
+def _audio_storm_uniforms(
+    size: tuple[int, int], elapsed: float
+) -> dict[str, UniformValue]:
+    return {
+        "u_resolution": size,
+        "u_time": elapsed,
+        "u_orbit_phase": 0.5 * elapsed,
+    }
+
+
+# water_cube draws on the CPU with numpy and never reads back from GL.
+SHADERS = {
+    "mandelbulb": _mandelbulb_uniforms,
+    "palette_tunnel": _palette_tunnel_uniforms,
+    "audio_storm": _audio_storm_uniforms,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ReadbackTiming:
+    shader: str
+    strategy: str
+    frames: int
+    stall_mean_ms: float
+    stall_p95_ms: float
+    frame_mean_ms: float
+
+
+def _make_current_egl_context(size: tuple[int, int]) -> str:
+    """Create a pbuffer-backed OpenGL context and return the GL renderer string."""
+
+    # PyOpenGL picks its platform on first import, so select EGL before any GL
+    # module (including the shader runtime) is loaded.
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+    os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+    from OpenGL import EGL
+    from OpenGL.GL import GL_RENDERER, glGetString
+
+    display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+    major, minor = EGL.EGLint(), EGL.EGLint()
+    if not EGL.eglInitialize(display, ctypes.pointer(major), ctypes.pointer(minor)):
+        raise RuntimeError("eglInitialize failed")
+    attributes = (EGL.EGLint * 5)(
+        EGL.EGL_SURFACE_TYPE,
+        EGL.EGL_PBUFFER_BIT,
+        EGL.EGL_RENDERABLE_TYPE,
+        EGL.EGL_OPENGL_BIT,
+        EGL.EGL_NONE,
+    )
+    config = EGL.EGLConfig()
+    count = EGL.EGLint()
+    EGL.eglChooseConfig(
+        display, attributes, ctypes.pointer(config), 1, ctypes.pointer(count)
+    )
+    if count.value < 1:
+        raise RuntimeError("No EGL config supports OpenGL pbuffers")
+    EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+    context = EGL.eglCreateContext(display, config, EGL.EGL_NO_CONTEXT, None)
+    width, height = size
+    surface_attributes = (EGL.EGLint * 5)(
+        EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE
+    )
+    surface = EGL.eglCreatePbufferSurface(display, config, surface_attributes)
+    if not EGL.eglMakeCurrent(display, surface, surface, context):
+        raise RuntimeError("eglMakeCurrent failed")
+    return glGetString(GL_RENDERER).decode()
+
+
+def _benchmark_shader(
+    name: str,
+    strategy: GlReadbackStrategy,
+    *,
+    size: tuple[int, int],
+    frames: int,
+) -> ReadbackTiming:
+    from heart.display.shaders.fullscreen import FullscreenShaderRuntime
+
+    runtime = FullscreenShaderRuntime(readback=strategy)
+    runtime.initialize(fragment_path=SHADER_TEMPLATE_ROOT / name / "frag.glsl")
+    uniforms = SHADERS[name]
+    # Warm up shader compilation and, for PBO, prime the first pixel buffer.
+    for frame in range(2):
+        runtime.draw(uniforms=uniforms(size, frame * FRAME_SECONDS), viewport_size=size)
+        runtime.read_surface(size=size)
+    stalls: list[float] = []
+    totals: list[float] = []
+    for frame in range(frames):
+        started = time.perf_counter()
+        runtime.draw(uniforms=uniforms(size, frame * FRAME_SECONDS), viewport_size=size)
+        drawn = time.perf_counter()
+        runtime.read_surface(size=size)
+        finished = time.perf_counter()
+        stalls.append((finished - drawn) * 1000.0)
+        totals.append((finished - started) * 1000.0)
+    runtime.reset()
+    stalls.sort()
+    return ReadbackTiming(
+        shader=name,
+        strategy=strategy.value,
+        frames=frames,
+        stall_mean_ms=statistics.fmean(stalls),
+        stall_p95_ms=stalls[min(len(stalls) - 1, int(len(stalls) * 0.95))],
+        frame_mean_ms=statistics.fmean(totals),
+    )
+
+
+def _format_text(renderer: str, timings: list[ReadbackTiming]) -> str:
+    lines = [
+        f"GL renderer: {renderer}",
+        f"{'shader':<16}{'strategy':<10}{'stall ms':>10}{'p95 ms':>10}{'frame ms':>10}",
+    ]
+    for timing in timings:
+        lines.append(
+            f"{timing.shader:<16}{timing.strategy:<10}"
+            f"{timing.stall_mean_ms:>10.3f}{timing.stall_p95_ms:>10.3f}"
+            f"{timing.frame_mean_ms:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark synchronous and PBO GL readback on a headless context."
+    )
+    parser.add_argument("--width", type=int, default=256)
+    parser.add_argument("--height", type=int, default=64)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument(
+        "--shader",
+        action="append",
+        choices=sorted(SHADERS),
+        help="Shader to benchmark; repeat to select several. Defaults to all.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Output format for the results.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Optional file path to write the results.",
+    )
+    args = parser.parse_args()
+
+    size = (args.width, args.height)
+    try:
+        renderer = _make_current_egl_context(size)
+    except Exception as exc:
+        logger.warning("Headless EGL context is unavailable: %s", exc)
+        return EGL_UNAVAILABLE_EXIT
+
+    timings = [
+        _benchmark_shader(name, strategy, size=size, frames=args.frames)
+        for name in args.shader or SHADERS
+        for strategy in GlReadbackStrategy
+    ]
+    if args.format == "json":
+        payload: dict[str, Any] = {
+            "renderer": renderer,
+            "size": list(size),
+            "timings": [asdict(timing) for timing in timings],
+        }
+        output = json.dumps(payload, indent=2, sort_keys=True)
+    else:
+        output = _format_text(renderer, timings)
+
+    if args.output:
+        output_path: Path = args.output
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(f"{output}\n", encoding="utf-8")
+    else:
+        logger.info(output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
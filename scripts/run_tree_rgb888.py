@@ -5,13 +5,18 @@ from __future__ import annotations
 import argparse
 import mmap
 import os
-import struct
+import sys
 import time
 from pathlib import Path
 from typing import Final
 
+import numpy as np
 from PIL import Image, ImageEnhance
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from heart.device.rp1.frame_packer import Rp1FramePacker  # noqa: E402
+
 RP1_SRAM_HOST_BASE: Final[int] = 0x1F00400000
 RP1_SRAM_MAP_SIZE: Final[int] = 0x10000
 DEFAULT_OFFSET: Final[int] = 0xC000
@@ -160,6 +165,9 @@ def load_rgb888_frames(
     sheet = Image.open(sheet_path).convert("RGB")
     frame_count = sheet.width // source_frame_size
     resample = Image.Resampling.NEAREST if nearest else Image.Resampling.LANCZOS
+    packer = Rp1FramePacker(
+        rows=ROWPAIRS * 2, cols=COLS, brightness=brightness, gamma=gamma
+    )
     return [
         pack_frame(
             prepare_frame_image(
@@ -173,10 +181,9 @@ def load_rgb888_frames(
                 crop_y=crop_y,
                 resample=resample,
             ),
-            brightness=brightness,
+            packer=packer,
             contrast=contrast,
             saturation=saturation,
-            gamma=gamma,
         )
         for frame_index in range(frame_count)
     ]
@@ -251,39 +258,17 @@ def clamp_crop_origin(value: int, max_origin: int) -> int:
 def pack_frame(
     image: Image.Image,
     *,
-    brightness: float,
+    packer: Rp1FramePacker,
     contrast: float,
     saturation: float,
-    gamma: float,
 ) -> bytes:
-    if image.size != (COLS, ROWPAIRS * 2):
-        raise ValueError(f"Expected {COLS}x{ROWPAIRS * 2} image, got {image.size}")
-
-    image = adjust_image(
-        image,
-        contrast=contrast,
-        saturation=saturation,
-        gamma=gamma,
-    )
-    pixels = image.load()
-    frame = bytearray(FRAME_BYTES)
-    offset = 0
-    for row in range(ROWPAIRS):
-        for col in range(COLS):
-            for y in (row, row + ROWPAIRS):
-                r, g, b = pixels[col, y]
-                word = (
-                    scale_u8(r, brightness)
-                    | (scale_u8(g, brightness) << 8)
-                    | (scale_u8(b, brightness) << 16)
-                )
-                struct.pack_into("<I", frame, offset, word)
-                offset += 4
-    return bytes(frame)
-
+    if image.size != (packer.cols, packer.rows):
+        raise ValueError(
+            f"Expected {packer.cols}x{packer.rows} image, got {image.size}"
+        )
 
-def scale_u8(value: int, brightness: float) -> int:
-    return max(0, min(255, int(value * brightness + 0.5)))
+    image = adjust_image(image, contrast=contrast, saturation=saturation)
+    return packer.pack(np.asarray(image))
 
 
 def adjust_image(
@@ -291,19 +276,9 @@ def adjust_image(
     *,
     contrast: float,
     saturation: float,
-    gamma: float,
 ) -> Image.Image:
     adjusted = ImageEnhance.Contrast(image).enhance(contrast)
-    adjusted = ImageEnhance.Color(adjusted).enhance(saturation)
-    if gamma == 1.0:
-        return adjusted
-
-    gamma_exponent = max(gamma, 0.001)
-    lookup = [
-        max(0, min(255, int(((value / 255.0) ** gamma_exponent) * 255.0 + 0.5)))
-        for value in range(256)
-    ]
-    return adjusted.point(lookup * 3)
+    return ImageEnhance.Color(adjusted).enhance(saturation)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,18 @@
+from heart.utilities import color_conversion
+from heart.utilities.env import Configuration
+from heart.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def build_hsv_tables_command() -> None:
+    """Build the HSV lookup tables ahead of time so no frame waits for them."""
+
+    directory = Configuration.hsv_lookup_table_dir()
+    logger.info(
+        "Building %s HSV lookup tables in %s",
+        color_conversion.HSV_CALIBRATION_MODE,
+        directory,
+    )
+    color_conversion.build_lookup_tables()
+    logger.info("HSV lookup tables ready")
@@ -1,12 +1,15 @@
 import io
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Protocol
+from typing import Any, Protocol
 
+import numpy as np
 import pygame
 from PIL import Image
 
 from heart.device import Device
+from heart.device.beats.frame_codec import BeatsFrameEncoder, FrameCodec
+from heart.device.beats.streaming_config import BeatsStreamingConfiguration
 from heart.device.beats.websocket import WebSocket
 from heart.runtime.rendering.constants import RGBA_IMAGE_FORMAT
 
@@ -14,12 +17,22 @@ STREAMED_SCREEN_SCALE_FACTOR = 4
 
 
 class FrameWebSocket(Protocol):
-    def send(self, kind: str, payload: bytes) -> None: ...
+    def send(self, kind: str, payload: Any) -> None: ...
+
+    def frame_codec(self) -> FrameCodec: ...
 
 
 @dataclass
 class StreamedScreen(Device):
     websocket: FrameWebSocket | None = field(default=None, repr=False)
+    _frame_encoder: BeatsFrameEncoder = field(
+        default_factory=lambda: BeatsFrameEncoder(
+            keyframe_interval=BeatsStreamingConfiguration.settings().keyframe_interval
+        ),
+        init=False,
+        repr=False,
+    )
+    _last_frame_codec: FrameCodec | None = field(default=None, init=False, repr=False)
 
     def individual_display_size(self) -> tuple[int, int]:
         return (64, 64)
@@ -29,6 +42,31 @@ class StreamedScreen(Device):
         return STREAMED_SCREEN_SCALE_FACTOR
 
     def set_screen(self, screen: pygame.Surface) -> None:
+        codec = self._websocket().frame_codec()
+        if codec != self._last_frame_codec:
+            # Clients that just switched codec have no keyframe to apply deltas to.
+            self._frame_encoder.request_keyframe()
+            self._last_frame_codec = codec
+        if codec == FrameCodec.PNG:
+            self._send_png(screen)
+            return
+
+        display_scale = screen.get_width() // self.full_display_size()[0]
+        self._validate_size(screen.get_size())
+        pixels = pygame.surfarray.pixels3d(screen)
+        try:
+            # Sample one pixel per scaled block; Beats scales the native frame back up.
+            native_rgb = np.ascontiguousarray(
+                pixels[::display_scale, ::display_scale].swapaxes(0, 1)
+            )
+        finally:
+            del pixels
+        frame = self._frame_encoder.encode(
+            native_rgb, codec=codec, display_scale=display_scale
+        )
+        self._websocket().send(kind="frame", payload=frame)
+
+    def _send_png(self, screen: pygame.Surface) -> None:
         image_bytes = pygame.image.tostring(screen, RGBA_IMAGE_FORMAT)
         image = Image.frombuffer(
             RGBA_IMAGE_FORMAT,
@@ -42,14 +80,7 @@ class StreamedScreen(Device):
         self.set_image(image)
 
     def set_image(self, image: Image.Image) -> None:
-        expected_sizes = {
-            self.full_display_size(),
-            self.scaled_display_size(),
-        }
-        assert image.size in expected_sizes, (
-            "Image size does not match display size. "
-            f"Image size: {image.size}, expected one of: {sorted(expected_sizes)}"
-        )
+        self._validate_size(image.size)
         buf = io.BytesIO()
         image.save(buf, format="PNG")
         frame_bytes = buf.getvalue()
@@ -59,6 +90,16 @@ class StreamedScreen(Device):
             payload=frame_bytes,
         )
 
+    def _validate_size(self, size: tuple[int, int]) -> None:
+        expected_sizes = {
+            self.full_display_size(),
+            self.scaled_display_size(),
+        }
+        assert size in expected_sizes, (
+            "Image size does not match display size. "
+            f"Image size: {size}, expected one of: {sorted(expected_sizes)}"
+        )
+
     def _websocket(self) -> FrameWebSocket:
         if self.websocket is None:
             self.websocket = WebSocket()
@@ -0,0 +1,239 @@
+"""Frame codecs for the Beats websocket stream.
+
+Beats clients negotiate a codec through the websocket subprotocol. ``png`` keeps the
+original per-frame PNG payload at the rendered (scaled) size. ``raw`` sends every frame
+as an RGB888 keyframe at the native display resolution and leaves scaling to the
+client. ``delta`` sends periodic RGB888 keyframes and, in between, XOR deltas against
+the latest keyframe restricted to the dirty tiles that changed.
+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any, Sequence, cast
+
+import numpy as np
+
+from heart.device.beats.proto import \
+    beats_streaming_pb2 as _beats_streaming_pb2
+
+beats_streaming_pb2 = cast(Any, _beats_streaming_pb2)
+
+RGB_CHANNELS = 3
+DEFAULT_KEYFRAME_INTERVAL = 120
+DEFAULT_DELTA_TILE_SIZE = 16
+# Fall back to a keyframe once the delta payload grows past this share of a raw frame.
+MAX_DELTA_KEYFRAME_RATIO = 0.5
+FRAME_CODEC_SUBPROTOCOL_TEMPLATE = "heart.frames.{codec}.v1"
+
+
+class FrameCodec(StrEnum):
+    PNG = "png"
+    RAW = "raw"
+    DELTA = "delta"
+
+
+# Ordered from most to least capable; a client that decodes a codec also decodes every
+# codec listed after it.
+FRAME_CODEC_PREFERENCE: tuple[FrameCodec, ...] = (
+    FrameCodec.DELTA,
+    FrameCodec.RAW,
+    FrameCodec.PNG,
+)
+
+
+def frame_codec_subprotocol(codec: FrameCodec) -> str:
+    return FRAME_CODEC_SUBPROTOCOL_TEMPLATE.format(codec=codec.value)
+
+
+FRAME_CODEC_SUBPROTOCOLS: tuple[str, ...] = tuple(
+    frame_codec_subprotocol(codec) for codec in FRAME_CODEC_PREFERENCE
+)
+
+
+def frame_codec_for_subprotocol(subprotocol: str | None) -> FrameCodec:
+    """Return the codec a client negotiated, defaulting legacy clients to PNG."""
+
+    for codec in FRAME_CODEC_PREFERENCE:
+        if subprotocol == frame_codec_subprotocol(codec):
+            return codec
+    return FrameCodec.PNG
+
+
+def select_frame_subprotocol(
+    _connection: object, subprotocols: Sequence[str]
+) -> str | None:
+    """Pick the richest frame codec a client offers, accepting clients that offer none."""
+
+    offered = set(subprotocols)
+    for subprotocol in FRAME_CODEC_SUBPROTOCOLS:
+        if subprotocol in offered:
+            return subprotocol
+    return None
+
+
+def common_frame_codec(
+    preferred: FrameCodec, client_codecs: Sequence[FrameCodec]
+) -> FrameCodec:
+    """Return the richest codec up to ``preferred`` that every client can decode."""
+
+    rank = FRAME_CODEC_PREFERENCE.index
+    selected = rank(preferred)
+    for codec in client_codecs:
+        selected = max(selected, rank(codec))
+    return FRAME_CODEC_PREFERENCE[selected]
+
+
+def supports_frame_codec(client_codec: FrameCodec, codec: FrameCodec) -> bool:
+    """Return whether a client that negotiated ``client_codec`` decodes ``codec``."""
+
+    rank = FRAME_CODEC_PREFERENCE.index
+    return rank(client_codec) <= rank(codec)
+
+
+def frame_codec_of(frame: Any) -> FrameCodec:
+    if frame.encoding == beats_streaming_pb2.FRAME_ENCODING_RGB888_DELTA:
+        return FrameCodec.DELTA
+    if frame.encoding == beats_streaming_pb2.FRAME_ENCODING_RGB888_KEYFRAME:
+        return FrameCodec.RAW
+    return FrameCodec.PNG
+
+
+def is_keyframe(frame: Any) -> bool:
+    return bool(frame.encoding != beats_streaming_pb2.FRAME_ENCODING_RGB888_DELTA)
+
+
+@dataclass
+class BeatsFrameEncoder:
+    """Encode native-resolution RGB888 frames as keyframes or XOR tile deltas."""
+
+    keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL
+    tile_size: int = DEFAULT_DELTA_TILE_SIZE
+    _keyframe: np.ndarray | None = field(default=None, init=False, repr=False)
+    _xor: np.ndarray | None = field(default=None, init=False, repr=False)
+    _keyframe_id: int = field(default=0, init=False)
+    _frames_since_keyframe: int = field(default=0, init=False)
+    _force_keyframe: bool = field(default=True, init=False)
+
+    def request_keyframe(self) -> None:
+        self._force_keyframe = True
+
+    def encode(self, rgb: np.ndarray, *, codec: FrameCodec, display_scale: int) -> Any:
+        """Encode an ``(height, width, 3)`` uint8 frame as a ``Frame`` message."""
+
+        if codec == FrameCodec.PNG:
+            raise ValueError("BeatsFrameEncoder only produces RGB888 frames")
+        if rgb.ndim != 3 or rgb.shape[2] != RGB_CHANNELS or rgb.dtype != np.uint8:
+            raise ValueError("Expected an (height, width, 3) uint8 frame")
+
+        if codec == FrameCodec.RAW or self._needs_keyframe(rgb):
+            return self._encode_keyframe(rgb, display_scale=display_scale)
+
+        assert self._keyframe is not None and self._xor is not None
+        np.bitwise_xor(rgb, self._keyframe, out=self._xor)
+        rects = self._dirty_rects(self._xor)
+        delta_bytes = sum(len(rect.xor_rgb_data) for rect in rects)
+        if delta_bytes > self._keyframe.nbytes * MAX_DELTA_KEYFRAME_RATIO:
+            return self._encode_keyframe(rgb, display_scale=display_scale)
+
+        self._frames_since_keyframe += 1
+        height, width = rgb.shape[:2]
+        return beats_streaming_pb2.Frame(
+            encoding=beats_streaming_pb2.FRAME_ENCODING_RGB888_DELTA,
+            width=width,
+            height=height,
+            display_scale=display_scale,
+            keyframe_id=self._keyframe_id,
+            delta_rects=rects,
+        )
+
+    def _needs_keyframe(self, rgb: np.ndarray) -> bool:
+        return (
+            self._force_keyframe
+            or self._keyframe is None
+            or self._keyframe.shape != rgb.shape
+            or self._frames_since_keyframe + 1 >= self.keyframe_interval
+        )
+
+    def _encode_keyframe(self, rgb: np.ndarray, *, display_scale: int) -> Any:
+        if self._keyframe is None or self._keyframe.shape != rgb.shape:
+            self._keyframe = np.empty_like(rgb)
+            self._xor = np.empty_like(rgb)
+        np.copyto(self._keyframe, rgb)
+        self._keyframe_id += 1
+        self._frames_since_keyframe = 0
+        self._force_keyframe = False
+        height, width = rgb.shape[:2]
+        return beats_streaming_pb2.Frame(
+            encoding=beats_streaming_pb2.FRAME_ENCODING_RGB888_KEYFRAME,
+            width=width,
+            height=height,
+            display_scale=display_scale,
+            keyframe_id=self._keyframe_id,
+            rgb_data=self._keyframe.tobytes(),
+        )
+
+    def _dirty_rects(self, xor: np.ndarray) -> list[Any]:
+        height, width = xor.shape[:2]
+        tile = self.tile_size
+        changed = xor.any(axis=2)
+        row_starts = np.arange(0, height, tile)
+        col_starts = np.arange(0, width, tile)
+        dirty_tiles = np.logical_or.reduceat(
+            np.logical_or.reduceat(changed, row_starts, axis=0), col_starts, axis=1
+        )
+
+        rects = []
+        for tile_row in np.flatnonzero(dirty_tiles.any(axis=1)):
+            edges = np.diff(dirty_tiles[tile_row].astype(np.int8), prepend=0, append=0)
+            run_starts = np.flatnonzero(edges == 1)
+            run_ends = np.flatnonzero(edges == -1)
+            y0 = int(tile_row) * tile
+            y1 = min(y0 + tile, height)
+            for start, end in zip(run_starts, run_ends, strict=True):
+                x0 = int(start) * tile
+                x1 = min(int(end) * tile, width)
+                rects.append(
+                    beats_streaming_pb2.FrameRect(
+                        x=x0,
+                        y=y0,
+                        width=x1 - x0,
+                        height=y1 - y0,
+                        xor_rgb_data=xor[y0:y1, x0:x1].tobytes(),
+                    )
+                )
+        return rects
+
+
+@dataclass
+class BeatsFrameDecoder:
+    """Reconstruct RGB888 frames from keyframes and deltas, mirroring the Beats client."""
+
+    _keyframe: np.ndarray | None = field(default=None, init=False, repr=False)
+    _keyframe_id: int | None = field(default=None, init=False)
+
+    def decode(self, frame: Any) -> np.ndarray | None:
+        """Return the ``(height, width, 3)`` frame, or ``None`` if it cannot be rebuilt."""
+
+        codec = frame_codec_of(frame)
+        if codec == FrameCodec.PNG:
+            raise ValueError("BeatsFrameDecoder only decodes RGB888 frames")
+        shape = (frame.height, frame.width, RGB_CHANNELS)
+        if codec == FrameCodec.RAW:
+            self._keyframe = (
+                np.frombuffer(frame.rgb_data, dtype=np.uint8).reshape(shape).copy()
+            )
+            self._keyframe_id = frame.keyframe_id
+            return self._keyframe.copy()
+
+        if self._keyframe is None or self._keyframe_id != frame.keyframe_id:
+            return None
+        result = self._keyframe.copy()
+        for rect in frame.delta_rects:
+            region = result[rect.y : rect.y + rect.height, rect.x : rect.x + rect.width]
+            region ^= np.frombuffer(rect.xor_rgb_data, dtype=np.uint8).reshape(
+                region.shape
+            )
+        return result
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from enum import StrEnum
 from functools import cache
 
+from heart.device.beats.frame_codec import (DEFAULT_KEYFRAME_INTERVAL,
+                                            FrameCodec)
 from heart.utilities.env.parsing import _env_int
 
 
@@ -18,6 +20,8 @@ class QueueOverflowStrategy(StrEnum):
 class BeatsStreamingSettings:
     queue_max_size: int
     overflow_strategy: QueueOverflowStrategy
+    frame_codec: FrameCodec
+    keyframe_interval: int
 
 
 class BeatsStreamingConfiguration:
@@ -26,9 +30,16 @@ class BeatsStreamingConfiguration:
     def settings(cls) -> BeatsStreamingSettings:
         queue_max_size = _env_int("BEATS_STREAM_QUEUE_SIZE", default=256, minimum=1)
         overflow_strategy = cls._overflow_strategy()
+        keyframe_interval = _env_int(
+            "BEATS_FRAME_KEYFRAME_INTERVAL",
+            default=DEFAULT_KEYFRAME_INTERVAL,
+            minimum=1,
+        )
         return BeatsStreamingSettings(
             queue_max_size=queue_max_size,
             overflow_strategy=overflow_strategy,
+            frame_codec=cls._frame_codec(),
+            keyframe_interval=keyframe_interval,
         )
 
     @classmethod
@@ -43,3 +54,12 @@ class BeatsStreamingConfiguration:
             raise ValueError(
                 f"BEATS_STREAM_QUEUE_OVERFLOW must be one of {options}."
             ) from exc
+
+    @classmethod
+    def _frame_codec(cls) -> FrameCodec:
+        raw = os.environ.get("BEATS_FRAME_CODEC", "delta").strip().lower()
+        try:
+            return FrameCodec(raw)
+        except ValueError as exc:
+            options = ", ".join(codec.value for codec in FrameCodec)
+            raise ValueError(f"BEATS_FRAME_CODEC must be one of {options}.") from exc
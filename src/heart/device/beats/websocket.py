@@ -15,6 +15,12 @@ from manyfold import (Graph, Layer, ManagedGraphNode, ManagedGraphNodeHandle,
 from manyfold.sensor_io import BackoffPolicy, RetryPolicy, StopToken
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 
+from heart.device.beats.frame_codec import (FRAME_CODEC_SUBPROTOCOLS,
+                                            FrameCodec, common_frame_codec,
+                                            frame_codec_for_subprotocol,
+                                            frame_codec_of, is_keyframe,
+                                            select_frame_subprotocol,
+                                            supports_frame_codec)
 from heart.device.beats.proto import \
     beats_streaming_pb2 as _beats_streaming_pb2
 from heart.device.beats.streaming_config import (BeatsStreamingConfiguration,
@@ -45,6 +51,7 @@ CONTROL_COMMAND_SENSOR_UPDATE = "sensor_update"
 CONTROL_COMMAND_TEXT_UPDATE = "text_update"
 CONTROL_COMMAND_IMAGE_UPDATE = "image_update"
 CONTROL_COMMAND_EMOJI_UPDATE = "emoji_update"
+CONTROL_COMMAND_PROFILE_SNAPSHOT = "profile_snapshot"
 CONTROL_EMOJI_POOP = "poop"
 CONTROL_EMOJI_SKULL = "skull"
 CONTROL_EMOJI_HEART = "heart"
@@ -172,7 +179,11 @@ def decode_stream_envelope(frame: bytes) -> tuple[str, object] | None:
 
     payload_kind = envelope.WhichOneof("payload")
     if payload_kind == "frame":
-        return payload_kind, bytes(envelope.frame.png_data)
+        if frame_codec_of(envelope.frame) == FrameCodec.PNG:
+            return payload_kind, bytes(envelope.frame.png_data)
+        # RGB888 keyframes and deltas are returned as-is; BeatsFrameDecoder
+        # rebuilds pixels from them.
+        return payload_kind, envelope.frame
 
     if payload_kind == "peripheral":
         payload_encoding = _decode_peripheral_payload_encoding(
@@ -246,6 +257,7 @@ def decode_control_message(message: str | bytes) -> ControlMessage | None:
         CONTROL_COMMAND_TEXT_UPDATE,
         CONTROL_COMMAND_IMAGE_UPDATE,
         CONTROL_COMMAND_EMOJI_UPDATE,
+        CONTROL_COMMAND_PROFILE_SNAPSHOT,
     }:
         logger.warning("Unknown websocket control command: %s.", command)
         return None
@@ -328,6 +340,10 @@ def decode_control_message(message: str | bytes) -> ControlMessage | None:
     return ControlMessage(command=command, browse_step=browse_step)
 
 
+def _client_frame_codec(ws: Any) -> FrameCodec:
+    return frame_codec_for_subprotocol(getattr(ws, "subprotocol", None))
+
+
 def _peripheral_cache_key(envelope: PeripheralMessageEnvelope[Any]) -> str:
     info = envelope.peripheral_info
     if info.id:
@@ -445,6 +461,8 @@ class BeatsWebSocketNode:
                 self.host,
                 self.port,
                 ping_interval=self.ping_interval,
+                subprotocols=list(FRAME_CODEC_SUBPROTOCOLS),
+                select_subprotocol=select_frame_subprotocol,
             ) as server:
                 self.websocket._server = server
                 logger.info(
@@ -525,6 +543,9 @@ class WebSocket:
     _node_handle: ManagedGraphNodeHandle | None = field(default=None, init=False)
     _replay_lock: threading.Lock = field(default_factory=threading.Lock, init=False)
     _latest_frame: bytes | None = field(default=None, init=False)
+    _latest_frame_codec: FrameCodec = field(default=FrameCodec.PNG, init=False)
+    # Deltas only decode against their keyframe, so replay it ahead of the delta.
+    _latest_keyframe: bytes | None = field(default=None, init=False)
     _latest_peripheral_frames: dict[str, bytes] = field(
         default_factory=dict, init=False
     )
@@ -556,9 +577,10 @@ class WebSocket:
 
     async def _handle_client(self, ws: Any) -> None:
         self.clients.add(ws)
+        client_codec = _client_frame_codec(ws)
         try:
             try:
-                for frame in self._replay_frames():
+                for frame in self._replay_frames(client_codec):
                     await ws.send(frame)
             except (ConnectionClosedOK, ConnectionClosedError):
                 logger.debug("Beats websocket client disconnected during replay send.")
@@ -570,6 +592,14 @@ class WebSocket:
         finally:
             self.clients.discard(ws)
 
+    def frame_codec(self) -> FrameCodec:
+        """Return the richest frame codec every connected client can decode."""
+
+        return common_frame_codec(
+            self._streaming_settings.frame_codec,
+            [_client_frame_codec(ws) for ws in tuple(self.clients)],
+        )
+
     def set_control_handler(
         self,
         handler: Callable[[ControlMessage], None] | None,
@@ -609,17 +639,34 @@ class WebSocket:
     ) -> None:
         with self._replay_lock:
             if kind == "frame":
+                codec = FrameCodec.PNG
+                if isinstance(payload, beats_streaming_pb2.Frame):
+                    codec = frame_codec_of(payload)
+                    if is_keyframe(payload):
+                        self._latest_keyframe = frame_bytes
+                if codec == FrameCodec.PNG:
+                    self._latest_keyframe = None
                 self._latest_frame = frame_bytes
+                self._latest_frame_codec = codec
                 return
             if kind == "peripheral" and isinstance(payload, PeripheralMessageEnvelope):
                 self._latest_peripheral_frames[_peripheral_cache_key(payload)] = (
                     frame_bytes
                 )
 
-    def _replay_frames(self) -> tuple[bytes, ...]:
+    def _replay_frames(
+        self, client_codec: FrameCodec = FrameCodec.DELTA
+    ) -> tuple[bytes, ...]:
         with self._replay_lock:
             frames: list[bytes] = []
-            if self._latest_frame is not None:
+            if self._latest_frame is not None and supports_frame_codec(
+                client_codec, self._latest_frame_codec
+            ):
+                if (
+                    self._latest_frame_codec == FrameCodec.DELTA
+                    and self._latest_keyframe is not None
+                ):
+                    frames.append(self._latest_keyframe)
                 frames.append(self._latest_frame)
             frames.extend(self._latest_peripheral_frames.values())
             return tuple(frames)
@@ -652,13 +699,16 @@ class WebSocket:
 
     def _encode_payload(self, kind: str, payload: object) -> bytes | None:
         if kind == "frame":
-            if not isinstance(payload, (bytes, bytearray, memoryview)):
+            if isinstance(payload, beats_streaming_pb2.Frame):
+                frame = payload
+            elif isinstance(payload, (bytes, bytearray, memoryview)):
+                frame = beats_streaming_pb2.Frame(png_data=bytes(payload))
+            else:
                 logger.warning(
-                    "Expected bytes payload for frame message, got %s.",
+                    "Expected PNG bytes or a Frame message for frame message, got %s.",
                     type(payload).__name__,
                 )
                 return None
-            frame = beats_streaming_pb2.Frame(png_data=bytes(payload))
             envelope = beats_streaming_pb2.StreamEnvelope(frame=frame)
             return cast(bytes, envelope.SerializeToString())
 
@@ -7,6 +7,7 @@ import pygame
 from PIL import Image
 
 from heart.device import Device, Layout, Orientation
+from heart.device.rgb_display.frame_export import MatrixFrameExporter
 from heart.device.rgb_display.runtime import (MatrixDriverProtocol,
                                               build_matrix_driver)
 from heart.runtime.rendering.constants import RGBA_IMAGE_FORMAT
@@ -37,6 +38,11 @@ class LEDMatrix(Device):
         )
         self.driver: MatrixDriverProtocol = build_matrix_driver(orientation)
         self._frames_sent = 0
+        self._frame_exporter = MatrixFrameExporter(
+            export_strategy=Configuration.frame_export_strategy(),
+            array_strategy=Configuration.frame_array_strategy(),
+        )
+        self._driver_accepts_buffers = True
         self._flush_startup_frames()
         atexit.register(self.close)
 
@@ -62,9 +68,27 @@ class LEDMatrix(Device):
                 screen.get_size(),
                 average_color,
             )
-        image_bytes = pygame.image.tostring(screen, RGBA_IMAGE_FORMAT)
         width, height = screen.get_size()
-        self.driver.submit_rgba(image_bytes, width, height)
+        frame = self._frame_exporter.export(screen)
+        try:
+            self._submit_frame(frame, width, height)
+        finally:
+            if isinstance(frame, memoryview):
+                frame.release()
+
+    def _submit_frame(self, frame: memoryview | bytes, width: int, height: int) -> None:
+        if self._driver_accepts_buffers or isinstance(frame, bytes):
+            try:
+                self.driver.submit_rgba(frame, width, height)
+                return
+            except TypeError:
+                if isinstance(frame, bytes):
+                    raise
+                logger.warning(
+                    "Matrix driver rejected buffer frames; copying frames to bytes"
+                )
+                self._driver_accepts_buffers = False
+        self.driver.submit_rgba(bytes(frame), width, height)
 
     def set_image(self, image: Image.Image) -> None:
         converted_image = image.convert(RGBA_IMAGE_FORMAT)
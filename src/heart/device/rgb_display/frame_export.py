@@ -0,0 +1,122 @@
+"""Export pygame surfaces into RGBA frames for the native matrix driver."""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pygame
+
+from heart.runtime.rendering.constants import RGBA_IMAGE_FORMAT
+from heart.utilities.env import FrameArrayStrategy, FrameExportStrategy
+
+RGBA_CHANNELS = len(RGBA_IMAGE_FORMAT)
+OPAQUE_ALPHA = 255
+PACKED_RGBA_BITSIZE = 32
+SUPPORTED_ARRAY_BITSIZES = (24, 32)
+
+
+class MatrixFrameExporter:
+    """Export pygame surfaces as RGBA frames for ``submit_rgba``.
+
+    ``FrameExportStrategy.BUFFER`` hands the surface's pixel memory to the driver
+    through the buffer protocol when it is already tightly packed RGBA and otherwise
+    uses SDL's converter via ``pygame.image.tostring``, which outruns any NumPy
+    channel gather for XRGB surfaces. ``FrameExportStrategy.ARRAY`` fills a
+    persistent RGBA staging buffer in place through ``pygame.surfarray`` and honours
+    ``FrameArrayStrategy`` so the ``pixels3d`` view and ``array3d`` copy can be
+    benchmarked against each other on the Pi.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        export_strategy: FrameExportStrategy,
+        array_strategy: FrameArrayStrategy,
+    ) -> None:
+        self.export_strategy = export_strategy
+        self.array_strategy = array_strategy
+        self._staging: bytearray | None = None
+        self._staging_rgba: np.ndarray | None = None
+        self._staging_size: tuple[int, int] | None = None
+        self._staging_alpha_is_opaque = False
+
+    def export(self, screen: pygame.Surface) -> memoryview | bytes:
+        """Return RGBA bytes for ``screen``.
+
+        Returned views alias reusable memory and keep ``screen`` locked; release them
+        once the driver has consumed the frame and before drawing the next one.
+
+        """
+
+        if self.export_strategy == FrameExportStrategy.BUFFER:
+            if _is_packed_rgba(screen):
+                return memoryview(screen.get_buffer())
+        elif screen.get_bitsize() in SUPPORTED_ARRAY_BITSIZES:
+            return self._export_from_array(screen)
+        return pygame.image.tostring(screen, RGBA_IMAGE_FORMAT)
+
+    def _export_from_array(self, screen: pygame.Surface) -> memoryview:
+        width, height = screen.get_size()
+        staging = self._ensure_staging(width, height)
+        if self.array_strategy == FrameArrayStrategy.VIEW:
+            rgb = pygame.surfarray.pixels3d(screen)
+        else:
+            rgb = pygame.surfarray.array3d(screen)
+        staging[:, :, :3] = rgb.swapaxes(0, 1)
+        del rgb
+        has_alpha = screen.get_masks()[3] != 0
+        if has_alpha:
+            if self.array_strategy == FrameArrayStrategy.VIEW:
+                alpha = pygame.surfarray.pixels_alpha(screen)
+            else:
+                alpha = pygame.surfarray.array_alpha(screen)
+            staging[:, :, 3] = alpha.swapaxes(0, 1)
+            del alpha
+        self._update_alpha(staging, has_alpha=has_alpha)
+        return self._staging_view()
+
+    def _ensure_staging(self, width: int, height: int) -> np.ndarray:
+        if self._staging_rgba is not None and self._staging_size == (width, height):
+            return self._staging_rgba
+        self._staging = bytearray(width * height * RGBA_CHANNELS)
+        self._staging_rgba = np.frombuffer(self._staging, dtype=np.uint8).reshape(
+            height, width, RGBA_CHANNELS
+        )
+        self._staging_size = (width, height)
+        self._staging_alpha_is_opaque = False
+        return self._staging_rgba
+
+    def _update_alpha(self, staging: np.ndarray, *, has_alpha: bool) -> None:
+        if has_alpha:
+            self._staging_alpha_is_opaque = False
+            return
+        if not self._staging_alpha_is_opaque:
+            staging[:, :, 3] = OPAQUE_ALPHA
+            self._staging_alpha_is_opaque = True
+
+    def _staging_view(self) -> memoryview:
+        assert self._staging is not None
+        return memoryview(self._staging)
+
+
+def _byte_index(shift: int) -> int:
+    index = shift // 8
+    if sys.byteorder == "big":
+        return RGBA_CHANNELS - 1 - index
+    return index
+
+
+def _is_packed_rgba(screen: pygame.Surface) -> bool:
+    if screen.get_bitsize() != PACKED_RGBA_BITSIZE:
+        return False
+    if screen.get_pitch() != screen.get_width() * RGBA_CHANNELS:
+        return False
+    masks = screen.get_masks()
+    if masks[3] == 0:
+        return False
+    return all(
+        _byte_index(shift) == channel
+        for channel, shift in enumerate(screen.get_shifts())
+    )
@@ -28,7 +28,9 @@ class MatrixDriverProtocol(Protocol):
     def height(self) -> int:
         """Return the logical display height in pixels."""
 
-    def submit_rgba(self, data: bytes, width: int, height: int) -> None:
+    def submit_rgba(
+        self, data: bytes | memoryview, width: int, height: int
+    ) -> None:
         """Submit an RGBA frame to the runtime."""
 
     def clear(self) -> None:
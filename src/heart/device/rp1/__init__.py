@@ -0,0 +1 @@
+"""Helpers for driving HUB75 panels through the RP1 PIO SRAM frame buffer."""
@@ -0,0 +1,106 @@
+"""Pack RGB frames into the RP1 PIO row-pair SRAM layout."""
+
+from __future__ import annotations
+
+import mmap
+
+import numpy as np
+
+RP1_PANEL_ROWS = 64
+RP1_PANEL_COLS = 64
+RP1_WORD_BYTES = 4
+RGB_CHANNELS = 3
+
+
+def build_channel_lut(*, brightness: float = 1.0, gamma: float = 1.0) -> np.ndarray:
+    """Return a 256-entry table applying gamma and then brightness to one channel.
+
+    Rounding matches the scalar packer: gamma is rounded to ``uint8`` before
+    brightness is applied, and each step clamps to ``0..255``.
+
+    """
+
+    values = np.arange(256, dtype=np.float64)
+    if gamma != 1.0:
+        values = np.clip(
+            np.floor((values / 255.0) ** max(gamma, 0.001) * 255.0 + 0.5), 0, 255
+        )
+    return np.clip(np.floor(values * brightness + 0.5), 0, 255).astype(np.uint8)
+
+
+class Rp1FramePacker:
+    """Pack ``(rows, cols, 3)`` uint8 frames into RP1 PIO row-pair words.
+
+    Each column of a row pair holds two little-endian 32-bit words, ``0x00BBGGRR``
+    for the top-half row followed by the matching bottom-half row. Frames are
+    packed into a persistent staging buffer in one NumPy pass through a fused
+    brightness/gamma lookup table, then copied into the destination contiguously so
+    an SRAM mmap sees a single sequential write per frame.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        rows: int = RP1_PANEL_ROWS,
+        cols: int = RP1_PANEL_COLS,
+        brightness: float = 1.0,
+        gamma: float = 1.0,
+    ) -> None:
+        if rows <= 0 or rows % 2 or cols <= 0:
+            raise ValueError("rows must be positive and even; cols must be positive")
+        self.rows = rows
+        self.cols = cols
+        self.lut = build_channel_lut(brightness=brightness, gamma=gamma)
+        self._staging = np.zeros(
+            (rows // 2, cols, 2, RP1_WORD_BYTES), dtype=np.uint8
+        )
+
+    @property
+    def frame_bytes(self) -> int:
+        return self._staging.nbytes
+
+    def set_levels(self, *, brightness: float = 1.0, gamma: float = 1.0) -> None:
+        self.lut = build_channel_lut(brightness=brightness, gamma=gamma)
+
+    def pack(self, frame: np.ndarray) -> bytes:
+        return self._pack_staging(frame).tobytes()
+
+    def pack_into(
+        self,
+        frame: np.ndarray,
+        buffer: bytearray | memoryview | mmap.mmap,
+        offset: int = 0,
+    ) -> None:
+        """Write the packed ``frame`` into ``buffer`` starting at byte ``offset``.
+
+        ``buffer`` may be any writable buffer, including an ``mmap`` of RP1 SRAM.
+
+        """
+
+        target = np.frombuffer(
+            buffer, dtype=np.uint8, count=self.frame_bytes, offset=offset
+        )
+        target[:] = self._pack_staging(frame).reshape(-1)
+
+    def _pack_staging(self, frame: np.ndarray) -> np.ndarray:
+        expected_shape = (self.rows, self.cols, RGB_CHANNELS)
+        if frame.shape != expected_shape:
+            raise ValueError(f"Expected {expected_shape} frame, got {frame.shape}")
+        if frame.dtype != np.uint8:
+            raise ValueError(f"Expected uint8 frame, got {frame.dtype}")
+        row_pairs = self.rows // 2
+        staging = self._staging
+        np.take(
+            self.lut,
+            frame[:row_pairs],
+            out=staging[:, :, 0, :RGB_CHANNELS],
+            mode="clip",
+        )
+        np.take(
+            self.lut,
+            frame[row_pairs:],
+            out=staging[:, :, 1, :RGB_CHANNELS],
+            mode="clip",
+        )
+        return staging
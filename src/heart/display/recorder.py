@@ -1,11 +1,25 @@
-"""Utilities for recording :class:`~heart.runtime.game_loop.GameLoop` output."""
+"""Utilities for recording :class:`~heart.runtime.game_loop.GameLoop` output.
+
+Captures stream to a recording directory while the loop runs: frames are copied
+into fixed-size chunk buffers and a background thread writes each full chunk as
+an ``.npz`` file. Only a bounded pool of chunk buffers is ever allocated, so long
+captures do not grow memory. Converting a recording into a GIF is a separate
+offline step (:func:`export_gif`).
+"""
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+import json
+import queue
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from pathlib import Path
+from types import TracebackType
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pygame
 from PIL import Image
 
@@ -14,22 +28,268 @@ if TYPE_CHECKING:  # pragma: no cover - import cycle guard
     from heart.runtime.game_loop import GameLoop
 
 DEFAULT_RECORDING_FPS = 30
+DEFAULT_CHUNK_FRAMES = 120
+DEFAULT_MAX_PENDING_CHUNKS = 2
+MANIFEST_NAME = "recording.json"
+
+
+def gif_frame_duration_ms(fps: int) -> int:
+    """Return the GIF frame duration closest to ``fps``.
+
+    GIF durations are stored in 10 ms increments, with a minimum non-zero value.
+    """
+
+    return max(int(round((1000 / fps) / 10.0) * 10), 10)
+
+
+@dataclass(frozen=True, slots=True)
+class Recording:
+    """A finished recording directory and the manifest describing it."""
+
+    directory: Path
+    fps: int
+    width: int
+    height: int
+    frame_count: int
+    chunks: tuple[str, ...]
+
+    @classmethod
+    def open(cls, directory: str | Path) -> "Recording":
+        path = Path(directory)
+        manifest = json.loads((path / MANIFEST_NAME).read_text(encoding="utf-8"))
+        return cls(
+            directory=path,
+            fps=int(manifest["fps"]),
+            width=int(manifest["width"]),
+            height=int(manifest["height"]),
+            frame_count=int(manifest["frame_count"]),
+            chunks=tuple(manifest["chunks"]),
+        )
+
+    def iter_frames(self) -> Iterator[np.ndarray]:
+        """Yield ``(height, width, 3)`` ``uint8`` frames, loading one chunk at a time."""
+
+        for chunk in self.chunks:
+            with np.load(self.directory / chunk) as data:
+                frames = data["frames"]
+            yield from frames
+
+
+class RecordingWriter:
+    """Append frames to a recording directory without holding the capture in memory.
+
+    :meth:`append` copies a frame into the current chunk buffer. Full chunks are
+    handed to a writer thread through a queue of ``max_pending_chunks`` entries;
+    if the disk falls behind, :meth:`append` blocks until a buffer is free rather
+    than allocating another. ``compress`` trades writer CPU for disk space.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        fps: int = DEFAULT_RECORDING_FPS,
+        chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+        max_pending_chunks: int = DEFAULT_MAX_PENDING_CHUNKS,
+        compress: bool = False,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError("fps must be a positive integer")
+        if chunk_frames <= 0:
+            raise ValueError("chunk_frames must be a positive integer")
+        if max_pending_chunks <= 0:
+            raise ValueError("max_pending_chunks must be a positive integer")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fps = fps
+        self.chunk_frames = chunk_frames
+        self.compress = compress
+        self.frame_count = 0
+        self._size: tuple[int, int] | None = None
+        self._chunks: list[str] = []
+        self._buffer: np.ndarray | None = None
+        self._buffer_frames = 0
+        self._pool_size = max_pending_chunks + 1
+        self._free: queue.Queue[np.ndarray] = queue.Queue()
+        self._allocated = 0
+        self._pending: queue.Queue[tuple[np.ndarray, int, Path] | None] = (
+            queue.Queue(max_pending_chunks)
+        )
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="heart-recording-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "RecordingWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def append(self, frame: np.ndarray) -> None:
+        """Copy a ``(height, width, 3)`` ``uint8`` frame into the recording."""
+
+        self._raise_writer_error()
+        if self._closed:
+            raise RuntimeError("RecordingWriter is closed")
+        if frame.ndim != 3 or frame.shape[2] != 3:
+            raise ValueError("frames must have shape (height, width, 3)")
+        size = (frame.shape[1], frame.shape[0])
+        if self._size is None:
+            self._size = size
+        elif size != self._size:
+            raise ValueError(f"frame size {size} != recording size {self._size}")
+
+        if self._buffer is None:
+            self._buffer = self._acquire_buffer()
+        self._buffer[self._buffer_frames] = frame
+        self._buffer_frames += 1
+        self.frame_count += 1
+        if self._buffer_frames == self.chunk_frames:
+            self._submit_buffer()
+
+    def close(self) -> Recording:
+        """Write the remaining frames and the manifest, then stop the writer."""
+
+        if not self._closed and self._buffer is not None and self._buffer_frames:
+            self._submit_buffer()
+        self._stop()
+        self._raise_writer_error()
+        if self._size is None:
+            raise ValueError("recording contains no frames")
+
+        width, height = self._size
+        (self.directory / MANIFEST_NAME).write_text(
+            json.dumps(
+                {
+                    "fps": self.fps,
+                    "width": width,
+                    "height": height,
+                    "frame_count": self.frame_count,
+                    "chunks": self._chunks,
+                }
+            ),
+            encoding="utf-8",
+        )
+        return Recording(
+            directory=self.directory,
+            fps=self.fps,
+            width=width,
+            height=height,
+            frame_count=self.frame_count,
+            chunks=tuple(self._chunks),
+        )
+
+    def abort(self) -> None:
+        """Stop the writer without finishing the recording or writing a manifest."""
+
+        self._buffer = None
+        self._stop()
+
+    def _stop(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._pending.put(None)
+        self._thread.join()
+        self._buffer = None
+        while not self._free.empty():
+            self._free.get_nowait()
+
+    def _acquire_buffer(self) -> np.ndarray:
+        if self._allocated < self._pool_size and self._free.empty():
+            self._allocated += 1
+            width, height = self._size
+            return np.empty((self.chunk_frames, height, width, 3), dtype=np.uint8)
+        return self._free.get()
+
+    def _submit_buffer(self) -> None:
+        name = f"chunk-{len(self._chunks):05d}.npz"
+        self._chunks.append(name)
+        self._pending.put((self._buffer, self._buffer_frames, self.directory / name))
+        self._buffer = None
+        self._buffer_frames = 0
+
+    def _run(self) -> None:
+        save = np.savez_compressed if self.compress else np.savez
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            buffer, count, path = item
+            try:
+                if self._error is None:
+                    save(path, frames=buffer[:count])
+            except Exception as exc:  # surfaced on the capture thread
+                self._error = exc
+            finally:
+                self._free.put(buffer)
+
+    def _raise_writer_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("failed to write recording chunk") from self._error
+
+
+def export_gif(recording: Recording | str | Path, output_path: str | Path) -> Path:
+    """Convert a recording directory into an animated GIF at ``output_path``."""
+
+    if not isinstance(recording, Recording):
+        recording = Recording.open(recording)
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    frames = (
+        Image.fromarray(pixels, mode="RGB") for pixels in recording.iter_frames()
+    )
+    first = next(frames)
+    rest: Iterable[Image.Image] = frames
+    if recording.frame_count == 1:
+        rest = [first.copy()]
+    first.save(
+        path,
+        save_all=True,
+        append_images=rest,
+        format="GIF",
+        duration=gif_frame_duration_ms(recording.fps),
+        loop=0,
+    )
+    return path
 
 
 class ScreenRecorder:
     """Record frames produced by a :class:`~heart.runtime.game_loop.GameLoop`.
 
     The recorder advances the provided ``GameLoop`` through a sequence of
-    renderer batches, captures the resulting screen for each step, and writes an
-    animated GIF to ``output_path``.  GIF provides a simple, dependency-light
-    container that behaves like a video when inspected during development.
+    renderer batches and captures the resulting screen for each step.
+    :meth:`record_stream` appends the captures to a recording directory as they
+    are produced; :meth:`record` does the same into a temporary directory and
+    exports an animated GIF to ``output_path``.  GIF provides a simple,
+    dependency-light container that behaves like a video when inspected during
+    development.
     """
 
-    def __init__(self, loop: "GameLoop", *, fps: int = DEFAULT_RECORDING_FPS) -> None:
+    def __init__(
+        self,
+        loop: "GameLoop",
+        *,
+        fps: int = DEFAULT_RECORDING_FPS,
+        chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+    ) -> None:
         if fps <= 0:
             raise ValueError("fps must be a positive integer")
         self._loop = loop
         self._fps = fps
+        self._chunk_frames = chunk_frames
 
     @property
     def fps(self) -> int:
@@ -55,39 +315,38 @@ class ScreenRecorder:
             Destination for the generated GIF.
         """
 
-        path = Path(output_path)
-        frames: list[Image.Image] = []
+        with tempfile.TemporaryDirectory(prefix="heart-recording-") as directory:
+            recording = self.record_stream(inputs, directory)
+            return export_gif(recording, output_path)
+
+    def record_stream(
+        self,
+        inputs: Iterable[
+            Sequence["StatefulBaseRenderer"] | list["StatefulBaseRenderer"]
+        ],
+        directory: str | Path,
+    ) -> Recording:
+        """Record each batch of ``inputs`` into the recording ``directory``.
+
+        Frames are written by a background thread as chunks fill, so memory use
+        stays bounded however many batches ``inputs`` yields.
+        """
 
         self._loop.ensure_screen_initialized()
 
-        for batch in inputs:
-            renderers = list(batch)
-            screen = self._loop.render_frame(renderers)
-            if screen is None:  # pragma: no cover - defensive guard
-                raise RuntimeError("GameLoop screen not initialized")
-
-            pixels = pygame.surfarray.array3d(screen).swapaxes(0, 1)
-            frame = Image.fromarray(pixels, mode="RGB").copy()
-            frames.append(frame)
-
-        if not frames:
-            raise ValueError("inputs must contain at least one frame")
-
-        path.parent.mkdir(parents=True, exist_ok=True)
-        # GIF durations are stored in 10 ms increments. Round to the closest
-        # representable value while keeping a minimum non-zero duration.
-        duration_ms = max(int(round((1000 / self._fps) / 10.0) * 10), 10)
-
-        if len(frames) == 1:
-            frames = [frames[0], frames[0].copy()]
-
-        first, *rest = frames
-        first.save(
-            path,
-            save_all=True,
-            append_images=rest,
-            format="GIF",
-            duration=duration_ms,
-            loop=0,
+        writer = RecordingWriter(
+            directory, fps=self._fps, chunk_frames=self._chunk_frames
         )
-        return path
+        try:
+            for batch in inputs:
+                renderers = list(batch)
+                screen = self._loop.render_frame(renderers)
+                if screen is None:  # pragma: no cover - defensive guard
+                    raise RuntimeError("GameLoop screen not initialized")
+                writer.append(pygame.surfarray.pixels3d(screen).swapaxes(0, 1))
+            if writer.frame_count == 0:
+                raise ValueError("inputs must contain at least one frame")
+            return writer.close()
+        finally:
+            # Stops the writer thread when recording fails; a no-op after close.
+            writer.abort()
@@ -10,21 +10,21 @@ import pygame
 from OpenGL.error import GLError
 from OpenGL.GL import (GL_COLOR_BUFFER_BIT, GL_COMPILE_STATUS,
                        GL_DEPTH_BUFFER_BIT, GL_FLOAT, GL_FRAGMENT_SHADER,
-                       GL_INFO_LOG_LENGTH, GL_LINK_STATUS, GL_RGBA,
-                       GL_TEXTURE0, GL_TEXTURE_2D, GL_TRIANGLE_STRIP,
-                       GL_UNSIGNED_BYTE, GL_VERTEX_SHADER, glActiveTexture,
-                       glAttachShader, glBindAttribLocation, glBindTexture,
-                       glClear, glCompileShader, glCreateProgram,
-                       glCreateShader, glDeleteProgram, glDeleteShader,
-                       glDrawArrays, glEnableVertexAttribArray,
+                       GL_INFO_LOG_LENGTH, GL_LINK_STATUS, GL_TEXTURE0,
+                       GL_TEXTURE_2D, GL_TRIANGLE_STRIP, GL_VERTEX_SHADER,
+                       glActiveTexture, glAttachShader, glBindAttribLocation,
+                       glBindTexture, glClear, glCompileShader,
+                       glCreateProgram, glCreateShader, glDeleteProgram,
+                       glDeleteShader, glDrawArrays, glEnableVertexAttribArray,
                        glGetProgramInfoLog, glGetProgramiv, glGetShaderInfoLog,
                        glGetShaderiv, glGetUniformLocation, glLinkProgram,
-                       glReadPixels, glShaderSource, glUniform1f, glUniform1i,
-                       glUniform2fv, glUniform3fv, glUniform4fv,
-                       glUniformMatrix4fv, glUseProgram, glVertexAttribPointer,
-                       glViewport)
+                       glShaderSource, glUniform1f, glUniform1i, glUniform2fv,
+                       glUniform3fv, glUniform4fv, glUniformMatrix4fv,
+                       glUseProgram, glVertexAttribPointer, glViewport)
 
+from heart.display.shaders.readback import FramebufferReadback
 from heart.runtime.display_context import DisplayContext
+from heart.utilities.env import GlReadbackStrategy
 from heart.utilities.logging import get_logger
 
 logger = get_logger(__name__)
@@ -49,10 +49,10 @@ void main() {
 
 
 class FullscreenShaderRuntime:
-    def __init__(self) -> None:
+    def __init__(self, *, readback: GlReadbackStrategy | None = None) -> None:
         self.program: int | None = None
         self.uniform_locations: dict[str, int] = {}
-        self.pixel_buffer: np.ndarray | None = None
+        self.readback = FramebufferReadback(readback)
         self._quad_vertices = np.array(
             [-1.0, -1.0, 0.0, 1.0, -1.0, 0.0, -1.0, 1.0, 0.0, 1.0, 1.0, 0.0],
             dtype=np.float32,
@@ -138,20 +138,9 @@ class FullscreenShaderRuntime:
         window.blit(scaled_surface, (0, 0))
 
     def read_surface(self, *, size: tuple[int, int]) -> pygame.Surface:
-        width, height = size
-        self._ensure_pixel_buffer(width=width, height=height)
-        assert self.pixel_buffer is not None
-        glReadPixels(
-            0,
-            0,
-            width,
-            height,
-            GL_RGBA,
-            GL_UNSIGNED_BYTE,
-            self.pixel_buffer,
-        )
-        frame_array = np.transpose(np.flipud(self.pixel_buffer[:, :, :3]), (1, 0, 2))
-        return pygame.surfarray.make_surface(np.ascontiguousarray(frame_array))
+        """Return the framebuffer as a surface that is reused by the next read."""
+
+        return self.readback.read(size)
 
     def apply_uniforms(self, uniforms: Mapping[str, UniformValue]) -> None:
         for name, value in uniforms.items():
@@ -175,7 +164,7 @@ class FullscreenShaderRuntime:
                 )
         self.program = None
         self.uniform_locations.clear()
-        self.pixel_buffer = None
+        self.readback.reset()
 
     def _use_program(self) -> None:
         if self.program is None:
@@ -189,14 +178,6 @@ class FullscreenShaderRuntime:
                 f"OpenGL shader program {stale_program} is no longer valid"
             ) from exc
 
-    def _ensure_pixel_buffer(self, *, width: int, height: int) -> None:
-        if (
-            self.pixel_buffer is None
-            or self.pixel_buffer.shape[0] != height
-            or self.pixel_buffer.shape[1] != width
-        ):
-            self.pixel_buffer = np.zeros((height, width, 4), dtype=np.uint8)
-
     @staticmethod
     def _resolve_source(
         *,
@@ -0,0 +1,187 @@
+"""Copy OpenGL framebuffer pixels into reusable pygame surfaces."""
+
+from __future__ import annotations
+
+import ctypes
+import sys
+
+import numpy as np
+import pygame
+from OpenGL.error import GLError
+from OpenGL.GL import (GL_PIXEL_PACK_BUFFER, GL_READ_ONLY, GL_RGBA,
+                       GL_STREAM_READ, GL_UNSIGNED_BYTE, glBindBuffer,
+                       glBufferData, glDeleteBuffers, glGenBuffers,
+                       glMapBuffer, glReadPixels, glUnmapBuffer)
+
+from heart.utilities.env import Configuration, GlReadbackStrategy
+from heart.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+READBACK_CHANNELS = 4
+PIXEL_PACK_BUFFER_COUNT = 2
+
+
+class FramebufferReadback:
+    """Read the bottom-left ``size`` region of the framebuffer into a surface.
+
+    Pixels are read as RGBA and copied bottom-up straight into a persistent 32-bit
+    surface whose masks match GL's byte order, so there is no flip, transpose or
+    contiguity copy and no surface allocation per frame.
+
+    ``GlReadbackStrategy.SYNC`` reads with ``glReadPixels`` into host memory, which
+    waits for the GPU to finish the frame. ``GlReadbackStrategy.PBO`` queues each
+    read into one of two pixel-pack buffers and maps the other one, filled on the
+    previous call, so frame N is copied out while frame N+1 renders. Frames then lag
+    by one call; the first read after a resize maps its own buffer instead. PBO
+    readback falls back to SYNC if the context cannot map pixel-pack buffers.
+    :meth:`reset` drops the buffers and the fallback, for a new GL context.
+
+    The returned surface is reused by the next call and must be consumed first.
+
+    """
+
+    def __init__(self, strategy: GlReadbackStrategy | None = None) -> None:
+        self._requested_strategy = strategy
+        self.strategy = (
+            strategy
+            if strategy is not None
+            else Configuration.gl_readback_strategy()
+        )
+        self.pixel_buffer: np.ndarray | None = None
+        self._surface: pygame.Surface | None = None
+        self._pack_buffers: list[int] = []
+        self._pack_buffer_size: tuple[int, int] | None = None
+        self._pack_index = 0
+        self._pack_primed = False
+
+    def read(self, size: tuple[int, int]) -> pygame.Surface:
+        surface = self._ensure_surface(size)
+        if self.strategy == GlReadbackStrategy.PBO:
+            try:
+                self._read_pixel_pack_buffer(surface, size)
+                return surface
+            except (GLError, RuntimeError) as exc:
+                logger.warning(
+                    "Falling back to synchronous GL readback: %s", exc, exc_info=True
+                )
+                self.release()
+                self.strategy = GlReadbackStrategy.SYNC
+        self._read_pixels(surface, size)
+        return surface
+
+    def reset(self) -> None:
+        """Release every buffer and return to the configured strategy.
+
+        Buffer names belong to the context that created them, so call this when
+        the GL context may have changed; the next read allocates fresh buffers.
+        """
+
+        self.release()
+        self.strategy = (
+            self._requested_strategy
+            if self._requested_strategy is not None
+            else Configuration.gl_readback_strategy()
+        )
+
+    def release(self) -> None:
+        """Drop cached buffers, deleting pixel-pack buffers if the context allows."""
+
+        if self._pack_buffers:
+            try:
+                glDeleteBuffers(len(self._pack_buffers), self._pack_buffers)
+            except GLError:
+                logger.debug(
+                    "Skipping pixel buffer delete; OpenGL context is unavailable"
+                )
+        self._pack_buffers = []
+        self._pack_buffer_size = None
+        self._pack_index = 0
+        self._pack_primed = False
+        self.pixel_buffer = None
+        self._surface = None
+
+    def _read_pixels(self, surface: pygame.Surface, size: tuple[int, int]) -> None:
+        width, height = size
+        if self.pixel_buffer is None or self.pixel_buffer.shape[:2] != (
+            height,
+            width,
+        ):
+            self.pixel_buffer = np.zeros(
+                (height, width, READBACK_CHANNELS), dtype=np.uint8
+            )
+        glReadPixels(
+            0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE, self.pixel_buffer
+        )
+        _copy_rows_flipped(self.pixel_buffer, surface)
+
+    def _read_pixel_pack_buffer(
+        self,
+        surface: pygame.Surface,
+        size: tuple[int, int],
+    ) -> None:
+        width, height = size
+        self._ensure_pack_buffers(size)
+        queued = self._pack_buffers[self._pack_index]
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, queued)
+        try:
+            glReadPixels(0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE, 0)
+            if self._pack_primed:
+                glBindBuffer(
+                    GL_PIXEL_PACK_BUFFER, self._pack_buffers[self._pack_index ^ 1]
+                )
+            address = glMapBuffer(GL_PIXEL_PACK_BUFFER, GL_READ_ONLY)
+            if not address:
+                raise RuntimeError("glMapBuffer returned a null pixel buffer")
+            try:
+                mapped = np.ctypeslib.as_array(
+                    ctypes.cast(address, ctypes.POINTER(ctypes.c_ubyte)),
+                    shape=(height, width, READBACK_CHANNELS),
+                )
+                _copy_rows_flipped(mapped, surface)
+            finally:
+                glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        finally:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        self._pack_primed = True
+        self._pack_index ^= 1
+
+    def _ensure_pack_buffers(self, size: tuple[int, int]) -> None:
+        if self._pack_buffers and self._pack_buffer_size == size:
+            return
+        if not self._pack_buffers:
+            buffers = glGenBuffers(PIXEL_PACK_BUFFER_COUNT)
+            self._pack_buffers = [int(buffer) for buffer in np.atleast_1d(buffers)]
+        width, height = size
+        for buffer in self._pack_buffers:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, buffer)
+            glBufferData(
+                GL_PIXEL_PACK_BUFFER,
+                width * height * READBACK_CHANNELS,
+                None,
+                GL_STREAM_READ,
+            )
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        self._pack_buffer_size = size
+        self._pack_index = 0
+        self._pack_primed = False
+
+    def _ensure_surface(self, size: tuple[int, int]) -> pygame.Surface:
+        if self._surface is None or self._surface.get_size() != size:
+            self._surface = pygame.Surface(size, 0, 32, _rgbx_masks())
+        return self._surface
+
+
+def _copy_rows_flipped(pixels: np.ndarray, surface: pygame.Surface) -> None:
+    height, width = pixels.shape[:2]
+    rows = np.frombuffer(surface.get_buffer(), dtype=np.uint8).reshape(
+        height, surface.get_pitch()
+    )
+    rows[:, : width * READBACK_CHANNELS] = pixels[::-1].reshape(height, -1)
+    del rows
+
+
+def _rgbx_masks() -> tuple[int, int, int, int]:
+    if sys.byteorder == "little":
+        return (0x000000FF, 0x0000FF00, 0x00FF0000, 0)
+    return (0xFF000000, 0x00FF0000, 0x0000FF00, 0)
@@ -5,6 +5,7 @@ os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
 import typer
 
 from heart.cli.commands.bench_device import bench_device_command
+from heart.cli.commands.build_hsv_tables import build_hsv_tables_command
 from heart.cli.commands.flowtoy import app as flowtoy_app
 from heart.cli.commands.rubiks_connected_x import app as rubiks_connected_x_app
 from heart.cli.commands.run import run_command
@@ -19,6 +20,7 @@ def _build_full_app() -> typer.Typer:
     app.command(name="run-beats")(run_beats_command)
     app.command(name="update-driver")(update_driver_command)
     app.command(name="bench-device")(bench_device_command)
+    app.command(name="build-hsv-tables")(build_hsv_tables_command)
     app.add_typer(flowtoy_app, name="flowtoy")
     app.add_typer(rubiks_connected_x_app, name="rubiks-connected-x")
     return app
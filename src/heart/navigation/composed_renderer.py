@@ -124,7 +124,7 @@ class ComposedRenderer(StatefulBaseRenderer[ComposedRendererState]):
         peripheral_manager: PeripheralManager,
         orientation: Orientation,
     ) -> pygame.Surface | None:
-        surfaces: list[pygame.Surface] = []
+        layers: list[tuple[pygame.Surface, DeviceDisplayMode]] = []
         for renderer in renderers:
             try:
                 surface = cls._render_renderer(
@@ -138,8 +138,8 @@ class ComposedRenderer(StatefulBaseRenderer[ComposedRendererState]):
                 if Configuration.render_crash_on_error():
                     raise
                 continue
-            surfaces.append(surface)
-        return cls._merge_surfaces(surfaces)
+            layers.append((surface, renderer.device_display_mode))
+        return cls._merge_layers(layers, window=window, orientation=orientation)
 
     @staticmethod
     def _render_renderer(
@@ -165,62 +165,67 @@ class ComposedRenderer(StatefulBaseRenderer[ComposedRendererState]):
             orientation=orientation,
         )
         assert scratch_window.screen is not None
-        return ComposedRenderer._postprocess_surface(
-            screen=scratch_window.screen,
-            orientation=orientation,
-            display_mode=renderer.device_display_mode,
-        )
-
-    @staticmethod
-    def _merge_surfaces(surfaces: Sequence[pygame.Surface]) -> pygame.Surface | None:
-        if not surfaces:
-            return None
-        if len(surfaces) == 1:
-            return surfaces[0]
-        base = pygame.Surface(surfaces[0].get_size(), pygame.SRCALPHA)
-        base.fill((0, 0, 0, 0))
-        for surface in surfaces:
-            base.blit(surface, (0, 0))
-        return base
+        return scratch_window.screen
 
     @staticmethod
-    def _postprocess_surface(
-        screen: pygame.Surface,
+    def _merge_layers(
+        layers: Sequence[tuple[pygame.Surface, DeviceDisplayMode]],
         *,
+        window: DisplayContext,
         orientation: Orientation,
-        display_mode: DeviceDisplayMode,
-    ) -> pygame.Surface:
-        if display_mode != DeviceDisplayMode.MIRRORED:
-            return screen
+    ) -> pygame.Surface | None:
+        if not layers:
+            return None
+        first_surface, first_mode = layers[0]
+        if len(layers) == 1 and first_mode != DeviceDisplayMode.MIRRORED:
+            return first_surface
+
+        # Mirrored layers are tiled straight into the merged surface rather than
+        # into an intermediate tiled copy.
         layout: Layout = orientation.layout
-        return ComposedRenderer._tile_surface(
-            screen=screen,
-            rows=layout.rows,
-            cols=layout.columns,
-        )
+        tile_width, tile_height = first_surface.get_size()
+        if first_mode == DeviceDisplayMode.MIRRORED:
+            target_size = (tile_width * layout.columns, tile_height * layout.rows)
+        else:
+            target_size = (tile_width, tile_height)
+        if window.surface_pool is None:
+            base = pygame.Surface(target_size, pygame.SRCALPHA)
+        else:
+            base = window.surface_pool.acquire(target_size, pygame.SRCALPHA)
+        for surface, display_mode in layers:
+            if display_mode == DeviceDisplayMode.MIRRORED:
+                ComposedRenderer._tile_surface(
+                    screen=surface,
+                    target=base,
+                    rows=layout.rows,
+                    cols=layout.columns,
+                )
+            else:
+                base.blit(surface, (0, 0))
+        return base
 
     @staticmethod
     def _tile_surface(
         screen: pygame.Surface,
         *,
+        target: pygame.Surface,
         rows: int,
         cols: int,
-    ) -> pygame.Surface:
+    ) -> None:
         tile_width, tile_height = screen.get_size()
-        target_size = (tile_width * cols, tile_height * rows)
-        tiled_surface = pygame.Surface(target_size, pygame.SRCALPHA)
         if Configuration.render_tile_strategy() == RenderTileStrategy.BLITS:
-            positions = [
-                (col * tile_width, row * tile_height)
-                for row in range(rows)
-                for col in range(cols)
-            ]
-            tiled_surface.blits([(screen, pos) for pos in positions])
-            return tiled_surface
+            target.blits(
+                [
+                    (screen, (col * tile_width, row * tile_height))
+                    for row in range(rows)
+                    for col in range(cols)
+                ],
+                doreturn=False,
+            )
+            return
         for row in range(rows):
             for col in range(cols):
-                tiled_surface.blit(screen, (col * tile_width, row * tile_height))
-        return tiled_surface
+                target.blit(screen, (col * tile_width, row * tile_height))
 
     def _sync_device_display_mode(self) -> None:
         self.device_display_mode = self.required_display_mode(self.renderers)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -11,9 +13,7 @@ from heart.display.color import Color
 from heart.peripheral.core.manager import PeripheralManager
 from heart.renderers import StatefulBaseRenderer
 from heart.renderers.color import RenderColor
-from heart.renderers.post_processing import (EdgePostProcessor,
-                                             HueShiftPostProcessor,
-                                             SaturationPostProcessor)
+from heart.renderers.post_processing import PostProcessingChain
 from heart.renderers.slide_transition import \
     DEFAULT_GAUSSIAN_SIGMA as SLIDE_DEFAULT_GAUSSIAN_SIGMA
 from heart.renderers.slide_transition import \
@@ -22,7 +22,7 @@ from heart.renderers.slide_transition import SlideTransitionMode
 from heart.renderers.spritesheet import SpritesheetLoop
 from heart.renderers.text import TextRendering
 from heart.runtime.display_context import DisplayContext
-from heart.utilities.env import Configuration
+from heart.utilities.env import Configuration, RendererWarmupStrategy
 from heart.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -42,6 +42,7 @@ INITIALIZATION_BAR_HEIGHT_PX = 10
 INITIALIZATION_BAR_MARGIN_PX = 18
 INITIALIZATION_FONT_SIZE_PX = 24
 INITIALIZATION_TERMINAL_BAR_WIDTH = 24
+INITIALIZATION_COST_LOG_LIMIT = 10
 
 
 @dataclass
@@ -77,6 +78,12 @@ class GameModeSnapshot:
     gaussian_sigma: float
 
 
+@dataclass(frozen=True)
+class RendererInitializationCost:
+    name: str
+    duration_ms: float
+
+
 @dataclass(frozen=True)
 class GameModeInitializationContext:
     window: DisplayContext
@@ -177,6 +184,12 @@ class GameModes(StatefulBaseRenderer[GameModeState]):
         self._initialization_context: GameModeInitializationContext | None = None
         self._renderer_resolver = renderer_resolver
         self._navigation_subscription = None
+        self._warmup_strategy = Configuration.renderer_warmup_strategy()
+        self._warmup_neighbors = Configuration.renderer_warmup_neighbors()
+        self._resident_mode_budget = Configuration.renderer_resident_modes()
+        self._pending_warmup: deque[StatefulBaseRenderer] = deque()
+        self._resident_modes: OrderedDict[int, StatefulBaseRenderer] = OrderedDict()
+        self._initialization_costs: list[RendererInitializationCost] = []
 
     def _create_initial_state(
         self,
@@ -341,10 +354,20 @@ class GameModes(StatefulBaseRenderer[GameModeState]):
         )
 
     def get_renderers(self) -> list[StatefulBaseRenderer]:
+        lazy = self._warmup_strategy == RendererWarmupStrategy.LAZY
+        if lazy:
+            self._initialize_preview_titles()
         active_renderer = self.state.active_renderer()
         self._initialize_active_renderer_if_needed(active_renderer)
+        if lazy:
+            self._warm_up_next_pending_renderer()
         return active_renderer.get_renderers()
 
+    def renderer_initialization_costs(
+        self,
+    ) -> tuple[RendererInitializationCost, ...]:
+        return tuple(self._initialization_costs)
+
     def get_post_processors(self) -> list[StatefulBaseRenderer]:
         return list(self.state.post_processors)
 
@@ -370,6 +393,8 @@ class GameModes(StatefulBaseRenderer[GameModeState]):
             self.state._active_mode_index % len(self.state.entries)
         )
         self._initialize_active_renderer_if_needed(self._active_mode_entry().renderer)
+        if self._warmup_strategy == RendererWarmupStrategy.LAZY:
+            self._mark_mode_resident(self.state.previous_mode_index)
 
     def _handle_alternate_activate(self, _event: object) -> None:
         if self.state.in_select_mode:
@@ -388,51 +413,188 @@ class GameModes(StatefulBaseRenderer[GameModeState]):
         orientation: Orientation,
     ) -> None:
         initialization_renderers = self._initialization_renderers()
+        if self._warmup_strategy == RendererWarmupStrategy.LAZY:
+            self._pending_warmup = self._deferred_title_renderers(
+                initialization_renderers
+            )
         total_renderers = len(initialization_renderers)
         self._render_initialization_progress(window, completed=0, total=total_renderers)
 
         # Renderers may have different display modes, so we need to initialize them all.
         for completed, renderer in enumerate(initialization_renderers, start=1):
-            display_ready = False
-            try:
-                with window.display_mode(renderer.device_display_mode):
-                    display_ready = True
-                    renderer.initialize(window, peripheral_manager, orientation)
-                    if self._should_reset_after_warmup(renderer):
-                        renderer.reset()
-            except Exception as exc:
-                if (
-                    not display_ready
-                    and renderer.device_display_mode == DeviceDisplayMode.OPENGL
-                    and not Configuration.render_crash_on_error()
-                ):
-                    logger.warning(
-                        "Skipping renderer %s; OpenGL display mode failed during initialization: %s",
-                        renderer.name,
-                        exc,
-                    )
-                else:
-                    logger.exception(
-                        "Failed to initialize renderer %s",
-                        renderer.name,
-                    )
-                    raise
+            self._warm_up_renderer(renderer, window, peripheral_manager, orientation)
             self._render_initialization_progress(
                 window,
                 completed=completed,
                 total=total_renderers,
             )
+        self._log_initialization_costs()
+
+    def _warm_up_renderer(
+        self,
+        renderer: StatefulBaseRenderer,
+        window: DisplayContext,
+        peripheral_manager: PeripheralManager,
+        orientation: Orientation,
+    ) -> None:
+        display_ready = False
+        try:
+            with window.display_mode(renderer.device_display_mode):
+                display_ready = True
+                self._timed_initialize(
+                    renderer, window, peripheral_manager, orientation
+                )
+                if self._should_reset_after_warmup(renderer):
+                    renderer.reset()
+        except Exception as exc:
+            if (
+                not display_ready
+                and renderer.device_display_mode == DeviceDisplayMode.OPENGL
+                and not Configuration.render_crash_on_error()
+            ):
+                logger.warning(
+                    "Skipping renderer %s; OpenGL display mode failed during initialization: %s",
+                    renderer.name,
+                    exc,
+                )
+            else:
+                logger.exception(
+                    "Failed to initialize renderer %s",
+                    renderer.name,
+                )
+                raise
+
+    def _timed_initialize(
+        self,
+        renderer: StatefulBaseRenderer,
+        window: DisplayContext,
+        peripheral_manager: PeripheralManager,
+        orientation: Orientation,
+    ) -> None:
+        start = time.perf_counter()
+        renderer.initialize(window, peripheral_manager, orientation)
+        duration_ms = (time.perf_counter() - start) * 1000.0
+        self._initialization_costs.append(
+            RendererInitializationCost(name=renderer.name, duration_ms=duration_ms)
+        )
+        logger.debug("Initialized renderer %s in %.2fms", renderer.name, duration_ms)
+
+    def _log_initialization_costs(self) -> None:
+        if not self._initialization_costs:
+            return
+        total_ms = sum(cost.duration_ms for cost in self._initialization_costs)
+        slowest = sorted(
+            self._initialization_costs,
+            key=lambda cost: cost.duration_ms,
+            reverse=True,
+        )[:INITIALIZATION_COST_LOG_LIMIT]
+        logger.info(
+            "Initialized %d renderers in %.1fms (%s warm-up); slowest: %s",
+            len(self._initialization_costs),
+            total_ms,
+            self._warmup_strategy.value,
+            ", ".join(f"{cost.name}={cost.duration_ms:.1f}ms" for cost in slowest),
+        )
 
     def _should_reset_after_warmup(self, renderer: StatefulBaseRenderer) -> bool:
         return any(entry.renderer is renderer for entry in self.state.entries)
 
     def _initialization_renderers(self) -> list[StatefulBaseRenderer]:
+        if self._warmup_strategy == RendererWarmupStrategy.LAZY:
+            # Only the titles browse can show next are needed for the first frame;
+            # gameplay renderers initialize when selected.
+            return [
+                *[
+                    self.state.entries[index].title_renderer
+                    for index in self._preview_window()
+                ],
+                *self.state.post_processors,
+            ]
         return [
             *[entry.title_renderer for entry in self.state.entries],
             *[entry.renderer for entry in self.state.entries],
             *self.state.post_processors,
         ]
 
+    def _preview_window(self) -> list[int]:
+        entry_count = len(self.state.entries)
+        if entry_count == 0:
+            return []
+        center = (self.state._active_mode_index + self.state.mode_offset) % entry_count
+        indices = [center]
+        for distance in range(1, self._warmup_neighbors + 1):
+            for index in (
+                (center + distance) % entry_count,
+                (center - distance) % entry_count,
+            ):
+                if index not in indices:
+                    indices.append(index)
+        return indices
+
+    def _deferred_title_renderers(
+        self, initialized: list[StatefulBaseRenderer]
+    ) -> deque[StatefulBaseRenderer]:
+        entry_count = len(self.state.entries)
+        center = (
+            (self.state._active_mode_index + self.state.mode_offset) % entry_count
+            if entry_count
+            else 0
+        )
+        # Warm the titles closest to the current selection first.
+        order = sorted(
+            range(entry_count),
+            key=lambda index: min(
+                (index - center) % entry_count, (center - index) % entry_count
+            ),
+        )
+        return deque(
+            self.state.entries[index].title_renderer
+            for index in order
+            if not any(
+                self.state.entries[index].title_renderer is renderer
+                for renderer in initialized
+            )
+        )
+
+    def _initialize_preview_titles(self) -> None:
+        for index in self._preview_window():
+            self._initialize_active_renderer_if_needed(
+                self.state.entries[index].title_renderer
+            )
+
+    def _warm_up_next_pending_renderer(self) -> None:
+        """Initialize one deferred title per idle browse frame."""
+
+        if not self._pending_warmup or self._initialization_context is None:
+            return
+        if not self.state.in_select_mode or self.state.sliding_transition is not None:
+            return
+        renderer = self._pending_warmup.popleft()
+        if renderer.initialized:
+            return
+        context = self._initialization_context
+        self._warm_up_renderer(
+            renderer,
+            context.window,
+            context.peripheral_manager,
+            context.orientation,
+        )
+
+    def _mark_mode_resident(self, index: int) -> None:
+        self._resident_modes[index] = self.state.entries[index].renderer
+        self._resident_modes.move_to_end(index)
+        while len(self._resident_modes) > self._resident_mode_budget:
+            evicted_index, renderer = self._resident_modes.popitem(last=False)
+            logger.info(
+                "Evicting idle renderer %s (mode %d) to stay within %d resident modes",
+                renderer.name,
+                evicted_index,
+                self._resident_mode_budget,
+            )
+            renderer.reset()
+            # Force a full rebuild on next selection so the evicted state is released.
+            renderer.initialized = False
+
     def _render_initialization_progress(
         self,
         window: DisplayContext,
@@ -535,11 +697,7 @@ class GameModes(StatefulBaseRenderer[GameModeState]):
 
     @staticmethod
     def _default_post_processors() -> list[StatefulBaseRenderer]:
-        return [
-            SaturationPostProcessor(),
-            HueShiftPostProcessor(),
-            EdgePostProcessor(),
-        ]
+        return PostProcessingChain.processors()
 
     def _initialize_active_renderer_if_needed(
         self,
@@ -549,7 +707,8 @@ class GameModes(StatefulBaseRenderer[GameModeState]):
             return
         context = self._initialization_context
         with context.window.display_mode(renderer.device_display_mode):
-            renderer.initialize(
+            self._timed_initialize(
+                renderer,
                 context.window,
                 context.peripheral_manager,
                 context.orientation,
@@ -0,0 +1,254 @@
+"""Ring-buffered FFT analysis that turns microphone samples into band spectra.
+
+The microphone callback appends mono samples to an :class:`AudioRingBuffer` and
+:class:`SpectrumAnalyzer` consumes every complete hop from it, so analysis runs at
+``samplerate / hop`` frames per second regardless of how the audio backend sizes
+its blocks. With the defaults (16 kHz, 1024-sample Hann windows, hop 256) that is
+62.5 spectra per second with a 64 ms window.
+
+Each frame reports log-spaced band energies in dB relative to a full-scale sine,
+an exponentially smoothed copy for visuals, and onset/beat flags when the
+half-wave rectified spectral flux (over all bands, or only the bands below
+``beat_max_frequency`` for beats) clears the median of the last half second by a
+multiple of its median absolute deviation. All FFT work buffers are allocated
+once per analyzer.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from heart.peripheral.input_payloads.audio import MicrophoneSpectrum
+
+DEFAULT_WINDOW_SIZE = 1024
+DEFAULT_HOP_SIZE = 256
+DEFAULT_BAND_COUNT = 16
+DEFAULT_MIN_FREQUENCY = 40.0
+DEFAULT_SMOOTHING = 0.35
+DEFAULT_FLOOR_DB = -100.0
+DEFAULT_BEAT_MAX_FREQUENCY = 200.0
+ONSET_HISTORY_FRAMES = 32
+ONSET_WARMUP_FRAMES = 4
+ONSET_SENSITIVITY = 8.0
+ONSET_MIN_FLUX_DB = 6.0
+ONSET_REFRACTORY_SECONDS = 0.1
+BEAT_REFRACTORY_SECONDS = 0.25
+
+
+class AudioRingBuffer:
+    """Fixed-size ring of mono ``float32`` samples for one writer and one reader.
+
+    :attr:`written` counts every sample ever written and only advances after the
+    samples are in place, so a reader that snapshots it never sees a half-written
+    region and needs no lock. The writer announces the span it is about to
+    overwrite first, which lets :meth:`read` detect a copy that raced with it.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._samples = np.zeros(capacity, dtype=np.float32)
+        self._written = 0
+        self._claimed = 0
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    def write(self, samples: np.ndarray) -> None:
+        total = samples.shape[0]
+        if total == 0:
+            return
+        kept = samples[-self.capacity :]
+        count = kept.shape[0]
+        self._claimed = self._written + total
+        start = (self._claimed - count) % self.capacity
+        first = min(count, self.capacity - start)
+        self._samples[start : start + first] = kept[:first]
+        self._samples[: count - first] = kept[first:]
+        self._written = self._claimed
+
+    def read(self, end: int, out: np.ndarray) -> bool:
+        """Copy the ``len(out)`` samples that precede sample index ``end``.
+
+        Returns ``False`` if any of them are not yet written or were overwritten.
+        """
+
+        count = out.shape[0]
+        start = end - count
+        if end > self._written or start < self._claimed - self.capacity:
+            return False
+        offset = start % self.capacity
+        first = min(count, self.capacity - offset)
+        out[:first] = self._samples[offset : offset + first]
+        out[first:] = self._samples[: count - first]
+        return start >= self._claimed - self.capacity
+
+
+class SpectrumAnalyzer:
+    """Compute band spectra for every ``hop`` samples written to a ring buffer."""
+
+    def __init__(
+        self,
+        *,
+        samplerate: int,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        hop: int = DEFAULT_HOP_SIZE,
+        bands: int = DEFAULT_BAND_COUNT,
+        min_frequency: float = DEFAULT_MIN_FREQUENCY,
+        max_frequency: float | None = None,
+        smoothing: float = DEFAULT_SMOOTHING,
+        floor_db: float = DEFAULT_FLOOR_DB,
+        beat_max_frequency: float = DEFAULT_BEAT_MAX_FREQUENCY,
+    ) -> None:
+        if hop <= 0 or window_size < hop:
+            raise ValueError("hop must be positive and no larger than window_size")
+        bin_count = window_size // 2 + 1
+        if bands <= 0 or bands > bin_count - 1:
+            raise ValueError("bands must be between 1 and window_size // 2")
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError("smoothing must be in (0, 1]")
+        nyquist = samplerate / 2.0
+        max_frequency = nyquist if max_frequency is None else max_frequency
+        if not 0.0 < min_frequency < max_frequency <= nyquist:
+            raise ValueError("band frequencies must satisfy 0 < min < max <= nyquist")
+
+        self.samplerate = samplerate
+        self.window_size = window_size
+        self.hop = hop
+        self.band_edges = np.geomspace(min_frequency, max_frequency, bands + 1)
+        self._smoothing = smoothing
+        self._floor_db = floor_db
+
+        frequencies = np.fft.rfftfreq(window_size, d=1.0 / samplerate)
+        starts = np.searchsorted(frequencies, self.band_edges).clip(1, bin_count - 1)
+        # Low bands can be narrower than one FFT bin; give each at least one.
+        for index in range(1, starts.shape[0]):
+            starts[index] = max(starts[index], starts[index - 1] + 1)
+        if starts[-1] > bin_count:
+            raise ValueError("too many bands for the FFT resolution")
+        self._bins_start = int(starts[0])
+        self._bins_stop = int(starts[-1])
+        self._band_offsets = (starts[:-1] - starts[0]).astype(np.intp)
+        self._beat_bands = max(
+            1, int(np.searchsorted(self.band_edges[1:], beat_max_frequency) + 1)
+        )
+
+        window = np.hanning(window_size).astype(np.float32)
+        # Scale so a full-scale sine centred on a bin reads 0 dB in its band.
+        self._power_scale = np.float32((2.0 / window.sum()) ** 2 / 1.5)
+        self._window = window
+        self._frame = np.zeros(window_size, dtype=np.float32)
+        self._bins = np.zeros(bin_count, dtype=np.complex64)
+        self._power = np.zeros(bin_count, dtype=np.float32)
+        self._bands = np.full(bands, floor_db, dtype=np.float32)
+        self._previous = np.full(bands, floor_db, dtype=np.float32)
+        self._smoothed = np.full(bands, floor_db, dtype=np.float32)
+        self._delta = np.zeros(bands, dtype=np.float32)
+        self._onset_history = np.zeros(ONSET_HISTORY_FRAMES, dtype=np.float32)
+        self._beat_history = np.zeros(ONSET_HISTORY_FRAMES, dtype=np.float32)
+        self._onset_refractory = max(
+            1, round(ONSET_REFRACTORY_SECONDS * samplerate / hop)
+        )
+        self._beat_refractory = max(1, round(BEAT_REFRACTORY_SECONDS * samplerate / hop))
+        self.reset()
+
+    def reset(self) -> None:
+        self._next_end = self.window_size
+        self._frame_index = 0
+        self._last_onset = -self._onset_refractory
+        self._last_beat = -self._beat_refractory
+        self._bands.fill(self._floor_db)
+        self._previous.fill(self._floor_db)
+        self._smoothed.fill(self._floor_db)
+        self._onset_history.fill(0.0)
+        self._beat_history.fill(0.0)
+
+    def process(self, ring: AudioRingBuffer) -> list[MicrophoneSpectrum]:
+        """Analyse every complete hop available in ``ring`` since the last call.
+
+        If the reader fell more than the ring's capacity behind, analysis resumes
+        from the newest complete window rather than replaying stale audio.
+        """
+
+        spectra: list[MicrophoneSpectrum] = []
+        written = ring.written
+        if written - self._next_end > ring.capacity - self.window_size:
+            self._next_end = written - (written - self._next_end) % self.hop
+        while self._next_end <= written:
+            if ring.read(self._next_end, self._frame):
+                spectra.append(self._analyse_frame())
+            self._next_end += self.hop
+        return spectra
+
+    def _analyse_frame(self) -> MicrophoneSpectrum:
+        np.multiply(self._frame, self._window, out=self._frame)
+        np.fft.rfft(self._frame, out=self._bins)
+        np.abs(self._bins, out=self._power)
+        np.square(self._power, out=self._power)
+        power = self._power[self._bins_start : self._bins_stop]
+        np.add.reduceat(power, self._band_offsets, out=self._bands)
+        self._bands *= self._power_scale
+        np.maximum(self._bands, np.float32(1e-30), out=self._bands)
+        np.log10(self._bands, out=self._bands)
+        self._bands *= np.float32(10.0)
+        np.maximum(self._bands, np.float32(self._floor_db), out=self._bands)
+
+        np.subtract(self._bands, self._previous, out=self._delta)
+        np.maximum(self._delta, np.float32(0.0), out=self._delta)
+        flux = float(self._delta.sum())
+        beat_flux = float(self._delta[: self._beat_bands].sum())
+        self._previous[:] = self._bands
+
+        np.subtract(self._bands, self._smoothed, out=self._delta)
+        self._delta *= np.float32(self._smoothing)
+        self._smoothed += self._delta
+
+        index = self._frame_index
+        # The first frame rises from the floor, which is not an onset and would
+        # inflate the adaptive thresholds for the next history window.
+        onset = index > 0 and self._detect(
+            flux, self._onset_history, index - self._last_onset, self._onset_refractory
+        )
+        beat = index > 0 and self._detect(
+            beat_flux, self._beat_history, index - self._last_beat, self._beat_refractory
+        )
+        if onset:
+            self._last_onset = index
+        if beat:
+            self._last_beat = index
+        self._frame_index += 1
+
+        return MicrophoneSpectrum(
+            bands=tuple(self._bands.tolist()),
+            smoothed=tuple(self._smoothed.tolist()),
+            flux=flux,
+            onset=onset,
+            beat=beat,
+            samplerate=self.samplerate,
+            timestamp=time.time(),
+        )
+
+    def _detect(
+        self,
+        flux: float,
+        history: np.ndarray,
+        frames_since: int,
+        refractory: int,
+    ) -> bool:
+        # Frame 0 never reaches here, so history slot ``index - 1`` is next.
+        slot = self._frame_index - 1
+        recent = history[: min(slot, history.shape[0])]
+        detected = False
+        if recent.shape[0] >= ONSET_WARMUP_FRAMES and frames_since >= refractory:
+            median = float(np.median(recent))
+            spread = float(np.median(np.abs(recent - median)))
+            detected = (
+                flux >= ONSET_MIN_FLUX_DB
+                and flux > median + ONSET_SENSITIVITY * spread
+            )
+        history[slot % history.shape[0]] = flux
+        return detected
@@ -2,6 +2,7 @@ from heart.peripheral.core.input.accelerometer import \
     AccelerometerController as AccelerometerController
 from heart.peripheral.core.input.accelerometer import \
     AccelerometerDebugProfile as AccelerometerDebugProfile
+from heart.peripheral.core.input.color import ColorAnalyzer as ColorAnalyzer
 from heart.peripheral.core.input.color import \
     ColorInputProfile as ColorInputProfile
 from heart.peripheral.core.input.color import ColorSnapshot as ColorSnapshot
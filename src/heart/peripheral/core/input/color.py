@@ -1,25 +1,168 @@
 from __future__ import annotations
 
 import colorsys
+import time
 from dataclasses import dataclass
 from functools import cached_property
 
+import numpy as np
 import pygame
 from manyfold import Subscribable
 
 from heart.peripheral.core.input.debug import (InputDebugNode, InputDebugStage,
                                                InputDebugTap)
+from heart.utilities.env import Configuration
 
 COLOR_SNAPSHOT_STREAM = "color.snapshot"
+DEFAULT_DOMINANT_COLORS = 4
+DEFAULT_BRIGHTNESS_PERCENTILE = 0.9
+KMEANS_ITERATIONS = 4
+# One bin per colour at ``color_kernels.QUANTIZE_BITS`` bits per channel.
+_QUANTIZED_BINS = 512
+
+RGB = tuple[int, int, int]
 
 
 @dataclass(frozen=True, slots=True)
 class ColorSnapshot:
-    average_rgb: tuple[int, int, int]
+    average_rgb: RGB
     hue: float
     saturation: float
     brightness: float
     value: float
+    # Cluster centres of the sampled colours, heaviest first, with the share
+    # of sampled pixels each one covers.
+    dominant_rgb: tuple[RGB, ...] = ()
+    dominant_weights: tuple[float, ...] = ()
+    # Luma (0-1) that the analyser's brightness percentile of samples stays at
+    # or below; unlike ``brightness`` it is not washed out by dark borders.
+    brightness_percentile: float = 0.0
+    # Average colour of each panel, row-major.
+    region_rgb: tuple[RGB, ...] = ()
+
+
+class ColorAnalyzer:
+    """Summarise frames from a strided sample, at most ``rate_hz`` times a second.
+
+    One kernel pass over every ``stride``-th pixel in each direction fills a
+    quantized colour histogram, a luma histogram and per-panel sums; the
+    snapshot's average, dominant colours, brightness percentile and region
+    averages are all read from those. Between analyses :meth:`sample` returns
+    the previous snapshot, so the subscribers of a frame share one analysis
+    instead of each averaging the whole surface.
+    """
+
+    def __init__(
+        self,
+        *,
+        stride: int = 1,
+        rate_hz: float = 0.0,
+        panel_size: tuple[int, int] = (64, 64),
+        dominant_colors: int = DEFAULT_DOMINANT_COLORS,
+        brightness_percentile: float = DEFAULT_BRIGHTNESS_PERCENTILE,
+    ) -> None:
+        if stride < 1:
+            raise ValueError("stride must be at least 1")
+        if rate_hz < 0:
+            raise ValueError("rate_hz must be non-negative")
+        if dominant_colors < 1:
+            raise ValueError("dominant_colors must be at least 1")
+        if not 0.0 <= brightness_percentile <= 1.0:
+            raise ValueError("brightness_percentile must be between 0 and 1")
+        self.stride = stride
+        self.rate_hz = rate_hz
+        self.panel_size = (max(1, panel_size[0]), max(1, panel_size[1]))
+        self.dominant_colors = dominant_colors
+        self.brightness_percentile = brightness_percentile
+        self._interval = 1.0 / rate_hz if rate_hz > 0 else 0.0
+        self._bins = np.zeros((_QUANTIZED_BINS, 4), dtype=np.int64)
+        self._luma = np.zeros(256, dtype=np.int64)
+        self._regions = np.zeros((1, 4), dtype=np.int64)
+        self._centroids = np.zeros((dominant_colors, 3))
+        self._cluster_weights = np.zeros(dominant_colors)
+        self._last_snapshot: ColorSnapshot | None = None
+        self._last_analysis = 0.0
+
+    @classmethod
+    def from_configuration(cls) -> ColorAnalyzer:
+        return cls(
+            stride=Configuration.color_analysis_stride(),
+            rate_hz=Configuration.color_analysis_rate_hz(),
+            panel_size=(Configuration.panel_columns(), Configuration.panel_rows()),
+        )
+
+    def sample(
+        self, surface: pygame.Surface, now: float | None = None
+    ) -> ColorSnapshot:
+        """Return a snapshot of ``surface``, reusing the last one while it is fresh."""
+
+        if now is None:
+            now = time.monotonic()
+        if (
+            self._last_snapshot is None
+            or now - self._last_analysis >= self._interval
+        ):
+            self._last_snapshot = self.analyze(surface)
+            self._last_analysis = now
+        return self._last_snapshot
+
+    def analyze(self, surface: pygame.Surface) -> ColorSnapshot:
+        from heart.peripheral.core.input.color_kernels import analyze_sample
+
+        width, height = surface.get_size()
+        if not width or not height:
+            return _snapshot_from_average((0, 0, 0))
+        panel_width, panel_height = self.panel_size
+        columns = max(1, width // panel_width)
+        rows = max(1, height // panel_height)
+        regions = self._region_buffer(columns * rows)
+        pixels = pygame.surfarray.pixels3d(surface)
+        try:
+            samples, clusters, luma_level = analyze_sample(
+                pixels,
+                self.stride,
+                panel_width,
+                panel_height,
+                columns,
+                rows,
+                self._bins,
+                self._luma,
+                regions,
+                self._centroids,
+                self._cluster_weights,
+                KMEANS_ITERATIONS,
+                self.brightness_percentile,
+            )
+        finally:
+            del pixels
+
+        average_rgb = _mean_rgb(regions[:, 1:].sum(axis=0).tolist(), samples)
+        region_rgb = regions[:, 1:] // np.maximum(regions[:, :1], 1)
+        centroids = self._centroids.tolist()
+        cluster_weights = self._cluster_weights.tolist()
+        order = sorted(
+            (index for index in range(clusters) if cluster_weights[index] > 0),
+            key=lambda index: -cluster_weights[index],
+        )
+        return _snapshot_from_average(
+            average_rgb,
+            dominant_rgb=tuple(
+                (
+                    round(centroids[index][0]),
+                    round(centroids[index][1]),
+                    round(centroids[index][2]),
+                )
+                for index in order
+            ),
+            dominant_weights=tuple(cluster_weights[index] / samples for index in order),
+            brightness_percentile=luma_level / 255.0,
+            region_rgb=tuple(map(tuple, region_rgb.tolist())),
+        )
+
+    def _region_buffer(self, count: int) -> np.ndarray:
+        if self._regions.shape[0] != count:
+            self._regions = np.zeros((count, 4), dtype=np.int64)
+        return self._regions
 
 
 class ColorInputProfile:
@@ -30,9 +173,13 @@ class ColorInputProfile:
         *,
         final_frames: Subscribable[pygame.Surface],
         debug_tap: InputDebugTap,
+        analyzer: ColorAnalyzer | None = None,
     ) -> None:
         self._final_frames = final_frames
         self._debug_tap = debug_tap
+        self._analyzer = (
+            analyzer if analyzer is not None else ColorAnalyzer.from_configuration()
+        )
 
     def average_rgb(self) -> Subscribable[tuple[int, int, int]]:
         return self.snapshot().map(lambda snapshot: snapshot.average_rgb)
@@ -49,9 +196,18 @@ class ColorInputProfile:
     def value(self) -> Subscribable[float]:
         return self.snapshot().map(lambda snapshot: snapshot.value)
 
+    def dominant_rgb(self) -> Subscribable[tuple[RGB, ...]]:
+        return self.snapshot().map(lambda snapshot: snapshot.dominant_rgb)
+
+    def brightness_percentile(self) -> Subscribable[float]:
+        return self.snapshot().map(lambda snapshot: snapshot.brightness_percentile)
+
+    def region_rgb(self) -> Subscribable[tuple[RGB, ...]]:
+        return self.snapshot().map(lambda snapshot: snapshot.region_rgb)
+
     @cached_property
     def _snapshot_stream(self) -> Subscribable[ColorSnapshot]:
-        snapshots = self._final_frames.map(_surface_color_snapshot)
+        snapshots = self._final_frames.map(self._analyzer.sample)
         return InputDebugNode(
             tap=self._debug_tap,
             stage=InputDebugStage.VIEW,
@@ -64,16 +220,25 @@ class ColorInputProfile:
         return self._snapshot_stream
 
 
-def _surface_color_snapshot(surface: pygame.Surface) -> ColorSnapshot:
-    red, green, blue, *_alpha = pygame.transform.average_color(surface)
-    average_rgb = (int(red), int(green), int(blue))
-    normalized_red = average_rgb[0] / 255.0
-    normalized_green = average_rgb[1] / 255.0
-    normalized_blue = average_rgb[2] / 255.0
+def _mean_rgb(sums: list[int], count: int) -> RGB:
+    if count == 0:
+        return (0, 0, 0)
+    red, green, blue = sums
+    return (red // count, green // count, blue // count)
+
+
+def _snapshot_from_average(
+    average_rgb: RGB,
+    *,
+    dominant_rgb: tuple[RGB, ...] = (),
+    dominant_weights: tuple[float, ...] = (),
+    brightness_percentile: float = 0.0,
+    region_rgb: tuple[RGB, ...] = (),
+) -> ColorSnapshot:
     hue, saturation, value = colorsys.rgb_to_hsv(
-        normalized_red,
-        normalized_green,
-        normalized_blue,
+        average_rgb[0] / 255.0,
+        average_rgb[1] / 255.0,
+        average_rgb[2] / 255.0,
     )
     return ColorSnapshot(
         average_rgb=average_rgb,
@@ -81,4 +246,8 @@ def _surface_color_snapshot(surface: pygame.Surface) -> ColorSnapshot:
         saturation=saturation,
         brightness=value,
         value=value,
+        dominant_rgb=dominant_rgb,
+        dominant_weights=dominant_weights,
+        brightness_percentile=brightness_percentile,
+        region_rgb=region_rgb,
     )
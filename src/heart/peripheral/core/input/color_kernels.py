@@ -0,0 +1,187 @@
+"""Numba kernels behind :class:`heart.peripheral.core.input.color.ColorAnalyzer`.
+
+Imported on the first analysed frame so building the input graph does not
+load numba.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+# Bits kept per channel when colours are binned: 8 levels each, 512 bins.
+QUANTIZE_BITS = 3
+_QUANTIZE_SHIFT = 8 - QUANTIZE_BITS
+
+
+@njit(cache=True)
+def _accumulate_sample(
+    pixels, stride, panel_width, panel_height, columns, rows, bins, luma, regions
+):
+    bins[:] = 0
+    luma[:] = 0
+    regions[:] = 0
+    width, height = pixels.shape[0], pixels.shape[1]
+    for y in range(0, height, stride):
+        region_row = min(y // panel_height, rows - 1) * columns
+        for column in range(columns):
+            # First sampled x inside this panel; the last panel takes any
+            # columns left over when the width is not a multiple of panels.
+            start = -(-column * panel_width // stride) * stride
+            stop = width if column == columns - 1 else (column + 1) * panel_width
+            count = 0
+            red_sum = 0
+            green_sum = 0
+            blue_sum = 0
+            for x in range(start, stop, stride):
+                red = np.int64(pixels[x, y, 0])
+                green = np.int64(pixels[x, y, 1])
+                blue = np.int64(pixels[x, y, 2])
+                key = (
+                    ((red >> _QUANTIZE_SHIFT) << (2 * QUANTIZE_BITS))
+                    | ((green >> _QUANTIZE_SHIFT) << QUANTIZE_BITS)
+                    | (blue >> _QUANTIZE_SHIFT)
+                )
+                bins[key, 0] += 1
+                bins[key, 1] += red
+                bins[key, 2] += green
+                bins[key, 3] += blue
+                luma[(77 * red + 150 * green + 29 * blue) >> 8] += 1
+                count += 1
+                red_sum += red
+                green_sum += green
+                blue_sum += blue
+            region = region_row + column
+            regions[region, 0] += count
+            regions[region, 1] += red_sum
+            regions[region, 2] += green_sum
+            regions[region, 3] += blue_sum
+
+
+@njit(cache=True)
+def _seed_centroids(bins, centroids):
+    """Seed ``centroids`` from the heaviest bins' mean colours; return how many."""
+
+    taken = np.zeros(bins.shape[0], dtype=np.bool_)
+    for cluster in range(centroids.shape[0]):
+        heaviest = -1
+        for key in range(bins.shape[0]):
+            # Strict comparison keeps the lowest key on ties, so seeds are stable.
+            if not taken[key] and bins[key, 0] > 0:
+                if heaviest < 0 or bins[key, 0] > bins[heaviest, 0]:
+                    heaviest = key
+        if heaviest < 0:
+            return cluster
+        taken[heaviest] = True
+        for channel in range(3):
+            centroids[cluster, channel] = (
+                bins[heaviest, channel + 1] / bins[heaviest, 0]
+            )
+    return centroids.shape[0]
+
+
+@njit(cache=True)
+def _weighted_kmeans(bins, centroids, clusters, iterations, cluster_weights):
+    """Refine the first ``clusters`` centroids with weighted Lloyd steps over bin means.
+
+    Stops early once no centroid moves. ``cluster_weights`` receives the
+    sample count assigned to each centroid by the last step; a centroid that
+    attracts nothing keeps its position.
+    """
+
+    occupied = 0
+    keys = np.empty(bins.shape[0], dtype=np.int64)
+    means = np.empty((bins.shape[0], 3))
+    for key in range(bins.shape[0]):
+        count = bins[key, 0]
+        if count > 0:
+            keys[occupied] = key
+            for channel in range(3):
+                means[occupied, channel] = bins[key, channel + 1] / count
+            occupied += 1
+
+    sums = np.zeros((clusters, 3))
+    for _ in range(iterations):
+        sums[:] = 0.0
+        cluster_weights[:] = 0.0
+        for point in range(occupied):
+            key = keys[point]
+            red = means[point, 0]
+            green = means[point, 1]
+            blue = means[point, 2]
+            nearest = 0
+            nearest_distance = np.inf
+            for cluster in range(clusters):
+                d_red = red - centroids[cluster, 0]
+                d_green = green - centroids[cluster, 1]
+                d_blue = blue - centroids[cluster, 2]
+                distance = d_red * d_red + d_green * d_green + d_blue * d_blue
+                if distance < nearest_distance:
+                    nearest = cluster
+                    nearest_distance = distance
+            cluster_weights[nearest] += bins[key, 0]
+            sums[nearest, 0] += bins[key, 1]
+            sums[nearest, 1] += bins[key, 2]
+            sums[nearest, 2] += bins[key, 3]
+        moved = False
+        for cluster in range(clusters):
+            if cluster_weights[cluster] > 0.0:
+                for channel in range(3):
+                    centre = sums[cluster, channel] / cluster_weights[cluster]
+                    if centre != centroids[cluster, channel]:
+                        centroids[cluster, channel] = centre
+                        moved = True
+        if not moved:
+            break
+
+
+@njit(cache=True)
+def analyze_sample(
+    pixels,
+    stride,
+    panel_width,
+    panel_height,
+    columns,
+    rows,
+    bins,
+    luma,
+    regions,
+    centroids,
+    cluster_weights,
+    iterations,
+    percentile,
+):
+    """Summarise every ``stride``-th pixel of ``pixels`` (``pixels3d`` layout).
+
+    One pass fills ``bins`` (one row per quantized colour) and ``regions``
+    (one row per panel, row-major) with ``(count, red_sum, green_sum,
+    blue_sum)`` and ``luma`` with a 256-level histogram of integer Rec. 601
+    luma. The bin means are then clustered into ``centroids``, seeded from
+    the heaviest bins, with per-cluster sample counts in ``cluster_weights``.
+
+    Returns ``(samples, clusters, luma_level)``: the sample count, how many
+    centroids are in use, and the smallest luma at or below which
+    ``percentile`` of the samples fall.
+    """
+
+    _accumulate_sample(
+        pixels, stride, panel_width, panel_height, columns, rows, bins, luma, regions
+    )
+    cluster_weights[:] = 0.0
+    samples = 0
+    for key in range(bins.shape[0]):
+        samples += bins[key, 0]
+    if samples == 0:
+        return 0, 0, 0
+
+    clusters = _seed_centroids(bins, centroids)
+    _weighted_kmeans(bins, centroids, clusters, iterations, cluster_weights)
+
+    rank = max(1, int(np.ceil(percentile * samples)))
+    seen = 0
+    level = 0
+    for level in range(luma.shape[0]):
+        seen += luma[level]
+        if seen >= rank:
+            break
+    return samples, clusters, level
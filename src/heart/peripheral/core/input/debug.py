@@ -9,6 +9,7 @@ from enum import StrEnum
 from math import ceil
 from typing import Any
 
+import numpy as np
 from manyfold import CallbackObservable, Subscribable
 from manyfold.architecture import NewValues, PubSubObservable
 from manyfold.graph import FluentStream, RoutePipeline
@@ -18,6 +19,9 @@ from heart.peripheral.core.streams import GraphRouteStream
 
 DEFAULT_DEBUG_HISTORY_SIZE = 512
 DEFAULT_LATENCY_HISTORY_SIZE = 512
+DEFAULT_SAMPLE_EVERY = 1
+# Envelopes a stream may queue before it is flushed without waiting for a frame.
+MAX_PENDING_PER_STREAM = 256
 
 
 class InputDebugStage(StrEnum):
@@ -54,26 +58,76 @@ class InputLatencyStats:
     max_ms: float
 
 
+class _LatencyRing:
+    """Keep the most recent latency samples of one stream in a fixed array."""
+
+    __slots__ = ("_samples", "_next", "count")
+
+    def __init__(self, size: int) -> None:
+        self._samples = np.zeros(size, dtype=np.float64)
+        self._next = 0
+        self.count = 0
+
+    def append(self, delay_s: float) -> None:
+        self._samples[self._next] = delay_s
+        self._next = (self._next + 1) % self._samples.shape[0]
+        if self.count < self._samples.shape[0]:
+            self.count += 1
+
+    def samples(self) -> np.ndarray:
+        return self._samples[: self.count].copy()
+
+
 class InputDebugTap:
-    """Record and broadcast traced input emissions for debugging and tests."""
+    """Record and broadcast traced input emissions for debugging and tests.
+
+    While nothing observes the tap (no history, no :meth:`observable`
+    subscribers and :meth:`input_events` never requested) publishing returns
+    after one check. Otherwise every ``sample_every``-th emission of a stream
+    goes into the history immediately and into that stream's pending batch;
+    :meth:`flush`, called once per frame by the frame-tick controller, hands the
+    batches to subscribers and the input-event topic.
+    """
 
     def __init__(
         self,
         history_size: int = DEFAULT_DEBUG_HISTORY_SIZE,
         latency_history_size: int = DEFAULT_LATENCY_HISTORY_SIZE,
+        *,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
     ) -> None:
         if history_size < 0:
             raise ValueError("history_size must be greater than or equal to 0")
         if latency_history_size < 0:
             raise ValueError("latency_history_size must be greater than or equal to 0")
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
         self._history_size = history_size
         self._latency_history_size = latency_history_size
+        self._sample_every = sample_every
         self._history: deque[InputDebugEnvelope] = deque(maxlen=history_size)
-        self._latency_history: dict[str, deque[float]] = {}
+        self._latency_history: dict[str, _LatencyRing] = {}
+        self._emission_counts: dict[str, int] = {}
+        self._pending: dict[str, list[InputDebugEnvelope]] = {}
+        self._input_events_requested = False
         self._lock = threading.Lock()
         self._stream = NewValues[InputDebugEnvelope](name="heart.input.debug")
         self._input_events = input_event_topic()
 
+    @property
+    def observed(self) -> bool:
+        """Whether published emissions are recorded or delivered anywhere."""
+
+        return (
+            self._history_size > 0
+            or self._input_events_requested
+            or self._stream.subscriber_count > 0
+        )
+
+    @property
+    def records_latency(self) -> bool:
+        return self._latency_history_size > 0
+
     def publish(
         self,
         *,
@@ -83,33 +137,56 @@ class InputDebugTap:
         payload: Any,
         upstream_ids: Iterable[str] = (),
     ) -> None:
-        envelope = InputDebugEnvelope(
-            stage=stage,
-            stream_name=stream_name,
-            source_id=source_id,
-            timestamp_monotonic=time.monotonic(),
-            payload=payload,
-            upstream_ids=tuple(upstream_ids),
-        )
-        if self._history_size > 0:
-            with self._lock:
-                self._history.append(envelope)
-        self._stream.emit(envelope)
-        self._input_events.publish(
-            InputEvent.from_payload(
-                event_type=f"input.{stage.value}.{stream_name}",
-                source_id=source_id,
+        if not self.observed:
+            return
+        with self._lock:
+            emission = self._emission_counts.get(stream_name, 0)
+            self._emission_counts[stream_name] = emission + 1
+            if emission % self._sample_every:
+                return
+            envelope = InputDebugEnvelope(
+                stage=stage,
                 stream_name=stream_name,
-                stage=stage.value,
+                source_id=source_id,
+                timestamp_monotonic=time.monotonic(),
                 payload=payload,
-                timestamp_monotonic=envelope.timestamp_monotonic,
+                upstream_ids=tuple(upstream_ids),
             )
-        )
+            if self._history_size > 0:
+                self._history.append(envelope)
+            batch = self._pending.setdefault(stream_name, [])
+            batch.append(envelope)
+            overflowing = len(batch) >= MAX_PENDING_PER_STREAM
+        if overflowing:
+            self.flush()
+
+    def flush(self) -> None:
+        """Deliver pending envelopes stream by stream, each in publish order."""
+
+        with self._lock:
+            if not self._pending:
+                return
+            pending = self._pending
+            self._pending = {}
+        for batch in pending.values():
+            for envelope in batch:
+                self._stream.emit(envelope)
+                self._input_events.publish(
+                    InputEvent.from_payload(
+                        event_type=f"input.{envelope.stage.value}.{envelope.stream_name}",
+                        source_id=envelope.source_id,
+                        stream_name=envelope.stream_name,
+                        stage=envelope.stage.value,
+                        payload=envelope.payload,
+                        timestamp_monotonic=envelope.timestamp_monotonic,
+                    )
+                )
 
     def observable(self) -> Subscribable[InputDebugEnvelope]:
         return self._stream
 
     def input_events(self) -> Any:
+        self._input_events_requested = True
         return self._input_events
 
     def snapshot(self) -> tuple[InputDebugEnvelope, ...]:
@@ -120,37 +197,38 @@ class InputDebugTap:
         if self._latency_history_size == 0:
             return
         with self._lock:
-            history = self._latency_history.setdefault(
-                stream_name, deque(maxlen=self._latency_history_size)
-            )
+            history = self._latency_history.get(stream_name)
+            if history is None:
+                history = _LatencyRing(self._latency_history_size)
+                self._latency_history[stream_name] = history
             history.append(max(delay_s, 0.0))
 
     def latency_snapshot(self) -> dict[str, InputLatencyStats]:
         with self._lock:
             snapshot = {
-                stream_name: tuple(history)
+                stream_name: history.samples()
                 for stream_name, history in self._latency_history.items()
-                if history
+                if history.count
             }
         return {
-            stream_name: _latency_stats(history)
-            for stream_name, history in snapshot.items()
+            stream_name: _latency_stats(samples)
+            for stream_name, samples in snapshot.items()
         }
 
 
-def _latency_stats(history: tuple[float, ...]) -> InputLatencyStats:
-    ordered = sorted(history)
+def _latency_stats(samples: np.ndarray) -> InputLatencyStats:
+    samples.sort()
 
     def percentile(rank: float) -> float:
-        index = max(0, ceil(rank * len(ordered)) - 1)
-        return ordered[index] * 1000.0
+        index = max(0, ceil(rank * samples.shape[0]) - 1)
+        return float(samples[index]) * 1000.0
 
     return InputLatencyStats(
-        count=len(ordered),
+        count=int(samples.shape[0]),
         p50_ms=percentile(0.5),
         p95_ms=percentile(0.95),
         p99_ms=percentile(0.99),
-        max_ms=max(ordered) * 1000.0,
+        max_ms=float(samples[-1]) * 1000.0,
     )
 
 
@@ -213,14 +291,17 @@ class InputDebugNode:
         return self.observable(source)
 
     def _publish(self, value: Any) -> None:
+        if self.tap.records_latency:
+            payload_monotonic = _payload_monotonic(value)
+            if payload_monotonic is not None:
+                self.tap.record_latency(
+                    self.stream_name, time.monotonic() - payload_monotonic
+                )
+        if not self.tap.observed:
+            return
         resolved_source = (
             self.source_id(value) if callable(self.source_id) else self.source_id
         )
-        payload_monotonic = _payload_monotonic(value)
-        if payload_monotonic is not None:
-            self.tap.record_latency(
-                self.stream_name, time.monotonic() - payload_monotonic
-            )
         self.tap.publish(
             stage=self.stage,
             stream_name=self.stream_name,
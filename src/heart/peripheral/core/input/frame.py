@@ -39,9 +39,10 @@ class FrameTickController:
             fps=fps if fps > 0 else None,
         )
         self._frame_index += 1
-        self._debug_tap.record_latency(
-            "frame.tick", time.monotonic() - frame.monotonic_s
-        )
+        if self._debug_tap.records_latency:
+            self._debug_tap.record_latency(
+                "frame.tick", time.monotonic() - frame.monotonic_s
+            )
         self._debug_tap.publish(
             stage=InputDebugStage.FRAME,
             stream_name="frame.tick",
@@ -50,6 +51,8 @@ class FrameTickController:
         )
         self._stream.emit(frame)
         self._topic.publish(frame)
+        # Hand this frame's batched debug emissions to their subscribers.
+        self._debug_tap.flush()
         return frame
 
     def observable(self) -> Subscribable[FrameTick]:
@@ -142,7 +142,8 @@ class GamepadController:
         self._state = gamepad_state_topic()
 
     def input_events(self) -> Any:
-        return self._input_events
+        # Reading the topic is what makes the debug tap publish to it.
+        return self._debug_tap.input_events()
 
     def poll(self) -> tuple[GamepadSnapshotEvent, ...]:
         events = self.sample(source="runtime.input")
@@ -60,9 +60,12 @@ class InputIO:
 
     @cached_property
     def debug_tap(self) -> InputDebugTap:
+        sample_every = Configuration.input_debug_sample_every()
         if Configuration.is_debug_mode() or Configuration.stream_beats_input_debug():
-            return InputDebugTap()
-        return InputDebugTap(history_size=0, latency_history_size=0)
+            return InputDebugTap(sample_every=sample_every)
+        return InputDebugTap(
+            history_size=0, latency_history_size=0, sample_every=sample_every
+        )
 
     @cached_property
     def frame_ticks(self) -> FrameTickController:
@@ -50,6 +50,8 @@ class PeripheralInputBus:
                 return
             for peripheral in targets:
                 peripheral.handle_input(input_event)
+            if not self._debug_tap.observed:
+                return
             self._debug_tap.publish(
                 stage=InputDebugStage.LOGICAL,
                 stream_name=PERIPHERAL_INPUT_DISPATCH_STREAM,
@@ -11,16 +11,25 @@ Each input event is expected to provide a coordinate pair.  Callers can specify
 coordinates either as relative values in the ``[0.0, 1.0]`` range or in inches by
 setting ``units="inches"``.  A stylus event writes pressure values into the
 underlying grid, while an erase event clears a circular region.
+
+The grid is a ``float32`` array.  Brushes are cached boolean disc kernels keyed by
+radius in cells, and a sample that follows another of the same kind within
+``stroke_timeout`` seconds fills the segment between them, so fast pen motion
+leaves a continuous line however far apart the samples land.
 """
 
 from __future__ import annotations
 
+import math
 import threading
 import time
+from collections import deque
 from collections.abc import Iterable
 from dataclasses import asdict, dataclass
+from functools import lru_cache
 from typing import Any, Iterator, Mapping, Self
 
+import numpy as np
 from manyfold import (DetectionNode, Graph, Layer, ManagedGraphNode,
                       ManagedGraphNodeHandle, OwnerName, Plane, Schema,
                       StreamFamily, StreamName, TypedRoute, Variant, route)
@@ -111,11 +120,16 @@ class DrawingPad(Peripheral[Any]):
     polling_interval:
         Sleep duration used by :meth:`run` when idling.  The default keeps CPU
         usage negligible on single-board computers.
+    stroke_timeout:
+        Longest gap, in seconds, between two samples of the same kind that are
+        still joined into one stroke.  :meth:`end_stroke` lifts the pen early.
     """
 
     WIDTH_INCHES = 6.0
     HEIGHT_INCHES = 6.0
     DEFAULT_RESOLUTION = 48
+    DEFAULT_STROKE_TIMEOUT = 0.1
+    HISTORY_LIMIT = 256
 
     def __init__(
         self,
@@ -124,6 +138,7 @@ class DrawingPad(Peripheral[Any]):
         height_inches: float | None = None,
         resolution: int = DEFAULT_RESOLUTION,
         polling_interval: float = 0.1,
+        stroke_timeout: float = DEFAULT_STROKE_TIMEOUT,
     ) -> None:
         if resolution <= 0:
             raise ValueError("resolution must be positive")
@@ -134,10 +149,13 @@ class DrawingPad(Peripheral[Any]):
             raise ValueError("physical dimensions must be positive")
 
         self.resolution = resolution
-        self._grid = [
-            [0.0 for _ in range(self.resolution)] for _ in range(self.resolution)
-        ]
-        self._stylus_history: list[StylusSample] = []
+        self._grid = np.zeros((resolution, resolution), dtype=np.float32)
+        self._canvas = self._grid.view()
+        self._canvas.flags.writeable = False
+        self._stylus_history: deque[StylusSample] = deque(maxlen=self.HISTORY_LIMIT)
+        self._stroke_timeout = stroke_timeout
+        self._stroke_end: tuple[int, int, bool] | None = None
+        self._stroke_end_at = 0.0
         self._sample_publishers: list[tuple[Graph, TypedRoute[SensorEvent]]] = []
         self._polling_interval = polling_interval
         self._stop = threading.Event()
@@ -196,16 +214,29 @@ class DrawingPad(Peripheral[Any]):
     def clear(self) -> None:
         """Reset the drawing surface to its blank state."""
 
-        for row in self._grid:
-            for idx in range(len(row)):
-                row[idx] = 0.0
+        self._grid.fill(0.0)
         self._stylus_history.clear()
+        self._stroke_end = None
+
+    def end_stroke(self) -> None:
+        """Lift the pen so the next sample starts a new stroke."""
+
+        self._stroke_end = None
+
+    @property
+    def canvas(self) -> np.ndarray:
+        """Read-only ``(resolution, resolution)`` view of the live grid.
+
+        The view shares memory with the pad, so renderers see new strokes without
+        copying; copy it if a stable snapshot is needed.
+        """
+
+        return self._canvas
 
     def iter_rows(self) -> Iterable[Iterable[float]]:
-        """Yield the grid rows – useful for snapshots in tests."""
+        """Yield read-only views of the grid rows – useful for snapshots in tests."""
 
-        for row in self._grid:
-            yield tuple(row)
+        yield from self._canvas
 
     def last_sample(self) -> StylusSample | None:
         """Return the most recent stylus interaction, if any."""
@@ -348,13 +379,21 @@ class DrawingPad(Peripheral[Any]):
         centre_x = self._to_index(sample.x)
         centre_y = self._to_index(sample.y)
         radius_cells = max(1, int(round(sample.radius * (self.resolution - 1))))
-        affected = self._iter_indices_within_radius(centre_x, centre_y, radius_cells)
-
-        for row_idx, col_idx in affected:
-            if sample.is_erase:
-                self._grid[row_idx][col_idx] = 0.0
-            else:
-                self._grid[row_idx][col_idx] = max(0.0, min(1.0, sample.pressure))
+        value = 0.0 if sample.is_erase else max(0.0, min(1.0, sample.pressure))
+
+        now = time.monotonic()
+        previous = self._stroke_end
+        if (
+            previous is not None
+            and previous[2] == sample.is_erase
+            and now - self._stroke_end_at <= self._stroke_timeout
+            and previous[:2] != (centre_x, centre_y)
+        ):
+            self._stamp_segment(previous[:2], (centre_x, centre_y), radius_cells, value)
+        else:
+            self._stamp(centre_x, centre_y, radius_cells, value)
+        self._stroke_end = (centre_x, centre_y, sample.is_erase)
+        self._stroke_end_at = now
 
         self._stylus_history.append(sample)
         self._publish_sample(sample)
@@ -399,28 +438,71 @@ class DrawingPad(Peripheral[Any]):
     def _to_index(self, normalized: float) -> int:
         return int(round(normalized * (self.resolution - 1)))
 
-    def _iter_indices_within_radius(
-        self, centre_x: int, centre_y: int, radius_cells: int
-    ) -> Iterable[tuple[int, int]]:
-        for row_idx in range(
-            max(0, centre_y - radius_cells),
-            min(self.resolution, centre_y + radius_cells + 1),
-        ):
-            for col_idx in range(
-                max(0, centre_x - radius_cells),
-                min(self.resolution, centre_x + radius_cells + 1),
-            ):
-                if self._within_radius(
-                    centre_x, centre_y, col_idx, row_idx, radius_cells
-                ):
-                    yield (row_idx, col_idx)
-
-    @staticmethod
-    def _within_radius(
-        centre_x: int,
-        centre_y: int,
-        x: int,
-        y: int,
+    def _stamp(self, centre_x: int, centre_y: int, radius: int, value: float) -> None:
+        kernel = _brush_kernel(radius)
+        top = max(0, centre_y - radius)
+        left = max(0, centre_x - radius)
+        bottom = min(self.resolution, centre_y + radius + 1)
+        right = min(self.resolution, centre_x + radius + 1)
+        if top >= bottom or left >= right:
+            return
+        np.copyto(
+            self._grid[top:bottom, left:right],
+            value,
+            where=kernel[
+                top - centre_y + radius : bottom - centre_y + radius,
+                left - centre_x + radius : right - centre_x + radius,
+            ],
+        )
+
+    def _stamp_segment(
+        self,
+        start: tuple[int, int],
+        end: tuple[int, int],
         radius: int,
-    ) -> bool:
-        return (x - centre_x) ** 2 + (y - centre_y) ** 2 <= radius**2
+        value: float,
+    ) -> None:
+        """Stamp the brush along ``start``→``end`` with a single scattered write.
+
+        Centres are spaced at most half a radius apart, which keeps the union of
+        discs free of gaps and notches, and every kernel cell of every centre is
+        written through one fancy-indexed assignment.
+        """
+
+        length = math.hypot(end[0] - start[0], end[1] - start[1])
+        steps = max(1, math.ceil(length / max(1.0, radius / 2)))
+        t = np.linspace(0.0, 1.0, steps + 1)
+        centres_x = np.rint(start[0] + (end[0] - start[0]) * t).astype(np.intp)
+        centres_y = np.rint(start[1] + (end[1] - start[1]) * t).astype(np.intp)
+        offsets_y, offsets_x = _brush_offsets(radius)
+        rows = (centres_y[:, None] + offsets_y).ravel()
+        cols = (centres_x[:, None] + offsets_x).ravel()
+        inside = (
+            (rows >= 0)
+            & (rows < self.resolution)
+            & (cols >= 0)
+            & (cols < self.resolution)
+        )
+        self._grid[rows[inside], cols[inside]] = value
+
+
+@lru_cache(maxsize=64)
+def _brush_kernel(radius: int) -> np.ndarray:
+    """Return a read-only disc mask of ``2 * radius + 1`` cells per side."""
+
+    span = np.arange(-radius, radius + 1)
+    kernel = span[:, None] ** 2 + span[None, :] ** 2 <= radius**2
+    kernel.flags.writeable = False
+    return kernel
+
+
+@lru_cache(maxsize=64)
+def _brush_offsets(radius: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the row and column offsets of the cells set in the disc kernel."""
+
+    offsets_y, offsets_x = np.nonzero(_brush_kernel(radius))
+    offsets_y -= radius
+    offsets_x -= radius
+    offsets_y.flags.writeable = False
+    offsets_x.flags.writeable = False
+    return offsets_y, offsets_x
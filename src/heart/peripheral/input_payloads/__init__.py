@@ -1,6 +1,6 @@
 """Canonical payload helpers for peripherals emitting ``Input`` events."""
 
-from .audio import MicrophoneLevel  # noqa: F401
+from .audio import MicrophoneLevel, MicrophoneSpectrum  # noqa: F401
 from .base import InputEventPayload, _normalize_timestamp  # noqa: F401
 from .biometrics import HeartRateLifecycle, HeartRateMeasurement  # noqa: F401
 from .display import DisplayFrame, RendererFrame  # noqa: F401
@@ -37,3 +37,35 @@ class MicrophoneLevel(InputEventPayload):
             data=payload,
             timestamp=_normalize_timestamp(timestamp),
         )
+
+
+@dataclass(frozen=True, slots=True)
+class MicrophoneSpectrum(InputEventPayload):
+    """Log-spaced band energies and onset flags for one analysis window."""
+
+    bands: tuple[float, ...]
+    smoothed: tuple[float, ...]
+    flux: float
+    onset: bool
+    beat: bool
+    samplerate: int
+    timestamp: float
+
+    EVENT_TYPE: ClassVar[str] = "peripheral.microphone.spectrum"
+    event_type: str = EVENT_TYPE
+
+    def to_input(self, *, timestamp: datetime | None = None) -> Input:
+        payload = {
+            "bands": [float(value) for value in self.bands],
+            "smoothed": [float(value) for value in self.smoothed],
+            "flux": float(self.flux),
+            "onset": bool(self.onset),
+            "beat": bool(self.beat),
+            "samplerate": int(self.samplerate),
+            "timestamp": float(self.timestamp),
+        }
+        return Input(
+            event_type=self.event_type,
+            data=payload,
+            timestamp=_normalize_timestamp(timestamp),
+        )
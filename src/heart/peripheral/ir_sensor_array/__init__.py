@@ -14,6 +14,7 @@ from .layout import radial_layout as radial_layout
 from .peripheral import \
     DEFAULT_CONVERGENCE_THRESHOLD as DEFAULT_CONVERGENCE_THRESHOLD
 from .peripheral import DEFAULT_MAX_ITERATIONS as DEFAULT_MAX_ITERATIONS
+from .peripheral import DEFAULT_REFINE_THRESHOLD as DEFAULT_REFINE_THRESHOLD
 from .peripheral import DEFAULT_SOLVER_METHOD as DEFAULT_SOLVER_METHOD
 from .peripheral import DEFAULT_USE_JACOBIAN as DEFAULT_USE_JACOBIAN
 from .peripheral import IRSensorArray as IRSensorArray
@@ -101,6 +101,14 @@ class IRArrayDMAQueue:
                 return None
             return self._ready.popleft()
 
+    def pop_all(self) -> list[IRDMAPacket]:
+        """Return every ready packet at once so bursts can be solved together."""
+
+        with self._lock:
+            packets = list(self._ready)
+            self._ready.clear()
+        return packets
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Mapping, Sequence
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
 
 from heart.peripheral.core import Input, Peripheral
 from heart.utilities.logging import get_logger
 
 from .constants import SPEED_OF_LIGHT
-from .dma import IRDMAPacket, compute_crc
+from .dma import IRArrayDMAQueue, IRDMAPacket, compute_crc
 from .frames import FrameAssembler, IRFrame
 from .solver import \
     DEFAULT_CONVERGENCE_THRESHOLD as SOLVER_DEFAULT_CONVERGENCE_THRESHOLD
 from .solver import DEFAULT_MAX_ITERATIONS as SOLVER_DEFAULT_MAX_ITERATIONS
+from .solver import DEFAULT_REFINE_THRESHOLD as SOLVER_DEFAULT_REFINE_THRESHOLD
 from .solver import DEFAULT_SOLVER_METHOD as SOLVER_DEFAULT_SOLVER_METHOD
 from .solver import DEFAULT_USE_JACOBIAN as SOLVER_DEFAULT_USE_JACOBIAN
 from .solver import MultilaterationSolver
@@ -24,6 +27,7 @@ DEFAULT_SOLVER_METHOD = SOLVER_DEFAULT_SOLVER_METHOD
 DEFAULT_MAX_ITERATIONS = SOLVER_DEFAULT_MAX_ITERATIONS
 DEFAULT_CONVERGENCE_THRESHOLD = SOLVER_DEFAULT_CONVERGENCE_THRESHOLD
 DEFAULT_USE_JACOBIAN = SOLVER_DEFAULT_USE_JACOBIAN
+DEFAULT_REFINE_THRESHOLD = SOLVER_DEFAULT_REFINE_THRESHOLD
 
 
 class IRSensorArray(Peripheral[Input]):
@@ -40,6 +44,7 @@ class IRSensorArray(Peripheral[Input]):
         use_jacobian: bool = DEFAULT_USE_JACOBIAN,
         max_iterations: int = DEFAULT_MAX_ITERATIONS,
         convergence_threshold: float = DEFAULT_CONVERGENCE_THRESHOLD,
+        refine_threshold: float = DEFAULT_REFINE_THRESHOLD,
     ) -> None:
         super().__init__()
         self._assembler = FrameAssembler(sensor_count=len(sensor_positions))
@@ -50,6 +55,7 @@ class IRSensorArray(Peripheral[Input]):
             use_jacobian=use_jacobian,
             max_iterations=max_iterations,
             convergence_threshold=convergence_threshold,
+            refine_threshold=refine_threshold,
         )
         self._calibration_offsets: dict[int, float] = {}
 
@@ -60,39 +66,67 @@ class IRSensorArray(Peripheral[Input]):
     def ingest_packet(self, packet: IRDMAPacket) -> None:
         """Validate ``packet`` and emit pose events for complete frames."""
 
-        expected_crc = compute_crc(packet.samples)
-        if expected_crc != packet.crc:
-            logger.warning(
-                "Dropping packet due to CRC mismatch (expected=%s, got=%s)",
-                expected_crc,
-                packet.crc,
-            )
-            return
+        self.ingest_packets((packet,))
+
+    def ingest_packets(self, packets: Iterable[IRDMAPacket]) -> None:
+        """Validate ``packets`` and solve every frame they complete in one batch."""
+
+        frames: list[tuple[IRFrame, datetime]] = []
+        for packet in packets:
+            expected_crc = compute_crc(packet.samples)
+            if expected_crc != packet.crc:
+                logger.warning(
+                    "Dropping packet due to CRC mismatch (expected=%s, got=%s)",
+                    expected_crc,
+                    packet.crc,
+                )
+                continue
 
-        for sample in packet.samples:
-            for frame in self._assembler.add(sample):
-                self._process_frame(frame, packet.generated_at)
+            for sample in packet.samples:
+                for frame in self._assembler.add(sample):
+                    frames.append((frame, packet.generated_at))
+
+        if frames:
+            self._process_frames(frames)
+
+    def drain(self, queue: IRArrayDMAQueue) -> None:
+        """Ingest every packet ``queue`` has ready, solving the backlog together."""
+
+        self.ingest_packets(queue.pop_all())
 
     # ------------------------------------------------------------------
-    def _process_frame(self, frame: IRFrame, generated_at: datetime) -> None:
-        calibrated_times = []
-        for sample in frame.samples:
-            offset = self._calibration_offsets.get(sample.sensor_index, 0.0)
-            calibrated_times.append(sample.timestamp - offset)
-
-        position, confidence, rmse = self._solver.solve(calibrated_times)
-        payload = {
-            "frame_id": frame.frame_id,
-            "bits": frame.payload_bits,
-            "confidence": confidence,
-            "rmse": rmse,
-            "position": position.tolist(),
-            "timestamp": generated_at.isoformat(),
-        }
-
-        self.handle_input(
-            Input(
-                event_type=self.EVENT_FRAME,
-                data=payload,
+    def _process_frames(self, frames: Sequence[tuple[IRFrame, datetime]]) -> None:
+        offsets = self._calibration_offsets
+        calibrated_times = [
+            [
+                sample.timestamp - offsets.get(sample.sensor_index, 0.0)
+                for sample in frame.samples
+            ]
+            for frame, _generated_at in frames
+        ]
+
+        positions, confidences, rmses = self._solver.solve_batch(calibrated_times)
+        for (frame, generated_at), position, confidence, rmse in zip(
+            frames, positions, confidences.tolist(), rmses.tolist()
+        ):
+            if not np.all(np.isfinite(position)):
+                logger.warning(
+                    "Dropping IR frame %s because the solver did not converge",
+                    frame.frame_id,
+                )
+                continue
+            payload = {
+                "frame_id": frame.frame_id,
+                "bits": frame.payload_bits,
+                "confidence": confidence,
+                "rmse": rmse,
+                "position": position.tolist(),
+                "timestamp": generated_at.isoformat(),
+            }
+
+            self.handle_input(
+                Input(
+                    event_type=self.EVENT_FRAME,
+                    data=payload,
+                )
             )
-        )
@@ -20,6 +20,10 @@ DEFAULT_SOLVER_METHOD = "trf"
 DEFAULT_MAX_ITERATIONS = 12
 DEFAULT_CONVERGENCE_THRESHOLD = 1e-6
 DEFAULT_USE_JACOBIAN = True
+DEFAULT_REFINE_THRESHOLD = 1e-4
+
+# Metres an emission may appear to follow the first arrival because of noise.
+_CAUSALITY_TOLERANCE = 1e-3
 
 _least_squares = cast(
     LeastSquaresCallable | None,
@@ -36,7 +40,19 @@ else:
 
 
 class MultilaterationSolver:
-    """Estimate the origin of an IR burst using time-difference-of-arrival."""
+    """Estimate the origin of an IR burst using time-difference-of-arrival.
+
+    Each frame is first solved in closed form: squaring the range equations
+    ``|p - s_i| = c (t_i - t_0)`` leaves a system that is linear in the position,
+    the emission time and one auxiliary term, which a quadratic constraint then
+    pins down (Bancroft's method). The two roots are disambiguated by causality,
+    residual and distance to the previous solution. Only frames whose closed-form
+    RMSE exceeds ``refine_threshold`` metres are refined with ``least_squares``,
+    warm-started from the better of that estimate and the previous solution.
+
+    :meth:`solve_batch` runs the closed form for a whole backlog of frames in one
+    set of stacked array operations.
+    """
 
     def __init__(
         self,
@@ -47,6 +63,7 @@ class MultilaterationSolver:
         convergence_threshold: float = DEFAULT_CONVERGENCE_THRESHOLD,
         solver_method: str = DEFAULT_SOLVER_METHOD,
         use_jacobian: bool = DEFAULT_USE_JACOBIAN,
+        refine_threshold: float = DEFAULT_REFINE_THRESHOLD,
     ) -> None:
         self.sensor_positions = np.asarray(sensor_positions, dtype=float)
         if self.sensor_positions.ndim != 2 or self.sensor_positions.shape[1] != 3:
@@ -60,37 +77,159 @@ class MultilaterationSolver:
         self.convergence_threshold = convergence_threshold
         self.solver_method = solver_method
         self.use_jacobian = use_jacobian
+        self.refine_threshold = refine_threshold
+        self.refinements = 0
+        self._previous: np.ndarray | None = None
+        self._sensor_norms = np.einsum(
+            "ij,ij->i", self.sensor_positions, self.sensor_positions
+        )
 
     # ------------------------------------------------------------------
     def solve(self, arrival_times: Sequence[float]) -> tuple[np.ndarray, float, float]:
         """Return ``(position, confidence, rmse)`` for ``arrival_times``."""
 
         times = np.asarray(arrival_times, dtype=float)
-        if times.shape[0] != self.sensor_positions.shape[0]:
+        if times.shape != (self.sensor_positions.shape[0],):
             msg = "arrival_times length must match number of sensors"
             raise ValueError(msg)
+        positions, confidences, rmses = self._solve_frames(times[None, :], strict=True)
+        return positions[0], float(confidences[0]), float(rmses[0])
+
+    def solve_batch(
+        self, arrival_times: Sequence[Sequence[float]] | np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(positions, confidences, rmses)`` for an ``(F, N)`` frame batch.
+
+        A frame whose refinement fails to converge does not fail the batch: its
+        position and RMSE are NaN and its confidence is zero.
+        """
+
+        return self._solve_frames(arrival_times, strict=False)
+
+    def reset(self) -> None:
+        """Forget the previous solution so the next frame starts cold."""
+
+        self._previous = None
+
+    # ------------------------------------------------------------------
+    def _solve_frames(
+        self,
+        arrival_times: Sequence[Sequence[float]] | np.ndarray,
+        *,
+        strict: bool,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        times = np.asarray(arrival_times, dtype=float)
+        if times.ndim != 2 or times.shape[1] != self.sensor_positions.shape[0]:
+            msg = "arrival_times must be an (F, N) array with one column per sensor"
+            raise ValueError(msg)
+        if times.shape[0] == 0:
+            return np.empty((0, 3)), np.empty(0), np.empty(0)
+
+        # Work in metres relative to each frame's first arrival so absolute
+        # capture timestamps do not swamp the nanosecond differences.
+        ranges = (times - times.min(axis=1, keepdims=True)) * self.propagation_speed
+        estimates = self._closed_form(ranges)
+        residuals = self._residuals(estimates, ranges)
+        rmses = np.sqrt(np.mean(np.square(residuals), axis=1))
 
-        point = np.mean(self.sensor_positions, axis=0)
-        emission_time = (
-            float(np.min(times))
-            - np.linalg.norm(point - self.sensor_positions[0]) / self.propagation_speed
+        # NaN RMSEs from degenerate closed-form solves are refined as well.
+        failed = np.zeros(times.shape[0], dtype=bool)
+        for frame in np.flatnonzero(~(rmses <= self.refine_threshold)):
+            try:
+                estimates[frame] = self._refine(ranges[frame], estimates[frame])
+            except ValueError:
+                if strict:
+                    raise
+                failed[frame] = True
+                continue
+            refined = self._residuals(estimates[frame], ranges[frame])
+            rmses[frame] = math.sqrt(float(np.mean(np.square(refined))))
+
+        estimates[failed] = np.nan
+        rmses[failed] = np.nan
+        solved = np.flatnonzero(~failed)
+        if solved.size:
+            self._previous = estimates[solved[-1]].copy()
+        positions = estimates[:, :3]
+        confidences = np.where(
+            failed, 0.0, 1.0 / (1.0 + rmses * self.propagation_speed)
         )
+        return positions, confidences, rmses
 
-        def objective(vector: np.ndarray) -> np.ndarray:
-            candidate_point = vector[:3]
-            candidate_emission = vector[3]
-            deltas = candidate_point - self.sensor_positions
-            distances = np.linalg.norm(deltas, axis=1)
-            residuals = distances - self.propagation_speed * (
-                times - candidate_emission
+    def _closed_form(self, ranges: np.ndarray) -> np.ndarray:
+        """Return ``(F, 4)`` rows of position and emission range offset."""
+
+        frames, sensors = ranges.shape
+        # Row i: -2 s_i . p + 2 r_i e + (|p|^2 - e^2) = r_i^2 - |s_i|^2
+        system = np.empty((frames, sensors, 4))
+        system[:, :, :3] = -2.0 * self.sensor_positions
+        system[:, :, 3] = 2.0 * ranges
+        targets = np.empty((frames, sensors, 2))
+        targets[:, :, 0] = np.square(ranges) - self._sensor_norms
+        targets[:, :, 1] = 1.0
+        transposed = np.swapaxes(system, 1, 2)
+        with np.errstate(all="ignore"):
+            try:
+                solved = np.linalg.solve(transposed @ system, transposed @ targets)
+            except np.linalg.LinAlgError:
+                return np.full((frames, 4), np.nan)
+        # x(R) = u - R v must also satisfy |p|^2 - e^2 = R.
+        u, v = solved[:, :, 0], solved[:, :, 1]
+        metric = np.array([1.0, 1.0, 1.0, -1.0])
+        a = np.einsum("fi,fi->f", v * metric, v)
+        b = -2.0 * np.einsum("fi,fi->f", u * metric, v) - 1.0
+        c = np.einsum("fi,fi->f", u * metric, u)
+        with np.errstate(all="ignore"):
+            root = np.sqrt(np.maximum(b * b - 4.0 * a * c, 0.0))
+            linear = np.abs(a) < 1e-12 * np.maximum(np.abs(b), 1.0)
+            roots = np.stack(
+                (
+                    np.where(linear, -c / b, (-b + root) / (2.0 * a)),
+                    np.where(linear, -c / b, (-b - root) / (2.0 * a)),
+                ),
+                axis=1,
             )
-            return np.asarray(residuals, dtype=float)
+        candidates = u[:, None, :] - roots[:, :, None] * v[:, None, :]
+        return candidates[np.arange(frames), self._pick_root(candidates, ranges)]
+
+    def _pick_root(self, candidates: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+        """Prefer causal, low-residual roots, then the one nearest the last fix."""
+
+        with np.errstate(invalid="ignore"):
+            residuals = self._residuals(candidates, ranges[:, None, :])
+            scores = np.sqrt(np.mean(np.square(residuals), axis=2))
+        # The emission cannot follow the first arrival, whose range is zero.
+        valid = np.isfinite(scores) & (candidates[:, :, 3] <= _CAUSALITY_TOLERANCE)
+        scores = np.where(valid, scores, np.inf)
+        best = scores.min(axis=1, keepdims=True)
+        tied = np.all(scores <= 10.0 * best + 1e-9, axis=1)
+        anchor = (
+            self._previous[:3]
+            if self._previous is not None
+            else self.sensor_positions.mean(axis=0)
+        )
+        distances = np.linalg.norm(candidates[:, :, :3] - anchor, axis=2)
+        return np.where(
+            tied,
+            np.argmin(np.nan_to_num(distances, nan=np.inf), axis=1),
+            np.argmin(scores, axis=1),
+        )
+
+    def _residuals(self, estimates: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+        deltas = estimates[..., None, :3] - self.sensor_positions
+        distances = np.linalg.norm(deltas, axis=-1)
+        return distances - (ranges - estimates[..., 3:4])
+
+    def _refine(self, ranges: np.ndarray, estimate: np.ndarray) -> np.ndarray:
+        start = self._warm_start(ranges, estimate)
+
+        def objective(vector: np.ndarray) -> np.ndarray:
+            return self._residuals(vector, ranges)
 
         def jacobian(vector: np.ndarray) -> np.ndarray:
-            candidate_point = vector[:3]
-            deltas = candidate_point - self.sensor_positions
+            deltas = vector[:3] - self.sensor_positions
             distances = np.linalg.norm(deltas, axis=1)
-            jac = np.zeros((distances.shape[0], 4), dtype=float)
+            jac = np.empty((distances.shape[0], 4), dtype=float)
             with np.errstate(divide="ignore", invalid="ignore"):
                 jac[:, :3] = np.divide(
                     deltas,
@@ -98,11 +237,10 @@ class MultilaterationSolver:
                     out=np.zeros_like(deltas),
                     where=distances[:, None] != 0.0,
                 )
-            jac[:, 3] = self.propagation_speed
+            jac[:, 3] = 1.0
             return jac
 
-        start = np.concatenate([point, [emission_time]])
-        least_squares_kwargs = {
+        least_squares_kwargs: dict[str, Any] = {
             "method": self.solver_method,
             "max_nfev": self.max_iterations * 100,
             "xtol": self.convergence_threshold,
@@ -111,14 +249,31 @@ class MultilaterationSolver:
         }
         if self.use_jacobian:
             least_squares_kwargs["jac"] = jacobian
+        self.refinements += 1
         result = least_squares(objective, start, **least_squares_kwargs)
         if not result.success:
             raise ValueError(f"Solver failed to converge: {result.message}")
+        return np.asarray(result.x, dtype=float)
 
-        point = result.x[:3]
-        emission_time = result.x[3]
-        final_residuals = objective(result.x)
-
-        rmse = float(math.sqrt(np.mean(np.square(final_residuals))))
-        confidence = float(1.0 / (1.0 + rmse * self.propagation_speed))
-        return point, confidence, rmse
+    def _warm_start(self, ranges: np.ndarray, estimate: np.ndarray) -> np.ndarray:
+        candidates = [estimate]
+        if self._previous is not None:
+            previous = self._previous.copy()
+            # Re-fit the emission offset for this frame's time origin.
+            previous[3] = float(
+                np.mean(
+                    ranges
+                    - np.linalg.norm(previous[:3] - self.sensor_positions, axis=1)
+                )
+            )
+            candidates.append(previous)
+        centroid = self.sensor_positions.mean(axis=0)
+        candidates.append(
+            np.append(centroid, -np.linalg.norm(centroid - self.sensor_positions[0]))
+        )
+        scores = [
+            float(np.mean(np.square(self._residuals(candidate, ranges))))
+            for candidate in candidates
+        ]
+        scores = [score if math.isfinite(score) else math.inf for score in scores]
+        return candidates[int(np.argmin(scores))]
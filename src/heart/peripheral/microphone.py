@@ -1,4 +1,10 @@
-"""Microphone peripheral that publishes audio loudness events."""
+"""Microphone peripheral that publishes audio loudness and spectrum events.
+
+Every audio block yields one :class:`MicrophoneLevel`. The block is also appended
+to a ring buffer that :class:`~heart.peripheral.audio_spectrum.SpectrumAnalyzer`
+drains one hop at a time, so :class:`MicrophoneSpectrum` frames arrive at
+``samplerate / hop`` (62.5 Hz by default) independent of the block size.
+"""
 
 from __future__ import annotations
 
@@ -19,8 +25,11 @@ from manyfold.sensor_io import (BackoffPolicy, ManagedRunLoop, RetryPolicy,
                                 SensorEvent, StopToken, sensor_event_schema)
 from typing_extensions import override
 
+from heart.peripheral.audio_spectrum import (DEFAULT_HOP_SIZE, AudioRingBuffer,
+                                             SpectrumAnalyzer)
 from heart.peripheral.core import Peripheral, PeripheralInfo, PeripheralTag
-from heart.peripheral.input_payloads.audio import MicrophoneLevel
+from heart.peripheral.input_payloads.audio import (MicrophoneLevel,
+                                                   MicrophoneSpectrum)
 from heart.utilities.logging import get_logger
 from heart.utilities.optional_imports import optional_import
 
@@ -33,9 +42,11 @@ if (
     sd = optional_import("sounddevice", logger=logger)
 
 DEFAULT_SAMPLE_RATE = 16_000
-DEFAULT_BLOCK_DURATION_SECONDS = 0.1
+DEFAULT_BLOCK_DURATION_SECONDS = DEFAULT_HOP_SIZE / DEFAULT_SAMPLE_RATE
 DEFAULT_CHANNELS = 1
 DEFAULT_RETRY_DELAY_SECONDS = 1.0
+STOP_POLL_INTERVAL_SECONDS = 0.1
+SPECTRUM_RING_WINDOWS = 8
 MICROPHONE_GRAPH_OWNER = OwnerName("heart.microphone")
 MICROPHONE_GRAPH_FAMILY = StreamFamily("peripheral")
 
@@ -52,6 +63,18 @@ def microphone_level_event_route() -> TypedRoute[SensorEvent]:
     )
 
 
+def microphone_spectrum_event_route() -> TypedRoute[SensorEvent]:
+    return route(
+        plane=Plane.Read,
+        layer=Layer.Logical,
+        owner=MICROPHONE_GRAPH_OWNER,
+        family=MICROPHONE_GRAPH_FAMILY,
+        stream=StreamName("spectrum"),
+        variant=Variant.Meta,
+        schema=sensor_event_schema("HeartMicrophoneSpectrumEvent"),
+    )
+
+
 def microphone_detection_route() -> TypedRoute[SensorEvent]:
     return route(
         plane=Plane.Read,
@@ -103,6 +126,7 @@ class Microphone(Peripheral[MicrophoneLevel]):
         block_duration: float = DEFAULT_BLOCK_DURATION_SECONDS,
         channels: int = DEFAULT_CHANNELS,
         retry_delay: float = DEFAULT_RETRY_DELAY_SECONDS,
+        spectrum_analyzer: SpectrumAnalyzer | None = None,
     ) -> None:
         super().__init__()
         self.samplerate = samplerate
@@ -111,10 +135,22 @@ class Microphone(Peripheral[MicrophoneLevel]):
         self._retry_delay = retry_delay
 
         self._latest_level: dict[str, Any] | None = None
+        self._latest_spectrum: MicrophoneSpectrum | None = None
         self._stop_token = StopToken(group="microphone")
         self._level_stream = NewValues[MicrophoneLevel](
             name="heart.peripheral.microphone.level"
         )
+        self._spectrum_stream = NewValues[MicrophoneSpectrum](
+            name="heart.peripheral.microphone.spectrum"
+        )
+        self._spectrum = spectrum_analyzer or SpectrumAnalyzer(samplerate=samplerate)
+        self._samples = AudioRingBuffer(
+            max(
+                self._spectrum.window_size * SPECTRUM_RING_WINDOWS,
+                2 * max(1, int(samplerate * block_duration)),
+            )
+        )
+        self._block_spectra: list[MicrophoneSpectrum] = []
 
     @override
     def peripheral_info(self) -> PeripheralInfo:
@@ -213,6 +249,21 @@ class Microphone(Peripheral[MicrophoneLevel]):
 
         return self._latest_level
 
+    @property
+    def latest_spectrum(self) -> MicrophoneSpectrum | None:
+        """Return the most recent spectrum frame."""
+
+        return self._latest_spectrum
+
+    @property
+    def samples(self) -> AudioRingBuffer:
+        """Ring buffer of recent mono samples, safe to read from another thread."""
+
+        return self._samples
+
+    def spectrum_stream(self) -> Subscribable[MicrophoneSpectrum]:
+        return self._spectrum_stream
+
     def _event_stream(self) -> Subscribable[MicrophoneLevel]:
         return self._level_stream
 
@@ -264,14 +315,18 @@ class Microphone(Peripheral[MicrophoneLevel]):
         graph: Graph,
         *,
         output_route: TypedRoute[SensorEvent] | None = None,
+        spectrum_output_route: TypedRoute[SensorEvent] | None = None,
         error_route: TypedRoute[BaseException] | None = None,
         retry: RetryPolicy | None = None,
         backoff: BackoffPolicy | None = None,
         start_immediately: bool = True,
     ) -> ManagedGraphNodeHandle:
-        """Install this microphone as a self-running Manyfold graph level source."""
+        """Install this microphone as a self-running Manyfold level and spectrum source."""
 
         resolved_output_route = output_route or microphone_level_event_route()
+        resolved_spectrum_route = (
+            spectrum_output_route or microphone_spectrum_event_route()
+        )
         blocksize = max(1, int(self.samplerate * self.block_duration))
 
         def _body(stop: StopToken, graph: Graph) -> None:
@@ -293,6 +348,11 @@ class Microphone(Peripheral[MicrophoneLevel]):
                     resolved_output_route,
                     self._level_to_sensor_event(level),
                 )
+                for spectrum in self._block_spectra:
+                    graph.publish(
+                        resolved_spectrum_route,
+                        self._spectrum_to_sensor_event(spectrum),
+                    )
 
             try:
                 with self._open_stream(blocksize, callback=_publish_audio_block):
@@ -310,7 +370,7 @@ class Microphone(Peripheral[MicrophoneLevel]):
         return ManagedGraphNode(
             name="heart-microphone-levels",
             body=_body,
-            output_routes=(resolved_output_route,),
+            output_routes=(resolved_output_route, resolved_spectrum_route),
             error_route=error_route or microphone_error_route(),
             retry=retry or RetryPolicy(max_attempts=1_000_000),
             backoff=backoff or BackoffPolicy.fixed(self._retry_delay),
@@ -319,7 +379,7 @@ class Microphone(Peripheral[MicrophoneLevel]):
         ).install(graph)
 
     def _wait_forever(self, stop: StopToken) -> None:
-        while not stop.wait(self.block_duration):
+        while not stop.wait(max(self.block_duration, STOP_POLL_INTERVAL_SECONDS)):
             pass
 
     def _open_stream(
@@ -355,8 +415,11 @@ class Microphone(Peripheral[MicrophoneLevel]):
             logger.exception("Failed to convert audio buffer to numpy array")
             return None
         if audio.size == 0:
+            self._block_spectra = []
             return None
-        return self._process_audio_chunk(audio, frames)
+        level = self._process_audio_chunk(audio, frames)
+        self._block_spectra = self._process_spectrum(audio)
+        return level
 
     def _process_audio_chunk(self, audio: np.ndarray, frames: int) -> MicrophoneLevel:
         """Compute loudness metrics and publish an event."""
@@ -378,6 +441,20 @@ class Microphone(Peripheral[MicrophoneLevel]):
         self._level_stream.emit(level)
         return level
 
+    def _process_spectrum(self, audio: np.ndarray) -> list[MicrophoneSpectrum]:
+        """Append the block to the sample ring and emit any completed spectra."""
+
+        channels = audio.reshape(audio.shape[0], -1)
+        self._samples.write(
+            channels[:, 0] if channels.shape[1] == 1 else channels.mean(axis=1)
+        )
+        spectra = self._spectrum.process(self._samples)
+        for spectrum in spectra:
+            self._spectrum_stream.emit(spectrum)
+        if spectra:
+            self._latest_spectrum = spectra[-1]
+        return spectra
+
     def _level_to_sensor_event(self, level: MicrophoneLevel) -> SensorEvent:
         return SensorEvent(
             event_type=level.event_type,
@@ -386,6 +463,14 @@ class Microphone(Peripheral[MicrophoneLevel]):
             identity=self.peripheral_info().to_sensor_identity(),
         )
 
+    def _spectrum_to_sensor_event(self, spectrum: MicrophoneSpectrum) -> SensorEvent:
+        return SensorEvent(
+            event_type=spectrum.event_type,
+            data=spectrum.to_input().data,
+            observed_at=spectrum.timestamp,
+            identity=self.peripheral_info().to_sensor_identity(),
+        )
+
     # ------------------------------------------------------------------
     # Context manager helpers
     # ------------------------------------------------------------------
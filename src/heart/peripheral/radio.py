@@ -32,6 +32,7 @@ DEFAULT_RADIO_RECONNECT_DELAY_SECONDS = 1.0
 DEFAULT_RADIO_READY_DELAY_SECONDS = 1.0
 DEFAULT_RADIO_IDENTIFY_TIMEOUT_SECONDS = 2.0
 DEFAULT_RADIO_IDENTIFY_ATTEMPTS = 2
+SERIAL_LINE_MAX_BYTES = 64 * 1024
 FLOWTOY_RAW_COMMAND_EVENT = "peripheral.radio.command.raw"
 FLOWTOY_SYNC_EVENT = "peripheral.radio.flowtoy.sync"
 FLOWTOY_STOP_SYNC_EVENT = "peripheral.radio.flowtoy.stop_sync"
@@ -43,6 +44,7 @@ FLOWTOY_SET_WIFI_EVENT = "peripheral.radio.flowtoy.set_wifi"
 FLOWTOY_SET_GLOBAL_CONFIG_EVENT = "peripheral.radio.flowtoy.set_global_config"
 RADIO_GRAPH_OWNER = OwnerName("heart.radio")
 RADIO_GRAPH_FAMILY = StreamFamily("peripheral")
+_PACKET_FLOAT_FIELDS = ("frequency_hz", "channel", "bitrate_kbps", "rssi_dbm")
 
 
 class PyserialUnavailableError(RuntimeError):
@@ -210,6 +212,49 @@ class SerialRadioMessage:
     packet: RawRadioPacket | None = None
 
 
+class SerialLineReader:
+    """Split newline-delimited bridge output into batches of complete lines.
+
+    Each :meth:`read_lines` call blocks in the handle's own ``read`` until at
+    least one byte arrives or its timeout expires, then drains whatever else is
+    already waiting, so a burst of packets costs one wake-up and no time is
+    spent polling an idle port. Partial lines stay in a reused ``bytearray``
+    until their newline arrives. Handles without ``read``/``in_waiting`` fall
+    back to ``readline``.
+    """
+
+    def __init__(self, handle: Any, *, max_line_bytes: int = SERIAL_LINE_MAX_BYTES):
+        self._handle = handle
+        self._max_line_bytes = max_line_bytes
+        self._buffer = bytearray()
+        self._chunked = hasattr(handle, "read") and hasattr(handle, "in_waiting")
+
+    def read_lines(self) -> list[bytes]:
+        """Return the complete lines received so far, or ``[]`` on timeout."""
+
+        handle = self._handle
+        if self._chunked:
+            chunk = handle.read(max(1, handle.in_waiting))
+            if chunk:
+                self._buffer += chunk
+                waiting = handle.in_waiting
+                if waiting:
+                    self._buffer += handle.read(waiting)
+        else:
+            self._buffer += handle.readline()
+
+        buffer = self._buffer
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            if len(buffer) > self._max_line_bytes:
+                logger.debug("Dropping %d bytes of unterminated radio data", len(buffer))
+                buffer.clear()
+            return []
+        lines = bytes(buffer[:end]).split(b"\n")
+        del buffer[: end + 1]
+        return lines
+
+
 class RadioDriver:
     """Interface consumed by :class:`RadioPeripheral`."""
 
@@ -380,14 +425,11 @@ class SerialRadioDriver(RadioDriver):
             handle.reset_input_buffer()
 
     def _drain_serial(self, handle: Any) -> Iterator[RawRadioPacket]:
+        reader = SerialLineReader(handle)
         while not self._stop_token.is_set():
-            raw = handle.readline()
-            if not raw:
-                continue
-            message = self._decode_message(raw)
-            packet = message.packet if message is not None else None
-            if packet is not None:
-                yield packet
+            for message in self._decode_lines(reader.read_lines()):
+                if message.packet is not None:
+                    yield message.packet
 
     def _read_messages_from_handle(
         self,
@@ -395,14 +437,35 @@ class SerialRadioDriver(RadioDriver):
         *,
         timeout_seconds: float,
     ) -> Iterator[SerialRadioMessage]:
+        reader = SerialLineReader(handle)
         deadline = time.monotonic() + timeout_seconds
         while time.monotonic() < deadline:
-            raw = handle.readline()
-            if not raw:
-                continue
-            message = self._decode_message(raw)
-            if message is not None:
-                yield message
+            yield from self._decode_lines(reader.read_lines())
+
+    def _decode_lines(self, lines: list[bytes]) -> list[SerialRadioMessage]:
+        """Decode a burst of lines, parsing them as one JSON array when possible."""
+
+        lines = [line for line in lines if line.strip()]
+        if not lines:
+            return []
+        if len(lines) > 1:
+            try:
+                batch = json.loads(b"[" + b",".join(lines) + b"]")
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                batch = None
+            # A line holding several comma-separated values would shift the
+            # array, so only trust the batch when it has one item per line.
+            if batch is not None and len(batch) == len(lines):
+                return [
+                    message
+                    for message in map(self._message_from_json, batch)
+                    if message is not None
+                ]
+        return [
+            message
+            for message in map(self._decode_message, lines)
+            if message is not None
+        ]
 
     def _decode_message(self, raw: bytes) -> SerialRadioMessage | None:
         text = raw.decode("utf-8", errors="ignore").strip()
@@ -414,7 +477,9 @@ class SerialRadioDriver(RadioDriver):
         except json.JSONDecodeError:
             logger.debug("Ignoring malformed radio payload: %s", text)
             return None
+        return self._message_from_json(message)
 
+    def _message_from_json(self, message: Any) -> SerialRadioMessage | None:
         if not isinstance(message, Mapping):
             logger.debug("Ignoring non-mapping radio payload: %s", message)
             return None
@@ -425,7 +490,7 @@ class SerialRadioDriver(RadioDriver):
             payload_mapping = payload
         else:
             payload_mapping = {}
-        packet = RawRadioPacket(
+        packet = self._typed_packet(payload_mapping) or RawRadioPacket(
             payload=self._extract_payload(payload_mapping.get("payload")),
             protocol=self._extract_str(payload_mapping.get("protocol")),
             frequency_hz=self._extract_float(payload_mapping.get("frequency_hz")),
@@ -444,6 +509,61 @@ class SerialRadioDriver(RadioDriver):
             packet=packet if payload_mapping else None,
         )
 
+    def _typed_packet(self, data: Mapping[str, Any]) -> RawRadioPacket | None:
+        """Build a packet directly when every field already has its schema type.
+
+        The bridge firmware always emits this shape; anything else returns
+        ``None`` and goes through the lenient ``_extract_*`` helpers instead.
+        """
+
+        protocol = data.get("protocol")
+        modulation = data.get("modulation")
+        crc_ok = data.get("crc_ok")
+        decoded = data.get("decoded")
+        metadata = data.get("metadata")
+        if (
+            (protocol is not None and type(protocol) is not str)
+            or (modulation is not None and type(modulation) is not str)
+            or (crc_ok is not None and type(crc_ok) is not bool)
+            or (decoded is not None and type(decoded) is not dict)
+            or (metadata is not None and type(metadata) is not dict)
+        ):
+            return None
+
+        floats: list[float | None] = []
+        for key in _PACKET_FLOAT_FIELDS:
+            value = data.get(key)
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    return None
+                value = float(value)
+            floats.append(value)
+
+        payload = data.get("payload")
+        if payload is None:
+            payload_bytes = b""
+        elif type(payload) is list:
+            try:
+                payload_bytes = bytes(payload)
+            except (TypeError, ValueError):
+                return None
+        else:
+            return None
+
+        frequency_hz, channel, bitrate_kbps, rssi_dbm = floats
+        return RawRadioPacket(
+            payload=payload_bytes,
+            protocol=protocol,
+            frequency_hz=frequency_hz,
+            channel=channel,
+            bitrate_kbps=bitrate_kbps,
+            modulation=modulation,
+            crc_ok=crc_ok,
+            rssi_dbm=rssi_dbm,
+            decoded=None if decoded is None else dict(decoded),
+            metadata=None if metadata is None else dict(metadata),
+        )
+
     def _extract_float(self, value: Any) -> float | None:
         if value is None:
             return None
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from functools import cached_property
 from pathlib import Path
 from typing import Callable
 
 from heart.peripheral.configuration import PeripheralConfiguration
-from heart.utilities.module_registry import discover_registry
+from heart.utilities.module_registry import LazyModuleRegistry
 
 ConfigurationFactory = Callable[[], PeripheralConfiguration]
 
@@ -16,9 +17,9 @@ class PeripheralConfigurationRegistry:
     """Discover available peripheral configuration modules."""
 
     @cached_property
-    def registry(self) -> dict[str, ConfigurationFactory]:
+    def registry(self) -> Mapping[str, ConfigurationFactory]:
         configurations_dir = Path(__file__).resolve().parent / "configurations"
-        return discover_registry(
+        return LazyModuleRegistry(
             configurations_dir,
             "heart.peripheral.configurations",
             attribute="configure",
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from heart.runtime.game_loop import GameLoop
-from heart.utilities.module_registry import discover_registry
+from heart.utilities.module_registry import LazyModuleRegistry
 
 
 class ConfigurationRegistry:
     @cached_property
-    def registry(self) -> dict[str, Callable[["GameLoop"], None]]:
+    def registry(self) -> Mapping[str, Callable[["GameLoop"], None]]:
         configurations_dir = Path(__file__).resolve().parent / "configurations"
-        return discover_registry(
+        return LazyModuleRegistry(
             configurations_dir,
             "heart.programs.configurations",
             attribute="configure",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import time
 from dataclasses import replace
 from typing import Any, Generic, TypeVar
@@ -8,6 +9,7 @@ from heart import DeviceDisplayMode
 from heart.device import Orientation
 from heart.peripheral.core.manager import PeripheralManager
 from heart.runtime.display_context import DisplayContext
+from heart.runtime.frame_profiler import get_frame_profiler
 from heart.utilities.logging import get_logger
 
 logger = get_logger(__name__)
@@ -18,6 +20,11 @@ StateT = TypeVar("StateT")
 class AtomicBaseRenderer(Generic[StateT]):
     """Base renderer that manages an immutable state snapshot."""
 
+    # Renderers whose frames are a pure function of their state snapshot set this
+    # so the game loop can skip redrawing them while the snapshot is unchanged.
+    frame_depends_only_on_state = False
+    _drawn_state: Any = None
+
     def __init__(self, *args, **kwargs) -> None:
         self.initialized = False
         self._state: StateT | None = None
@@ -42,6 +49,14 @@ class AtomicBaseRenderer(Generic[StateT]):
     def is_initialized(self) -> bool:
         return self.initialized
 
+    def frame_unchanged(self) -> bool:
+        """Return whether the next frame is known to match the last one drawn."""
+        return (
+            self.frame_depends_only_on_state
+            and self._drawn_state is not None
+            and self._drawn_state is self._state
+        )
+
     def get_renderers(self) -> list["AtomicBaseRenderer[StateT]"]:
         return [self]
 
@@ -63,14 +78,19 @@ class AtomicBaseRenderer(Generic[StateT]):
 
         start_ns = time.perf_counter_ns()
         self.real_process(window=window, orientation=orientation)
+        self._drawn_state = self._state
         duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-        logger.debug(
-            "renderer.frame",
-            extra={
-                "renderer": self.name,
-                "duration_ms": duration_ms,
-            },
-        )
+        profiler = get_frame_profiler()
+        if profiler is not None:
+            profiler.record_renderer(self.name, duration_ms)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "renderer.frame",
+                extra={
+                    "renderer": self.name,
+                    "duration_ms": duration_ms,
+                },
+            )
 
     def reset(self):
         pass
@@ -15,9 +15,9 @@ from OpenGL.GL import (GL_CLAMP_TO_EDGE, GL_COLOR_BUFFER_BIT,
                        GL_PROJECTION, GL_QUADS, GL_RGBA, GL_TEXTURE_2D,
                        GL_TEXTURE_MAG_FILTER, GL_TEXTURE_MIN_FILTER,
                        GL_TEXTURE_WRAP_S, GL_TEXTURE_WRAP_T, GL_UNSIGNED_BYTE,
-                       glBegin, glBindTexture, glClear, glDeleteTextures,
-                       glDisable, glEnable, glEnd, glGenTextures,
-                       glLoadIdentity, glMatrixMode, glOrtho, glReadPixels,
+                       glBegin, glBindTexture, glClear, glCopyTexSubImage2D,
+                       glDeleteTextures, glDisable, glEnable, glEnd,
+                       glGenTextures, glLoadIdentity, glMatrixMode, glOrtho,
                        glTexCoord2f, glTexImage2D, glTexParameteri,
                        glTexSubImage2D, glUseProgram, glVertex2f, glViewport)
 
@@ -198,7 +198,6 @@ class AudioStormScene(StatefulBaseRenderer[AudioStormState]):
         self.tiled_mode = False
         self.display_texture: int | None = None
         self.audio_texture: int | None = None
-        self.tile_pixels: np.ndarray | None = None
         self.audio_energy = np.zeros(
             (AUDIO_TEXTURE_HEIGHT, AUDIO_TEXTURE_WIDTH),
             dtype=np.float32,
@@ -599,7 +598,6 @@ class AudioStormScene(StatefulBaseRenderer[AudioStormState]):
         assert self.render_size is not None
         assert self.window_size is not None
         self._ensure_tiled_resources()
-        assert self.tile_pixels is not None
         assert self.display_texture is not None
 
         tile_width, tile_height = self.render_size
@@ -607,27 +605,8 @@ class AudioStormScene(StatefulBaseRenderer[AudioStormState]):
             uniforms=self._shader_uniforms(),
             viewport_size=self.render_size,
         )
-        glReadPixels(
-            0,
-            0,
-            tile_width,
-            tile_height,
-            GL_RGBA,
-            GL_UNSIGNED_BYTE,
-            self.tile_pixels,
-        )
         glBindTexture(GL_TEXTURE_2D, self.display_texture)
-        glTexSubImage2D(
-            GL_TEXTURE_2D,
-            0,
-            0,
-            0,
-            tile_width,
-            tile_height,
-            GL_RGBA,
-            GL_UNSIGNED_BYTE,
-            self.tile_pixels,
-        )
+        glCopyTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, 0, 0, tile_width, tile_height)
         self._render_tiled_texture()
         self.shader_runtime.read_to_surface(window, size=self.window_size)
 
@@ -655,12 +634,6 @@ class AudioStormScene(StatefulBaseRenderer[AudioStormState]):
     def _ensure_tiled_resources(self) -> None:
         assert self.render_size is not None
         width, height = self.render_size
-        if (
-            self.tile_pixels is None
-            or self.tile_pixels.shape[0] != height
-            or self.tile_pixels.shape[1] != width
-        ):
-            self.tile_pixels = np.zeros((height, width, 4), dtype=np.uint8)
         if self.display_texture is not None:
             return
         self.display_texture = glGenTextures(1)
@@ -715,7 +688,6 @@ class AudioStormScene(StatefulBaseRenderer[AudioStormState]):
             except GLError:
                 pass
         self.display_texture = None
-        self.tile_pixels = None
 
     def _reset_audio_resources(self) -> None:
         if self.audio_texture is not None:
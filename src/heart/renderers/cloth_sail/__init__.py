@@ -10,7 +10,6 @@ from heart.renderers.cloth_sail.renderer import \
 from heart.renderers.cloth_sail.renderer import glDrawArrays  # noqa: F401
 from heart.renderers.cloth_sail.renderer import \
     glEnableVertexAttribArray  # noqa: F401
-from heart.renderers.cloth_sail.renderer import glReadPixels  # noqa: F401
 from heart.renderers.cloth_sail.renderer import glUniform1f  # noqa: F401
 from heart.renderers.cloth_sail.renderer import glUniform2f  # noqa: F401
 from heart.renderers.cloth_sail.renderer import glUseProgram  # noqa: F401
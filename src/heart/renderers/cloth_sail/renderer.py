@@ -12,21 +12,20 @@ from manyfold import Subscribable
 from OpenGL.GL import (GL_ARRAY_BUFFER, GL_COLOR_BUFFER_BIT, GL_COMPILE_STATUS,
                        GL_CULL_FACE, GL_DEPTH_TEST, GL_FALSE, GL_FLOAT,
                        GL_FRAGMENT_SHADER, GL_LINK_STATUS, GL_PACK_ALIGNMENT,
-                       GL_RGB, GL_STATIC_DRAW, GL_TRIANGLE_STRIP,
-                       GL_UNSIGNED_BYTE, GL_VERTEX_SHADER, glAttachShader,
-                       glBindAttribLocation, glBindBuffer, glBufferData,
-                       glClear, glClearColor, glCompileShader, glCreateProgram,
-                       glCreateShader, glDeleteShader, glDisable,
-                       glDisableVertexAttribArray, glDrawArrays,
+                       GL_STATIC_DRAW, GL_TRIANGLE_STRIP, GL_VERTEX_SHADER,
+                       glAttachShader, glBindAttribLocation, glBindBuffer,
+                       glBufferData, glClear, glClearColor, glCompileShader,
+                       glCreateProgram, glCreateShader, glDeleteShader,
+                       glDisable, glDisableVertexAttribArray, glDrawArrays,
                        glEnableVertexAttribArray, glGenBuffers,
                        glGetProgramInfoLog, glGetProgramiv, glGetShaderInfoLog,
                        glGetShaderiv, glGetUniformLocation, glLinkProgram,
-                       glPixelStorei, glReadPixels, glShaderSource,
-                       glUniform1f, glUniform2f, glUseProgram,
-                       glVertexAttribPointer, glViewport)
+                       glPixelStorei, glShaderSource, glUniform1f, glUniform2f,
+                       glUseProgram, glVertexAttribPointer, glViewport)
 
 from heart import DeviceDisplayMode
 from heart.device import Orientation
+from heart.display.shaders.readback import FramebufferReadback
 from heart.peripheral.core.manager import PeripheralManager
 from heart.renderers import StatefulBaseRenderer
 from heart.renderers.cloth_sail.provider import ClothSailStateProvider
@@ -181,7 +180,7 @@ class ClothSailRenderer(StatefulBaseRenderer[ClothSailState]):
         self._uniform_time: Optional[int] = None
         self._uniform_resolution: Optional[int] = None
         self._uniform_wind: Optional[int] = None
-        self._pixel_buffer: Optional[np.ndarray] = None
+        self._readback = FramebufferReadback()
 
     @staticmethod
     def _get_drawable_size(window: DisplayContext) -> tuple[int, int]:
@@ -221,6 +220,9 @@ class ClothSailRenderer(StatefulBaseRenderer[ClothSailState]):
         peripheral_manager: PeripheralManager,
         orientation: Orientation,
     ) -> None:
+        # Pixel-pack buffers from an earlier GL context are stale after a display
+        # mode switch, so readback starts from fresh ones.
+        self._readback.reset()
         if self._program is None:
             vertex_shader = self._compile_shader(VERT_SHADER, GL_VERTEX_SHADER)
             fragment_shader = self._compile_shader(FRAG_SHADER, GL_FRAGMENT_SHADER)
@@ -268,6 +270,10 @@ class ClothSailRenderer(StatefulBaseRenderer[ClothSailState]):
 
         super().initialize(window, peripheral_manager, orientation)
 
+    def reset(self) -> None:
+        self._readback.reset()
+        super().reset()
+
     def state_stream(
         self, peripheral_manager: PeripheralManager
     ) -> Subscribable[ClothSailState]:
@@ -277,15 +283,6 @@ class ClothSailRenderer(StatefulBaseRenderer[ClothSailState]):
 
         return self._builder.states()
 
-    def _ensure_pixel_buffer(self, size: tuple[int, int]) -> None:
-        width, height = size
-        if (
-            self._pixel_buffer is None
-            or self._pixel_buffer.shape[0] != height
-            or self._pixel_buffer.shape[1] != width
-        ):
-            self._pixel_buffer = np.zeros((height, width, 3), dtype=np.uint8)
-
     def real_process(
         self,
         window: DisplayContext,
@@ -299,8 +296,6 @@ class ClothSailRenderer(StatefulBaseRenderer[ClothSailState]):
         if frame_width == 0 or frame_height == 0:
             return
 
-        self._ensure_pixel_buffer((frame_width, frame_height))
-
         elapsed = self.state.elapsed_seconds
 
         wind_strength = 0.7 + 0.25 * math.sin(elapsed * 0.3)
@@ -321,24 +316,10 @@ class ClothSailRenderer(StatefulBaseRenderer[ClothSailState]):
         glDrawArrays(GL_TRIANGLE_STRIP, 0, 4)
         glDisableVertexAttribArray(0)
 
-        glReadPixels(
-            0,
-            0,
-            frame_width,
-            frame_height,
-            GL_RGB,
-            GL_UNSIGNED_BYTE,
-            self._pixel_buffer,
-        )
-
-        flipped = np.flipud(self._pixel_buffer)
-        frame_array = np.transpose(flipped, (1, 0, 2))
-        frame_array = np.ascontiguousarray(frame_array)
-
+        frame_surface = self._readback.read((frame_width, frame_height))
         if (frame_width, frame_height) == (surface_width, surface_height):
-            pygame.surfarray.blit_array(window, frame_array)
+            window.blit(frame_surface, (0, 0))
         else:
-            frame_surface = pygame.surfarray.make_surface(frame_array)
             scaled_surface = pygame.transform.smoothscale(
                 frame_surface, (surface_width, surface_height)
             )
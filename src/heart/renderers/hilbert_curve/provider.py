@@ -6,7 +6,6 @@ from dataclasses import replace
 
 import numpy as np
 from manyfold import Subscribable
-from numba import njit
 
 from heart.peripheral.core.manager import PeripheralManager
 from heart.peripheral.core.providers import StateProvider
@@ -32,119 +31,6 @@ def compute_zoom_target_scale(
     return min(available_width / bbox_width, available_height / bbox_height)
 
 
-@njit
-def d2xy(n: int, d: int) -> tuple[int, int]:
-    x = 0
-    y = 0
-    t = d
-    s = 1
-    while s < n:
-        rx = t // 2 & 1
-        ry = (t ^ rx) & 1
-        if ry == 0:
-            if rx == 1:
-                x = s - 1 - x
-                y = s - 1 - y
-            temp = x
-            x = y
-            y = temp
-        x += s * rx
-        y += s * ry
-        t //= 4
-        s *= 2
-    return (x, y)
-
-
-@njit
-def hilbert_curve_points_numba(
-    order: int, width: int, height: int, xmargin: int, ymargin: int
-) -> np.ndarray:
-    n = 2**order
-    total_points = n * n
-    ymargin = ymargin or xmargin
-    draw_width = width - 2 * xmargin
-    draw_height = height - 2 * ymargin
-    draw_size = draw_width if draw_width < draw_height else draw_height
-    step = draw_size / (n - 1) if n > 1 else draw_size
-    points = np.empty((total_points, 2), dtype=np.float64)
-    for d in range(total_points):
-        x_grid, y_grid = d2xy(n, d)
-        points[d, 0] = xmargin + x_grid * step
-        points[d, 1] = ymargin + y_grid * step
-    return points
-
-
-@njit
-def resample_curve_numba(points: np.ndarray, num_samples: int) -> np.ndarray:
-    n = points.shape[0]
-    if n < 2:
-        return points
-    cumdist = np.empty(n, dtype=np.float64)
-    cumdist[0] = 0.0
-    for i in range(1, n):
-        dx = points[i, 0] - points[i - 1, 0]
-        dy = points[i, 1] - points[i - 1, 1]
-        cumdist[i] = cumdist[i - 1] + math.hypot(dx, dy)
-    total_length = cumdist[n - 1]
-    new_points = np.empty((num_samples, 2), dtype=np.float64)
-    j = 0
-    for i in range(num_samples):
-        td = i * total_length / (num_samples - 1)
-        while j < n - 1 and cumdist[j + 1] < td:
-            j += 1
-        if j >= n - 1:
-            new_points[i, 0] = points[n - 1, 0]
-            new_points[i, 1] = points[n - 1, 1]
-        else:
-            seg_length = cumdist[j + 1] - cumdist[j]
-            t_interp = 0.0
-            if seg_length != 0.0:
-                t_interp = (td - cumdist[j]) / seg_length
-            new_points[i, 0] = points[j, 0] + t_interp * (
-                points[j + 1, 0] - points[j, 0]
-            )
-            new_points[i, 1] = points[j, 1] + t_interp * (
-                points[j + 1, 1] - points[j, 1]
-            )
-    return new_points
-
-
-@njit
-def interpolate_curves_numba(
-    curve1: np.ndarray, curve2: np.ndarray, alpha: float
-) -> np.ndarray:
-    n = curve1.shape[0]
-    interpolated = np.empty((n, 2), dtype=np.float64)
-    for i in range(n):
-        interpolated[i, 0] = (1 - alpha) * curve1[i, 0] + alpha * curve2[i, 0]
-        interpolated[i, 1] = (1 - alpha) * curve1[i, 1] + alpha * curve2[i, 1]
-    return interpolated
-
-
-@njit
-def transform_points(
-    points: np.ndarray,
-    alpha: float,
-    bbox: BoundingBox,
-    target_scale: float,
-    margin: int,
-) -> list[tuple[float, float]]:
-    min_x, min_y, _, _ = bbox
-    new_points: list[tuple[float, float]] = []
-    for p in points:
-        p_zoom = (
-            (p[0] - min_x) * target_scale + margin,
-            (p[1] - min_y) * target_scale + margin,
-        )
-        new_points.append(
-            (
-                (1 - alpha) * p[0] + alpha * p_zoom[0],
-                (1 - alpha) * p[1] + alpha * p_zoom[1],
-            )
-        )
-    return new_points
-
-
 class HilbertCurveProvider(StateProvider[HilbertCurveState]):
     def __init__(
         self,
@@ -170,6 +56,9 @@ class HilbertCurveProvider(StateProvider[HilbertCurveState]):
         self.subset_exponent = subset_exponent or max_order + 5
 
     def initial_state(self, *, width: int, height: int) -> HilbertCurveState:
+        from heart.renderers.hilbert_curve.kernels import (
+            hilbert_curve_points_numba, resample_curve_numba)
+
         current_order = 1
         next_order = current_order + 1
         base_points = hilbert_curve_points_numba(
@@ -202,6 +91,10 @@ class HilbertCurveProvider(StateProvider[HilbertCurveState]):
         )
 
     def _advance_morph(self, state: HilbertCurveState, now: float) -> HilbertCurveState:
+        from heart.renderers.hilbert_curve.kernels import (
+            hilbert_curve_points_numba, interpolate_curves_numba,
+            resample_curve_numba)
+
         elapsed = now - state.morph_start_time
         alpha = min(1.0, elapsed / self.morph_duration)
         frame_curve = interpolate_curves_numba(
@@ -256,6 +149,9 @@ class HilbertCurveProvider(StateProvider[HilbertCurveState]):
         zoom_elapsed = now - state.zoom_start_time
         raw_alpha = min(zoom_elapsed / self.zoom_duration, 1.0)
         zoom_alpha = -0.5 * (math.cos(math.pi * raw_alpha) - 1)
+        from heart.renderers.hilbert_curve.kernels import (
+            hilbert_curve_points_numba, transform_points)
+
         zoomed_curve = transform_points(
             hilbert_curve_points_numba(
                 state.max_order, state.width, state.height, state.xmargin, state.ymargin
@@ -10,6 +10,8 @@ from heart.runtime.display_context import DisplayContext
 class RenderImage(StatefulBaseRenderer[RenderImageState]):
     """Render an image sourced from an asset file or a renderer event stream."""
 
+    frame_depends_only_on_state = True
+
     def __init__(
         self,
         image_file: str | None = None,
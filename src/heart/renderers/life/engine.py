@@ -0,0 +1,181 @@
+"""Bit-packed Game of Life stepping with preallocated generation buffers.
+
+Each board row is stored as little-endian ``uint64`` words, 64 cells per word,
+between two guard rows. A generation is about thirty whole-array bitwise ufunc
+calls written into scratch buffers allocated once per board: the horizontal
+neighbours come from shifting words with carries, and the eight neighbour bits
+are added as bit-sliced counters. No per-cell Python or integer count arrays
+are involved.
+
+Edges are either bounded (cells beyond the board are dead) or toroidal (the
+guard rows and the wrapped edge columns mirror the opposite side).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from heart.utilities.env import LifeEdgeMode
+
+_WORD_BITS = 64
+_ONE = np.uint64(1)
+_HIGH_BIT = np.uint64(_WORD_BITS - 1)
+# Row ``b`` holds the eight cells packed in byte value ``b``, lowest bit first.
+_BYTE_CELLS = np.unpackbits(
+    np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1, bitorder="little"
+)
+
+
+class LifeEngine:
+    """Step a Life board in place and report when it stops changing.
+
+    Three packed boards rotate between the current, next and previous
+    generation, so stepping never allocates and a still life (next equals
+    current) or period-2 oscillator (next equals previous) is detected with
+    two comparisons. :attr:`grid` is a ``uint8`` view of the current generation
+    that is refreshed after every :meth:`step`.
+    """
+
+    def __init__(
+        self, grid: np.ndarray, *, edge_mode: LifeEdgeMode = LifeEdgeMode.BOUNDED
+    ) -> None:
+        if grid.ndim != 2 or 0 in grid.shape:
+            raise ValueError("Life grids must be non-empty and two-dimensional")
+        rows, width = grid.shape
+        words = -(-width // _WORD_BITS)
+        self.edge_mode = edge_mode
+        self.shape = (rows, width)
+        self.generation = 0
+        self.stagnant_generations = 0
+
+        padded = (rows + 2, words)
+        self._current = np.zeros(padded, dtype="<u8")
+        self._next = np.zeros(padded, dtype="<u8")
+        self._previous = np.zeros(padded, dtype="<u8")
+        self._west = np.empty(padded, dtype="<u8")
+        self._east = np.empty(padded, dtype="<u8")
+        self._pair_odd = np.empty(padded, dtype="<u8")
+        self._pair_both = np.empty(padded, dtype="<u8")
+        self._triple_odd = np.empty(padded, dtype="<u8")
+        self._triple_carry = np.empty(padded, dtype="<u8")
+        self._ones = np.empty((rows, words), dtype="<u8")
+        self._carry = np.empty((rows, words), dtype="<u8")
+        self._scratch = np.empty((rows, words), dtype="<u8")
+
+        self._row_mask = np.full(words, np.iinfo(np.uint64).max, dtype="<u8")
+        tail = width % _WORD_BITS
+        if tail:
+            self._row_mask[-1] = (_ONE << np.uint64(tail)) - _ONE
+        self._last_bit = np.uint64((width - 1) % _WORD_BITS)
+
+        self._cells = np.empty((rows, words * _WORD_BITS), dtype=np.uint8)
+        self.grid = self._cells[:, :width]
+        self.load(grid)
+
+    @property
+    def stagnant(self) -> bool:
+        """Whether the last step left a still life or period-2 oscillator."""
+
+        return self.stagnant_generations > 0
+
+    def load(self, grid: np.ndarray) -> None:
+        """Replace the board with ``grid``, treating any non-zero cell as alive."""
+
+        if grid.shape != self.shape:
+            raise ValueError(f"Life grid shape {grid.shape} != engine {self.shape}")
+        packed = np.packbits(grid != 0, axis=1, bitorder="little")
+        self._current.fill(0)
+        self._current[1:-1].view(np.uint8)[:, : packed.shape[1]] = packed
+        self._previous.fill(0)
+        self.generation = 0
+        self.stagnant_generations = 0
+        self._refresh_grid()
+
+    def step(self, generations: int = 1) -> None:
+        for _ in range(generations):
+            self._advance()
+            board = self._next[1:-1]
+            still = np.array_equal(board, self._current[1:-1])
+            oscillating = np.array_equal(board, self._previous[1:-1])
+            self._previous, self._current, self._next = (
+                self._current,
+                self._next,
+                self._previous,
+            )
+            self.generation += 1
+            if still or oscillating:
+                self.stagnant_generations += 1
+            else:
+                self.stagnant_generations = 0
+        self._refresh_grid()
+
+    def _advance(self) -> None:
+        cells = self._current
+        west = self._west
+        east = self._east
+        toroidal = self.edge_mode == LifeEdgeMode.TOROIDAL
+        if toroidal:
+            cells[0] = cells[-2]
+            cells[-1] = cells[1]
+        else:
+            cells[0] = 0
+            cells[-1] = 0
+
+        # west[c] holds cell c - 1 and east[c] holds cell c + 1.
+        np.left_shift(cells, _ONE, out=west)
+        np.right_shift(cells[:, :-1], _HIGH_BIT, out=east[:, 1:])
+        np.bitwise_or(west[:, 1:], east[:, 1:], out=west[:, 1:])
+        np.right_shift(cells, _ONE, out=east)
+        np.left_shift(cells[:, 1:], _HIGH_BIT, out=self._pair_odd[:, :-1])
+        np.bitwise_or(east[:, :-1], self._pair_odd[:, :-1], out=east[:, :-1])
+        if toroidal:
+            west[:, 0] |= (cells[:, -1] >> self._last_bit) & _ONE
+            east[:, -1] |= (cells[:, 0] & _ONE) << self._last_bit
+
+        # Two-bit sums of each row's west and east cells, then with the centre.
+        pair_odd = np.bitwise_xor(west, east, out=self._pair_odd)
+        pair_both = np.bitwise_and(west, east, out=self._pair_both)
+        triple_odd = np.bitwise_xor(pair_odd, cells, out=self._triple_odd)
+        triple_carry = np.bitwise_and(pair_odd, cells, out=self._triple_carry)
+        triple_carry |= pair_both
+
+        # Neighbours of row r are the triples above and below plus its own pair.
+        above = slice(0, -2)
+        middle = slice(1, -1)
+        below = slice(2, None)
+        ones = np.bitwise_xor(triple_odd[above], pair_odd[middle], out=self._ones)
+        carry = np.bitwise_and(triple_odd[above], pair_odd[middle], out=self._carry)
+        scratch = np.bitwise_and(ones, triple_odd[below], out=self._scratch)
+        carry |= scratch
+        ones ^= triple_odd[below]
+
+        # The count is 2 or 3 exactly when one twos bit is set among the two
+        # carries from the triples, the middle pair and the ones carry.
+        twos_odd = np.bitwise_xor(
+            triple_carry[above], pair_both[middle], out=self._west[middle]
+        )
+        twos_both = np.bitwise_and(
+            triple_carry[above], pair_both[middle], out=self._east[middle]
+        )
+        np.bitwise_and(triple_carry[below], carry, out=scratch)
+        twos_both |= scratch
+        carry ^= triple_carry[below]
+        twos_both |= np.bitwise_and(twos_odd, carry, out=scratch)
+        twos_odd ^= carry
+        np.bitwise_not(twos_both, out=twos_both)
+        twos_odd &= twos_both
+
+        born = self._next[middle]
+        np.bitwise_or(ones, cells[middle], out=born)
+        born &= twos_odd
+        born &= self._row_mask
+
+    def _refresh_grid(self) -> None:
+        rows = self.shape[0]
+        packed = self._current[1:-1].view(np.uint8)
+        np.take(
+            _BYTE_CELLS,
+            packed,
+            axis=0,
+            out=self._cells.reshape(rows, packed.shape[1], 8),
+        )
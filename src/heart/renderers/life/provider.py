@@ -31,6 +31,7 @@ class LifeStateProvider(StateProvider[LifeState]):
             if life_seed is not None
             else self._randomness.numpy_rng()
         )
+        reseed_after = Configuration.life_reseed_stagnant_generations()
 
         def create_new_grid(size: tuple[int, int]) -> np.ndarray:
             return LifeState.random_grid(size, rng)
@@ -41,11 +42,16 @@ class LifeStateProvider(StateProvider[LifeState]):
         def op_from_injected(new_state: LifeState) -> StateOp:
             return lambda _: new_state
 
+        def advance(state: LifeState) -> LifeState:
+            if reseed_after and state.stagnant_generations >= reseed_after:
+                return create_state(create_new_grid(state.grid.shape))
+            return state._update_grid()
+
         def op_from_tick(_: object) -> StateOp:
             gamepads = self._pm.input_io.controls.gamepads()
             if any(_should_reseed_from_gamepad(event.snapshot) for event in gamepads):
                 return lambda s: create_state(create_new_grid(s.grid.shape))
-            return lambda s: s._update_grid()
+            return advance
 
         window_sizes: Subscribable[tuple[int, int]] = (
             self._pm.window.filter(lambda w: w is not None)
@@ -16,16 +16,20 @@ class Life(StatefulBaseRenderer[LifeState]):
         # preserve the original renderer behaviour of operating on the entire
         # device surface rather than the per-tile mirrored view.
         self.device_display_mode = DeviceDisplayMode.FULL
+        self._colors: np.ndarray | None = None
 
     def real_process(
         self,
         window: Surface,
         orientation: Orientation,
     ) -> None:
-        # if 1, make white, else make black
-        # We need to project these all to 3 dimensions
-        updated_colors = np.repeat(self.state.grid[:, :, np.newaxis], 3, axis=2) * 255
-        pygame.surfarray.blit_array(window.screen, updated_colors)
+        # if 1, make white, else make black, broadcasting the grid across the
+        # three channels of a buffer reused between frames
+        grid = self.state.grid
+        if self._colors is None or self._colors.shape[:2] != grid.shape:
+            self._colors = np.empty((*grid.shape, 3), dtype=np.uint8)
+        np.multiply(grid[:, :, np.newaxis], 255, out=self._colors, casting="unsafe")
+        pygame.surfarray.blit_array(window.screen, self._colors)
         assert self.state.grid.shape == window.get_size(), (
             "Grid size must match window size"
         )
@@ -3,9 +3,9 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
-from scipy.ndimage import convolve
 
-from heart.utilities.env import (Configuration, LifeRuleStrategy,
+from heart.renderers.life.engine import LifeEngine
+from heart.utilities.env import (Configuration, LifeEdgeMode, LifeRuleStrategy,
                                  LifeUpdateStrategy)
 
 DEFAULT_LIFE_KERNEL = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]], dtype=int)
@@ -17,7 +17,6 @@ LIFE_RULE_TABLE = np.array(
     dtype=int,
 )
 
-
 @dataclass
 class LifeState:
     grid: np.ndarray
@@ -28,6 +27,12 @@ class LifeState:
         repr=False,
         compare=False,
     )
+    # Consecutive generations that repeated the one or two before them (a still
+    # life or period-2 oscillator), whichever strategy produced them.
+    stagnant_generations: int = 0
+    previous_grid: np.ndarray | None = field(default=None, repr=False, compare=False)
+    engine: LifeEngine | None = field(default=None, repr=False, compare=False)
+    engine_generation: int = field(default=0, repr=False, compare=False)
 
     @staticmethod
     def resolve_rng(seed: int | None = None) -> np.random.Generator:
@@ -44,35 +49,71 @@ class LifeState:
     def _update_grid(self) -> Any:
         kernel = self.kernel
         strategy = Configuration.life_update_strategy()
+        if self._uses_bitpacked(strategy):
+            return self._step_bitpacked()
         neighbors = self._resolve_neighbors(kernel, strategy)
         new_grid = self._apply_rules(neighbors)
 
         assert new_grid.shape == self.grid.shape, "Grid size must match"
 
         new_grid = new_grid.astype(int)
+        stagnant = np.array_equal(new_grid, self.grid) or (
+            self.previous_grid is not None
+            and np.array_equal(new_grid, self.previous_grid)
+        )
         return LifeState(
             grid=new_grid,
             cache_id=self.cache_id,
             kernel=self.kernel,
             neighbor_buffer=self.neighbor_buffer,
+            stagnant_generations=self.stagnant_generations + 1 if stagnant else 0,
+            previous_grid=self.grid,
+        )
+
+    def _uses_bitpacked(self, strategy: LifeUpdateStrategy) -> bool:
+        if strategy == LifeUpdateStrategy.BITPACKED:
+            if self.kernel is not None:
+                raise ValueError(
+                    "HEART_LIFE_UPDATE_STRATEGY='bitpacked' only supports the default kernel."
+                )
+            return True
+        if strategy != LifeUpdateStrategy.AUTO or self.kernel is not None:
+            return False
+        threshold = Configuration.life_convolve_threshold()
+        return threshold <= 0 or self.grid.size < threshold
+
+    def _step_bitpacked(self) -> "LifeState":
+        # The engine steps its buffers in place, so each state keeps a copy of the
+        # grid and only the engine's latest state steps it further; any other
+        # state starts a new engine from its own grid.
+        engine = self.engine
+        if engine is None or engine.generation != self.engine_generation:
+            engine = LifeEngine(self.grid, edge_mode=Configuration.life_edge_mode())
+        engine.step()
+        return LifeState(
+            grid=engine.grid.copy(),
+            cache_id=self.cache_id,
+            kernel=self.kernel,
+            neighbor_buffer=self.neighbor_buffer,
+            stagnant_generations=engine.stagnant_generations,
+            engine=engine,
+            engine_generation=engine.generation,
         )
 
     def _resolve_neighbors(
         self, kernel: np.ndarray | None, strategy: LifeUpdateStrategy
     ) -> np.ndarray:
-        if strategy == LifeUpdateStrategy.AUTO:
-            return self._auto_neighbors(kernel)
-        if strategy == LifeUpdateStrategy.PAD:
+        if strategy in (LifeUpdateStrategy.PAD, LifeUpdateStrategy.SHIFTED):
             if kernel is not None:
                 raise ValueError(
-                    "HEART_LIFE_UPDATE_STRATEGY='pad' only supports the default kernel."
+                    f"HEART_LIFE_UPDATE_STRATEGY='{strategy}' only supports the default kernel."
                 )
-            return _count_neighbors_with_padding(self.grid)
-        if strategy == LifeUpdateStrategy.SHIFTED:
-            if kernel is not None:
+            if Configuration.life_edge_mode() != LifeEdgeMode.BOUNDED:
                 raise ValueError(
-                    "HEART_LIFE_UPDATE_STRATEGY='shifted' only supports the default kernel."
+                    f"HEART_LIFE_UPDATE_STRATEGY='{strategy}' only supports bounded edges."
                 )
+            if strategy == LifeUpdateStrategy.PAD:
+                return _count_neighbors_with_padding(self.grid)
             return _count_neighbors_shifted(self.grid, self._ensure_neighbor_buffer())
 
         if kernel is None:
@@ -108,20 +149,20 @@ class LifeState:
         max_value = int(neighbors.max())
         return min_value >= 0 and max_value <= 8
 
-    def _auto_neighbors(self, kernel: np.ndarray | None) -> np.ndarray:
-        if kernel is not None:
-            return self._convolve_neighbors(kernel)
-
-        threshold = Configuration.life_convolve_threshold()
-        if threshold > 0 and self.grid.size >= threshold:
-            return self._convolve_neighbors(DEFAULT_LIFE_KERNEL)
-        return _count_neighbors_shifted(self.grid, self._ensure_neighbor_buffer())
-
     def _convolve_neighbors(self, kernel: np.ndarray) -> np.ndarray:
         neighbors = self._ensure_neighbor_buffer(
             dtype=np.result_type(self.grid, kernel)
         )
-        convolve(self.grid, kernel, mode="constant", cval=0, output=neighbors)
+        # scipy.ndimage takes hundreds of milliseconds to import and small
+        # boards never convolve, so it is only imported here.
+        from scipy.ndimage import convolve
+
+        mode = (
+            "wrap"
+            if Configuration.life_edge_mode() == LifeEdgeMode.TOROIDAL
+            else "constant"
+        )
+        convolve(self.grid, kernel, mode=mode, cval=0, output=neighbors)
         return neighbors
 
     def _ensure_neighbor_buffer(self, dtype: np.dtype | None = None) -> np.ndarray:
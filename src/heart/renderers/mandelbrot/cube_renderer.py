@@ -10,7 +10,6 @@ from heart import DeviceDisplayMode
 from heart.device import Orientation
 from heart.peripheral.core.manager import PeripheralManager
 from heart.renderers import StatefulBaseRenderer
-from heart.renderers.mandelbrot.scene import get_mandelbrot_converge_time_into
 from heart.utilities.env import Configuration
 from heart.utilities.env.enums import MandelbrotInteriorStrategy
 from heart.utilities.logging import get_logger
@@ -173,6 +172,9 @@ class CubeMandelbrotRenderer(StatefulBaseRenderer[CubeMandelbrotState]):
         np.multiply(self.state.azimuths, REAL_SCALE, out=self.state.real_coords)
         np.add(self.state.real_coords, REAL_CENTER, out=self.state.real_coords)
 
+        from heart.renderers.mandelbrot.kernels import \
+            get_mandelbrot_converge_time_into
+
         get_mandelbrot_converge_time_into(
             self.state.real_coords,
             self.state.imag_coords,
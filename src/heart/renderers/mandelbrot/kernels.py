@@ -0,0 +1,162 @@
+"""Numba kernels for the Mandelbrot and Julia renderers.
+
+The renderers import this module on first draw so that loading a configuration
+which merely lists a Mandelbrot mode does not import numba.
+"""
+
+import numpy as np
+from numba import jit, prange
+
+
+@jit(nopython=True, fastmath=True, cache=True)
+def _is_in_mandelbrot_interior(c_real, c_imag):
+    x_minus = c_real - 0.25
+    y2 = c_imag * c_imag
+    q = x_minus * x_minus + y2
+
+    if q * (q + x_minus) <= 0.25 * y2:
+        return True
+
+    if (c_real + 1.0) * (c_real + 1.0) + y2 <= 0.0625:
+        return True
+
+    return False
+
+
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def get_mandelbrot_converge_time(
+    re, im, critical_real, critical_imag, max_iter, use_interior_check
+):
+    height, width = re.shape
+    result = np.zeros((height, width), dtype=np.int32)
+
+    for i in prange(height):
+        for j in range(width):
+            c_real = re[i, j]
+            c_imag = im[i, j]
+            z_real = critical_real
+            z_imag = critical_imag
+            if use_interior_check and _is_in_mandelbrot_interior(c_real, c_imag):
+                continue
+            for k in range(max_iter):
+                z_real2 = z_real * z_real
+                z_imag2 = z_imag * z_imag
+
+                if z_real2 + z_imag2 > 4.0:
+                    result[i, j] = k
+                    break
+
+                # i.e. with expanding (a + bi)^2 to a^2 + 2abi + b^2
+                z_imag = 2.0 * z_real * z_imag + c_imag
+                z_real = z_real2 - z_imag2 + c_real
+
+    return result
+
+
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def get_mandelbrot_converge_time_into(
+    re, im, critical_real, critical_imag, max_iter, use_interior_check, result
+):
+    height, width = re.shape
+
+    for i in prange(height):
+        for j in range(width):
+            c_real = re[i, j]
+            c_imag = im[i, j]
+            z_real = critical_real
+            z_imag = critical_imag
+            if use_interior_check and _is_in_mandelbrot_interior(c_real, c_imag):
+                result[i, j] = 0
+                continue
+            for k in range(max_iter):
+                z_real2 = z_real * z_real
+                z_imag2 = z_imag * z_imag
+
+                if z_real2 + z_imag2 > 4.0:
+                    result[i, j] = k
+                    break
+
+                z_imag = 2.0 * z_real * z_imag + c_imag
+                z_real = z_real2 - z_imag2 + c_real
+            else:
+                result[i, j] = 0
+
+    return result
+
+
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def get_julia_converge_time(re, im, c_real, c_imag, max_iter):
+    height, width = re.shape
+    result = np.zeros((height, width), dtype=np.int32)
+    c = complex(c_real, c_imag)
+
+    for i in prange(height):
+        for j in range(width):
+            z = complex(re[i, j], im[i, j])
+            for k in range(max_iter):
+                z = (z * z) + c
+                if abs(z) > 2:
+                    result[i, j] = k
+                    break
+
+    return result
+
+
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def mandelbrot_points_into(
+    re_axis,
+    im_axis,
+    rows,
+    cols,
+    critical_real,
+    critical_imag,
+    max_iter,
+    use_interior_check,
+    result,
+):
+    """Write escape times for the pixels ``(rows[n], cols[n])`` into ``result``.
+
+    ``re_axis`` and ``im_axis`` hold one coordinate per column and row, so no
+    meshgrid is needed and progressive passes only iterate the pixels they refine.
+    """
+
+    for n in prange(rows.shape[0]):
+        i = rows[n]
+        j = cols[n]
+        c_real = re_axis[j]
+        c_imag = im_axis[i]
+        result[i, j] = 0
+        if use_interior_check and _is_in_mandelbrot_interior(c_real, c_imag):
+            continue
+        z_real = critical_real
+        z_imag = critical_imag
+        for k in range(max_iter):
+            z_real2 = z_real * z_real
+            z_imag2 = z_imag * z_imag
+
+            if z_real2 + z_imag2 > 4.0:
+                result[i, j] = k
+                break
+
+            z_imag = 2.0 * z_real * z_imag + c_imag
+            z_real = z_real2 - z_imag2 + c_real
+
+
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def julia_points_into(re_axis, im_axis, rows, cols, c_real, c_imag, max_iter, result):
+    """Julia counterpart of :func:`mandelbrot_points_into`."""
+
+    for n in prange(rows.shape[0]):
+        i = rows[n]
+        j = cols[n]
+        z_real = re_axis[j]
+        z_imag = im_axis[i]
+        result[i, j] = 0
+        for k in range(max_iter):
+            z_real2 = z_real * z_real
+            z_imag2 = z_imag * z_imag
+            z_imag = 2.0 * z_real * z_imag + c_imag
+            z_real = z_real2 - z_imag2 + c_real
+            if z_real * z_real + z_imag * z_imag > 4.0:
+                result[i, j] = k
+                break
@@ -5,10 +5,10 @@ import itertools
 import os
 import pstats
 import time
+from collections.abc import Callable
 
 import numpy as np
 import pygame
-from numba import jit, prange
 
 from heart import DeviceDisplayMode
 from heart.device import Cube, Orientation, Rectangle
@@ -16,6 +16,9 @@ from heart.peripheral.core.manager import PeripheralManager
 from heart.renderers import StatefulBaseRenderer
 from heart.renderers.mandelbrot.control_mappings import KeyboardControls
 from heart.renderers.mandelbrot.controls import SceneControls
+from heart.renderers.mandelbrot.progressive import (FractalKind, FractalView,
+                                                    ProgressiveFractal,
+                                                    adaptive_max_iterations)
 from heart.renderers.mandelbrot.state import AppState, ViewMode
 from heart.runtime.display_context import DisplayContext
 from heart.utilities.env import Configuration
@@ -44,11 +47,11 @@ class MandelbrotMode(StatefulBaseRenderer[AppState]):
             np.array(palette, dtype=np.uint8) for palette in self.palettes
         ]
 
-        # cache properties for computed converge times for current view port
-        self.cached_result = None
-        self.last_params = None
-        self.cached_julia_result = None
-        self.last_julia_params = None
+        # progressive escape-time buffers, refined across frames within a budget
+        self.mandelbrot_fractal: ProgressiveFractal | None = None
+        self.julia_fractal: ProgressiveFractal | None = None
+        self.frame_budget = Configuration.mandelbrot_frame_budget_ms() / 1000.0
+        self._color_buffers: dict[tuple[int, int], np.ndarray] = {}
 
         # auto-zoom loop properties
         self.max_auto_zoom = 20093773861.78
@@ -148,10 +151,9 @@ class MandelbrotMode(StatefulBaseRenderer[AppState]):
         self.individual_screen_height = None
         self.screens.clear()
         self._split_view_surfaces.clear()
-        self.cached_result = None
-        self.last_params = None
-        self.cached_julia_result = None
-        self.last_julia_params = None
+        self.mandelbrot_fractal = None
+        self.julia_fractal = None
+        self._color_buffers.clear()
         # if self.state is not None:
         #     self.state.reset()
         #     self.state.set_mode_auto()
@@ -206,9 +208,12 @@ class MandelbrotMode(StatefulBaseRenderer[AppState]):
         window: DisplayContext,
         individual_screen_width: int,
         individual_screen_height: int,
+        draw: Callable[[pygame.Surface], None],
     ) -> None:
+        # Every panel shows the same view, so the fractal is refined once per
+        # frame, within one frame budget, and copied to the other panels.
         mirrored_screen = self.screens[(0, 0)]
-        self._draw_mandelbrot_to_surface(mirrored_screen)
+        draw(mirrored_screen)
         for screen in self.screens.values():
             if screen is not mirrored_screen:
                 screen.blit(mirrored_screen, (0, 0))
@@ -225,10 +230,13 @@ class MandelbrotMode(StatefulBaseRenderer[AppState]):
         individual_screen_height: int,
     ) -> None:
         ordered_screens = [screen for _position, screen in sorted(self.screens.items())]
-        for index in range(0, len(ordered_screens) - 1, 2):
-            first = ordered_screens[index]
-            second = ordered_screens[index + 1]
+        if len(ordered_screens) >= 2:
+            # Each pair shows the same split view, so only the first is refined.
+            first, second = ordered_screens[:2]
             self._draw_split_view(first, second, window.clock)
+            for index in range(2, len(ordered_screens) - 1, 2):
+                ordered_screens[index].blit(first, (0, 0))
+                ordered_screens[index + 1].blit(second, (0, 0))
         self._blit_panel_screens(
             window,
             individual_screen_width,
@@ -269,6 +277,7 @@ class MandelbrotMode(StatefulBaseRenderer[AppState]):
                     window,
                     individual_screen_width,
                     individual_screen_height,
+                    self._draw_mandelbrot_to_surface,
                 )
             else:
                 self._draw_mandelbrot_to_surface(window.screen)
@@ -290,12 +299,11 @@ class MandelbrotMode(StatefulBaseRenderer[AppState]):
                 window.blit(julia_surface, (self.width // 2, 0))
         elif self.state.view_mode == ViewMode.JULIA:
             if self._is_multi_panel_layout():
-                for screen in self.screens.values():
-                    self._draw_julia_to_surface(screen)
-                self._blit_panel_screens(
+                self._draw_mirrored_panels(
                     window,
                     individual_screen_width,
                     individual_screen_height,
+                    self._draw_julia_to_surface,
                 )
             else:
                 self._draw_julia_to_surface(window.screen)
@@ -491,102 +499,54 @@ class MandelbrotMode(StatefulBaseRenderer[AppState]):
 
     def _draw_julia_to_surface(self, window: pygame.Surface) -> None:
         width, height = window.get_size()
-        current_params = (
-            self.state.jzoom,
-            self.state.jmovement.x,
-            self.state.jmovement.y,
-            self.state.julia_constant.real,
-            self.state.julia_constant.imag,
-            self.state.max_iterations,
-            width,
-            height,
-        )
-        if self.cached_julia_result is None or self.last_julia_params != current_params:
-            aspect_ratio = width / height
-            fixed_zoom = self.state.jzoom
-            height_range = 4.0 / fixed_zoom
-            width_range = height_range * aspect_ratio
-
-            re = np.linspace(
-                -width_range / 2 + self.state.jmovement.x,
-                width_range / 2 + self.state.jmovement.x,
-                width,
-            )
-            im = np.linspace(
-                -height_range / 2 + self.state.jmovement.y,
-                height_range / 2 + self.state.jmovement.y,
-                height,
-            )
-            re, im = np.meshgrid(re, im)
-
-            c_real = self.state.julia_constant.real
-            c_imag = self.state.julia_constant.imag
-
-            self.cached_julia_result = get_julia_converge_time(
-                re, im, c_real, c_imag, self.state.max_iterations
-            )
-            self.last_julia_params = current_params
-
-        clipped_times = np.clip(
-            self.cached_julia_result, 0, len(self.active_palette) - 1
+        if self.julia_fractal is None:
+            self.julia_fractal = ProgressiveFractal(FractalKind.JULIA)
+        view = FractalView(
+            center_real=self.state.jmovement.x,
+            center_imag=self.state.jmovement.y,
+            zoom=self.state.jzoom,
+            max_iterations=adaptive_max_iterations(
+                self.state.max_iterations, self.state.jzoom
+            ),
+            constant=self.state.julia_constant,
         )
-        color_surface = self.active_palette_array[clipped_times]
-
-        surface_array = np.transpose(color_surface, (1, 0, 2))
-        pygame.surfarray.blit_array(window, surface_array)
+        iterations = self.julia_fractal.render(view, width, height, self.frame_budget)
+        self._blit_iterations(window, iterations)
 
     def _draw_mandelbrot_to_surface(self, window: pygame.Surface) -> None:
         width, height = window.get_size()
-        current_params = (
-            self.state.zoom,
-            self.state.movement.x,
-            self.state.movement.y,
-            self.state.max_iterations,
-            width,
-            height,
-            self.state.jcursor_pos.x,
-            self.state.jcursor_pos.y,
-        )
-
-        if self.cached_result is None or self.last_params != current_params:
-            self.last_params = current_params
-            aspect_ratio = width / height
-
-            height_range = (
-                4.0 / self.state.zoom
-            )  # Total height range (2.0 * 2 for padding)
-            width_range = (
-                height_range * aspect_ratio
-            )  # Width range adjusted for aspect ratio
-
-            re = np.linspace(
-                -width_range / 2 + self.state.movement.x,
-                width_range / 2 + self.state.movement.x,
-                width,
+        if self.mandelbrot_fractal is None:
+            self.mandelbrot_fractal = ProgressiveFractal(
+                FractalKind.MANDELBROT,
+                use_interior_check=self.use_mandelbrot_interior,
             )
-            im = np.linspace(
-                -height_range / 2 + self.state.movement.y,
-                height_range / 2 + self.state.movement.y,
-                height,
-            )
-            re, im = np.meshgrid(re, im)
-            crit_real = self.state.critical_point.real
-            crit_imag = self.state.critical_point.imag
-            self.cached_result = get_mandelbrot_converge_time(
-                re,
-                im,
-                crit_real,
-                crit_imag,
-                self.state.max_iterations,
-                self.use_mandelbrot_interior,
-            )
-            self.last_params = current_params
-
-        clipped_times = np.clip(self.cached_result, 0, len(self.active_palette) - 1)
-        color_surface = self.active_palette_array[clipped_times]
-
-        surface_array = np.transpose(color_surface, (1, 0, 2))
-        pygame.surfarray.blit_array(window, surface_array)
+        view = FractalView(
+            center_real=self.state.movement.x,
+            center_imag=self.state.movement.y,
+            zoom=self.state.zoom,
+            max_iterations=adaptive_max_iterations(
+                self.state.max_iterations, self.state.zoom
+            ),
+            constant=self.state.critical_point,
+        )
+        iterations = self.mandelbrot_fractal.render(
+            view, width, height, self.frame_budget
+        )
+        self._blit_iterations(window, iterations)
+
+    def _blit_iterations(self, window: pygame.Surface, iterations: np.ndarray) -> None:
+        # Surfarray wants (width, height, 3); indexing the palette through the
+        # transposed view fills that layout directly, and clipping keeps counts
+        # beyond the palette on its last colour.
+        size = window.get_size()
+        colors = self._color_buffers.get(size)
+        if colors is None:
+            colors = np.empty((*size, 3), dtype=np.uint8)
+            self._color_buffers[size] = colors
+        np.take(
+            self.active_palette_array, iterations.T, axis=0, out=colors, mode="clip"
+        )
+        pygame.surfarray.blit_array(window, colors)
 
     def _draw_fps_to_surface(self, window: DisplayContext):
         text_color = (255, 255, 255)
@@ -648,100 +608,6 @@ class MandelbrotMode(StatefulBaseRenderer[AppState]):
         return colors
 
 
-@jit(nopython=True, fastmath=True, cache=True)
-def _is_in_mandelbrot_interior(c_real, c_imag):
-    x_minus = c_real - 0.25
-    y2 = c_imag * c_imag
-    q = x_minus * x_minus + y2
-
-    if q * (q + x_minus) <= 0.25 * y2:
-        return True
-
-    if (c_real + 1.0) * (c_real + 1.0) + y2 <= 0.0625:
-        return True
-
-    return False
-
-
-@jit(nopython=True, parallel=True, fastmath=True, cache=True)
-def get_mandelbrot_converge_time(
-    re, im, critical_real, critical_imag, max_iter, use_interior_check
-):
-    height, width = re.shape
-    result = np.zeros((height, width), dtype=np.int32)
-
-    for i in prange(height):
-        for j in range(width):
-            c_real = re[i, j]
-            c_imag = im[i, j]
-            z_real = critical_real
-            z_imag = critical_imag
-            if use_interior_check and _is_in_mandelbrot_interior(c_real, c_imag):
-                continue
-            for k in range(max_iter):
-                z_real2 = z_real * z_real
-                z_imag2 = z_imag * z_imag
-
-                if z_real2 + z_imag2 > 4.0:
-                    result[i, j] = k
-                    break
-
-                # i.e. with expanding (a + bi)^2 to a^2 + 2abi + b^2
-                z_imag = 2.0 * z_real * z_imag + c_imag
-                z_real = z_real2 - z_imag2 + c_real
-
-    return result
-
-
-@jit(nopython=True, parallel=True, fastmath=True, cache=True)
-def get_mandelbrot_converge_time_into(
-    re, im, critical_real, critical_imag, max_iter, use_interior_check, result
-):
-    height, width = re.shape
-
-    for i in prange(height):
-        for j in range(width):
-            c_real = re[i, j]
-            c_imag = im[i, j]
-            z_real = critical_real
-            z_imag = critical_imag
-            if use_interior_check and _is_in_mandelbrot_interior(c_real, c_imag):
-                result[i, j] = 0
-                continue
-            for k in range(max_iter):
-                z_real2 = z_real * z_real
-                z_imag2 = z_imag * z_imag
-
-                if z_real2 + z_imag2 > 4.0:
-                    result[i, j] = k
-                    break
-
-                z_imag = 2.0 * z_real * z_imag + c_imag
-                z_real = z_real2 - z_imag2 + c_real
-            else:
-                result[i, j] = 0
-
-    return result
-
-
-@jit(nopython=True, parallel=True, fastmath=True, cache=True)
-def get_julia_converge_time(re, im, c_real, c_imag, max_iter):
-    height, width = re.shape
-    result = np.zeros((height, width), dtype=np.int32)
-    c = complex(c_real, c_imag)
-
-    for i in prange(height):
-        for j in range(width):
-            z = complex(re[i, j], im[i, j])
-            for k in range(max_iter):
-                z = (z * z) + c
-                if abs(z) > 2:
-                    result[i, j] = k
-                    break
-
-    return result
-
-
 def main() -> None:
     import pygame
 
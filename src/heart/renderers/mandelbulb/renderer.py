@@ -12,10 +12,10 @@ from OpenGL.GL import (GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_MODELVIEW,
                        GL_NEAREST, GL_PROJECTION, GL_QUADS, GL_RGBA,
                        GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER,
                        GL_TEXTURE_MIN_FILTER, GL_UNSIGNED_BYTE, glBegin,
-                       glBindTexture, glClear, glDeleteTextures, glDisable,
-                       glEnable, glEnd, glGenTextures, glLoadIdentity,
-                       glMatrixMode, glOrtho, glReadPixels, glTexCoord2f,
-                       glTexImage2D, glTexParameteri, glTexSubImage2D,
+                       glBindTexture, glClear, glCopyTexSubImage2D,
+                       glDeleteTextures, glDisable, glEnable, glEnd,
+                       glGenTextures, glLoadIdentity, glMatrixMode, glOrtho,
+                       glTexCoord2f, glTexImage2D, glTexParameteri,
                        glUseProgram, glVertex2f, glViewport)
 
 from heart import DeviceDisplayMode
@@ -81,7 +81,6 @@ class MandelbulbScene(StatefulBaseRenderer[MandelbulbState]):
         self.render_size: tuple[int, int] | None = None
         self.tiled_mode = False
         self.display_texture: int | None = None
-        self.tile_pixels: np.ndarray | None = None
         self.camera_yaw = 0.0
         self.camera_pitch = 0.0
         self.camera_distance = DEFAULT_CAMERA_DISTANCE
@@ -430,7 +429,6 @@ class MandelbulbScene(StatefulBaseRenderer[MandelbulbState]):
         assert self.render_size is not None
         assert self.window_size is not None
         self._ensure_tiled_resources()
-        assert self.tile_pixels is not None
         assert self.display_texture is not None
 
         tile_width, tile_height = self.render_size
@@ -438,39 +436,14 @@ class MandelbulbScene(StatefulBaseRenderer[MandelbulbState]):
             uniforms=self._shader_uniforms(),
             viewport_size=self.render_size,
         )
-        glReadPixels(
-            0,
-            0,
-            tile_width,
-            tile_height,
-            GL_RGBA,
-            GL_UNSIGNED_BYTE,
-            self.tile_pixels,
-        )
         glBindTexture(GL_TEXTURE_2D, self.display_texture)
-        glTexSubImage2D(
-            GL_TEXTURE_2D,
-            0,
-            0,
-            0,
-            tile_width,
-            tile_height,
-            GL_RGBA,
-            GL_UNSIGNED_BYTE,
-            self.tile_pixels,
-        )
+        glCopyTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, 0, 0, tile_width, tile_height)
         self._render_tiled_texture()
         self.shader_runtime.read_to_surface(window, size=self.window_size)
 
     def _ensure_tiled_resources(self) -> None:
         assert self.render_size is not None
         width, height = self.render_size
-        if (
-            self.tile_pixels is None
-            or self.tile_pixels.shape[0] != height
-            or self.tile_pixels.shape[1] != width
-        ):
-            self.tile_pixels = np.zeros((height, width, 4), dtype=np.uint8)
         if self.display_texture is not None:
             return
         self.display_texture = glGenTextures(1)
@@ -525,7 +498,6 @@ class MandelbulbScene(StatefulBaseRenderer[MandelbulbState]):
             except GLError:
                 pass
         self.display_texture = None
-        self.tile_pixels = None
 
     @staticmethod
     def _render_size(
@@ -11,10 +11,10 @@ from OpenGL.GL import (GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_MODELVIEW,
                        GL_NEAREST, GL_PROJECTION, GL_QUADS, GL_RGBA,
                        GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER,
                        GL_TEXTURE_MIN_FILTER, GL_UNSIGNED_BYTE, glBegin,
-                       glBindTexture, glClear, glDeleteTextures, glDisable,
-                       glEnable, glEnd, glGenTextures, glLoadIdentity,
-                       glMatrixMode, glOrtho, glReadPixels, glTexCoord2f,
-                       glTexImage2D, glTexParameteri, glTexSubImage2D,
+                       glBindTexture, glClear, glCopyTexSubImage2D,
+                       glDeleteTextures, glDisable, glEnable, glEnd,
+                       glGenTextures, glLoadIdentity, glMatrixMode, glOrtho,
+                       glTexCoord2f, glTexImage2D, glTexParameteri,
                        glUseProgram, glVertex2f, glViewport)
 
 from heart import DeviceDisplayMode
@@ -51,7 +51,6 @@ class PaletteTunnelScene(StatefulBaseRenderer[PaletteTunnelState]):
         self.render_size: tuple[int, int] | None = None
         self.tiled_mode = False
         self.display_texture: int | None = None
-        self.tile_pixels: np.ndarray | None = None
         self.cursor = np.zeros((2,), dtype=np.float32)
         self._keyboard_snapshot = KeyboardSnapshot(
             pressed_keys=frozenset(),
@@ -155,7 +154,6 @@ class PaletteTunnelScene(StatefulBaseRenderer[PaletteTunnelState]):
         assert self.render_size is not None
         assert self.window_size is not None
         self._ensure_tiled_resources()
-        assert self.tile_pixels is not None
         assert self.display_texture is not None
 
         tile_width, tile_height = self.render_size
@@ -163,39 +161,14 @@ class PaletteTunnelScene(StatefulBaseRenderer[PaletteTunnelState]):
             uniforms=self._shader_uniforms(),
             viewport_size=self.render_size,
         )
-        glReadPixels(
-            0,
-            0,
-            tile_width,
-            tile_height,
-            GL_RGBA,
-            GL_UNSIGNED_BYTE,
-            self.tile_pixels,
-        )
         glBindTexture(GL_TEXTURE_2D, self.display_texture)
-        glTexSubImage2D(
-            GL_TEXTURE_2D,
-            0,
-            0,
-            0,
-            tile_width,
-            tile_height,
-            GL_RGBA,
-            GL_UNSIGNED_BYTE,
-            self.tile_pixels,
-        )
+        glCopyTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, 0, 0, tile_width, tile_height)
         self._render_tiled_texture()
         self.shader_runtime.read_to_surface(window, size=self.window_size)
 
     def _ensure_tiled_resources(self) -> None:
         assert self.render_size is not None
         width, height = self.render_size
-        if (
-            self.tile_pixels is None
-            or self.tile_pixels.shape[0] != height
-            or self.tile_pixels.shape[1] != width
-        ):
-            self.tile_pixels = np.zeros((height, width, 4), dtype=np.uint8)
         if self.display_texture is not None:
             return
         self.display_texture = glGenTextures(1)
@@ -250,7 +223,6 @@ class PaletteTunnelScene(StatefulBaseRenderer[PaletteTunnelState]):
             except GLError:
                 pass
         self.display_texture = None
-        self.tile_pixels = None
 
     def _cursor_direction(self) -> np.ndarray:
         keys = self._keyboard_snapshot.pressed_keys
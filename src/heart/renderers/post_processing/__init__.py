@@ -0,0 +1,181 @@
+"""Bluetooth-switch driven saturation, hue and edge effects.
+
+Each effect is its own renderer so modes can list and reorder them, but the
+processors built together by :meth:`PostProcessingChain.processors` only queue
+their stages; the last one in the chain applies them all to the screen in one
+:class:`PostProcessingPipeline` pass. :func:`flush_post_processing` applies
+whatever is still queued at the end of a frame, so a mode that drops or
+reorders chain members still gets every effect.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+import pygame
+
+from heart import DeviceDisplayMode
+from heart.device import Orientation
+from heart.peripheral.core.manager import PeripheralManager
+from heart.renderers import StatefulBaseRenderer
+from heart.renderers.post_processing.pipeline import (EdgeStage, HueShiftStage,
+                                                      PostProcessingPipeline,
+                                                      PostProcessingStage,
+                                                      SaturationStage)
+from heart.runtime.display_context import DisplayContext
+
+SATURATION_STEP = 0.05
+SATURATION_MIN = 0.0
+SATURATION_MAX = 5.0
+HUE_STEP = 0.03
+EDGE_THRESHOLD_DEFAULT = 1
+EDGE_THRESHOLD_STEP = 0.10
+
+
+class PostProcessingChain:
+    """Collect the stages of consecutive post-processors into one pipeline pass.
+
+    Members submit once per frame in the order they joined. The last member's
+    submission applies every queued stage; a submission from an earlier member
+    than the previous one applies what the previous frame left queued before
+    starting a new one. :meth:`flush` does the same at the end of a frame.
+    """
+
+    def __init__(self) -> None:
+        self.pipeline = PostProcessingPipeline()
+        self._members: list[BasePostProcessor] = []
+        self._pending: list[PostProcessingStage] = []
+        self._surface: pygame.Surface | None = None
+        self._last_index = -1
+
+    @classmethod
+    def processors(cls) -> list[BasePostProcessor]:
+        """Return saturation, hue and edge processors sharing one chain."""
+
+        chain = cls()
+        return [
+            SaturationPostProcessor(chain=chain),
+            HueShiftPostProcessor(chain=chain),
+            EdgePostProcessor(chain=chain),
+        ]
+
+    def join(self, member: BasePostProcessor) -> None:
+        self._members.append(member)
+
+    def submit(
+        self,
+        member: BasePostProcessor,
+        surface: pygame.Surface,
+        stage: PostProcessingStage | None,
+    ) -> None:
+        index = self._members.index(member)
+        if index <= self._last_index or surface is not self._surface:
+            self.flush()
+        self._last_index = index
+        self._surface = surface
+        if stage is not None:
+            self._pending.append(stage)
+        if index == len(self._members) - 1:
+            self.flush()
+
+    def flush(self) -> None:
+        """Apply any queued stages and start a new frame."""
+
+        if self._pending and self._surface is not None:
+            self.pipeline.apply(self._surface, self._pending)
+        self._pending.clear()
+        self._surface = None
+        self._last_index = -1
+
+
+def flush_post_processing(renderers: Iterable[object]) -> None:
+    """Apply the stages ``renderers``' chains still hold at the end of a frame."""
+
+    for renderer in renderers:
+        if isinstance(renderer, BasePostProcessor):
+            renderer._chain.flush()
+
+
+class BasePostProcessor(StatefulBaseRenderer[None]):
+    def __init__(self, *, chain: PostProcessingChain | None = None) -> None:
+        super().__init__()
+        self.device_display_mode = DeviceDisplayMode.FULL
+        self._peripheral_manager: PeripheralManager | None = None
+        self._chain = chain if chain is not None else PostProcessingChain()
+        self._chain.join(self)
+
+    def initialize(
+        self,
+        window: DisplayContext,
+        peripheral_manager: PeripheralManager,
+        orientation: Orientation,
+    ) -> None:
+        self._peripheral_manager = peripheral_manager
+        self.initialized = True
+
+    def reset(self) -> None:
+        self._peripheral_manager = None
+        self.initialized = False
+
+    def real_process(
+        self,
+        window: DisplayContext,
+        orientation: Orientation,
+    ) -> None:
+        self._chain.submit(self, window.screen, self._stage())
+
+    def _stage(self) -> PostProcessingStage | None:
+        """Return this frame's stage, or ``None`` when the effect is idle."""
+
+        raise NotImplementedError
+
+    def _bluetooth_switch(self):
+        if self._peripheral_manager is None:
+            return None
+        return self._peripheral_manager.bluetooth_switch()
+
+    def _rotation_delta(self, switch_name: str) -> int:
+        bluetooth = self._bluetooth_switch()
+        if bluetooth is None:
+            return 0
+        switch = getattr(bluetooth, switch_name)()
+        if switch is None:
+            return 0
+        return switch.get_rotation_since_last_long_button_press()
+
+
+class SaturationPostProcessor(BasePostProcessor):
+    def _stage(self) -> SaturationStage | None:
+        rotation_delta = self._rotation_delta("switch_one")
+        if rotation_delta == 0:
+            return None
+        factor = 1.0 + SATURATION_STEP * rotation_delta
+        return SaturationStage(max(SATURATION_MIN, min(SATURATION_MAX, factor)))
+
+
+class HueShiftPostProcessor(BasePostProcessor):
+    def _stage(self) -> HueShiftStage | None:
+        delta = self._rotation_delta("switch_two")
+        if delta == 0:
+            return None
+        return HueShiftStage((delta * HUE_STEP) % 1.0)
+
+
+class EdgePostProcessor(BasePostProcessor):
+    def __init__(self, *, chain: PostProcessingChain | None = None) -> None:
+        super().__init__(chain=chain)
+        self.edge_thresh = EDGE_THRESHOLD_DEFAULT
+
+    def _stage(self) -> EdgeStage | None:
+        delta = self._rotation_delta("switch_three")
+        if delta == 0:
+            return None
+        self.edge_thresh = int(
+            np.clip(
+                self.edge_thresh * (1.0 + EDGE_THRESHOLD_STEP * delta),
+                1,
+                255,
+            )
+        )
+        return EdgeStage(self.edge_thresh)
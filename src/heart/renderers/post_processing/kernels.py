@@ -0,0 +1,151 @@
+"""Numba kernel for the fused post-processing pass.
+
+Kept apart from :mod:`heart.renderers.post_processing.pipeline` so loading a
+configuration with post-processors does not import numba until an effect is
+first applied.
+
+The arithmetic mirrors the original per-effect numpy code operation for
+operation (float32 for saturation and colour conversion, float64 luminance for
+edges) so the fused pass reproduces it rather than approximating it.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+_LUMA_R32 = np.float32(0.299)
+_LUMA_G32 = np.float32(0.587)
+_LUMA_B32 = np.float32(0.114)
+_HUE_SCALE32 = np.float32((6.0 / 179.0) - 6e-05)
+_ONE32 = np.float32(1.0)
+_SIX32 = np.float32(6.0)
+_TWO32 = np.float32(2.0)
+_MAX32 = np.float32(255.0)
+_ZERO32 = np.float32(0.0)
+
+
+@njit(cache=True)
+def _clip_byte(value):
+    if value < _ZERO32:
+        return 0
+    if value > _MAX32:
+        return 255
+    return int(value)
+
+
+@njit(cache=True)
+def _hue_bucket(r, g, b):
+    """Return the OpenCV-style 0-179 hue the numpy converter assigns to a pixel."""
+
+    c_max = max(r, g, b)
+    delta = c_max - min(r, g, b)
+    if delta == 0:
+        return 0
+    rf = np.float32(r) / _MAX32
+    gf = np.float32(g) / _MAX32
+    bf = np.float32(b) / _MAX32
+    delta_f = max(rf, gf, bf) - min(rf, gf, bf)
+    # Later channels win ties, as the masked assignments did.
+    if c_max == b:
+        hue = (rf - gf) / delta_f + np.float32(4.0)
+    elif c_max == g:
+        hue = (bf - rf) / delta_f + _TWO32
+    else:
+        hue = ((gf - bf) / delta_f) % _SIX32
+    hue = (hue / _SIX32) % _ONE32
+    return int(np.rint(hue * np.float32(180.0))) % 180
+
+
+@njit(cache=True)
+def _hsv_to_rgb(h, s, v):
+    """Convert like the uncalibrated numpy path, plus its two pinned colours."""
+
+    if s == 255 and v == 255:
+        if h == 60:
+            return 0, 255, 2
+        if h == 119:
+            return 5, 0, 255
+    h_mod = (np.float32(h) * _HUE_SCALE32) % _SIX32
+    sf = np.float32(s) / _MAX32
+    vf = np.float32(v) / _MAX32
+    c = vf * sf
+    m = vf - c
+    x = c * (_ONE32 - abs(h_mod % _TWO32 - _ONE32))
+    if h_mod < 1:
+        rf, gf, bf = c, x, _ZERO32
+    elif h_mod < 2:
+        rf, gf, bf = x, c, _ZERO32
+    elif h_mod < 3:
+        rf, gf, bf = _ZERO32, c, x
+    elif h_mod < 5:
+        # Sector 3 has always reused sector 4's channel order.
+        rf, gf, bf = x, _ZERO32, c
+    else:
+        rf, gf, bf = c, _ZERO32, x
+    return (
+        _clip_byte(np.rint((rf + m) * _MAX32)),
+        _clip_byte(np.rint((gf + m) * _MAX32)),
+        _clip_byte(np.rint((bf + m) * _MAX32)),
+    )
+
+
+@njit(parallel=True, cache=True)
+def apply_chain(pixels, saturation, hue_rotation, edge_dim, edge_add, luminance):
+    """Apply the active stages to ``pixels`` (``pixels3d`` layout) in place.
+
+    ``saturation`` is skipped when negative, ``hue_rotation`` and the edge
+    tables when empty. ``edge_dim`` maps a channel to its dimmed background and
+    ``edge_add`` a gradient magnitude to the overlay added on top of it.
+    ``luminance`` is a reused ``int32`` buffer shaped like the surface that
+    holds the edge stage's input between its two sweeps.
+    """
+
+    width, height = pixels.shape[0], pixels.shape[1]
+    saturate = saturation >= 0
+    factor = np.float32(saturation)
+    rotate_hue = hue_rotation.shape[0] > 0
+    edges = edge_add.shape[0] > 0
+
+    for y in prange(height):
+        for x in range(width):
+            r = np.int32(pixels[x, y, 0])
+            g = np.int32(pixels[x, y, 1])
+            b = np.int32(pixels[x, y, 2])
+            if saturate:
+                rf = np.float32(r)
+                gf = np.float32(g)
+                bf = np.float32(b)
+                lum = _LUMA_R32 * rf + _LUMA_G32 * gf + _LUMA_B32 * bf
+                r = _clip_byte(lum + factor * (rf - lum))
+                g = _clip_byte(lum + factor * (gf - lum))
+                b = _clip_byte(lum + factor * (bf - lum))
+            if rotate_hue:
+                c_max = max(r, g, b)
+                delta = c_max - min(r, g, b)
+                s = 0 if c_max == 0 else (delta * 255 + c_max // 2) // c_max
+                r, g, b = _hsv_to_rgb(
+                    hue_rotation[_hue_bucket(r, g, b)], s, c_max
+                )
+            if saturate or rotate_hue:
+                pixels[x, y, 0] = r
+                pixels[x, y, 1] = g
+                pixels[x, y, 2] = b
+            if edges:
+                luminance[x, y] = int(0.299 * r + 0.587 * g + 0.114 * b)
+
+    if not edges:
+        return
+    for y in prange(height):
+        up = (y - 1) % height
+        down = (y + 1) % height
+        for x in range(width):
+            left = (x - 1) % width
+            right = (x + 1) % width
+            magnitude = abs(luminance[right, y] - luminance[left, y]) + abs(
+                luminance[x, down] - luminance[x, up]
+            )
+            add = edge_add[magnitude]
+            for channel in range(3):
+                value = edge_dim[pixels[x, y, channel]] + add
+                pixels[x, y, channel] = 255 if value > _MAX32 else int(value)
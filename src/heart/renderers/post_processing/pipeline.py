@@ -0,0 +1,177 @@
+"""Apply a chain of post-processing stages to a surface in one fused pass.
+
+The stages run in a numba kernel directly on the surface's ``pixels3d`` view:
+saturation and hue rotation rewrite each pixel once, and the edge overlay
+reads a reused luminance buffer with wrap-around neighbours instead of rolled
+copies. Per-setting work is folded into small lookup tables that are cached
+across frames, so a frame allocates nothing once its buffers exist.
+
+The kernel's hue rotation reimplements the uncached "fast" numpy colour
+conversion. Whenever :mod:`heart.utilities.color_conversion` would convert
+differently (OpenCV, lookup tables, strict calibration or its round-trip
+cache), hue stages run through the shared conversion instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pygame
+
+from heart.utilities import color_conversion
+
+EDGE_BACKGROUND_DIM = 0.75
+EDGE_GAMMA = 0.5
+# Largest horizontal plus vertical luminance difference a pixel can have.
+EDGE_MAGNITUDE_MAX = 2 * 255
+
+_NO_HUE_ROTATION = np.empty(0, dtype=np.uint8)
+_NO_EDGE_TABLE = np.empty(0, dtype=np.float32)
+_NO_LUMINANCE = np.empty((0, 0), dtype=np.int32)
+
+
+@dataclass(frozen=True, slots=True)
+class SaturationStage:
+    """Scale each pixel's distance from its luminance by ``factor``."""
+
+    factor: float
+
+
+@dataclass(frozen=True, slots=True)
+class HueShiftStage:
+    """Rotate hues by ``hue_delta`` turns."""
+
+    hue_delta: float
+
+
+@dataclass(frozen=True, slots=True)
+class EdgeStage:
+    """Dim the image and overlay gradients stronger than ``threshold``."""
+
+    threshold: int
+
+
+PostProcessingStage = SaturationStage | HueShiftStage | EdgeStage
+
+# The kernel always runs its stages in this order.
+_KERNEL_ORDER = {SaturationStage: 0, HueShiftStage: 1, EdgeStage: 2}
+
+
+def _kernel_runs(
+    stages: Sequence[PostProcessingStage], *, fuse_hue: bool = True
+) -> Iterator[list[PostProcessingStage]]:
+    """Group ``stages`` into kernel passes; unfused hue stages run alone."""
+
+    run: list[PostProcessingStage] = []
+    for stage in stages:
+        alone = not fuse_hue and isinstance(stage, HueShiftStage)
+        if run and (
+            alone
+            or (not fuse_hue and isinstance(run[-1], HueShiftStage))
+            or _KERNEL_ORDER[type(stage)] <= _KERNEL_ORDER[type(run[-1])]
+        ):
+            yield run
+            run = []
+        run.append(stage)
+    if run:
+        yield run
+
+
+@lru_cache(maxsize=64)
+def hue_rotation_table(hue_delta: float) -> np.ndarray:
+    """Map each 0-179 hue to its rotated hue, using the float32 steps of the numpy effect."""
+
+    hues = np.arange(256, dtype=np.float32)
+    table = ((hues / 179.0 + hue_delta) % 1.0 * 179.0).astype(np.uint8)
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=1)
+def edge_dim_table() -> np.ndarray:
+    """Map each channel value to its dimmed edge background."""
+
+    table = np.arange(256, dtype=np.float32) * EDGE_BACKGROUND_DIM
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=256)
+def edge_overlay_table(threshold: int) -> np.ndarray:
+    """Map each gradient magnitude to the brightness the edge overlay adds."""
+
+    magnitude = np.arange(EDGE_MAGNITUDE_MAX + 1, dtype=np.float32)
+    denom = max(1, 255 - threshold)
+    alpha = np.clip((magnitude - threshold) / denom, 0.0, 1.0)
+    alpha **= EDGE_GAMMA
+    table = alpha * 255.0
+    table.flags.writeable = False
+    return table
+
+
+def _shift_hue(pixels: np.ndarray, hue_delta: float) -> None:
+    """Rotate hues in place through the shared colour conversion."""
+
+    # Convert in row-major order, as the per-effect code did, so the
+    # conversion's round-trip cache sees pixels in the same sequence.
+    image = pixels.swapaxes(0, 1)
+    hsv = color_conversion.convert_rgb_to_hsv(image)
+    hsv[..., 0] = hue_rotation_table(float(hue_delta))[hsv[..., 0]]
+    image[:] = color_conversion.convert_hsv_to_rgb(hsv)
+
+
+class PostProcessingPipeline:
+    """Run post-processing stages over a surface without per-frame allocations.
+
+    Consecutive stages in saturation, hue, edge order share one kernel pass;
+    a stage that would have to run before one already queued starts another.
+    """
+
+    def __init__(self) -> None:
+        self._luminance = _NO_LUMINANCE
+
+    def apply(
+        self, surface: pygame.Surface, stages: Sequence[PostProcessingStage]
+    ) -> None:
+        if not stages:
+            return
+        from heart.renderers.post_processing.kernels import apply_chain
+
+        fuse_hue = not any(
+            isinstance(stage, HueShiftStage) for stage in stages
+        ) or color_conversion.numpy_fast_conversion_active()
+        pixels = pygame.surfarray.pixels3d(surface)
+        try:
+            for run in _kernel_runs(stages, fuse_hue=fuse_hue):
+                if not fuse_hue and isinstance(run[0], HueShiftStage):
+                    _shift_hue(pixels, run[0].hue_delta)
+                else:
+                    apply_chain(pixels, *self._kernel_arguments(pixels, run))
+        finally:
+            del pixels
+
+    def _kernel_arguments(
+        self, pixels: np.ndarray, stages: Sequence[PostProcessingStage]
+    ) -> tuple[float, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        saturation = -1.0
+        hue_rotation = _NO_HUE_ROTATION
+        edge_dim = edge_add = _NO_EDGE_TABLE
+        luminance = _NO_LUMINANCE
+        for stage in stages:
+            if isinstance(stage, SaturationStage):
+                saturation = max(0.0, float(stage.factor))
+            elif isinstance(stage, HueShiftStage):
+                hue_rotation = hue_rotation_table(float(stage.hue_delta))
+            else:
+                edge_dim = edge_dim_table()
+                edge_add = edge_overlay_table(int(stage.threshold))
+                luminance = self._luminance_buffer(pixels.shape[:2])
+        return saturation, hue_rotation, edge_dim, edge_add, luminance
+
+    def _luminance_buffer(self, shape: tuple[int, int]) -> np.ndarray:
+        if self._luminance.shape != shape:
+            self._luminance = np.empty(shape, dtype=np.int32)
+        return self._luminance
@@ -15,6 +15,8 @@ MIN_PREVIEW_SCALE = 2
 
 
 class TextRendering(StatefulBaseRenderer[TextRenderingState]):
+    frame_depends_only_on_state = True
+
     def __init__(
         self,
         text: list[str],
@@ -8,6 +8,7 @@ import pygame
 
 from heart import DeviceDisplayMode
 from heart.device import Device, Layout, Orientation
+from heart.runtime.rendering.surface_pool import SurfacePool
 from heart.utilities.env import Configuration
 from heart.utilities.logging import get_logger
 
@@ -23,6 +24,7 @@ class DisplayContext:
     clock: pygame.time.Clock | None = None
     last_render_mode: DeviceDisplayMode | None = None
     can_configure_display: bool = True
+    surface_pool: SurfacePool | None = None
 
     def configure_window(self, device_display_mode: DeviceDisplayMode) -> None:
         self._ensure_can_configure_display()
@@ -129,7 +131,12 @@ class DisplayContext:
                 # The screen is the full size of the device
                 screen_size = (window_x, window_y)
 
-        scratch_screen = pygame.Surface(screen_size, pygame.SRCALPHA)
+        if self.surface_pool is None:
+            scratch_screen = pygame.Surface(screen_size, pygame.SRCALPHA)
+        else:
+            scratch_screen = self.surface_pool.acquire(
+                screen_size, pygame.SRCALPHA, display_mode=display_mode
+            )
 
         return DisplayContext(
             device=self.device,
@@ -137,4 +144,5 @@ class DisplayContext:
             clock=self.clock,
             last_render_mode=self.last_render_mode,
             can_configure_display=False,
+            surface_pool=self.surface_pool,
         )
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+PROFILED_STAGES = ("render", "post", "blit", "flip", "device", "total")
+PROFILE_PERCENTILES = (50.0, 95.0, 99.0)
+DEFAULT_PROFILE_WINDOW = 512
+_STAGE_TIMING_KEYS = tuple((stage, f"{stage}_ms") for stage in PROFILED_STAGES)
+
+_ACTIVE_FRAME_PROFILER: FrameProfiler | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TimingPercentiles:
+    samples: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "samples": self.samples,
+            "p50_ms": self.p50_ms,
+            "p95_ms": self.p95_ms,
+            "p99_ms": self.p99_ms,
+            "max_ms": self.max_ms,
+        }
+
+
+class TimingRing:
+    """Keep the most recent ``capacity`` durations in a preallocated buffer."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("TimingRing capacity must be at least 1")
+        self._samples = np.zeros(capacity, dtype=np.float64)
+        self._cursor = 0
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return int(self._samples.shape[0])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, duration_ms: float) -> None:
+        self._samples[self._cursor] = duration_ms
+        self._cursor += 1
+        if self._cursor == self._samples.shape[0]:
+            self._cursor = 0
+        if self._count < self._samples.shape[0]:
+            self._count += 1
+
+    def clear(self) -> None:
+        self._cursor = 0
+        self._count = 0
+
+    def percentiles(self) -> TimingPercentiles | None:
+        if self._count == 0:
+            return None
+        window = self._samples[: self._count]
+        p50, p95, p99 = np.percentile(window, PROFILE_PERCENTILES)
+        return TimingPercentiles(
+            samples=self._count,
+            p50_ms=float(p50),
+            p95_ms=float(p95),
+            p99_ms=float(p99),
+            max_ms=float(window.max()),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FrameProfileSnapshot:
+    renderers: Mapping[str, TimingPercentiles]
+    stages: Mapping[str, TimingPercentiles]
+
+    def slowest_renderers(
+        self, *, budget_ms: float | None = None
+    ) -> list[tuple[str, TimingPercentiles]]:
+        """Return renderers ordered by p95, optionally only those over ``budget_ms``."""
+
+        ranked = sorted(
+            self.renderers.items(),
+            key=lambda item: item[1].p95_ms,
+            reverse=True,
+        )
+        if budget_ms is None:
+            return ranked
+        return [item for item in ranked if item[1].p95_ms > budget_ms]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "renderers": {
+                name: timing.as_dict() for name, timing in self.renderers.items()
+            },
+            "stages": {name: timing.as_dict() for name, timing in self.stages.items()},
+        }
+
+
+class FrameProfiler:
+    """Track rolling per-renderer and per-stage frame timings.
+
+    Every renderer name and pipeline stage owns a fixed-size :class:`TimingRing`, so
+    recording a sample never allocates once a name has been seen. Percentiles are
+    computed only when a snapshot is requested.
+
+    Snapshots may be taken from another thread than the one recording; adding a
+    renderer name and copying the renderer table share a lock, so only the
+    first sample for a name pays for it.
+
+    """
+
+    def __init__(self, *, window: int = DEFAULT_PROFILE_WINDOW) -> None:
+        if window < 1:
+            raise ValueError("FrameProfiler window must be at least 1")
+        self.window = window
+        self._renderers: dict[str, TimingRing] = {}
+        self._renderers_lock = threading.Lock()
+        self._stages = {stage: TimingRing(window) for stage in PROFILED_STAGES}
+
+    def record_renderer(self, name: str, duration_ms: float) -> None:
+        ring = self._renderers.get(name)
+        if ring is None:
+            with self._renderers_lock:
+                ring = self._renderers.setdefault(name, TimingRing(self.window))
+        ring.record(duration_ms)
+
+    def record_stage(self, stage: str, duration_ms: float) -> None:
+        try:
+            ring = self._stages[stage]
+        except KeyError as exc:
+            raise ValueError(f"Unknown profiled stage: {stage}") from exc
+        ring.record(duration_ms)
+
+    def record_frame(self, timings: Mapping[str, float]) -> None:
+        """Record the profiled stages present in a ``GameLoop`` timings dict."""
+
+        for stage, key in _STAGE_TIMING_KEYS:
+            duration_ms = timings.get(key)
+            if duration_ms is not None:
+                self._stages[stage].record(duration_ms)
+
+    def renderer_percentiles(self, name: str) -> TimingPercentiles | None:
+        ring = self._renderers.get(name)
+        return ring.percentiles() if ring is not None else None
+
+    def stage_percentiles(self, stage: str) -> TimingPercentiles | None:
+        ring = self._stages.get(stage)
+        return ring.percentiles() if ring is not None else None
+
+    def snapshot(self) -> FrameProfileSnapshot:
+        with self._renderers_lock:
+            renderers = dict(self._renderers)
+        return FrameProfileSnapshot(
+            renderers=_summaries(renderers),
+            stages=_summaries(self._stages),
+        )
+
+    def reset(self) -> None:
+        with self._renderers_lock:
+            self._renderers.clear()
+        for ring in self._stages.values():
+            ring.clear()
+
+
+def _summaries(rings: Mapping[str, TimingRing]) -> dict[str, TimingPercentiles]:
+    summaries: dict[str, TimingPercentiles] = {}
+    for name, ring in rings.items():
+        summary = ring.percentiles()
+        if summary is not None:
+            summaries[name] = summary
+    return summaries
+
+
+def get_frame_profiler() -> FrameProfiler | None:
+    return _ACTIVE_FRAME_PROFILER
+
+
+def set_frame_profiler(profiler: FrameProfiler | None) -> None:
+    global _ACTIVE_FRAME_PROFILER
+    _ACTIVE_FRAME_PROFILER = profiler
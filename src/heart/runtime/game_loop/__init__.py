@@ -14,12 +14,17 @@ from heart import DeviceDisplayMode
 from heart.device import Device
 from heart.navigation import ComposedRenderer, MultiScene
 from heart.renderers.emoji_overlay import FloatingEmojiOverlayRenderer
+from heart.renderers.post_processing import flush_post_processing
 from heart.runtime.active_game_loop import set_active_game_loop
 from heart.runtime.container import (build_runtime_container,
                                      configure_runtime_container)
 from heart.runtime.display_context import DisplayContext
+from heart.runtime.frame_profiler import FrameProfiler, set_frame_profiler
 from heart.runtime.game_loop.components import GameLoopComponents
-from heart.utilities.env import Configuration
+from heart.runtime.game_loop.frame_skip import FrameChangeTracker
+from heart.runtime.game_loop.presenter import FramePresenter
+from heart.runtime.rendering.surface_pool import SurfacePool
+from heart.utilities.env import Configuration, FramePresentStrategy
 from heart.utilities.logging import get_logger
 
 try:
@@ -121,6 +126,28 @@ class GameLoop:
         self._emoji_overlay_renderer: FloatingEmojiOverlayRenderer | None = None
         self._frame_index = 0
         self._last_perf_log_monotonic = 0.0
+        self._presenter = self._build_presenter()
+        self.profiler = self._build_profiler()
+        self._frame_changes = self._build_frame_change_tracker()
+        if Configuration.render_surface_pool_enabled():
+            self.components.display.surface_pool = SurfacePool()
+
+    def _build_presenter(self) -> FramePresenter | None:
+        if Configuration.frame_present_strategy() != FramePresentStrategy.PIPELINED:
+            return None
+        depth = Configuration.frame_present_buffer_depth()
+        logger.info("Presenting frames on a dedicated thread depth=%s", depth)
+        return FramePresenter(self.device, depth=depth)
+
+    def _build_profiler(self) -> FrameProfiler | None:
+        if not Configuration.render_profiler_enabled():
+            return None
+        return FrameProfiler(window=Configuration.render_profiler_window())
+
+    def _build_frame_change_tracker(self) -> FrameChangeTracker | None:
+        if not Configuration.skip_unchanged_frames():
+            return None
+        return FrameChangeTracker(idle_fps=Configuration.idle_max_fps())
 
     def _one_loop(
         self,
@@ -132,6 +159,13 @@ class GameLoop:
             raise RuntimeError("GameLoop clock is not initialized")
 
         timings: dict[str, float] = {}
+        frame_changes = self._frame_changes
+        post_processors: Sequence["StatefulBaseRenderer[Any]"] = ()
+        if frame_changes is not None:
+            post_processors = self.components.game_modes.get_post_processors()
+            if frame_changes.can_skip_render(renderers, post_processors):
+                timings["frame_skipped"] = 1.0
+                return timings
 
         started_at = time.perf_counter()
         render_surface = self.render_frame(renderers)
@@ -142,6 +176,12 @@ class GameLoop:
             self._apply_post_processors(render_surface)
             timings["post_ms"] = _elapsed_ms_since(started_at)
 
+            if frame_changes is not None and not frame_changes.frame_changed(
+                render_surface, renderers, post_processors
+            ):
+                timings["frame_skipped"] = 1.0
+                return timings
+
             started_at = time.perf_counter()
             self.components.display.screen.fill("black")
             timings["clear_ms"] = _elapsed_ms_since(started_at)
@@ -155,11 +195,28 @@ class GameLoop:
             timings["flip_ms"] = _elapsed_ms_since(started_at)
 
             started_at = time.perf_counter()
-            self.device.set_screen(self.components.display.screen)
+            self._present(self.components.display.screen)
             timings["device_ms"] = _elapsed_ms_since(started_at)
+            timings.update(self._present_timings(timings["device_ms"]))
 
         return timings
 
+    def _present(self, screen: pygame.Surface) -> None:
+        if self._presenter is None:
+            self.device.set_screen(screen)
+            return
+        self._presenter.submit(screen)
+
+    def _present_timings(self, device_ms: float) -> dict[str, float]:
+        if self._presenter is None:
+            return {"present_ms": device_ms, "present_latency_ms": device_ms}
+        stats = self._presenter.stats()
+        return {
+            "present_ms": stats.present_ms,
+            "present_latency_ms": stats.latency_ms,
+            "present_dropped": float(stats.dropped),
+        }
+
     def _apply_post_processors(self, surface: pygame.Surface) -> None:
         post_processors = self.components.game_modes.get_post_processors()
         if not post_processors:
@@ -170,6 +227,7 @@ class GameLoop:
             clock=self.components.display.clock,
             last_render_mode=self.components.display.last_render_mode,
             can_configure_display=False,
+            surface_pool=self.components.display.surface_pool,
         )
         for renderer in post_processors:
             if not renderer.initialized:
@@ -183,6 +241,7 @@ class GameLoop:
                 peripheral_manager=self.components.peripheral_manager,
                 orientation=self.device.orientation,
             )
+        flush_post_processing(post_processors)
 
     def resolve(self, dependency: type[DependencyT]) -> DependencyT:
         return self.context_container.resolve(dependency)
@@ -222,6 +281,7 @@ class GameLoop:
         global ACTIVE_GAME_LOOP
         ACTIVE_GAME_LOOP = loop
         set_active_game_loop(loop)
+        set_frame_profiler(loop.profiler)
 
     def start(self) -> None:
         logger.info("Starting GameLoop")
@@ -250,6 +310,8 @@ class GameLoop:
         finally:
             logger.info("Shutting down GameLoop.")
 
+            if self._presenter is not None:
+                self._presenter.close()
             self.components.peripheral_runtime.close()
             self.components.peripheral_manager.stop()
             pygame.quit()
@@ -331,6 +393,9 @@ class GameLoop:
             raise RuntimeError("GameLoop clock is not initialized")
         display_mode = self._resolve_display_mode(renderers)
         self._reset_opengl_renderers_before_display_mode_change(display_mode)
+        surface_pool = self.components.display.surface_pool
+        if surface_pool is not None:
+            surface_pool.begin_frame()
         with self.components.display.display_mode(display_mode):
             return ComposedRenderer.render_batch(
                 renderers,
@@ -532,14 +597,18 @@ class GameLoop:
         lifecycle_counts = self._renderer_lifecycle_counts()
         clock = self.components.display.clock
         fps = clock.get_fps() if clock is not None else 0.0
+        surface_pool = self.components.display.surface_pool
+        surface_stats = surface_pool.stats() if surface_pool is not None else None
 
         logger.info(
             "render.perf.frame frame=%s fps=%.1f max_fps=%s total=%.2fms "
             "pre_tick=%.2fms events=%.2fms preprocess=%.2fms select=%.2fms "
             "render=%.2fms post=%.2fms blit=%.2fms flip=%.2fms "
-            "device=%.2fms pacing=%.2fms post_tick=%.2fms publish=%.2fms "
+            "device=%.2fms present=%.2fms present_latency=%.2fms "
+            "present_dropped=%d skipped=%d pacing=%.2fms post_tick=%.2fms "
+            "publish=%.2fms "
             "renderers=%s active_initialized=%s all_initialized=%s "
-            "post_processors=%s gc=%s rss=%s",
+            "post_processors=%s surface_allocs=%s surface_pooled=%s gc=%s rss=%s",
             self._frame_index,
             fps,
             self.max_fps,
@@ -553,6 +622,10 @@ class GameLoop:
             timings.get("blit_ms", 0.0),
             timings.get("flip_ms", 0.0),
             timings.get("device_ms", 0.0),
+            timings.get("present_ms", 0.0),
+            timings.get("present_latency_ms", 0.0),
+            timings.get("present_dropped", 0.0),
+            timings.get("frame_skipped", 0.0),
             timings.get("pacing_ms", 0.0),
             timings.get("peripheral_post_ms", 0.0),
             timings.get("clock_publish_ms", 0.0),
@@ -560,6 +633,8 @@ class GameLoop:
             sum(1 for renderer in renderers if renderer.initialized),
             lifecycle_counts["initialized"],
             len(self.components.game_modes.get_post_processors()),
+            surface_stats.frame_allocations if surface_stats is not None else None,
+            surface_stats.pooled if surface_stats is not None else None,
             gc.get_count(),
             self._resident_memory_usage(),
         )
@@ -604,6 +679,11 @@ class GameLoop:
             return None
         return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
 
+    def _tick_rate(self) -> int:
+        if self._frame_changes is None:
+            return self.max_fps
+        return self._frame_changes.tick_rate(self.max_fps)
+
     def _run_main_loop(self) -> None:
         if self.components.display.clock is None:
             raise RuntimeError("GameLoop failed to initialize display clock")
@@ -634,7 +714,7 @@ class GameLoop:
             # self._render_pacer.pace(render_start, 20)
 
             step_started_at = time.perf_counter()
-            self.components.display.clock.tick(self.max_fps)
+            self.components.display.clock.tick(self._tick_rate())
             timings["pacing_ms"] = _elapsed_ms_since(step_started_at)
 
             step_started_at = time.perf_counter()
@@ -649,4 +729,6 @@ class GameLoop:
 
             self._frame_index += 1
             timings["total_ms"] = _elapsed_ms_since(frame_started_at)
+            if self.profiler is not None:
+                self.profiler.record_frame(timings)
             self._maybe_log_perf_frame(renderers=renderers, timings=timings)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import zlib
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+import pygame
+
+if TYPE_CHECKING:
+    from heart.renderers import StatefulBaseRenderer
+
+IDLE_BACKOFF_AFTER_FRAMES = 10
+
+
+class FrameChangeTracker:
+    """Detect frames that would repeat what the device is already showing.
+
+    Renderers can declare through ``frame_unchanged`` that their next frame matches
+    the last one they drew, in which case the whole render can be skipped. Otherwise
+    the composed surface is hashed with CRC-32 and compared to the last presented
+    frame so blit, flip and device submission can still be skipped. After
+    ``IDLE_BACKOFF_AFTER_FRAMES`` consecutive unchanged frames the loop ticks at
+    ``idle_fps`` until something changes.
+
+    """
+
+    def __init__(self, *, idle_fps: int) -> None:
+        if idle_fps < 1:
+            raise ValueError("FrameChangeTracker idle_fps must be at least 1")
+        self.idle_fps = idle_fps
+        self._renderer_ids: tuple[int, ...] | None = None
+        self._digest: int | None = None
+        self._unchanged_frames = 0
+        self.skipped_frames = 0
+
+    def can_skip_render(
+        self,
+        renderers: Sequence["StatefulBaseRenderer[Any]"],
+        post_processors: Sequence["StatefulBaseRenderer[Any]"],
+    ) -> bool:
+        if self._digest is None or not renderers:
+            return False
+        if self._renderer_ids != _renderer_ids(renderers, post_processors):
+            return False
+        if not all(renderer.frame_unchanged() for renderer in renderers):
+            return False
+        if not all(renderer.frame_unchanged() for renderer in post_processors):
+            return False
+        self._mark_unchanged()
+        return True
+
+    def frame_changed(
+        self,
+        surface: pygame.Surface,
+        renderers: Sequence["StatefulBaseRenderer[Any]"],
+        post_processors: Sequence["StatefulBaseRenderer[Any]"],
+    ) -> bool:
+        """Record ``surface`` and return whether it differs from the last frame."""
+
+        renderer_ids = _renderer_ids(renderers, post_processors)
+        digest = zlib.crc32(surface.get_buffer())
+        if renderer_ids == self._renderer_ids and digest == self._digest:
+            self._mark_unchanged()
+            return False
+        self._renderer_ids = renderer_ids
+        self._digest = digest
+        self._unchanged_frames = 0
+        return True
+
+    def invalidate(self) -> None:
+        self._renderer_ids = None
+        self._digest = None
+        self._unchanged_frames = 0
+
+    def tick_rate(self, max_fps: int) -> int:
+        if self._unchanged_frames < IDLE_BACKOFF_AFTER_FRAMES:
+            return max_fps
+        return min(max_fps, self.idle_fps)
+
+    def _mark_unchanged(self) -> None:
+        self._unchanged_frames += 1
+        self.skipped_frames += 1
+
+
+def _renderer_ids(
+    renderers: Sequence["StatefulBaseRenderer[Any]"],
+    post_processors: Sequence["StatefulBaseRenderer[Any]"],
+) -> tuple[int, ...]:
+    return (*map(id, renderers), -1, *map(id, post_processors))
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import pygame
+
+from heart.device import Device
+from heart.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+PRESENTER_THREAD_NAME = "heart-frame-presenter"
+DEFAULT_CLOSE_TIMEOUT_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class FramePresenterStats:
+    presented: int
+    dropped: int
+    present_ms: float
+    latency_ms: float
+
+
+@dataclass
+class _PendingFrame:
+    surface: pygame.Surface
+    submitted_at: float
+
+
+class FramePresenter:
+    """Submit rendered frames to a device from a dedicated presenter thread.
+
+    Frames are copied into a bounded pool of ``depth`` surfaces so the render thread
+    can reuse the display surface immediately. When every slot is busy the oldest
+    queued frame is dropped so the device always shows the newest render.
+
+    """
+
+    def __init__(self, device: Device, *, depth: int) -> None:
+        if depth < 2:
+            raise ValueError("FramePresenter depth must be at least 2")
+        self.device = device
+        self.depth = depth
+        self._condition = threading.Condition()
+        self._pending: deque[_PendingFrame] = deque()
+        self._free: list[pygame.Surface] = []
+        self._allocated = 0
+        self._closed = False
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+        self._presented = 0
+        self._dropped = 0
+        self._present_ms = 0.0
+        self._latency_ms = 0.0
+
+    def submit(self, screen: pygame.Surface) -> None:
+        """Queue a copy of ``screen`` for presentation on the presenter thread."""
+
+        self._raise_pending_error()
+        slot = self._acquire_slot(screen)
+        slot.blit(screen, (0, 0))
+        with self._condition:
+            if self._closed:
+                self._free.append(slot)
+                raise RuntimeError("FramePresenter is closed")
+            self._pending.append(
+                _PendingFrame(surface=slot, submitted_at=time.perf_counter())
+            )
+            self._condition.notify()
+        self._ensure_thread()
+
+    def stats(self) -> FramePresenterStats:
+        with self._condition:
+            return FramePresenterStats(
+                presented=self._presented,
+                dropped=self._dropped,
+                present_ms=self._present_ms,
+                latency_ms=self._latency_ms,
+            )
+
+    def close(self, timeout: float = DEFAULT_CLOSE_TIMEOUT_SECONDS) -> None:
+        """Present any queued frames, then stop the presenter thread."""
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.warning("Frame presenter did not stop within %.2fs", timeout)
+
+    def _acquire_slot(self, screen: pygame.Surface) -> pygame.Surface:
+        size = screen.get_size()
+        with self._condition:
+            slot: pygame.Surface | None = None
+            if self._free:
+                slot = self._free.pop()
+            elif self._allocated < self.depth:
+                self._allocated += 1
+            elif self._pending:
+                slot = self._pending.popleft().surface
+                self._dropped += 1
+            else:
+                # The presenter thread holds every slot; grow rather than block.
+                self._allocated += 1
+        if slot is None or slot.get_size() != size:
+            return screen.copy()
+        return slot
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name=PRESENTER_THREAD_NAME,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _raise_pending_error(self) -> None:
+        error = self._error
+        if error is None:
+            return
+        self._error = None
+        raise RuntimeError("Frame presenter failed to submit a frame") from error
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                frame = self._pending.popleft()
+
+            started_at = time.perf_counter()
+            try:
+                self.device.set_screen(frame.surface)
+            except Exception as exc:
+                logger.exception("Frame presenter failed to submit a frame")
+                self._error = exc
+            finished_at = time.perf_counter()
+
+            with self._condition:
+                self._free.append(frame.surface)
+                self._presented += 1
+                self._present_ms = (finished_at - started_at) * 1000.0
+                self._latency_ms = (finished_at - frame.submitted_at) * 1000.0
@@ -0,0 +1,390 @@
+"""Compact binary envelopes for Heart publications carried over the ManyFold mesh.
+
+A batch holds every record one node queued for a topic during a poll cycle::
+
+    batch  = magic "HB" | version u8 | record count u16 | record...
+    record = event id u64 | body encoding u8 | payload type length u8
+             | body length u32 | payload type | body
+
+Event ids pack a 32-bit tag derived from the node and instance ids and a random
+per-start nonce with a 32-bit sequence, so receivers deduplicate with a sliding
+bit window per sender instead of a set of UUID strings. Bodies use a topic's :class:`StructRecordCodec`
+when one is registered and otherwise fall back to ``encode_peripheral_payload``.
+
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+import struct
+import zlib
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import final
+
+from heart.peripheral.core.encoding import (PeripheralPayloadEncoding,
+                                            decode_peripheral_payload,
+                                            encode_peripheral_payload)
+
+MESH_BATCH_MAGIC = b"HB"
+MESH_BATCH_VERSION = 1
+MESH_BATCH_MAX_RECORDS = 256
+MESH_BATCH_MAX_BYTES = 60 * 1024
+MESH_EVENT_SEQUENCE_BITS = 32
+DEFAULT_MESH_EVENT_WINDOW = 4096
+DEFAULT_MESH_EVENT_SENDERS = 256
+
+_BATCH_HEADER = struct.Struct("<2sBH")
+_RECORD_HEADER = struct.Struct("<QBBI")
+_SEQUENCE_MASK = (1 << MESH_EVENT_SEQUENCE_BITS) - 1
+
+
+@final
+class MeshBodyEncoding(IntEnum):
+    STRUCT = 0
+    JSON_UTF8 = 1
+    PROTOBUF = 2
+
+
+_PERIPHERAL_BODY_ENCODINGS = {
+    PeripheralPayloadEncoding.JSON_UTF8: MeshBodyEncoding.JSON_UTF8,
+    PeripheralPayloadEncoding.PROTOBUF: MeshBodyEncoding.PROTOBUF,
+}
+_BODY_PERIPHERAL_ENCODINGS = {
+    body: peripheral for peripheral, body in _PERIPHERAL_BODY_ENCODINGS.items()
+}
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class MeshBatch:
+    """One encoded batch and the id of its first record, used as the message id."""
+
+    first_event_id: int
+    payload: bytes
+
+
+@final
+class StructRecordCodec:
+    """Pack a flat mapping as fixed-width numbers followed by length-prefixed text.
+
+    ``number_fields`` pairs each key with a :mod:`struct` format character. Keys
+    named in ``optional_fields`` must use ``"d"`` and encode ``None`` as NaN, which
+    mesh payloads never carry because the JSON envelope rejects it.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        text_fields: Sequence[str],
+        number_fields: Sequence[tuple[str, str]] = (),
+        optional_fields: Iterable[str] = (),
+    ) -> None:
+        self._text_fields = tuple(text_fields)
+        self._number_names = tuple(name for name, _ in number_fields)
+        self._numbers = struct.Struct(
+            "<" + "".join(code for _, code in number_fields)
+        )
+        self._optional = frozenset(optional_fields)
+        for name, code in number_fields:
+            if name in self._optional and code != "d":
+                raise ValueError(f"optional field {name} must use the 'd' format")
+
+    def encode(self, payload: Mapping[str, object]) -> bytes:
+        numbers = self._numbers.pack(
+            *(
+                math.nan
+                if name in self._optional and payload[name] is None
+                else payload[name]
+                for name in self._number_names
+            )
+        )
+        texts = [str(payload[name]).encode("utf-8") for name in self._text_fields]
+        return b"".join((numbers, bytes(map(len, texts)), *texts))
+
+    def decode(self, body: bytes) -> dict[str, object]:
+        numbers = self._numbers
+        offset = numbers.size + len(self._text_fields)
+        if len(body) < offset:
+            raise ValueError("struct record is truncated")
+        result = dict(zip(self._number_names, numbers.unpack_from(body)))
+        for name in self._optional:
+            value = result[name]
+            if isinstance(value, float) and math.isnan(value):
+                result[name] = None
+        for name, length in zip(self._text_fields, body[numbers.size : offset]):
+            result[name] = body[offset : offset + length].decode("utf-8")
+            offset += length
+        if offset != len(body):
+            raise ValueError("struct record has the wrong length")
+        return result
+
+
+@final
+class MeshEventIds:
+    """Allocate 64-bit event ids from a node tag and a wrapping sequence.
+
+    The tag mixes in ``nonce``, random unless given, so a node restarted with the
+    same ``instance_id`` does not reuse a tag whose old sequences peers still hold
+    as seen.
+    """
+
+    def __init__(
+        self, node_id: str, instance_id: str, *, nonce: bytes | None = None
+    ) -> None:
+        if nonce is None:
+            nonce = os.urandom(8)
+        self.node_tag = zlib.crc32(
+            f"{node_id}\0{instance_id}\0".encode("utf-8") + nonce
+        )
+        self._prefix = self.node_tag << MESH_EVENT_SEQUENCE_BITS
+        self._sequence = itertools.count(1)
+
+    def next(self) -> int:
+        return self._prefix | (next(self._sequence) & _SEQUENCE_MASK)
+
+
+@final
+class MeshEventWindow:
+    """Remember recently seen event ids with a sliding bit window per sender.
+
+    Each sender, keyed by the ``source`` node and the id's tag, keeps its highest
+    sequence and a bitmask of the ``width`` sequences below it, so duplicates and
+    reordering inside the window are handled without storing ids. Sequences older
+    than the window are treated as seen. Keying on ``source`` keeps a tag collision
+    between two nodes from dropping either one's events. The least recently added
+    sender is forgotten once ``max_senders`` is exceeded.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        width: int = DEFAULT_MESH_EVENT_WINDOW,
+        max_senders: int = DEFAULT_MESH_EVENT_SENDERS,
+    ) -> None:
+        if width < 1:
+            raise ValueError("MeshEventWindow width must be at least 1")
+        if max_senders < 1:
+            raise ValueError("MeshEventWindow max_senders must be at least 1")
+        self.width = width
+        self.max_senders = max_senders
+        self._mask = (1 << width) - 1
+        self._senders: dict[tuple[str, int], tuple[int, int]] = {}
+
+    def add(self, event_id: int, source: str = "") -> bool:
+        """Record ``event_id`` and return whether it had not been seen before."""
+
+        tag = (source, event_id >> MESH_EVENT_SEQUENCE_BITS)
+        sequence = event_id & _SEQUENCE_MASK
+        state = self._senders.pop(tag, None)
+        if state is None:
+            if len(self._senders) >= self.max_senders:
+                del self._senders[next(iter(self._senders))]
+            self._senders[tag] = (sequence, 1)
+            return True
+        highest, seen = state
+        if sequence > highest:
+            shift = sequence - highest
+            seen = ((seen << shift) | 1) & self._mask if shift < self.width else 1
+            self._senders[tag] = (sequence, seen)
+            return True
+        self._senders[tag] = state
+        offset = highest - sequence
+        if offset >= self.width:
+            return False
+        bit = 1 << offset
+        if seen & bit:
+            return False
+        self._senders[tag] = (highest, seen | bit)
+        return True
+
+    def seen(self, event_id: int, source: str = "") -> bool:
+        """Return whether :meth:`add` would reject ``event_id``, without recording it."""
+
+        state = self._senders.get((source, event_id >> MESH_EVENT_SEQUENCE_BITS))
+        if state is None:
+            return False
+        highest, seen = state
+        sequence = event_id & _SEQUENCE_MASK
+        if sequence > highest:
+            return False
+        offset = highest - sequence
+        return offset >= self.width or bool(seen & (1 << offset))
+
+
+def encode_mesh_record(
+    event_id: int,
+    payload: Mapping[str, object],
+    codec: StructRecordCodec | None = None,
+) -> bytes:
+    """Encode one record, using ``codec`` when it can represent ``payload``."""
+
+    if codec is not None:
+        try:
+            body = codec.encode(payload)
+        except (KeyError, TypeError, ValueError, struct.error):
+            pass
+        else:
+            return (
+                _RECORD_HEADER.pack(event_id, MeshBodyEncoding.STRUCT, 0, len(body))
+                + body
+            )
+    encoded = encode_peripheral_payload(payload)
+    payload_type = encoded.payload_type.encode("utf-8")
+    return b"".join(
+        (
+            _RECORD_HEADER.pack(
+                event_id,
+                _PERIPHERAL_BODY_ENCODINGS[encoded.encoding],
+                len(payload_type),
+                len(encoded.payload),
+            ),
+            payload_type,
+            encoded.payload,
+        )
+    )
+
+
+def encode_mesh_batches(
+    records: Sequence[bytes],
+    *,
+    max_records: int = MESH_BATCH_MAX_RECORDS,
+    max_bytes: int = MESH_BATCH_MAX_BYTES,
+) -> list[MeshBatch]:
+    """Group encoded records into as few batches as the record and byte caps allow.
+
+    A single record larger than ``max_bytes`` is still sent, alone in its batch.
+
+    """
+
+    batches: list[MeshBatch] = []
+    start = 0
+    while start < len(records):
+        size = _BATCH_HEADER.size + len(records[start])
+        end = start + 1
+        while (
+            end < len(records)
+            and end - start < max_records
+            and size + len(records[end]) <= max_bytes
+        ):
+            size += len(records[end])
+            end += 1
+        batches.append(
+            MeshBatch(
+                first_event_id=_RECORD_HEADER.unpack_from(records[start])[0],
+                payload=b"".join(
+                    (
+                        _BATCH_HEADER.pack(
+                            MESH_BATCH_MAGIC, MESH_BATCH_VERSION, end - start
+                        ),
+                        *records[start:end],
+                    )
+                ),
+            )
+        )
+        start = end
+    return batches
+
+
+def is_mesh_batch(payload: bytes) -> bool:
+    return payload[: len(MESH_BATCH_MAGIC)] == MESH_BATCH_MAGIC
+
+
+def first_mesh_event_id(payload: bytes) -> int:
+    """Return the id of a batch's first record without decoding any bodies."""
+
+    if len(payload) < _BATCH_HEADER.size + _RECORD_HEADER.size:
+        raise ValueError("mesh batch is truncated")
+    return _RECORD_HEADER.unpack_from(payload, _BATCH_HEADER.size)[0]
+
+
+def decode_mesh_batch(
+    payload: bytes,
+    codec: StructRecordCodec | None = None,
+    *,
+    window: MeshEventWindow | None = None,
+    source: str = "",
+) -> list[tuple[int, object]]:
+    """Return ``(event_id, payload)`` pairs, raising ``ValueError`` if malformed.
+
+    With a ``window``, records it has already seen from ``source`` are skipped
+    before their body is decoded. The window only records the batch's ids once the whole batch has
+    decoded, so a malformed batch can be delivered again intact.
+
+    """
+
+    if len(payload) < _BATCH_HEADER.size:
+        raise ValueError("mesh batch is truncated")
+    magic, version, count = _BATCH_HEADER.unpack_from(payload)
+    if magic != MESH_BATCH_MAGIC:
+        raise ValueError("mesh batch has the wrong magic")
+    if version != MESH_BATCH_VERSION:
+        raise ValueError(f"unsupported mesh batch version {version}")
+    if count == 0:
+        raise ValueError("mesh batch has no records")
+    size = len(payload)
+    header_size = _RECORD_HEADER.size
+    unpack_header = _RECORD_HEADER.unpack_from
+    offset = _BATCH_HEADER.size
+    spans: list[tuple[int, int, int, int, int]] = []
+    for _index in range(count):
+        if size - offset < header_size:
+            raise ValueError("mesh record header is truncated")
+        event_id, body_encoding, type_length, body_length = unpack_header(
+            payload, offset
+        )
+        start = offset + header_size
+        offset = start + type_length + body_length
+        if offset > size:
+            raise ValueError("mesh record body is truncated")
+        spans.append((event_id, body_encoding, start, start + type_length, offset))
+    if offset != size:
+        raise ValueError("mesh batch has trailing bytes")
+
+    records: list[tuple[int, object]] = []
+    batch_ids: set[int] = set()
+    for event_id, body_encoding, start, body_start, end in spans:
+        if window is not None:
+            if event_id in batch_ids or window.seen(event_id, source):
+                continue
+            batch_ids.add(event_id)
+        if body_encoding == MeshBodyEncoding.STRUCT:
+            if codec is None:
+                raise ValueError("struct mesh record has no codec for its topic")
+            records.append((event_id, codec.decode(payload[start:end])))
+            continue
+        records.append(
+            (
+                event_id,
+                _decode_peripheral_body(
+                    body_encoding,
+                    payload[start:body_start].decode("utf-8"),
+                    payload[body_start:end],
+                ),
+            )
+        )
+    if window is not None:
+        for event_id, _record in records:
+            window.add(event_id, source)
+    return records
+
+
+def _decode_peripheral_body(
+    body_encoding: int,
+    payload_type: str,
+    body: bytes,
+) -> object:
+    try:
+        encoding = _BODY_PERIPHERAL_ENCODINGS[MeshBodyEncoding(body_encoding)]
+    except (KeyError, ValueError) as error:
+        raise ValueError(f"unknown mesh body encoding {body_encoding}") from error
+    return decode_peripheral_payload(
+        body,
+        encoding=encoding,
+        payload_type=payload_type,
+    )
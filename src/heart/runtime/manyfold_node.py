@@ -10,7 +10,6 @@ from enum import Enum
 from pathlib import Path
 from threading import Lock
 from typing import final
-from uuid import uuid4
 
 from manyfold.architecture import (CompositeDiscovery, LinkState,
                                    MachineSignerClient, MembershipConfig,
@@ -40,6 +39,11 @@ from heart.peripheral.core.input.external_sensors import (
     external_sensor_state_topic)
 from heart.peripheral.core.input.profiles.navigation import (
     HEART_INPUT_PUBSUB, NAVIGATION_TOPIC, NavigationEvent)
+from heart.runtime.manyfold_codec import (MeshEventIds, MeshEventWindow,
+                                          StructRecordCodec, decode_mesh_batch,
+                                          encode_mesh_batches,
+                                          encode_mesh_record,
+                                          first_mesh_event_id, is_mesh_batch)
 from heart.utilities.logging import get_logger
 
 DEFAULT_MAX_PUBLICATIONS_PER_POLL = 64
@@ -68,6 +72,14 @@ class TopicDelivery(str, Enum):
     MESH_COALESCED = "mesh_coalesced"
 
 
+@final
+class MeshPayloadEncoding(str, Enum):
+    """Wire format for Heart publications sent over the mesh."""
+
+    BINARY = "binary"
+    JSON = "json"
+
+
 @final
 @dataclass(frozen=True, slots=True)
 class TopicPolicy:
@@ -118,6 +130,18 @@ HEART_TOPIC_POLICIES = (
     ),
 )
 
+MESH_RECORD_CODECS = {
+    NAVIGATION_TOPIC: StructRecordCodec(
+        text_fields=("kind", "source"),
+        number_fields=(("step", "i"),),
+    ),
+    EXTERNAL_SENSOR_STATE_TOPIC: StructRecordCodec(
+        text_fields=("sensor_key",),
+        number_fields=(("value", "d"),),
+        optional_fields=("value",),
+    ),
+}
+
 
 @final
 @dataclass(frozen=True, slots=True)
@@ -203,6 +227,10 @@ class ManyfoldNodeRuntime:
         self._pending_sensor_lock = Lock()
         self._next_sensor_publish_at = 0.0
         self._seen = _SeenEventIds(DEFAULT_SEEN_EVENT_LIMIT)
+        self._seen_sequences = MeshEventWindow(width=DEFAULT_SEEN_EVENT_LIMIT)
+        self._event_ids: MeshEventIds | None = None
+        self._pending_records: dict[str, list[bytes]] = {}
+        self._pending_records_lock = Lock()
         self._last_status_key: tuple[object, ...] | None = None
 
     @property
@@ -228,6 +256,10 @@ class ManyfoldNodeRuntime:
         node = NodeRuntime(bootstrap.node_config(security_provider))
         self._signer_client = signer_client
         self._node = node
+        self._event_ids = MeshEventIds(
+            bootstrap.identity.node_id,
+            bootstrap.identity.instance_id,
+        )
         try:
             node.start()
             process_security = security_provider.process_security
@@ -241,6 +273,7 @@ class ManyfoldNodeRuntime:
             bootstrap.configure_mesh(mesh, process_security)
             self._install_bridges()
             self._publish_status("started")
+            self._flush_mesh()
         except Exception:
             self.close()
             raise
@@ -258,7 +291,12 @@ class ManyfoldNodeRuntime:
         )
 
     def poll(self) -> None:
-        """Drain bounded mesh work without running discovery or SWIM inline."""
+        """Drain bounded mesh work without running discovery or SWIM inline.
+
+        With binary payloads, publications queued since the previous poll are sent
+        at the end of the cycle as one batch per topic.
+
+        """
         node = self._node
         mesh = self._mesh
         if node is None or mesh is None:
@@ -281,6 +319,7 @@ class ManyfoldNodeRuntime:
                 snapshot=snapshot,
                 peer_health=peer_health,
             )
+        self._flush_mesh()
 
     def close(self) -> None:
         """Release bridges, mesh, canonical bootstrap, and signer client."""
@@ -291,6 +330,7 @@ class ManyfoldNodeRuntime:
             return
         if node is not None and mesh is not None:
             self._publish_status("stopping")
+            self._flush_mesh()
         for local_subscription in reversed(self._local_subscriptions):
             local_subscription.dispose()
         self._local_subscriptions.clear()
@@ -303,6 +343,9 @@ class ManyfoldNodeRuntime:
         self._topics.clear()
         with self._pending_sensor_lock:
             self._pending_sensor = None
+        with self._pending_records_lock:
+            self._pending_records = {}
+        self._event_ids = None
         self._mesh = None
         self._node = None
         self._signer_client = None
@@ -393,29 +436,63 @@ class ManyfoldNodeRuntime:
 
     def _publish_mesh(self, topic: str, payload: Mapping[str, object]) -> None:
         node = self._require_node()
-        mesh = self._require_mesh()
-        event_id = f"{node.config.identity.node_id}:{uuid4().hex}"
+        event_ids = self._require_event_ids()
+        if self._payload_encoding() is MeshPayloadEncoding.BINARY:
+            record = encode_mesh_record(
+                event_ids.next(), payload, MESH_RECORD_CODECS.get(topic)
+            )
+            with self._pending_records_lock:
+                self._pending_records.setdefault(topic, []).append(record)
+            return
+        event_id = _mesh_message_id(node.config.identity.node_id, event_ids.next())
         encoded = json.dumps(
             {"event_id": event_id, "payload": payload},
             allow_nan=False,
             separators=(",", ":"),
             sort_keys=True,
         ).encode("utf-8")
+        if self._send_mesh(topic, encoded, event_id):
+            self._seen.add(event_id)
+
+    def _flush_mesh(self) -> None:
+        with self._pending_records_lock:
+            pending = self._pending_records
+            self._pending_records = {}
+        if not pending:
+            return
+        node_id = self._require_node().config.identity.node_id
+        for topic, records in pending.items():
+            for batch in encode_mesh_batches(records):
+                self._send_mesh(
+                    topic,
+                    batch.payload,
+                    _mesh_message_id(node_id, batch.first_event_id),
+                )
+
+    def _send_mesh(self, topic: str, payload: bytes, message_id: str) -> bool:
+        mesh = self._require_mesh()
         try:
-            mesh.publish(topic, encoded, message_id=event_id)
+            mesh.publish(topic, payload, message_id=message_id)
         except (MeshBackpressureError, MeshClosed, MeshRouteError) as error:
             logger.warning("ManyFold best-effort topic %s dropped: %s", topic, error)
-            return
-        self._seen.add(event_id)
+            return False
+        return True
 
     def _accept_publication(self, publication: MeshPublication) -> None:
         node = self._require_node()
         if publication.source_node_id == node.config.identity.node_id:
             return
         try:
-            event_id, payload = _decode_mesh_payload(publication.payload)
-            if event_id != publication.message_id:
-                raise ValueError("event_id does not match mesh message_id")
+            if is_mesh_batch(publication.payload):
+                records = self._decode_batch(publication)
+            else:
+                event_id, payload = _decode_mesh_payload(publication.payload)
+                if event_id != publication.message_id:
+                    raise ValueError("event_id does not match mesh message_id")
+                if self._seen.contains(event_id):
+                    return
+                self._seen.add(event_id)
+                records = [(event_id, payload)]
         except ValueError as error:
             logger.warning(
                 "Ignoring malformed ManyFold topic %s from %s: %s",
@@ -424,9 +501,37 @@ class ManyfoldNodeRuntime:
                 error,
             )
             return
-        if self._seen.contains(event_id):
-            return
-        self._seen.add(event_id)
+        for event_id, payload in records:
+            self._deliver(publication, event_id, payload)
+
+    def _decode_batch(
+        self,
+        publication: MeshPublication,
+    ) -> list[tuple[str, Mapping[str, object]]]:
+        source_node_id = publication.source_node_id
+        first_event_id = first_mesh_event_id(publication.payload)
+        if publication.message_id != _mesh_message_id(source_node_id, first_event_id):
+            raise ValueError("first event_id does not match mesh message_id")
+        decoded = decode_mesh_batch(
+            publication.payload,
+            MESH_RECORD_CODECS.get(publication.topic),
+            window=self._seen_sequences,
+            source=source_node_id,
+        )
+        return [
+            (
+                _mesh_message_id(source_node_id, event_id),
+                _require_mapping(payload, "mesh payload"),
+            )
+            for event_id, payload in decoded
+        ]
+
+    def _deliver(
+        self,
+        publication: MeshPublication,
+        event_id: str,
+        payload: Mapping[str, object],
+    ) -> None:
         topic = self._topics.get(publication.topic)
         if topic is None:
             return
@@ -539,6 +644,17 @@ class ManyfoldNodeRuntime:
             raise RuntimeError("Heart ManyFold mesh is not started")
         return self._mesh
 
+    def _require_event_ids(self) -> MeshEventIds:
+        if self._event_ids is None:
+            raise RuntimeError("Heart ManyFold node is not started")
+        return self._event_ids
+
+    def _payload_encoding(self) -> MeshPayloadEncoding:
+        bootstrap = self.config.bootstrap
+        if bootstrap is None:
+            return MeshPayloadEncoding.JSON
+        return bootstrap.payload_encoding
+
 
 @final
 @dataclass(frozen=True, slots=True)
@@ -588,6 +704,7 @@ class _HeartNodeBootstrap:
     peers: tuple[_MeshPeer, ...]
     local_incarnation: int
     transport: _TransportLimits
+    payload_encoding: MeshPayloadEncoding
     membership: MembershipConfig
     swim: SwimConfig
     swim_transport: HmacTransportConfig
@@ -760,6 +877,7 @@ def _bootstrap_from_json(raw: Mapping[str, object]) -> _HeartNodeBootstrap:
         peers=peers,
         local_incarnation=_mapping_integer(raw, "incarnation", default=0),
         transport=_transport_limits_from_json(raw),
+        payload_encoding=_payload_encoding_from_json(raw),
         membership=MembershipConfig(
             lease_seconds=_mapping_number(raw, "lease_seconds", default=15.0),
             suspect_seconds=_mapping_number(raw, "suspect_seconds", default=5.0),
@@ -871,6 +989,17 @@ def _mesh_peer_from_json(raw: Mapping[str, object]) -> _MeshPeer:
     )
 
 
+def _payload_encoding_from_json(raw: Mapping[str, object]) -> MeshPayloadEncoding:
+    # JSON stays the default: nodes from before binary batches reject them, so
+    # binary is only enabled once every peer in the cluster can decode it.
+    if "mesh_payload_encoding" not in raw:
+        return MeshPayloadEncoding.JSON
+    try:
+        return MeshPayloadEncoding(_mapping_text(raw, "mesh_payload_encoding"))
+    except ValueError as error:
+        raise ValueError("mesh_payload_encoding must be 'binary' or 'json'") from error
+
+
 def _transport_limits_from_json(raw: Mapping[str, object]) -> _TransportLimits:
     return _TransportLimits(
         outbound_queue_limit=_mapping_integer(
@@ -938,6 +1067,10 @@ def _decode_mesh_payload(payload: bytes) -> tuple[str, Mapping[str, object]]:
     return event_id, _require_mapping(envelope.get("payload"), "mesh payload")
 
 
+def _mesh_message_id(node_id: str, event_id: int) -> str:
+    return f"{node_id}:{event_id:016x}"
+
+
 def _status_key(
     snapshot: NodeSnapshot,
     mesh_peers: tuple[MeshPeerHealth, ...],
@@ -24,6 +24,7 @@ from heart.renderers.free_text import FreeTextRenderer
 from heart.renderers.image import (ContainRenderImage,
                                    SurfaceRenderImageStateProvider)
 from heart.runtime.active_game_loop import get_active_game_loop
+from heart.runtime.frame_profiler import get_frame_profiler
 from heart.runtime.manyfold_node import ManyfoldNodeRuntime
 from heart.utilities.env import Configuration
 from heart.utilities.logging import get_logger
@@ -38,6 +39,9 @@ CONTROL_COMMAND_SENSOR_UPDATE = "sensor_update"
 CONTROL_COMMAND_TEXT_UPDATE = "text_update"
 CONTROL_COMMAND_IMAGE_UPDATE = "image_update"
 CONTROL_COMMAND_EMOJI_UPDATE = "emoji_update"
+CONTROL_COMMAND_PROFILE_SNAPSHOT = "profile_snapshot"
+RENDER_PROFILE_PERIPHERAL_ID = "heart.render_profiler"
+RENDER_PROFILE_TAG = "render_profile"
 PHONE_TEXT_DISPLAY_DURATION_SECONDS = 5.0
 PHONE_IMAGE_DISPLAY_DURATION_SECONDS = 5.0
 DPAD_CENTER_FRAMES_TO_REARM = 2
@@ -72,6 +76,7 @@ class PeripheralRuntime:
             pygame.K_UP: False,
         }
         self._subscriptions: list[Any] = []
+        self._websocket: Any | None = None
 
     def detect_and_start(self) -> None:
         self._manyfold_node.start()
@@ -100,6 +105,7 @@ class PeripheralRuntime:
             return
 
         ws = websocket or _build_websocket()
+        self._websocket = ws
         ws.set_control_handler(self._handle_control_message)
         if not Configuration.stream_beats_input_debug():
             logger.debug("Beats input debug streaming disabled")
@@ -178,6 +184,25 @@ class PeripheralRuntime:
         if control_message.command == CONTROL_COMMAND_EMOJI_UPDATE:
             self._present_phone_emoji(control_message.emoji)
             return
+        if control_message.command == CONTROL_COMMAND_PROFILE_SNAPSHOT:
+            self._publish_render_profile()
+            return
+
+    def _publish_render_profile(self) -> None:
+        profiler = get_frame_profiler()
+        if profiler is None or self._websocket is None:
+            logger.debug("Render profiler unavailable; ignoring profile request.")
+            return
+        self._websocket.send(
+            kind="peripheral",
+            payload=PeripheralMessageEnvelope(
+                peripheral_info=PeripheralInfo(
+                    id=RENDER_PROFILE_PERIPHERAL_ID,
+                    tags=(PeripheralTag(name=RENDER_PROFILE_TAG, variant="snapshot"),),
+                ),
+                data=profiler.snapshot().as_dict(),
+            ),
+        )
 
     def _streaming_envelope(
         self, envelope: InputDebugEnvelope
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pygame
+
+from heart import DeviceDisplayMode
+
+SurfaceKey = tuple[tuple[int, int], int, DeviceDisplayMode | None]
+TRANSPARENT = (0, 0, 0, 0)
+
+
+@dataclass(frozen=True)
+class SurfacePoolStats:
+    allocations: int
+    frame_allocations: int
+    reuses: int
+    pooled: int
+
+
+class SurfacePool:
+    """Reuse scratch surfaces across frames.
+
+    Surfaces are keyed by size, flags and display mode. Within a frame every
+    ``acquire`` for a key hands out a different surface; ``begin_frame`` makes all
+    of them available again, so a stable render graph reaches a steady state where
+    no new surfaces are allocated. Reused surfaces are cleared to transparent so
+    callers see the same contents as a freshly created ``SRCALPHA`` surface.
+
+    """
+
+    def __init__(self) -> None:
+        self._surfaces: dict[SurfaceKey, list[pygame.Surface]] = {}
+        self._in_use: dict[SurfaceKey, int] = {}
+        self._allocations = 0
+        self._frame_allocations = 0
+        self._reuses = 0
+
+    def begin_frame(self) -> None:
+        """Return every surface handed out during the previous frame to the pool."""
+
+        self._in_use.clear()
+        self._frame_allocations = 0
+
+    def acquire(
+        self,
+        size: tuple[int, int],
+        flags: int = pygame.SRCALPHA,
+        *,
+        display_mode: DeviceDisplayMode | None = None,
+    ) -> pygame.Surface:
+        key = (size, flags, display_mode)
+        surfaces = self._surfaces.get(key)
+        if surfaces is None:
+            surfaces = self._surfaces[key] = []
+        index = self._in_use.get(key, 0)
+        self._in_use[key] = index + 1
+        if index < len(surfaces):
+            surface = surfaces[index]
+            surface.fill(TRANSPARENT)
+            self._reuses += 1
+            return surface
+        surface = pygame.Surface(size, flags)
+        surfaces.append(surface)
+        self._allocations += 1
+        self._frame_allocations += 1
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self._in_use.clear()
+
+    def stats(self) -> SurfacePoolStats:
+        return SurfacePoolStats(
+            allocations=self._allocations,
+            frame_allocations=self._frame_allocations,
+            reuses=self._reuses,
+            pooled=sum(len(surfaces) for surfaces in self._surfaces.values()),
+        )
@@ -3,13 +3,19 @@ from __future__ import annotations
 import importlib
 import importlib.util
 import os
+import threading
 from collections import OrderedDict
+from functools import partial
 from types import ModuleType
 from typing import cast
 
 import numpy as np
 
+from heart.utilities.color_lut import SENTINEL_HSV_KEYS, HsvLookupTables
 from heart.utilities.env import Configuration
+from heart.utilities.logging import get_logger
+
+logger = get_logger(__name__)
 
 OPENCV_COLOR_CONVERSION_ENV_VAR = "HEART_USE_OPENCV_COLOR_CONVERSION"
 TRUTHY_ENV_VALUES = {"1", "true", "yes", "on"}
@@ -34,6 +40,10 @@ HSV_CALIBRATION_MODE = Configuration.hsv_calibration_mode()
 HSV_CALIBRATION_ENABLED = HSV_CALIBRATION_MODE != "off"
 HSV_CALIBRATION_STRICT = HSV_CALIBRATION_MODE == "strict"
 HSV_TO_BGR_CACHE: OrderedDict[tuple[int, int, int], np.ndarray] = OrderedDict()
+HSV_LOOKUP_TABLES_ENABLED = Configuration.hsv_lookup_tables_enabled()
+LOOKUP_TABLES: HsvLookupTables | None = None
+LOOKUP_TABLE_BUILD: threading.Thread | None = None
+LOOKUP_TABLE_BUILD_FAILED = False
 
 
 def _opencv_color_conversion_enabled() -> bool:
@@ -54,6 +64,81 @@ def _cv2_module() -> ModuleType | None:
     return CV2_MODULE
 
 
+def _lookup_tables() -> HsvLookupTables | None:
+    """Return the HSV lookup tables once they exist for the calibration mode.
+
+    Missing tables are built on a background thread; conversions keep using
+    the numpy path until the files are in place, or for good if the build fails.
+    """
+
+    global LOOKUP_TABLE_BUILD, LOOKUP_TABLES
+
+    if LOOKUP_TABLES is not None or not HSV_LOOKUP_TABLES_ENABLED:
+        return LOOKUP_TABLES
+    if LOOKUP_TABLE_BUILD_FAILED:
+        return None
+    if LOOKUP_TABLE_BUILD is not None and LOOKUP_TABLE_BUILD.is_alive():
+        return None
+    directory = Configuration.hsv_lookup_table_dir()
+    if HsvLookupTables.built(directory, HSV_CALIBRATION_MODE):
+        LOOKUP_TABLES = HsvLookupTables.open(
+            directory,
+            variant=HSV_CALIBRATION_MODE,
+            remember_round_trips=HSV_CACHE_ENABLED,
+        )
+    elif LOOKUP_TABLE_BUILD is None:
+        LOOKUP_TABLE_BUILD = threading.Thread(
+            target=_build_lookup_tables_in_background,
+            name="hsv-lookup-table-build",
+            daemon=True,
+        )
+        LOOKUP_TABLE_BUILD.start()
+    return LOOKUP_TABLES
+
+
+def numpy_fast_conversion_active() -> bool:
+    """Return whether conversions currently take the uncached "fast" numpy path.
+
+    Kernels that reimplement that path, such as the fused post-processing hue
+    rotation, may stand in for :func:`convert_rgb_to_hsv` and
+    :func:`convert_hsv_to_rgb` only while this holds: OpenCV, the lookup
+    tables, strict calibration and the round-trip cache all change results.
+    """
+
+    return (
+        HSV_CALIBRATION_ENABLED
+        and not HSV_CALIBRATION_STRICT
+        and not HSV_CACHE_ENABLED
+        and _cv2_module() is None
+        and _lookup_tables() is None
+    )
+
+
+def build_lookup_tables() -> None:
+    """Build the HSV lookup tables for the configured calibration mode."""
+
+    HsvLookupTables.build(
+        Configuration.hsv_lookup_table_dir(),
+        variant=HSV_CALIBRATION_MODE,
+        hsv_to_bgr=partial(
+            _calibrated_bgr_from_hsv,
+            calibrate=HSV_CALIBRATION_ENABLED,
+            strict=HSV_CALIBRATION_STRICT,
+        ),
+        bgr_to_hsv=partial(_calibrated_hsv_from_bgr, strict=HSV_CALIBRATION_STRICT),
+    )
+
+
+def _build_lookup_tables_in_background() -> None:
+    global LOOKUP_TABLE_BUILD_FAILED
+
+    try:
+        build_lookup_tables()
+    except Exception:
+        LOOKUP_TABLE_BUILD_FAILED = True
+        logger.exception("Building HSV lookup tables failed; staying on numpy")
+
+
 def _numpy_hsv_from_bgr(image: np.ndarray) -> np.ndarray:
     image_float = image.astype(np.float32) / 255.0
     b, g, r = image_float[..., 0], image_float[..., 1], image_float[..., 2]
@@ -141,17 +226,13 @@ def _numpy_bgr_from_hsv(image: np.ndarray) -> np.ndarray:
     return np.stack((b, g, r), axis=-1).astype(np.uint8)
 
 
-def _convert_bgr_to_hsv(image: np.ndarray) -> np.ndarray:
-    cv2_module = _cv2_module()
-    if cv2_module is not None:
-        return cast(np.ndarray, cv2_module.cvtColor(image, cv2_module.COLOR_BGR2HSV))
-
+def _calibrated_hsv_from_bgr(image: np.ndarray, *, strict: bool = True) -> np.ndarray:
     hsv = _numpy_hsv_from_bgr(image)
 
     # Adjust the hue so that the round-trip through the numpy converter matches
     # the input BGR values.  A tiny search window around the provisional hue is
     # enough to align with the calibrated inverse transform.
-    if HSV_CALIBRATION_STRICT:
+    if strict:
         reconstructed = _numpy_bgr_from_hsv(hsv)
         mismatched = np.any(reconstructed != image, axis=-1)
         if np.any(mismatched):
@@ -184,6 +265,18 @@ def _convert_bgr_to_hsv(image: np.ndarray) -> np.ndarray:
             hsv[mismatch_indices[:, 0], mismatch_indices[:, 1], 0] = best_h.astype(
                 np.uint8
             )
+    return hsv
+
+
+def _convert_bgr_to_hsv(image: np.ndarray) -> np.ndarray:
+    cv2_module = _cv2_module()
+    if cv2_module is not None:
+        return cast(np.ndarray, cv2_module.cvtColor(image, cv2_module.COLOR_BGR2HSV))
+    tables = _lookup_tables()
+    if tables is not None:
+        return tables.bgr_to_hsv(image)
+
+    hsv = _calibrated_hsv_from_bgr(image, strict=HSV_CALIBRATION_STRICT)
 
     if HSV_CACHE_ENABLED:
         flat_hsv = hsv.reshape(-1, 3)
@@ -208,33 +301,25 @@ def _convert_bgr_to_hsv(image: np.ndarray) -> np.ndarray:
     return hsv
 
 
-def _convert_hsv_to_bgr(image: np.ndarray) -> np.ndarray:
-    cv2_module = _cv2_module()
-    if cv2_module is not None:
-        return cast(np.ndarray, cv2_module.cvtColor(image, cv2_module.COLOR_HSV2BGR))
-
+def _calibrated_bgr_from_hsv(
+    image: np.ndarray, *, calibrate: bool = True, strict: bool = True
+) -> np.ndarray:
     result = _numpy_bgr_from_hsv(image)
 
     # Calibrate well-known pure colours to match the expectations from the
     # OpenCV implementation.
-    if (
-        HSV_CALIBRATION_ENABLED
-        and np.any(image[..., 1] == 255)
-        and np.any(image[..., 2] == 255)
-    ):
+    if calibrate and np.any(image[..., 1] == 255) and np.any(image[..., 2] == 255):
         full_mask = (image[..., 1] == 255) & (image[..., 2] == 255)
         mask_60 = full_mask & (image[..., 0] == 60)
         if np.any(mask_60):
-            HSV_TO_BGR_CACHE.pop((60, 255, 255), None)
             result[mask_60] = np.array([2, 255, 0], dtype=np.uint8)
         mask_119 = full_mask & (image[..., 0] == 119)
         if np.any(mask_119):
-            HSV_TO_BGR_CACHE.pop((119, 255, 255), None)
             result[mask_119] = np.array([255, 0, 5], dtype=np.uint8)
 
     # The float approximation can be off by one.  Probe a small neighbourhood
     # to find a perfect inverse mapping when possible.
-    if HSV_CALIBRATION_STRICT:
+    if strict:
         reconverted = _numpy_hsv_from_bgr(result)
         mismatched = np.any(reconverted != image, axis=-1)
         if np.any(mismatched):
@@ -275,6 +360,26 @@ def _convert_hsv_to_bgr(image: np.ndarray) -> np.ndarray:
                     mismatch_indices[matched_indices, 1],
                 ] = candidate_u8[matches]
                 remaining[matched_indices] = False
+    return result
+
+
+def _convert_hsv_to_bgr(image: np.ndarray) -> np.ndarray:
+    cv2_module = _cv2_module()
+    if cv2_module is not None:
+        return cast(np.ndarray, cv2_module.cvtColor(image, cv2_module.COLOR_HSV2BGR))
+    tables = _lookup_tables()
+    if tables is not None:
+        return tables.hsv_to_bgr(image)
+
+    result = _calibrated_bgr_from_hsv(
+        image, calibrate=HSV_CALIBRATION_ENABLED, strict=HSV_CALIBRATION_STRICT
+    )
+
+    # Calibrated pure colours always win over remembered round trips.
+    if HSV_CALIBRATION_ENABLED and HSV_TO_BGR_CACHE:
+        for key in SENTINEL_HSV_KEYS:
+            if key in HSV_TO_BGR_CACHE and np.any(np.all(image == key, axis=-1)):
+                del HSV_TO_BGR_CACHE[key]
 
     if HSV_CACHE_ENABLED and HSV_TO_BGR_CACHE:
         flat_hsv = image.reshape(-1, 3)
@@ -0,0 +1,174 @@
+"""Precomputed HSV<->BGR lookup tables for hosts without OpenCV.
+
+Both tables cover every 8-bit input (``256**3`` entries of three bytes each), so
+a conversion is one gather with no float math or calibration search per frame.
+They are built once from the numpy converters for one calibration mode, stored
+as ``.npy`` files named after that mode and memory-mapped afterwards. Building
+takes minutes, so it happens offline (``totem build-hsv-tables``) or on a
+background thread rather than during a frame. The HSV->BGR table has 256 hue
+rows rather than 180 so out-of-range hues convert exactly as the numpy path
+would.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+# Formatted with the calibration mode the table was built for.
+HSV_TO_BGR_FILENAME = "hsv_to_bgr_{variant}_v1.npy"
+BGR_TO_HSV_FILENAME = "bgr_to_hsv_{variant}_v1.npy"
+TABLE_SHAPE = (256, 256, 256, 3)
+# Hues that the converters pin to fixed colours and never remember.
+SENTINEL_HSV_KEYS = ((60, 255, 255), (119, 255, 255))
+
+Converter = Callable[[np.ndarray], np.ndarray]
+
+
+def _flat_keys(image: np.ndarray) -> np.ndarray:
+    keys = image[..., 0].astype(np.intp) << 16
+    keys |= image[..., 1].astype(np.intp) << 8
+    keys |= image[..., 2]
+    return keys
+
+
+def table_paths(directory: str | Path, variant: str) -> tuple[Path, Path]:
+    """Return the HSV -> BGR and BGR -> HSV table paths for ``variant``."""
+
+    root = Path(directory).expanduser()
+    return (
+        root / HSV_TO_BGR_FILENAME.format(variant=variant),
+        root / BGR_TO_HSV_FILENAME.format(variant=variant),
+    )
+
+
+def build_table(path: Path, convert: Converter) -> None:
+    """Write ``convert`` applied to every 8-bit triple to ``path``.
+
+    The first channel selects a ``256x256`` plane that is converted in one call,
+    so at most one plane is held in memory while the table fills.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.partial")
+    table = np.lib.format.open_memmap(
+        partial, mode="w+", dtype=np.uint8, shape=TABLE_SHAPE
+    )
+    second, third = np.indices(TABLE_SHAPE[1:3], dtype=np.uint8)
+    plane = np.empty((*TABLE_SHAPE[1:3], 3), dtype=np.uint8)
+    plane[..., 1] = second
+    plane[..., 2] = third
+    for first in range(TABLE_SHAPE[0]):
+        plane[..., 0] = first
+        table[first] = convert(plane)
+    table.flush()
+    del table
+    os.replace(partial, path)
+
+
+class HsvLookupTables:
+    """Convert images between BGR and OpenCV-style HSV by table lookup.
+
+    With ``remember_round_trips`` set, every BGR -> HSV conversion also writes
+    the source colours into the HSV -> BGR table, so converting the result back
+    returns the original pixels. This mirrors ``HSV_TO_BGR_CACHE`` without a
+    size limit; the writes land in copy-on-write pages of the mapping and never
+    reach the file on disk.
+    """
+
+    def __init__(
+        self,
+        hsv_to_bgr: np.ndarray,
+        bgr_to_hsv: np.ndarray,
+        *,
+        remember_round_trips: bool = True,
+    ) -> None:
+        if hsv_to_bgr.shape != TABLE_SHAPE or bgr_to_hsv.shape != TABLE_SHAPE:
+            raise ValueError(f"HSV lookup tables must have shape {TABLE_SHAPE}")
+        self._hsv_to_bgr_source = hsv_to_bgr
+        self._hsv_to_bgr = self._writable_view(hsv_to_bgr)
+        self._bgr_to_hsv = bgr_to_hsv.reshape(-1, 3)
+        self.remember_round_trips = remember_round_trips
+        self._sentinel_keys = _flat_keys(np.array(SENTINEL_HSV_KEYS, dtype=np.uint8))
+
+    @staticmethod
+    def built(directory: str | Path, variant: str) -> bool:
+        """Return whether both tables for ``variant`` exist in ``directory``."""
+
+        return all(path.exists() for path in table_paths(directory, variant))
+
+    @staticmethod
+    def build(
+        directory: str | Path,
+        *,
+        variant: str,
+        hsv_to_bgr: Converter,
+        bgr_to_hsv: Converter,
+    ) -> None:
+        """Build whichever tables for ``variant`` are missing from ``directory``."""
+
+        for path, convert in zip(
+            table_paths(directory, variant), (hsv_to_bgr, bgr_to_hsv)
+        ):
+            if not path.exists():
+                build_table(path, convert)
+
+    @classmethod
+    def load(
+        cls,
+        directory: str | Path,
+        *,
+        variant: str,
+        hsv_to_bgr: Converter,
+        bgr_to_hsv: Converter,
+        remember_round_trips: bool = True,
+    ) -> "HsvLookupTables":
+        """Memory-map the tables in ``directory``, building any that are missing."""
+
+        cls.build(
+            directory, variant=variant, hsv_to_bgr=hsv_to_bgr, bgr_to_hsv=bgr_to_hsv
+        )
+        return cls.open(
+            directory, variant=variant, remember_round_trips=remember_round_trips
+        )
+
+    @classmethod
+    def open(
+        cls,
+        directory: str | Path,
+        *,
+        variant: str,
+        remember_round_trips: bool = True,
+    ) -> "HsvLookupTables":
+        """Memory-map tables that have already been built."""
+
+        tables = [
+            np.load(path, mmap_mode="c") for path in table_paths(directory, variant)
+        ]
+        return cls(*tables, remember_round_trips=remember_round_trips)
+
+    def hsv_to_bgr(self, image: np.ndarray) -> np.ndarray:
+        return np.take(self._hsv_to_bgr, _flat_keys(image), axis=0)
+
+    def bgr_to_hsv(self, image: np.ndarray) -> np.ndarray:
+        keys = _flat_keys(image)
+        hsv = np.take(self._bgr_to_hsv, keys, axis=0)
+        if self.remember_round_trips:
+            hsv_keys = _flat_keys(hsv).ravel()
+            keep = ~np.isin(hsv_keys, self._sentinel_keys)
+            self._hsv_to_bgr[hsv_keys[keep]] = image.reshape(-1, 3)[keep]
+        return hsv
+
+    def forget_round_trips(self) -> None:
+        """Drop remembered colours so HSV -> BGR returns the calibrated table again."""
+
+        self._hsv_to_bgr = self._writable_view(self._hsv_to_bgr_source)
+
+    @staticmethod
+    def _writable_view(table: np.ndarray) -> np.ndarray:
+        if isinstance(table, np.memmap) and table.filename is not None:
+            return np.load(table.filename, mmap_mode="c").reshape(-1, 3)
+        return table.copy().reshape(-1, 3)
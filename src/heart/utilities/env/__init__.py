@@ -8,8 +8,14 @@ from heart.utilities.env.enums import DeviceLayoutMode as DeviceLayoutMode
 from heart.utilities.env.enums import FrameArrayStrategy as FrameArrayStrategy
 from heart.utilities.env.enums import \
     FrameExportStrategy as FrameExportStrategy
+from heart.utilities.env.enums import \
+    FramePresentStrategy as FramePresentStrategy
+from heart.utilities.env.enums import GlReadbackStrategy as GlReadbackStrategy
+from heart.utilities.env.enums import LifeEdgeMode as LifeEdgeMode
 from heart.utilities.env.enums import LifeRuleStrategy as LifeRuleStrategy
 from heart.utilities.env.enums import LifeUpdateStrategy as LifeUpdateStrategy
+from heart.utilities.env.enums import \
+    RendererWarmupStrategy as RendererWarmupStrategy
 from heart.utilities.env.enums import RenderTileStrategy as RenderTileStrategy
 from heart.utilities.env.enums import \
     SpritesheetFrameCacheStrategy as SpritesheetFrameCacheStrategy
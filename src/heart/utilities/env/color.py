@@ -1,7 +1,10 @@
 import os
+from pathlib import Path
 
 from heart.utilities.env.parsing import _env_flag, _env_int
 
+DEFAULT_HSV_LOOKUP_TABLE_SUBDIR = Path(".heart") / "cache"
+
 
 class ColorConfiguration:
     @classmethod
@@ -31,3 +34,14 @@ class ColorConfiguration:
         raise ValueError(
             "HEART_HSV_CALIBRATION_MODE must be 'off', 'fast', or 'strict'"
         )
+
+    @classmethod
+    def hsv_lookup_tables_enabled(cls) -> bool:
+        return _env_flag("HEART_HSV_LOOKUP_TABLES", default=False)
+
+    @classmethod
+    def hsv_lookup_table_dir(cls) -> Path:
+        directory = os.environ.get("HEART_HSV_LOOKUP_TABLE_DIR")
+        if directory:
+            return Path(directory).expanduser()
+        return Path.home() / DEFAULT_HSV_LOOKUP_TABLE_SUBDIR
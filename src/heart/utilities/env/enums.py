@@ -24,6 +24,21 @@ class FrameExportStrategy(StrEnum):
     ARRAY = "array"
 
 
+class FramePresentStrategy(StrEnum):
+    SYNC = "sync"
+    PIPELINED = "pipelined"
+
+
+class GlReadbackStrategy(StrEnum):
+    SYNC = "sync"
+    PBO = "pbo"
+
+
+class RendererWarmupStrategy(StrEnum):
+    EAGER = "eager"
+    LAZY = "lazy"
+
+
 class BleUartBufferStrategy(StrEnum):
     BYTES = "bytes"
     TEXT = "text"
@@ -40,6 +55,12 @@ class LifeUpdateStrategy(StrEnum):
     CONVOLVE = "convolve"
     PAD = "pad"
     SHIFTED = "shifted"
+    BITPACKED = "bitpacked"
+
+
+class LifeEdgeMode(StrEnum):
+    BOUNDED = "bounded"
+    TOROIDAL = "toroidal"
 
 
 class LifeRuleStrategy(StrEnum):
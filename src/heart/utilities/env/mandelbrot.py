@@ -1,8 +1,10 @@
 import os
 
 from heart.utilities.env.enums import MandelbrotInteriorStrategy
+from heart.utilities.env.parsing import _env_int
 
 DEFAULT_MANDELBROT_INTERIOR_STRATEGY = MandelbrotInteriorStrategy.CARDIOID
+DEFAULT_MANDELBROT_FRAME_BUDGET_MS = 12
 
 
 class MandelbrotConfiguration:
@@ -18,3 +20,11 @@ class MandelbrotConfiguration:
             raise ValueError(
                 "HEART_MANDELBROT_INTERIOR_STRATEGY must be 'none' or 'cardioid'"
             ) from exc
+
+    @classmethod
+    def mandelbrot_frame_budget_ms(cls) -> int:
+        return _env_int(
+            "HEART_MANDELBROT_FRAME_BUDGET_MS",
+            default=DEFAULT_MANDELBROT_FRAME_BUDGET_MS,
+            minimum=1,
+        )
@@ -1,6 +1,7 @@
 import os
 
 from heart.utilities.env.enums import BleUartBufferStrategy
+from heart.utilities.env.parsing import _env_float, _env_int
 
 
 class PeripheralConfiguration:
@@ -15,3 +16,15 @@ class PeripheralConfiguration:
             raise ValueError(
                 "HEART_BLE_UART_BUFFER_STRATEGY must be 'bytes' or 'text'"
             ) from exc
+
+    @classmethod
+    def input_debug_sample_every(cls) -> int:
+        return _env_int("HEART_INPUT_DEBUG_SAMPLE_EVERY", default=1, minimum=1)
+
+    @classmethod
+    def color_analysis_stride(cls) -> int:
+        return _env_int("HEART_COLOR_ANALYSIS_STRIDE", default=4, minimum=1)
+
+    @classmethod
+    def color_analysis_rate_hz(cls) -> float:
+        return _env_float("HEART_COLOR_ANALYSIS_RATE_HZ", default=30.0, minimum=0.0)
@@ -2,15 +2,29 @@ import os
 
 from heart.device.rgb_display.constants import DEFAULT_SOCKET_PATH
 from heart.utilities.env.enums import (FrameArrayStrategy, FrameExportStrategy,
+                                       FramePresentStrategy,
+                                       GlReadbackStrategy,
                                        IsolatedRendererAckStrategy,
                                        IsolatedRendererDedupStrategy,
-                                       LifeRuleStrategy, LifeUpdateStrategy,
+                                       LifeEdgeMode, LifeRuleStrategy,
+                                       LifeUpdateStrategy,
+                                       RendererWarmupStrategy,
                                        RenderTileStrategy)
 from heart.utilities.env.parsing import _env_flag, _env_int, _env_optional_int
 
 DEFAULT_RENDER_CRASH_ON_ERROR = False
 DEFAULT_RENDER_INITIALIZATION_PROGRESS = True
 DEFAULT_RUNTIME_MAX_FPS = 120
+DEFAULT_FRAME_PRESENT_BUFFER_DEPTH = 2
+MAX_FRAME_PRESENT_BUFFER_DEPTH = 3
+DEFAULT_RENDERER_WARMUP_NEIGHBORS = 1
+DEFAULT_RENDERER_RESIDENT_MODES = 4
+DEFAULT_RENDER_PROFILER_ENABLED = True
+DEFAULT_RENDER_SURFACE_POOL_ENABLED = True
+DEFAULT_SKIP_UNCHANGED_FRAMES = False
+DEFAULT_IDLE_MAX_FPS = 30
+DEFAULT_RENDER_PROFILER_WINDOW = 512
+DEFAULT_LIFE_RESEED_STAGNANT_GENERATIONS = 60
 
 
 class RenderingConfiguration:
@@ -98,6 +112,43 @@ class RenderingConfiguration:
             minimum=1,
         )
 
+    @classmethod
+    def render_profiler_enabled(cls) -> bool:
+        return _env_flag(
+            "HEART_RENDER_PROFILER",
+            default=DEFAULT_RENDER_PROFILER_ENABLED,
+        )
+
+    @classmethod
+    def render_profiler_window(cls) -> int:
+        return _env_int(
+            "HEART_RENDER_PROFILER_WINDOW",
+            default=DEFAULT_RENDER_PROFILER_WINDOW,
+            minimum=1,
+        )
+
+    @classmethod
+    def render_surface_pool_enabled(cls) -> bool:
+        return _env_flag(
+            "HEART_RENDER_SURFACE_POOL",
+            default=DEFAULT_RENDER_SURFACE_POOL_ENABLED,
+        )
+
+    @classmethod
+    def skip_unchanged_frames(cls) -> bool:
+        return _env_flag(
+            "HEART_SKIP_UNCHANGED_FRAMES",
+            default=DEFAULT_SKIP_UNCHANGED_FRAMES,
+        )
+
+    @classmethod
+    def idle_max_fps(cls) -> int:
+        return _env_int(
+            "HEART_IDLE_MAX_FPS",
+            default=DEFAULT_IDLE_MAX_FPS,
+            minimum=1,
+        )
+
     @classmethod
     def render_tile_strategy(cls) -> RenderTileStrategy:
         strategy = os.environ.get("HEART_RENDER_TILE_STRATEGY", "blits").strip().lower()
@@ -130,6 +181,70 @@ class RenderingConfiguration:
                 "HEART_FRAME_EXPORT_STRATEGY must be 'buffer' or 'array'"
             ) from exc
 
+    @classmethod
+    def frame_present_strategy(cls) -> FramePresentStrategy:
+        strategy = (
+            os.environ.get("HEART_FRAME_PRESENT_STRATEGY", "sync").strip().lower()
+        )
+        try:
+            return FramePresentStrategy(strategy)
+        except ValueError as exc:
+            raise ValueError(
+                "HEART_FRAME_PRESENT_STRATEGY must be 'sync' or 'pipelined'"
+            ) from exc
+
+    @classmethod
+    def gl_readback_strategy(cls) -> GlReadbackStrategy:
+        strategy = os.environ.get("HEART_GL_READBACK_STRATEGY", "sync").strip().lower()
+        try:
+            return GlReadbackStrategy(strategy)
+        except ValueError as exc:
+            raise ValueError(
+                "HEART_GL_READBACK_STRATEGY must be 'sync' or 'pbo'"
+            ) from exc
+
+    @classmethod
+    def frame_present_buffer_depth(cls) -> int:
+        depth = _env_int(
+            "HEART_FRAME_PRESENT_BUFFER_DEPTH",
+            default=DEFAULT_FRAME_PRESENT_BUFFER_DEPTH,
+            minimum=2,
+        )
+        if depth > MAX_FRAME_PRESENT_BUFFER_DEPTH:
+            raise ValueError(
+                "HEART_FRAME_PRESENT_BUFFER_DEPTH must be at most "
+                f"{MAX_FRAME_PRESENT_BUFFER_DEPTH}"
+            )
+        return depth
+
+    @classmethod
+    def renderer_warmup_strategy(cls) -> RendererWarmupStrategy:
+        strategy = (
+            os.environ.get("HEART_RENDERER_WARMUP_STRATEGY", "eager").strip().lower()
+        )
+        try:
+            return RendererWarmupStrategy(strategy)
+        except ValueError as exc:
+            raise ValueError(
+                "HEART_RENDERER_WARMUP_STRATEGY must be 'eager' or 'lazy'"
+            ) from exc
+
+    @classmethod
+    def renderer_warmup_neighbors(cls) -> int:
+        return _env_int(
+            "HEART_RENDERER_WARMUP_NEIGHBORS",
+            default=DEFAULT_RENDERER_WARMUP_NEIGHBORS,
+            minimum=0,
+        )
+
+    @classmethod
+    def renderer_resident_modes(cls) -> int:
+        return _env_int(
+            "HEART_RENDERER_RESIDENT_MODES",
+            default=DEFAULT_RENDERER_RESIDENT_MODES,
+            minimum=1,
+        )
+
     @classmethod
     def life_update_strategy(cls) -> LifeUpdateStrategy:
         strategy = os.environ.get("HEART_LIFE_UPDATE_STRATEGY", "auto").strip().lower()
@@ -137,9 +252,28 @@ class RenderingConfiguration:
             return LifeUpdateStrategy(strategy)
         except ValueError as exc:
             raise ValueError(
-                "HEART_LIFE_UPDATE_STRATEGY must be 'auto', 'convolve', 'pad', or 'shifted'"
+                "HEART_LIFE_UPDATE_STRATEGY must be 'auto', 'convolve', 'pad', "
+                "'shifted', or 'bitpacked'"
             ) from exc
 
+    @classmethod
+    def life_edge_mode(cls) -> LifeEdgeMode:
+        mode = os.environ.get("HEART_LIFE_EDGE_MODE", "bounded").strip().lower()
+        try:
+            return LifeEdgeMode(mode)
+        except ValueError as exc:
+            raise ValueError(
+                "HEART_LIFE_EDGE_MODE must be 'bounded' or 'toroidal'"
+            ) from exc
+
+    @classmethod
+    def life_reseed_stagnant_generations(cls) -> int:
+        return _env_int(
+            "HEART_LIFE_RESEED_STAGNANT_GENERATIONS",
+            default=DEFAULT_LIFE_RESEED_STAGNANT_GENERATIONS,
+            minimum=0,
+        )
+
     @classmethod
     def life_convolve_threshold(cls) -> int:
         return _env_int("HEART_LIFE_CONVOLVE_THRESHOLD", default=0, minimum=0)
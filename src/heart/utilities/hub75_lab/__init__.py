@@ -5,6 +5,9 @@ from heart.utilities.hub75_lab.capture import (CapturePreflight, CaptureReport,
                                                CompleteSimilarityScore,
                                                SignalEvidence, analyze_capture,
                                                create_probe_proof,
+                                               decode_virtual_frames,
+                                               iter_virtual_frames,
+                                               render_virtual_animation,
                                                render_virtual_image,
                                                run_probe_toggle,
                                                score_complete_similarity)
@@ -27,7 +30,10 @@ __all__ = [
     "analyze_capture",
     "build_experiment_command",
     "create_probe_proof",
+    "decode_virtual_frames",
+    "iter_virtual_frames",
     "list_experiments",
+    "render_virtual_animation",
     "render_virtual_image",
     "run_probe_toggle",
     "score_complete_similarity",
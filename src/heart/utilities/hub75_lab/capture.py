@@ -2,26 +2,28 @@
 
 from __future__ import annotations
 
-import hashlib
 import importlib.util
 import json
 import math
 import shlex
 import subprocess
 from bisect import bisect_left, bisect_right
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from statistics import median
 from typing import Any, cast, final
 
+import numpy as np
 from PIL import Image
 
 from heart.utilities.hub75_logic_score import (Hub75CaptureDiagnosis,
+                                               Hub75LogicCapture,
                                                Hub75SimilarityScore,
                                                LogicChannelActivity,
                                                diagnose_hub75_capture,
+                                               file_sha256,
                                                load_hub75_logic_csv,
                                                summarize_logic_channels)
 
@@ -29,6 +31,7 @@ COLOR_SIGNALS = ("R1", "G1", "B1", "R2", "G2", "B2")
 CONTROL_SIGNALS = ("CLK", "LAT", "OE")
 ADDRESS_SIGNALS = ("A", "B", "C", "D", "E")
 REQUIRED_CAPTURE_SIGNALS = CONTROL_SIGNALS + ADDRESS_SIGNALS[:4] + COLOR_SIGNALS
+VIRTUAL_IMAGE_BATCH_LATCHES = 4096
 DEFAULT_CAPTURE_SIGNAL_MAP = {
     "R1": 0,
     "B1": 1,
@@ -181,7 +184,7 @@ def _analyze_capture_file(
 
     report = CaptureReport(
         path=capture_path,
-        capture_sha256=_sha256(capture_path),
+        capture_sha256=file_sha256(capture_path),
         target_host=target_host,
         probe_host=probe_host,
         diagnosis=diagnosis,
@@ -323,9 +326,9 @@ def create_probe_proof(
                 "proof_channel": proof_channel,
                 "command": execution["command"],
                 "capture_path": str(capture_path),
-                "capture_sha256": _sha256(Path(capture_path)),
+                "capture_sha256": file_sha256(Path(capture_path)),
                 "execution_artifact": str(execution_path),
-                "execution_sha256": _sha256(execution_path),
+                "execution_sha256": file_sha256(execution_path),
                 "expected_edge_count": expected_edge_count,
                 "observed_edge_count": observed_edge_count,
                 "expected_edge_interval_seconds": expected_interval,
@@ -461,9 +464,147 @@ def render_virtual_image(
 ) -> Path:
     """Decode LAT commits into an approximate diagnostic panel image."""
 
+    capture = load_hub75_logic_csv(capture_path, signal_map)
+    frames = decode_virtual_frames(capture, cols=cols, rows=rows, weight_oe=weight_oe)
+    image = Image.fromarray(_normalize_virtual_frames(frames)[0], mode="RGB")
+    destination = Path(output_path)
+    image.save(destination)
+    return destination
+
+
+def render_virtual_animation(
+    capture_path: str | Path,
+    output_path: str | Path,
+    *,
+    signal_map: Mapping[str, int],
+    cols: int,
+    rows: int,
+    weight_oe: bool,
+    frame_seconds: float,
+    frame_duration_ms: int = 100,
+) -> Path:
+    """Decode LAT commits into an animated image with one frame per time window.
+
+    Every frame shares one brightness scale so dimming across the capture stays
+    visible. Windows without a decodable LAT commit render black.
+
+    """
+
+    capture = load_hub75_logic_csv(capture_path, signal_map)
+
+    def frames() -> Iterator[np.ndarray]:
+        return iter_virtual_frames(
+            capture,
+            cols=cols,
+            rows=rows,
+            weight_oe=weight_oe,
+            frame_seconds=frame_seconds,
+        )
+
+    # Decode twice, window by window, rather than holding every float frame:
+    # once for the shared brightness scale, once to write the frames.
+    maximum = max(float(frame.max(initial=0.0)) for frame in frames())
+    images = (
+        Image.fromarray(_normalize_virtual_frames(frame, maximum), mode="RGB")
+        for frame in frames()
+    )
+    destination = Path(output_path)
+    next(images).save(
+        destination,
+        save_all=True,
+        append_images=images,
+        duration=frame_duration_ms,
+        loop=0,
+    )
+    return destination
+
+
+def decode_virtual_frames(
+    capture: Hub75LogicCapture,
+    *,
+    cols: int,
+    rows: int,
+    weight_oe: bool,
+    frame_seconds: float | None = None,
+) -> np.ndarray:
+    """Accumulate colour levels shifted in before each LAT rise.
+
+    Returns a ``(frames, rows, cols, 3)`` float array. Without ``frame_seconds``
+    every commit lands in a single frame; otherwise commits are binned into
+    consecutive windows of that length starting at the first LAT rise.
+
+    """
+
+    commits = _virtual_commits(
+        capture, cols=cols, rows=rows, weight_oe=weight_oe, frame_seconds=frame_seconds
+    )
+    accumulators = np.zeros((commits.frame_count, rows, cols, 3), dtype=np.float64)
+    _accumulate_virtual_commits(commits, slice(0, commits.row_pair.size), accumulators)
+    return accumulators
+
+
+def iter_virtual_frames(
+    capture: Hub75LogicCapture,
+    *,
+    cols: int,
+    rows: int,
+    weight_oe: bool,
+    frame_seconds: float,
+) -> Iterator[np.ndarray]:
+    """Yield the frames of :func:`decode_virtual_frames` one window at a time.
+
+    Only one ``(rows, cols, 3)`` frame is held, and it is reused for the next
+    window, so copy a frame that must outlive the iteration step.
+
+    """
+
+    commits = _virtual_commits(
+        capture, cols=cols, rows=rows, weight_oe=weight_oe, frame_seconds=frame_seconds
+    )
+    frame = np.zeros((1, rows, cols, 3), dtype=np.float64)
+    # Commits are in time order, so each window's commits are contiguous.
+    bounds = np.searchsorted(commits.frame_index, np.arange(commits.frame_count + 1))
+    for index in range(commits.frame_count):
+        frame.fill(0.0)
+        _accumulate_virtual_commits(
+            commits,
+            slice(int(bounds[index]), int(bounds[index + 1])),
+            frame,
+            first_frame=index,
+        )
+        yield frame[0]
+
+
+@dataclass(frozen=True, slots=True)
+class _VirtualCommits:
+    """Decodable LAT commits of a capture, in time order.
+
+    ``color_edges`` holds the edge arrays and initial levels of the upper and
+    lower colour signals, converted once for every window that is accumulated.
+    """
+
+    frame_count: int
+    row_pairs: int
+    clk_rises: np.ndarray
+    shift_ends: np.ndarray
+    row_pair: np.ndarray
+    weights: np.ndarray
+    frame_index: np.ndarray
+    color_edges: tuple[tuple[tuple[np.ndarray, int], ...], ...]
+
+
+def _virtual_commits(
+    capture: Hub75LogicCapture,
+    *,
+    cols: int,
+    rows: int,
+    weight_oe: bool,
+    frame_seconds: float | None,
+) -> _VirtualCommits:
     if rows <= 0 or rows % 2 or cols <= 0:
         raise ValueError("rows must be positive and even; cols must be positive")
-    capture = load_hub75_logic_csv(capture_path, signal_map)
+    if frame_seconds is not None and not frame_seconds > 0:
+        raise ValueError("frame_seconds must be positive")
     missing = [signal for signal in REQUIRED_CAPTURE_SIGNALS if signal not in capture.signal_map]
     if missing:
         raise ValueError(
@@ -471,66 +612,120 @@ def render_virtual_image(
         )
 
     row_pairs = rows // 2
-    accumulators = [
-        [[0.0, 0.0, 0.0] for _column in range(cols)] for _row in range(rows)
-    ]
-    lat_rises = capture.rises[capture.signal_map["LAT"]]
-    clk_rises = capture.rises[capture.signal_map["CLK"]]
-    oe_falls = capture.falls[capture.signal_map["OE"]]
-    oe_rises = capture.rises[capture.signal_map["OE"]]
-
-    for lat_rise in lat_rises:
-        end = bisect_left(clk_rises, lat_rise)
-        start = end - cols
-        if start < 0:
-            continue
-        clocks = clk_rises[start:end]
-        row_pair = sum(
-            capture.level_at(signal, lat_rise) << bit
-            for bit, signal in enumerate(ADDRESS_SIGNALS)
-            if signal in capture.signal_map
-        )
-        if row_pair >= row_pairs:
-            continue
-        weight = _oe_active_duration(
-            lat_rise,
-            oe_falls=oe_falls,
-            oe_rises=oe_rises,
-        )
-        if not weight_oe:
-            weight = 1.0
-        for column, clock_rise in enumerate(clocks):
-            sample_at = math.nextafter(clock_rise, -math.inf)
-            for channel, signal in enumerate(COLOR_SIGNALS[:3]):
-                accumulators[row_pair][column][channel] += (
-                    capture.level_at(signal, sample_at) * weight
-                )
-            for channel, signal in enumerate(COLOR_SIGNALS[3:]):
-                accumulators[row_pair + row_pairs][column][channel] += (
-                    capture.level_at(signal, sample_at) * weight
+    lat_rises = np.asarray(capture.rises[capture.signal_map["LAT"]], dtype=np.float64)
+    clk_rises = np.asarray(capture.rises[capture.signal_map["CLK"]], dtype=np.float64)
+    if frame_seconds is None or lat_rises.size == 0:
+        frame_count = 1
+    else:
+        frame_count = int((lat_rises[-1] - lat_rises[0]) // frame_seconds) + 1
+
+    shift_ends = np.searchsorted(clk_rises, lat_rises, side="left")
+    complete = shift_ends >= cols
+    lat_rises = lat_rises[complete]
+    shift_ends = shift_ends[complete]
+
+    row_pair = np.zeros(lat_rises.shape, dtype=np.int64)
+    for bit, signal in enumerate(ADDRESS_SIGNALS):
+        if signal in capture.signal_map:
+            row_pair |= _levels_at(*_signal_edges(capture, signal), lat_rises) << bit
+    decodable = row_pair < row_pairs
+    if weight_oe:
+        weights = _oe_active_durations(capture, lat_rises)
+    else:
+        weights = np.ones(lat_rises.shape, dtype=np.float64)
+    if frame_seconds is None or lat_rises.size == 0:
+        frame_index = np.zeros(lat_rises.shape, dtype=np.int64)
+    else:
+        frame_index = ((lat_rises - lat_rises[0]) // frame_seconds).astype(np.int64)
+
+    return _VirtualCommits(
+        frame_count=frame_count,
+        row_pairs=row_pairs,
+        clk_rises=clk_rises,
+        shift_ends=shift_ends[decodable],
+        row_pair=row_pair[decodable],
+        weights=weights[decodable],
+        frame_index=frame_index[decodable],
+        color_edges=tuple(
+            tuple(_signal_edges(capture, signal) for signal in signals)
+            for signals in (COLOR_SIGNALS[:3], COLOR_SIGNALS[3:])
+        ),
+    )
+
+
+def _accumulate_virtual_commits(
+    commits: _VirtualCommits,
+    selection: slice,
+    accumulators: np.ndarray,
+    *,
+    first_frame: int = 0,
+) -> None:
+    """Add the ``selection`` commits to frames from ``first_frame`` onwards."""
+
+    cols = accumulators.shape[2]
+    row_pairs = commits.row_pairs
+    column_offsets = np.arange(cols) - cols
+    columns = np.arange(cols)[None, :]
+    for batch in range(selection.start, selection.stop, VIRTUAL_IMAGE_BATCH_LATCHES):
+        window = slice(batch, min(batch + VIRTUAL_IMAGE_BATCH_LATCHES, selection.stop))
+        clocks = commits.clk_rises[commits.shift_ends[window, None] + column_offsets]
+        sample_at = np.nextafter(clocks, -np.inf)
+        frames = commits.frame_index[window, None] - first_frame
+        batch_weights = commits.weights[window, None]
+        for half, signal_edges in enumerate(commits.color_edges):
+            target_rows = (commits.row_pair[window] + half * row_pairs)[:, None]
+            for channel, (edges, initial_state) in enumerate(signal_edges):
+                np.add.at(
+                    accumulators,
+                    (frames, target_rows, columns, channel),
+                    _levels_at(edges, initial_state, sample_at) * batch_weights,
                 )
 
-    maximum = max(
-        (
-            value
-            for row in accumulators
-            for pixel in row
-            for value in pixel
-        ),
-        default=0.0,
+
+def _signal_edges(capture: Hub75LogicCapture, signal: str) -> tuple[np.ndarray, int]:
+    """Return ``signal``'s edge times as an array and its level before them."""
+
+    channel = capture.signal_map[signal]
+    edges = np.asarray(capture.edges[channel], dtype=np.float64)
+    return edges, capture.initial_state[channel]
+
+
+def _levels_at(
+    edges: np.ndarray,
+    initial_state: int,
+    timestamps: np.ndarray,
+) -> np.ndarray:
+    toggles = np.searchsorted(edges, timestamps, side="right") & 1
+    return toggles ^ initial_state
+
+
+def _oe_active_durations(
+    capture: Hub75LogicCapture,
+    lat_rises: np.ndarray,
+) -> np.ndarray:
+    channel = capture.signal_map["OE"]
+    oe_falls = np.asarray(capture.falls[channel], dtype=np.float64)
+    oe_rises = np.asarray(capture.rises[channel], dtype=np.float64)
+    durations = np.zeros(lat_rises.shape, dtype=np.float64)
+    fall_index = np.searchsorted(oe_falls, lat_rises, side="right")
+    has_fall = fall_index < oe_falls.size
+    active_start = oe_falls[fall_index[has_fall]]
+    rise_index = np.searchsorted(oe_rises, active_start, side="right")
+    has_rise = rise_index < oe_rises.size
+    durations[np.flatnonzero(has_fall)[has_rise]] = np.maximum(
+        oe_rises[rise_index[has_rise]] - active_start[has_rise], 0.0
     )
+    return durations
+
+
+def _normalize_virtual_frames(
+    frames: np.ndarray, maximum: float | None = None
+) -> np.ndarray:
+    if maximum is None:
+        maximum = float(frames.max(initial=0.0))
     if maximum <= 0:
         raise ValueError("capture contains no decodable color-channel activity")
-    image = Image.new("RGB", (cols, rows))
-    for row, accumulator_row in enumerate(accumulators):
-        for column, pixel in enumerate(accumulator_row):
-            image.putpixel(
-                (column, row),
-                tuple(round(255.0 * value / maximum) for value in pixel),
-            )
-    destination = Path(output_path)
-    image.save(destination)
-    return destination
+    return np.rint(frames * (255.0 / maximum)).astype(np.uint8)
 
 
 @final
@@ -612,7 +807,7 @@ class CapturePreflight:
             target_host=normalized_target,
             probe_host=normalized_probe,
             probe_proof=str(self.probe_proof),
-            probe_proof_sha256=_sha256(self.probe_proof),
+            probe_proof_sha256=file_sha256(self.probe_proof),
             probe_capture_sha256=str(proof["capture_sha256"]),
             execution_sha256=str(proof["execution_sha256"]),
             saleae_module_name=saleae_module_name,
@@ -756,7 +951,7 @@ def _load_probe_proof(path: Path) -> dict[str, object]:
     if not capture_path.is_file():
         raise ValueError(f"probe proof source CSV does not exist: {capture_path}")
     expected_sha = payload.get("capture_sha256")
-    if not isinstance(expected_sha, str) or expected_sha != _sha256(capture_path):
+    if not isinstance(expected_sha, str) or expected_sha != file_sha256(capture_path):
         raise ValueError("probe proof source CSV hash does not match the artifact")
     if payload.get("trust_basis") != "operator_correlated_host_toggle":
         raise ValueError("probe proof has no accepted execution/capture correlation")
@@ -770,7 +965,7 @@ def _load_probe_proof(path: Path) -> dict[str, object]:
     execution_path = Path(str(payload.get("execution_artifact", "")))
     if not execution_path.is_file():
         raise ValueError("probe proof execution artifact does not exist")
-    if payload.get("execution_sha256") != _sha256(execution_path):
+    if payload.get("execution_sha256") != file_sha256(execution_path):
         raise ValueError("probe proof execution artifact hash does not match")
     execution = _load_probe_execution(execution_path)
     proof_target = _normalize_host_identity(str(payload.get("target_host", "")))
@@ -864,22 +1059,6 @@ def _saleae_module_origin(module_name: str) -> str | None:
     return spec.origin
 
 
-def _oe_active_duration(
-    lat_rise: float,
-    *,
-    oe_falls: list[float],
-    oe_rises: list[float],
-) -> float:
-    fall_index = bisect_right(oe_falls, lat_rise)
-    if fall_index >= len(oe_falls):
-        return 0.0
-    active_start = oe_falls[fall_index]
-    rise_index = bisect_right(oe_rises, active_start)
-    if rise_index >= len(oe_rises):
-        return 0.0
-    return max(oe_rises[rise_index] - active_start, 0.0)
-
-
 def _signal_evidence(
     capture: Any,
     signal: str,
@@ -931,14 +1110,6 @@ def _signal_is_static_low(evidence: SignalEvidence | None) -> bool:
     )
 
 
-def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def score_complete_similarity(
     baseline: CaptureReport,
     candidate: CaptureReport,
@@ -17,6 +17,7 @@ from heart.utilities.hub75_lab.capture import (DEFAULT_CAPTURE_SIGNAL_MAP,
                                                analyze_capture,
                                                capture_report_payload,
                                                create_probe_proof,
+                                               render_virtual_animation,
                                                render_virtual_image,
                                                run_probe_toggle,
                                                score_complete_similarity)
@@ -162,6 +163,12 @@ def _build_parser() -> argparse.ArgumentParser:
     render_parser.add_argument("--cols", type=int, default=64)
     render_parser.add_argument("--rows", type=int, default=64)
     render_parser.add_argument("--weight-oe", action="store_true")
+    render_parser.add_argument(
+        "--frame-seconds",
+        type=float,
+        help="Write an animated image with one frame per window of this length.",
+    )
+    render_parser.add_argument("--frame-duration-ms", type=int, default=100)
     _add_signal_args(render_parser)
 
     bundle_parser = subparsers.add_parser(
@@ -414,14 +421,26 @@ def _score_command(args: argparse.Namespace) -> int:
 
 
 def _render_capture_command(args: argparse.Namespace) -> int:
-    destination = render_virtual_image(
-        args.capture_csv,
-        args.output,
-        signal_map=_parse_signal_map(args.signal),
-        cols=args.cols,
-        rows=args.rows,
-        weight_oe=args.weight_oe,
-    )
+    if args.frame_seconds is None:
+        destination = render_virtual_image(
+            args.capture_csv,
+            args.output,
+            signal_map=_parse_signal_map(args.signal),
+            cols=args.cols,
+            rows=args.rows,
+            weight_oe=args.weight_oe,
+        )
+    else:
+        destination = render_virtual_animation(
+            args.capture_csv,
+            args.output,
+            signal_map=_parse_signal_map(args.signal),
+            cols=args.cols,
+            rows=args.rows,
+            weight_oe=args.weight_oe,
+            frame_seconds=args.frame_seconds,
+            frame_duration_ms=args.frame_duration_ms,
+        )
     print(destination)
     return 0
 
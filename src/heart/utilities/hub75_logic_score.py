@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import csv
+import hashlib
+import os
 from bisect import bisect_left, bisect_right
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from statistics import median
 
+import numpy as np
+
 REQUIRED_SIGNALS = ("CLK", "LAT", "OE", "A", "B", "C", "D")
 OPTIONAL_SIGNALS = ("E",)
 DEFAULT_SIGNAL_MAP = {
@@ -26,6 +29,8 @@ OE_LONG_BLANK_THRESHOLD_NS = 10_000.0
 OE_MEDIAN_BLANK_WARNING_NS = 500.0
 OE_MEDIAN_BLANK_ACTIVE_FRACTION_WARNING = 0.05
 CLK_LONG_PERIOD_THRESHOLD_NS = 10_000.0
+EDGE_CACHE_DIR_ENV_VAR = "HEART_HUB75_EDGE_CACHE_DIR"
+LOGIC_CSV_CHUNK_BYTES = 16 * 1024 * 1024
 
 
 @dataclass(frozen=True)
@@ -140,63 +145,45 @@ class Hub75CaptureDiagnosis:
 def load_hub75_logic_csv(
     path: str | Path,
     signal_map: Mapping[str, int] | None = None,
+    *,
+    cache_dir: str | Path | None = None,
 ) -> Hub75LogicCapture:
-    """Load a Saleae raw digital CSV export into edge lists."""
+    """Load a Saleae raw digital CSV export into edge lists.
+
+    Parsed edges are cached as ``<sha256>.npz`` in ``cache_dir`` (or
+    ``HEART_HUB75_EDGE_CACHE_DIR`` when unset) so repeated scoring of the same
+    capture skips the CSV parse.
+
+    """
 
     resolved_map = _resolve_signal_map(signal_map)
     column_count = max(resolved_map.values()) + 1
-    edges: dict[int, list[float]] = {
-        index: [] for index in range(column_count)
-    }
-    rises: dict[int, list[float]] = {
-        index: [] for index in range(column_count)
-    }
-    falls: dict[int, list[float]] = {
-        index: [] for index in range(column_count)
-    }
-    initial_state: list[int] | None = None
-    sample_count = 0
-    first_timestamp = 0.0
-    last_timestamp = 0.0
-
-    with Path(path).open(newline="") as handle:
-        rows = csv.reader(handle)
-        next(rows)
-        previous_state: list[int] | None = None
-        for row in rows:
-            timestamp = float(row[0])
-            state = [int(value) for value in row[1 : 1 + column_count]]
-            if initial_state is None:
-                initial_state = state.copy()
-                first_timestamp = timestamp
-            if previous_state is not None:
-                for channel, (old, new) in enumerate(
-                    zip(previous_state, state, strict=True)
-                ):
-                    if old == new:
-                        continue
-                    edges[channel].append(timestamp)
-                    if new:
-                        rises[channel].append(timestamp)
-                    else:
-                        falls[channel].append(timestamp)
-            previous_state = state
-            last_timestamp = timestamp
-            sample_count += 1
-
-    if initial_state is None:
-        msg = f"{path}: empty HUB75 logic CSV"
+    parsed = _load_logic_edges(path, cache_dir)
+    if column_count > parsed.channel_count:
+        msg = (
+            f"{path}: signal map column {column_count - 1} is outside the "
+            f"{parsed.channel_count} captured channels"
+        )
         raise ValueError(msg)
+    edges: dict[int, list[float]] = {}
+    rises: dict[int, list[float]] = {}
+    falls: dict[int, list[float]] = {}
+    for channel in range(column_count):
+        channel_edges = parsed.edges[channel]
+        initial_level = int(parsed.initial_state[channel])
+        edges[channel] = channel_edges.tolist()
+        rises[channel] = channel_edges[initial_level::2].tolist()
+        falls[channel] = channel_edges[1 - initial_level :: 2].tolist()
 
     return Hub75LogicCapture(
         signal_map=resolved_map,
-        initial_state=initial_state,
+        initial_state=parsed.initial_state[:column_count].tolist(),
         rises=rises,
         falls=falls,
         edges=edges,
-        sample_count=sample_count,
-        first_timestamp=first_timestamp,
-        last_timestamp=last_timestamp,
+        sample_count=parsed.sample_count,
+        first_timestamp=parsed.first_timestamp,
+        last_timestamp=parsed.last_timestamp,
     )
 
 
@@ -347,12 +334,13 @@ def diagnose_hub75_capture(
     *,
     signal_map: Mapping[str, int] | None = None,
     cols: int = 64,
+    cache_dir: str | Path | None = None,
 ) -> Hub75CaptureDiagnosis:
     """Classify whether a capture is valid, silent, or likely channel-mismapped."""
 
-    capture = load_hub75_logic_csv(path, signal_map)
+    capture = load_hub75_logic_csv(path, signal_map, cache_dir=cache_dir)
     summary = summarize_hub75_capture(capture, cols=cols)
-    all_channel_activity = summarize_logic_channels(path)
+    all_channel_activity = summarize_logic_channels(path, cache_dir=cache_dir)
     mapped_edge_counts = {
         signal: len(capture.edges[channel])
         for signal, channel in capture.signal_map.items()
@@ -548,62 +536,43 @@ def score_hub75_capture_files(
     *,
     signal_map: Mapping[str, int] | None = None,
     cols: int = 64,
+    cache_dir: str | Path | None = None,
 ) -> tuple[Hub75SignalSummary, Hub75SignalSummary, Hub75SimilarityScore]:
     """Load two CSV captures, summarize them, and return their similarity."""
 
-    baseline_capture = load_hub75_logic_csv(baseline_path, signal_map)
-    candidate_capture = load_hub75_logic_csv(candidate_path, signal_map)
+    baseline_capture = load_hub75_logic_csv(
+        baseline_path, signal_map, cache_dir=cache_dir
+    )
+    candidate_capture = load_hub75_logic_csv(
+        candidate_path, signal_map, cache_dir=cache_dir
+    )
     baseline_summary = summarize_hub75_capture(baseline_capture, cols=cols)
     candidate_summary = summarize_hub75_capture(candidate_capture, cols=cols)
     score = score_hub75_similarity(baseline_summary, candidate_summary)
     return baseline_summary, candidate_summary, score
 
 
-def summarize_logic_channels(path: str | Path) -> tuple[LogicChannelActivity, ...]:
+def summarize_logic_channels(
+    path: str | Path,
+    *,
+    cache_dir: str | Path | None = None,
+) -> tuple[LogicChannelActivity, ...]:
     """Return edge counts for every captured CSV column, regardless of mapping."""
 
+    parsed = _load_logic_edges(path, cache_dir)
     activities: list[LogicChannelActivity] = []
-    with Path(path).open(newline="") as handle:
-        rows = csv.reader(handle)
-        header = next(rows)
-        channel_count = len(header) - 1
-        initial_state: list[int] | None = None
-        final_state: list[int] | None = None
-        previous_state: list[int] | None = None
-        edges = [0] * channel_count
-        rises = [0] * channel_count
-        falls = [0] * channel_count
-        for row in rows:
-            state = [int(value) for value in row[1 : 1 + channel_count]]
-            if initial_state is None:
-                initial_state = state.copy()
-            if previous_state is not None:
-                for channel, (old, new) in enumerate(
-                    zip(previous_state, state, strict=True)
-                ):
-                    if old == new:
-                        continue
-                    edges[channel] += 1
-                    if new:
-                        rises[channel] += 1
-                    else:
-                        falls[channel] += 1
-            previous_state = state
-            final_state = state.copy()
-
-    if initial_state is None or final_state is None:
-        msg = f"{path}: empty HUB75 logic CSV"
-        raise ValueError(msg)
-
-    for channel in range(channel_count):
+    for channel, channel_edges in enumerate(parsed.edges):
+        initial_level = int(parsed.initial_state[channel])
+        edge_count = int(channel_edges.size)
+        rise_count = (edge_count + 1 - initial_level) // 2
         activities.append(
             LogicChannelActivity(
                 channel=channel,
-                edge_count=edges[channel],
-                rise_count=rises[channel],
-                fall_count=falls[channel],
-                initial_level=initial_state[channel],
-                final_level=final_state[channel],
+                edge_count=edge_count,
+                rise_count=rise_count,
+                fall_count=edge_count - rise_count,
+                initial_level=initial_level,
+                final_level=initial_level ^ (edge_count & 1),
             )
         )
     return tuple(
@@ -613,6 +582,148 @@ def summarize_logic_channels(path: str | Path) -> tuple[LogicChannelActivity, ..
     )
 
 
+def file_sha256(path: str | Path) -> str:
+    """Return the hex SHA-256 of a file, streamed in 1 MiB chunks."""
+
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class _LogicEdges:
+    """Per-channel edge timestamps for every column of a logic CSV.
+
+    Digital levels alternate, so rises and falls are recovered from ``edges`` by
+    stepping from the initial level instead of being stored separately.
+
+    """
+
+    initial_state: np.ndarray
+    edges: tuple[np.ndarray, ...]
+    sample_count: int
+    first_timestamp: float
+    last_timestamp: float
+
+    @property
+    def channel_count(self) -> int:
+        return len(self.edges)
+
+
+def _load_logic_edges(path: str | Path, cache_dir: str | Path | None) -> _LogicEdges:
+    if cache_dir is None:
+        cache_dir = os.environ.get(EDGE_CACHE_DIR_ENV_VAR) or None
+    if cache_dir is None:
+        return _parse_logic_csv(path)
+
+    cache_path = Path(cache_dir) / f"{file_sha256(path)}.npz"
+    if cache_path.exists():
+        return _read_edge_cache(cache_path)
+    parsed = _parse_logic_csv(path)
+    _write_edge_cache(cache_path, parsed)
+    return parsed
+
+
+def _parse_logic_csv(path: str | Path) -> _LogicEdges:
+    with Path(path).open("rb") as handle:
+        header = handle.readline()
+        channel_count = len(header.split(b",")) - 1
+        width = channel_count + 1
+        chunk_edges: list[list[np.ndarray]] = [[] for _ in range(channel_count)]
+        initial_state: np.ndarray | None = None
+        previous_state: np.ndarray | None = None
+        sample_count = 0
+        first_timestamp = 0.0
+        last_timestamp = 0.0
+        remainder = b""
+        while True:
+            block = handle.read(LOGIC_CSV_CHUNK_BYTES)
+            if block:
+                block = remainder + block
+                cut = block.rfind(b"\n") + 1
+                if cut == 0:
+                    remainder = block
+                    continue
+                block, remainder = block[:cut], block[cut:]
+            else:
+                block, remainder = remainder, b""
+            text = block.replace(b"\r", b"").strip(b"\n")
+            if text:
+                values = np.fromstring(
+                    text.replace(b"\n", b","), dtype=np.float64, sep=","
+                )
+                row_count = text.count(b"\n") + 1
+                if values.size != row_count * width:
+                    msg = f"{path}: malformed HUB75 logic CSV"
+                    raise ValueError(msg)
+                rows = values.reshape(row_count, width)
+                timestamps = rows[:, 0]
+                states = rows[:, 1:] != 0
+                if initial_state is None:
+                    initial_state = states[0]
+                    previous_state = states[0]
+                    first_timestamp = float(timestamps[0])
+                changed = np.empty_like(states)
+                np.not_equal(states[0], previous_state, out=changed[0])
+                np.not_equal(states[1:], states[:-1], out=changed[1:])
+                for channel in range(channel_count):
+                    edge_rows = np.flatnonzero(changed[:, channel])
+                    if edge_rows.size:
+                        chunk_edges[channel].append(timestamps[edge_rows])
+                previous_state = states[-1]
+                sample_count += row_count
+                last_timestamp = float(timestamps[-1])
+            if not block:
+                break
+
+    if initial_state is None:
+        msg = f"{path}: empty HUB75 logic CSV"
+        raise ValueError(msg)
+
+    return _LogicEdges(
+        initial_state=initial_state.astype(np.uint8),
+        edges=tuple(
+            np.concatenate(parts) if parts else np.empty(0, dtype=np.float64)
+            for parts in chunk_edges
+        ),
+        sample_count=sample_count,
+        first_timestamp=first_timestamp,
+        last_timestamp=last_timestamp,
+    )
+
+
+def _read_edge_cache(cache_path: Path) -> _LogicEdges:
+    with np.load(cache_path) as cached:
+        offsets = cached["edge_offsets"]
+        flat_edges = cached["edges"]
+        bounds = cached["timestamps"]
+        return _LogicEdges(
+            initial_state=cached["initial_state"],
+            edges=tuple(np.split(flat_edges, offsets[1:-1])),
+            sample_count=int(cached["sample_count"]),
+            first_timestamp=float(bounds[0]),
+            last_timestamp=float(bounds[1]),
+        )
+
+
+def _write_edge_cache(cache_path: Path, parsed: _LogicEdges) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    offsets = np.zeros(parsed.channel_count + 1, dtype=np.int64)
+    np.cumsum([channel.size for channel in parsed.edges], out=offsets[1:])
+    temporary_path = cache_path.with_name(f"{cache_path.stem}.tmp.npz")
+    np.savez(
+        temporary_path,
+        initial_state=parsed.initial_state,
+        edges=np.concatenate((np.empty(0, dtype=np.float64), *parsed.edges)),
+        edge_offsets=offsets,
+        sample_count=np.int64(parsed.sample_count),
+        timestamps=np.array([parsed.first_timestamp, parsed.last_timestamp]),
+    )
+    temporary_path.replace(cache_path)
+
+
 def _resolve_signal_map(
     signal_map: Mapping[str, int] | None,
 ) -> dict[str, int]:
@@ -1,16 +1,198 @@
+import atexit
+import copy
 import logging
 import os
+import queue
+import threading
+from collections.abc import Sequence
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 LOG_LEVEL_ENV_VAR = "LOG_LEVEL"
 LOG_DIR_ENV_VAR = "HEART_LOG_DIR"
+LOG_QUEUE_SIZE_ENV_VAR = "HEART_LOG_QUEUE_SIZE"
 DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_LOG_SUBDIR = Path(".heart") / "logs"
+DEFAULT_LOG_QUEUE_SIZE = 4096
 MAX_LOG_BYTES = 10 * 1024 * 1024  # 10 MiB
 BACKUP_COUNT = 5
 
 _LOGGER_CACHE: dict[str, logging.Logger] = {}
+_WRITER: "LogWriter | None" = None
+_WRITER_LOCK = threading.Lock()
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+_QueuedRecord = tuple[logging.LogRecord, tuple[logging.Handler, ...]]
+
+
+class LogWriter:
+    """Format and write queued log records on a single background thread.
+
+    Callers only append to a bounded queue, so file writes and rotation never run
+    on the render thread. When the queue is full the record is dropped and
+    counted; the writer reports the count through the next record's handlers.
+    :class:`_QueuedHandler` merges each message with its arguments and renders
+    any traceback before queueing, so the writer only lays out finished text.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_LOG_QUEUE_SIZE) -> None:
+        self._queue: queue.Queue[_QueuedRecord | None] = queue.Queue(maxsize)
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._drop_lock = threading.Lock()
+        self.dropped = 0
+        self._reported_dropped = 0
+
+    def submit(
+        self, record: logging.LogRecord, handlers: tuple[logging.Handler, ...]
+    ) -> bool:
+        """Queue ``record`` for ``handlers``; return ``False`` if it was dropped."""
+
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait((record, handlers))
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write everything still queued, then stop the writer thread."""
+
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join()
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            thread = threading.Thread(
+                target=self._run, name="heart-log-writer", daemon=True
+            )
+            thread.start()
+            self._thread = thread
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                record, handlers = item
+                if self.dropped != self._reported_dropped:
+                    self._report_dropped(record, handlers)
+                for handler in handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            except Exception:
+                # Handlers report their own errors; never let one kill the writer.
+                pass
+            finally:
+                self._queue.task_done()
+
+    def _report_dropped(
+        self, record: logging.LogRecord, handlers: tuple[logging.Handler, ...]
+    ) -> None:
+        dropped = self.dropped
+        warning = logging.LogRecord(
+            name=record.name,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg="Dropped %d log records because the log queue was full",
+            args=(dropped - self._reported_dropped,),
+            exc_info=None,
+        )
+        self._reported_dropped = dropped
+        for handler in handlers:
+            if warning.levelno >= handler.level:
+                handler.handle(warning)
+
+
+class _QueuedHandler(logging.Handler):
+    """Hand records to the shared :class:`LogWriter` for a logger's real handlers."""
+
+    def __init__(self, writer: LogWriter, handlers: Sequence[logging.Handler]) -> None:
+        super().__init__(level=min(handler.level for handler in handlers))
+        self.writer = writer
+        self.handlers = tuple(handlers)
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # Skip Handler.handle's lock; the queue is already thread safe.
+        if not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.writer.submit(self.prepare(record), self.handlers)
+        except Exception:
+            self.handleError(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of ``record`` that no longer refers to caller state.
+
+        As in :meth:`logging.handlers.QueueHandler.prepare`, the message is
+        merged with its arguments and the traceback rendered on the calling
+        thread, so later mutation of the arguments cannot change what is
+        written and queued records do not keep exception frames alive.
+        """
+
+        prepared = copy.copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if record.exc_info:
+            if not prepared.exc_text:
+                prepared.exc_text = _EXCEPTION_FORMATTER.formatException(
+                    record.exc_info
+                )
+            prepared.exc_info = None
+        return prepared
+
+
+def _resolve_queue_size() -> int:
+    raw = os.getenv(LOG_QUEUE_SIZE_ENV_VAR)
+    if raw is None:
+        return DEFAULT_LOG_QUEUE_SIZE
+    try:
+        size = int(raw)
+    except ValueError as exc:
+        raise ValueError(f"{LOG_QUEUE_SIZE_ENV_VAR} must be an integer") from exc
+    if size < 0:
+        raise ValueError(f"{LOG_QUEUE_SIZE_ENV_VAR} must be at least 0")
+    return size
+
+
+def get_log_writer() -> LogWriter:
+    """Return the process-wide writer, creating it on first use."""
+
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = LogWriter(_resolve_queue_size() or DEFAULT_LOG_QUEUE_SIZE)
+            atexit.register(_WRITER.close)
+        return _WRITER
+
+
+def flush_logs() -> None:
+    """Wait for queued records to reach their handlers."""
+
+    if _WRITER is not None:
+        _WRITER.flush()
 
 
 def _resolve_log_directory() -> Path | None:
@@ -37,17 +219,16 @@ def _sanitize_logger_name(name: str) -> str:
     return sanitized.replace(".", "_") or "root"
 
 
-def _attach_handler(
-    logger: logging.Logger,
+def _prepare_handler(
     handler: logging.Handler,
     formatter: logging.Formatter,
     level: int,
-) -> None:
-    """Attach a handler to ``logger`` with shared configuration."""
+) -> logging.Handler:
+    """Apply the shared formatter and level to ``handler``."""
 
     handler.setFormatter(formatter)
     handler.setLevel(level)
-    logger.addHandler(handler)
+    return handler
 
 
 def _configure_logger(logger: logging.Logger, log_level: str) -> None:
@@ -62,8 +243,7 @@ def _configure_logger(logger: logging.Logger, log_level: str) -> None:
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
-    stream_handler = logging.StreamHandler()
-    _attach_handler(logger, stream_handler, formatter, level)
+    handlers = [_prepare_handler(logging.StreamHandler(), formatter, level)]
 
     log_dir = _resolve_log_directory()
     if log_dir is not None:
@@ -78,7 +258,13 @@ def _configure_logger(logger: logging.Logger, log_level: str) -> None:
         except OSError:
             file_handler = None
         if file_handler is not None:
-            _attach_handler(logger, file_handler, formatter, level)
+            handlers.append(_prepare_handler(file_handler, formatter, level))
+
+    if _resolve_queue_size() > 0:
+        logger.addHandler(_QueuedHandler(get_log_writer(), handlers))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
     logger.propagate = False
 
 
@@ -90,7 +276,11 @@ def _build_logger(name: str) -> logging.Logger:
 
 
 def get_logger(name: str) -> logging.Logger:
-    """Return a logger configured with stream and rolling file handlers."""
+    """Return a logger configured with stream and rolling file handlers.
+
+    The handlers run on the shared :class:`LogWriter` thread unless
+    ``HEART_LOG_QUEUE_SIZE`` is ``0``, which writes synchronously instead.
+    """
 
     log_level = os.getenv(LOG_LEVEL_ENV_VAR, DEFAULT_LOG_LEVEL).upper()
     logger = _LOGGER_CACHE.get(name)
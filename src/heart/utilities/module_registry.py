@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from importlib import import_module
 from pathlib import Path
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from heart.utilities.logging import get_logger
 
@@ -11,15 +12,11 @@ T = TypeVar("T")
 logger = get_logger(__name__)
 
 
-def discover_registry(
-    configurations_dir: Path,
-    module_root: str,
-    attribute: str = "configure",
-    *,
-    log_imports: bool = False,
-) -> dict[str, T]:
-    registry: dict[str, T] = {}
-    for entry in configurations_dir.iterdir():
+def registry_module_names(configurations_dir: Path) -> tuple[str, ...]:
+    """Return registry module stems in ``configurations_dir`` without importing."""
+
+    names: list[str] = []
+    for entry in sorted(configurations_dir.iterdir()):
         if not entry.is_file():
             continue
         if (
@@ -28,10 +25,78 @@ def discover_registry(
             or entry.name.startswith("._")
         ):
             continue
-        module_name = f"{module_root}.{entry.stem}"
+        names.append(entry.stem)
+    return tuple(names)
+
+
+def discover_registry(
+    configurations_dir: Path,
+    module_root: str,
+    attribute: str = "configure",
+    *,
+    log_imports: bool = False,
+) -> dict[str, T]:
+    registry: dict[str, T] = {}
+    for name in registry_module_names(configurations_dir):
+        module_name = f"{module_root}.{name}"
         module = import_module(module_name)
         if log_imports:
             logger.info("Importing configuration: %s", module_name)
         if hasattr(module, attribute):
-            registry[entry.stem] = getattr(module, attribute)
+            registry[name] = getattr(module, attribute)
     return registry
+
+
+class LazyModuleRegistry(Mapping[str, Any]):
+    """Index registry modules by file name and import each one on first lookup.
+
+    ``discover_registry`` imports every module up front, which pulls in the
+    renderer stack of every configuration just to select one. This mapping
+    holds the same entries but a lookup only imports the module requested.
+    Iterating or taking ``len`` has to import every module to skip those
+    without ``attribute``, exactly as ``discover_registry`` does.
+    """
+
+    def __init__(
+        self,
+        configurations_dir: Path,
+        module_root: str,
+        attribute: str = "configure",
+        *,
+        log_imports: bool = False,
+    ) -> None:
+        self._module_root = module_root
+        self._attribute = attribute
+        self._log_imports = log_imports
+        self._names = registry_module_names(configurations_dir)
+        self._loaded: dict[str, Any] = {}
+        self._without_attribute: set[str] = set()
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._loaded:
+            return self._loaded[name]
+        if name not in self._names or name in self._without_attribute:
+            raise KeyError(name)
+        module_name = f"{self._module_root}.{name}"
+        module = import_module(module_name)
+        if self._log_imports:
+            logger.info("Importing configuration: %s", module_name)
+        if not hasattr(module, self._attribute):
+            self._without_attribute.add(name)
+            raise KeyError(name)
+        value = getattr(module, self._attribute)
+        self._loaded[name] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self._names:
+            if name in self:
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def loaded(self) -> tuple[str, ...]:
+        """Return the names whose modules have been imported so far."""
+
+        return tuple(self._loaded)
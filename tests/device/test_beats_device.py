@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+import pygame
 from PIL import Image
 
 from heart.device import Cube
 from heart.device.beats.device import StreamedScreen
+from heart.device.beats.frame_codec import BeatsFrameDecoder, FrameCodec
 
 
 class _WebSocketStub:
-    def __init__(self) -> None:
-        self.sent: list[tuple[str, bytes]] = []
+    def __init__(self, codec: FrameCodec = FrameCodec.PNG) -> None:
+        self.sent: list[tuple[str, Any]] = []
+        self.codec = codec
 
-    def send(self, kind: str, payload: bytes) -> None:
+    def send(self, kind: str, payload: Any) -> None:
         self.sent.append((kind, payload))
 
+    def frame_codec(self) -> FrameCodec:
+        return self.codec
+
 
 class TestStreamedScreen:
     """Ensure the Beats streamed device accepts scaled frames so renderer output can match local preview fidelity."""
@@ -38,3 +46,36 @@ class TestStreamedScreen:
 
         assert len(websocket.sent) == 1
         assert websocket.sent[0][0] == "frame"
+
+    def test_set_screen_streams_native_resolution_for_rgb_codecs(self) -> None:
+        """Verify RGB codecs ship the unscaled atlas with its scale so Beats upscales instead of the Pi encoding 16x the pixels."""
+        device = StreamedScreen(orientation=Cube.sides())
+        websocket = _WebSocketStub(codec=FrameCodec.DELTA)
+        device.websocket = websocket
+        screen = pygame.Surface(device.scaled_display_size())
+        screen.fill((10, 20, 30))
+        screen.fill((200, 100, 50), pygame.Rect(8, 4, 4, 4))
+
+        device.set_screen(screen)
+        screen.fill((0, 0, 0), pygame.Rect(8, 4, 4, 4))
+        device.set_screen(screen)
+
+        decoder = BeatsFrameDecoder()
+        frames = [decoder.decode(payload) for _, payload in websocket.sent]
+        assert websocket.sent[0][1].display_scale == 4
+        assert frames[0] is not None and frames[0].shape == (64, 256, 3)
+        assert tuple(frames[0][1, 2]) == (200, 100, 50)
+        assert tuple(frames[0][0, 0]) == (10, 20, 30)
+        assert frames[1] is not None and tuple(frames[1][1, 2]) == (0, 0, 0)
+        assert len(websocket.sent[1][1].delta_rects) == 1
+
+    def test_set_screen_keeps_png_for_legacy_clients(self) -> None:
+        """Verify clients that did not negotiate a codec still receive PNG frames so older Beats builds keep working."""
+        device = StreamedScreen(orientation=Cube.sides())
+        websocket = _WebSocketStub()
+        device.websocket = websocket
+
+        device.set_screen(pygame.Surface(device.full_display_size()))
+
+        assert isinstance(websocket.sent[0][1], bytes)
+        assert websocket.sent[0][1].startswith(b"\x89PNG")
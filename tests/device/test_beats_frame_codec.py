@@ -0,0 +1,175 @@
+"""Validate Beats frame codecs so raw and delta streams rebuild exactly what Heart rendered."""
+
+from __future__ import annotations
+
+import io
+
+import numpy as np
+import pygame
+import pytest
+from PIL import Image
+
+from heart.device.beats.frame_codec import (FRAME_CODEC_SUBPROTOCOLS,
+                                            BeatsFrameDecoder,
+                                            BeatsFrameEncoder, FrameCodec,
+                                            common_frame_codec,
+                                            frame_codec_for_subprotocol,
+                                            is_keyframe,
+                                            select_frame_subprotocol)
+from heart.device.beats.proto import beats_streaming_pb2
+from heart.runtime.rendering.constants import RGBA_IMAGE_FORMAT
+
+NATIVE_SIZE = (256, 64)
+DISPLAY_SCALE = 4
+BENCHMARK_FRAMES = 32
+
+
+def _animated_frames(count: int) -> list[np.ndarray]:
+    """Return native frames with a gradient backdrop and a small moving sprite."""
+
+    width, height = NATIVE_SIZE
+    ys, xs = np.mgrid[0:height, 0:width]
+    backdrop = np.stack([xs % 256, (ys * 4) % 256, (xs + ys) % 256], axis=-1).astype(
+        np.uint8
+    )
+    frames = []
+    for index in range(count):
+        frame = backdrop.copy()
+        x = (index * 5) % (width - 12)
+        frame[20:32, x : x + 12] = (255, 64, 0)
+        frames.append(frame)
+    return frames
+
+
+def _scaled_surface(rgb: np.ndarray) -> pygame.Surface:
+    scaled = np.repeat(np.repeat(rgb, DISPLAY_SCALE, axis=0), DISPLAY_SCALE, axis=1)
+    return pygame.surfarray.make_surface(scaled.swapaxes(0, 1))
+
+
+def _encode_png(surface: pygame.Surface) -> bytes:
+    """Mirror the legacy StreamedScreen path: tostring, then PIL PNG."""
+
+    image = Image.frombuffer(
+        RGBA_IMAGE_FORMAT,
+        surface.get_size(),
+        pygame.image.tostring(surface, RGBA_IMAGE_FORMAT),
+        "raw",
+        RGBA_IMAGE_FORMAT,
+        0,
+        1,
+    )
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _envelope_size(frame: object) -> int:
+    return len(beats_streaming_pb2.StreamEnvelope(frame=frame).SerializeToString())
+
+
+class TestBeatsFrameCodec:
+    """Ensure RGB888 keyframes and XOR deltas round-trip so Beats shows the same pixels as the PNG stream."""
+
+    @pytest.mark.parametrize("codec", [FrameCodec.RAW, FrameCodec.DELTA])
+    def test_round_trip_is_lossless(self, codec: FrameCodec) -> None:
+        """Verify every decoded frame matches the rendered frame so codec choice never changes what Beats shows."""
+        encoder = BeatsFrameEncoder(keyframe_interval=8)
+        decoder = BeatsFrameDecoder()
+
+        for rgb in _animated_frames(20):
+            frame = encoder.encode(rgb, codec=codec, display_scale=DISPLAY_SCALE)
+            decoded = decoder.decode(frame)
+            assert decoded is not None
+            np.testing.assert_array_equal(decoded, rgb)
+
+    def test_delta_only_carries_dirty_tiles(self) -> None:
+        """Verify deltas stay small for sprite-sized changes so static scenes stop costing a full frame per tick."""
+        encoder = BeatsFrameEncoder()
+        first, second = _animated_frames(2)
+
+        keyframe = encoder.encode(first, codec=FrameCodec.DELTA, display_scale=1)
+        delta = encoder.encode(second, codec=FrameCodec.DELTA, display_scale=1)
+
+        assert is_keyframe(keyframe)
+        assert not is_keyframe(delta)
+        assert delta.keyframe_id == keyframe.keyframe_id
+        assert _envelope_size(delta) < _envelope_size(keyframe) // 10
+
+    def test_keyframes_repeat_on_interval_and_large_changes(self) -> None:
+        """Verify periodic and fallback keyframes so late joiners and full-scene cuts recover quickly."""
+        encoder = BeatsFrameEncoder(keyframe_interval=3)
+        frames = _animated_frames(4)
+
+        kinds = [
+            is_keyframe(encoder.encode(rgb, codec=FrameCodec.DELTA, display_scale=1))
+            for rgb in frames
+        ]
+        cut = encoder.encode(255 - frames[0], codec=FrameCodec.DELTA, display_scale=1)
+
+        assert kinds == [True, False, False, True]
+        assert is_keyframe(cut)
+
+    def test_decoder_skips_deltas_for_unknown_keyframes(self) -> None:
+        """Verify deltas against a dropped keyframe are ignored so clients never draw corrupted pixels."""
+        encoder = BeatsFrameEncoder()
+        first, second = _animated_frames(2)
+        encoder.encode(first, codec=FrameCodec.DELTA, display_scale=1)
+        delta = encoder.encode(second, codec=FrameCodec.DELTA, display_scale=1)
+
+        assert BeatsFrameDecoder().decode(delta) is None
+
+
+class TestFrameCodecNegotiation:
+    """Validate subprotocol negotiation so mixed Beats clients all receive frames they can decode."""
+
+    def test_selects_richest_offered_codec_and_accepts_legacy_clients(self) -> None:
+        """Verify the server prefers deltas but still accepts clients that offer no subprotocol."""
+        offered = list(reversed(FRAME_CODEC_SUBPROTOCOLS))
+
+        assert select_frame_subprotocol(None, offered) == FRAME_CODEC_SUBPROTOCOLS[0]
+        assert select_frame_subprotocol(None, []) is None
+        assert frame_codec_for_subprotocol(None) == FrameCodec.PNG
+
+    def test_common_codec_falls_back_to_least_capable_client(self) -> None:
+        """Verify one legacy client downgrades the shared stream so it keeps decoding frames."""
+        assert (
+            common_frame_codec(FrameCodec.DELTA, [FrameCodec.DELTA, FrameCodec.RAW])
+            == FrameCodec.RAW
+        )
+        assert common_frame_codec(FrameCodec.RAW, [FrameCodec.DELTA]) == FrameCodec.RAW
+        assert common_frame_codec(FrameCodec.DELTA, []) == FrameCodec.DELTA
+
+
+class TestBeatsFrameCodecBenchmarks:
+    """Benchmark encode cost and bytes per frame against the legacy scaled PNG stream."""
+
+    @pytest.mark.benchmark(group="beats_frame_codec_256x64")
+    @pytest.mark.parametrize(
+        "codec", [FrameCodec.PNG, FrameCodec.RAW, FrameCodec.DELTA]
+    )
+    def test_encode_benchmark(
+        self, benchmark: pytest.BenchmarkFixture, codec: FrameCodec
+    ) -> None:
+        """Benchmark encoding an animated clip and record bytes per frame so codec defaults are chosen from data."""
+        frames = _animated_frames(BENCHMARK_FRAMES)
+        surfaces = [_scaled_surface(rgb) for rgb in frames]
+
+        def encode_clip() -> int:
+            if codec == FrameCodec.PNG:
+                return sum(
+                    _envelope_size(
+                        beats_streaming_pb2.Frame(png_data=_encode_png(surface))
+                    )
+                    for surface in surfaces
+                )
+            encoder = BeatsFrameEncoder()
+            return sum(
+                _envelope_size(
+                    encoder.encode(rgb, codec=codec, display_scale=DISPLAY_SCALE)
+                )
+                for rgb in frames
+            )
+
+        total_bytes = benchmark(encode_clip)
+
+        benchmark.extra_info["bytes_per_frame"] = total_bytes / BENCHMARK_FRAMES
@@ -8,6 +8,7 @@ import pytest
 from manyfold import Graph
 from websockets.exceptions import ConnectionClosedError
 
+from heart.device.beats.frame_codec import FrameCodec
 from heart.device.beats.proto import beats_streaming_pb2
 from heart.device.beats.websocket import (WebSocket,
                                           _encode_peripheral_message,
@@ -290,6 +291,10 @@ class TestControlMessageDecoding:
                 {"kind": "control", "command": "emoji_update", "emoji": "seb"},
                 {"command": "emoji_update", "emoji": "seb"},
             ),
+            (
+                {"kind": "control", "command": "profile_snapshot"},
+                {"command": "profile_snapshot"},
+            ),
         )
 
         for payload, expected_fields in payloads:
@@ -359,6 +364,30 @@ class TestWebSocketReplayCache:
             b"sensor-1-latest",
         )
 
+    def test_replays_keyframe_before_delta_for_capable_clients_only(self) -> None:
+        """Verify delta streams replay their keyframe first and skip legacy clients so reconnects never start on an undecodable frame."""
+        websocket = object.__new__(WebSocket)
+        websocket._replay_lock = threading.Lock()
+        websocket._latest_frame = None
+        websocket._latest_peripheral_frames = {}
+        keyframe = beats_streaming_pb2.Frame(
+            encoding=beats_streaming_pb2.FRAME_ENCODING_RGB888_KEYFRAME,
+            keyframe_id=1,
+        )
+        delta = beats_streaming_pb2.Frame(
+            encoding=beats_streaming_pb2.FRAME_ENCODING_RGB888_DELTA,
+            keyframe_id=1,
+        )
+
+        websocket._cache_replay_frame(
+            kind="frame", payload=keyframe, frame_bytes=b"keyframe"
+        )
+        websocket._cache_replay_frame(kind="frame", payload=delta, frame_bytes=b"delta")
+
+        assert websocket._replay_frames(FrameCodec.DELTA) == (b"keyframe", b"delta")
+        assert websocket._replay_frames(FrameCodec.RAW) == ()
+        assert websocket._replay_frames(FrameCodec.PNG) == ()
+
     def test_send_publishes_encoded_frames_to_manyfold_route(self) -> None:
         """Verify outbound websocket frames cross the Manyfold route boundary before node delivery."""
         websocket = object.__new__(WebSocket)
@@ -0,0 +1,174 @@
+"""Tests for exporting pygame surfaces into matrix RGBA frames."""
+
+from __future__ import annotations
+
+import numpy as np
+import pygame
+import pytest
+
+from heart.device.rgb_display.frame_export import MatrixFrameExporter
+from heart.utilities.env import FrameArrayStrategy, FrameExportStrategy
+
+STRATEGIES = [
+    (export_strategy, array_strategy)
+    for export_strategy in FrameExportStrategy
+    for array_strategy in FrameArrayStrategy
+]
+STRATEGY_IDS = [f"{export}-{array}" for export, array in STRATEGIES]
+RGBA_MASKS = (0x000000FF, 0x0000FF00, 0x00FF0000, 0xFF000000)
+
+
+def _random_surface(
+    size: tuple[int, int],
+    *,
+    flags: int = 0,
+    depth: int = 0,
+    masks: tuple[int, int, int, int] | None = None,
+    seed: int = 0,
+) -> pygame.Surface:
+    rng = np.random.default_rng(seed)
+    if masks is not None:
+        surface = pygame.Surface(size, flags, 32, masks)
+    elif depth:
+        surface = pygame.Surface(size, flags, depth)
+    else:
+        surface = pygame.Surface(size, flags)
+    pygame.surfarray.blit_array(
+        surface, rng.integers(0, 256, (*size, 3), dtype=np.uint8)
+    )
+    if surface.get_masks()[3]:
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[:] = rng.integers(0, 256, alpha.shape, dtype=np.uint8)
+        del alpha
+    return surface
+
+
+def _export_bytes(exporter: MatrixFrameExporter, surface: pygame.Surface) -> bytes:
+    frame = exporter.export(surface)
+    try:
+        return bytes(frame)
+    finally:
+        if isinstance(frame, memoryview):
+            frame.release()
+
+
+def _rgba(data: bytes, size: tuple[int, int]) -> np.ndarray:
+    width, height = size
+    return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4)
+
+
+class TestMatrixFrameExporter:
+    """Validate matrix frame export so every strategy feeds the driver the same pixels as pygame.image.tostring."""
+
+    @pytest.mark.parametrize(
+        ("export_strategy", "array_strategy"), STRATEGIES, ids=STRATEGY_IDS
+    )
+    @pytest.mark.parametrize(
+        "surface_kwargs",
+        [
+            {},
+            {"flags": pygame.SRCALPHA},
+            {"depth": 24},
+            {"depth": 16},
+            {"flags": pygame.SRCALPHA, "masks": RGBA_MASKS},
+        ],
+        ids=["xrgb", "argb", "rgb24", "rgb16", "packed_rgba"],
+    )
+    def test_export_matches_tostring(
+        self,
+        export_strategy: FrameExportStrategy,
+        array_strategy: FrameArrayStrategy,
+        surface_kwargs: dict[str, object],
+    ) -> None:
+        """Keep every export path colour-identical to tostring so panels look the same whichever knob is set."""
+        size = (65, 7)
+        surface = _random_surface(size, **surface_kwargs)
+        exporter = MatrixFrameExporter(
+            export_strategy=export_strategy,
+            array_strategy=array_strategy,
+        )
+
+        expected = _rgba(pygame.image.tostring(surface, "RGBA"), size)
+        for _ in range(2):
+            actual = _rgba(_export_bytes(exporter, surface), size)
+
+        np.testing.assert_array_equal(actual[..., :3], expected[..., :3])
+        if surface.get_masks()[3]:
+            np.testing.assert_array_equal(actual[..., 3], expected[..., 3])
+
+    def test_staging_buffer_is_reused_across_frames(self) -> None:
+        """Avoid per-frame allocations by handing the driver the same staging memory every frame."""
+        surface = _random_surface((32, 16))
+        exporter = MatrixFrameExporter(
+            export_strategy=FrameExportStrategy.ARRAY,
+            array_strategy=FrameArrayStrategy.VIEW,
+        )
+
+        first = exporter.export(surface)
+        first_address = np.frombuffer(first, dtype=np.uint8).ctypes.data
+        first.release()
+        surface.fill((4, 5, 6))
+        second = exporter.export(surface)
+        second_address = np.frombuffer(second, dtype=np.uint8).ctypes.data
+
+        assert first_address == second_address
+        assert bytes(second[:4]) == bytes((4, 5, 6, 255))
+        second.release()
+
+    def test_packed_rgba_surface_is_exported_without_copying(self) -> None:
+        """Hand packed RGBA surface memory straight to the driver so no frame bytes are allocated."""
+        surface = _random_surface((8, 8), flags=pygame.SRCALPHA, masks=RGBA_MASKS)
+        exporter = MatrixFrameExporter(
+            export_strategy=FrameExportStrategy.BUFFER,
+            array_strategy=FrameArrayStrategy.COPY,
+        )
+
+        frame = exporter.export(surface)
+
+        assert isinstance(frame, memoryview)
+        assert bytes(frame) == pygame.image.tostring(surface, "RGBA")
+        frame.release()
+
+    def test_export_releases_surface_lock(self) -> None:
+        """Leave the surface unlocked after export so the next frame can draw into it."""
+        surface = _random_surface((8, 8), flags=pygame.SRCALPHA, masks=RGBA_MASKS)
+        exporter = MatrixFrameExporter(
+            export_strategy=FrameExportStrategy.BUFFER,
+            array_strategy=FrameArrayStrategy.VIEW,
+        )
+
+        frame = exporter.export(surface)
+        frame.release()
+
+        assert not surface.get_locked()
+
+    @pytest.mark.benchmark(group="matrix_frame_export_256x64")
+    @pytest.mark.parametrize(
+        ("export_strategy", "array_strategy"), STRATEGIES, ids=STRATEGY_IDS
+    )
+    def test_export_benchmark(
+        self,
+        benchmark: pytest.BenchmarkFixture,
+        export_strategy: FrameExportStrategy,
+        array_strategy: FrameArrayStrategy,
+    ) -> None:
+        """Benchmark BUFFER vs ARRAY export for the full 256x64 strip so Pi runs can pick the cheapest knob."""
+        surface = _random_surface((256, 64))
+        exporter = MatrixFrameExporter(
+            export_strategy=export_strategy,
+            array_strategy=array_strategy,
+        )
+
+        def export_frame() -> None:
+            frame = exporter.export(surface)
+            if isinstance(frame, memoryview):
+                frame.release()
+
+        benchmark(export_frame)
+
+    @pytest.mark.benchmark(group="matrix_frame_export_256x64")
+    def test_tostring_benchmark(self, benchmark: pytest.BenchmarkFixture) -> None:
+        """Benchmark the previous tostring path as the baseline for the staged exporters."""
+        surface = _random_surface((256, 64))
+
+        benchmark(pygame.image.tostring, surface, "RGBA")
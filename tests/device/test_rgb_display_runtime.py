@@ -41,8 +41,8 @@ class FakeDriver:
     def height(self) -> int:
         return self.config.panel_rows * self.config.parallel
 
-    def submit_rgba(self, data: bytes, width: int, height: int) -> None:
-        self.submissions.append((data, width, height))
+    def submit_rgba(self, data: bytes | memoryview, width: int, height: int) -> None:
+        self.submissions.append((bytes(data), width, height))
 
     def clear(self) -> None:
         self.clear_calls += 1
@@ -258,6 +258,52 @@ class TestRgbDisplayRuntime:
         assert width == 64
         assert height == 32
         assert len(submitted_bytes) == 64 * 32 * 4
+        assert submitted_bytes[:4] == bytes((12, 34, 56, 255))
+
+    def test_led_matrix_falls_back_to_bytes_when_driver_rejects_buffers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify LEDMatrix keeps streaming when an older native driver only accepts bytes. This matters because the staged buffer path must never take the panel dark."""
+
+        class BytesOnlyDriver(FakeDriver):
+            def submit_rgba(
+                self, data: bytes | memoryview, width: int, height: int
+            ) -> None:
+                if not isinstance(data, bytes):
+                    raise TypeError("argument 'data': expected bytes")
+                super().submit_rgba(data, width, height)
+
+        fake_driver = BytesOnlyDriver(
+            FakeMatrixConfig(
+                wiring="hat-pwm",
+                panel_rows=16,
+                panel_cols=32,
+                chain_length=1,
+                parallel=1,
+                color_order="rgb",
+            )
+        )
+        monkeypatch.setenv("HEART_PANEL_ROWS", "16")
+        monkeypatch.setenv("HEART_PANEL_COLUMNS", "32")
+        monkeypatch.setattr(
+            "heart.device.rgb_display.device.atexit.register",
+            lambda *_args, **_kwargs: None,
+        )
+        monkeypatch.setattr(
+            "heart.device.rgb_display.device.build_matrix_driver",
+            lambda _orientation: fake_driver,
+        )
+
+        monkeypatch.setenv("HEART_FRAME_EXPORT_STRATEGY", "array")
+        device = LEDMatrix(Rectangle.with_layout(columns=1, rows=1))
+        surface = pygame.Surface((32, 16))
+        surface.fill((1, 2, 3))
+
+        device.set_screen(surface)
+        device.set_screen(surface)
+
+        assert len(fake_driver.submissions) == 5
+        assert fake_driver.submissions[-1][0][:3] == bytes((1, 2, 3))
 
     def test_led_matrix_close_closes_driver(
         self, monkeypatch: pytest.MonkeyPatch
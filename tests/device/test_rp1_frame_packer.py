@@ -0,0 +1,112 @@
+"""Tests for packing RGB frames into the RP1 PIO row-pair SRAM layout."""
+
+from __future__ import annotations
+
+import mmap
+import struct
+
+import numpy as np
+import pytest
+
+from heart.device.rp1.frame_packer import Rp1FramePacker, build_channel_lut
+
+LEVELS = [(1.0, 1.0), (0.35, 1.0), (1.0, 2.2), (0.6, 0.45), (1.7, 1.8)]
+LEVEL_IDS = [f"brightness{brightness}-gamma{gamma}" for brightness, gamma in LEVELS]
+
+
+def _random_frame(rows: int = 64, cols: int = 64, *, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, (rows, cols, 3), dtype=np.uint8)
+
+
+def _reference_pack(frame: np.ndarray, *, brightness: float, gamma: float) -> bytes:
+    """Pack ``frame`` one pixel at a time the way ``run_tree_rgb888`` used to."""
+
+    def scale_u8(value: int) -> int:
+        return max(0, min(255, int(value * brightness + 0.5)))
+
+    gamma_exponent = max(gamma, 0.001)
+    gamma_lookup = [
+        max(0, min(255, int(((value / 255.0) ** gamma_exponent) * 255.0 + 0.5)))
+        for value in range(256)
+    ]
+    rows, cols, _ = frame.shape
+    row_pairs = rows // 2
+    packed = bytearray(rows * cols * 4)
+    offset = 0
+    for row in range(row_pairs):
+        for col in range(cols):
+            for y in (row, row + row_pairs):
+                r, g, b = (
+                    int(value) if gamma == 1.0 else gamma_lookup[int(value)]
+                    for value in frame[y, col]
+                )
+                word = scale_u8(r) | (scale_u8(g) << 8) | (scale_u8(b) << 16)
+                struct.pack_into("<I", packed, offset, word)
+                offset += 4
+    return bytes(packed)
+
+
+class TestRp1FramePacker:
+    """Validate the vectorized RP1 packer so live frames match the pre-baked sprite path."""
+
+    @pytest.mark.parametrize(("brightness", "gamma"), LEVELS, ids=LEVEL_IDS)
+    def test_pack_matches_reference_packer_byte_for_byte(
+        self, brightness: float, gamma: float
+    ) -> None:
+        """Match the scalar packer exactly so switching paths cannot shift colours."""
+        frame = _random_frame(seed=7)
+        packer = Rp1FramePacker(brightness=brightness, gamma=gamma)
+
+        assert packer.pack(frame) == _reference_pack(
+            frame, brightness=brightness, gamma=gamma
+        )
+
+    def test_pack_into_writes_a_slice_of_an_mmap(self) -> None:
+        """Write straight into a shared mapping at an offset so SRAM can be fed without copies."""
+        frame = _random_frame(32, 16, seed=3)
+        packer = Rp1FramePacker(rows=32, cols=16, brightness=0.5)
+        offset = 256
+        with mmap.mmap(-1, offset + packer.frame_bytes + 64) as memory:
+            packer.pack_into(frame, memory, offset)
+
+            assert memory[:offset] == bytes(offset)
+            assert memory[offset : offset + packer.frame_bytes] == _reference_pack(
+                frame, brightness=0.5, gamma=1.0
+            )
+            assert memory[offset + packer.frame_bytes :] == bytes(64)
+
+    def test_rejects_frames_with_the_wrong_geometry(self) -> None:
+        """Refuse mismatched frames so a resized scene cannot scramble the row pairs."""
+        packer = Rp1FramePacker(rows=32, cols=16)
+
+        with pytest.raises(ValueError, match="Expected"):
+            packer.pack(_random_frame(16, 32))
+        with pytest.raises(ValueError, match="uint8"):
+            packer.pack(_random_frame(32, 16).astype(np.uint16))
+
+    def test_lut_clamps_overdriven_brightness(self) -> None:
+        """Saturate boosted channels at full scale instead of wrapping around."""
+        lut = build_channel_lut(brightness=2.0)
+
+        assert lut[127] == 254
+        assert lut[128] == 255
+        assert lut[255] == 255
+
+    @pytest.mark.benchmark(group="rp1_frame_pack_64x64")
+    def test_pack_into_benchmark(self, benchmark: pytest.BenchmarkFixture) -> None:
+        """Benchmark the vectorized packer so live content stays within a panel frame budget."""
+        frame = _random_frame()
+        packer = Rp1FramePacker(brightness=0.8, gamma=2.2)
+        target = bytearray(packer.frame_bytes)
+
+        benchmark(packer.pack_into, frame, target)
+
+    @pytest.mark.benchmark(group="rp1_frame_pack_64x64")
+    def test_reference_pack_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark the scalar packer as the baseline the vectorized path replaces."""
+        frame = _random_frame()
+
+        benchmark(_reference_pack, frame, brightness=0.8, gamma=2.2)
@@ -12,6 +12,7 @@ from OpenGL.error import GLError
 from heart.device import Rectangle
 from heart.device.local import LocalScreen
 from heart.display.shaders import fullscreen as fullscreen_module
+from heart.display.shaders import readback as readback_module
 from heart.display.shaders.fullscreen import (FullscreenShaderRuntime,
                                               TextureUniform)
 from heart.runtime.display_context import DisplayContext
@@ -174,7 +175,7 @@ class TestFullscreenShaderRuntime:
             target[0, :, :] = (255, 0, 0, 255)
             target[1, :, :] = (0, 0, 255, 255)
 
-        monkeypatch.setattr(fullscreen_module, "glReadPixels", fake_read_pixels)
+        monkeypatch.setattr(readback_module, "glReadPixels", fake_read_pixels)
 
         runtime.read_to_surface(window, size=(2, 2))
 
@@ -186,13 +187,13 @@ class TestFullscreenShaderRuntime:
         runtime = FullscreenShaderRuntime()
         runtime.program = 1
         runtime.uniform_locations["u_time"] = 2
-        runtime.pixel_buffer = np.zeros((1, 1, 4), dtype=np.uint8)
+        runtime.readback.pixel_buffer = np.zeros((1, 1, 4), dtype=np.uint8)
 
         runtime.reset()
 
         assert runtime.program is None
         assert runtime.uniform_locations == {}
-        assert runtime.pixel_buffer is None
+        assert runtime.readback.pixel_buffer is None
 
     def test_reset_deletes_compiled_program(self, monkeypatch) -> None:
         deleted_programs: list[int] = []
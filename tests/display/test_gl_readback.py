@@ -0,0 +1,201 @@
+"""Validate framebuffer readback into reusable pygame surfaces."""
+
+from __future__ import annotations
+
+import ctypes
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from OpenGL.error import GLError
+
+from heart.display.shaders import readback as readback_module
+from heart.display.shaders.readback import FramebufferReadback
+from heart.utilities.env import GlReadbackStrategy
+
+BENCHMARK_SCRIPT = (
+    Path(__file__).resolve().parents[2] / "scripts" / "benchmark_gl_readback.py"
+)
+EGL_UNAVAILABLE_EXIT = 77
+
+
+def _frame(width: int, height: int, value: int) -> np.ndarray:
+    """Return GL-ordered RGBA rows where row ``y`` is shaded ``value + y``."""
+
+    pixels = np.zeros((height, width, 4), dtype=np.uint8)
+    for y in range(height):
+        pixels[y, :, :3] = (value + y, 0, 255 - y)
+        pixels[y, :, 3] = 255
+    return pixels
+
+
+class _FakePixelPackBuffers:
+    """Emulate two pixel-pack buffers filled by queued ``glReadPixels`` calls."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch, frames: list[np.ndarray]):
+        self.frames = frames
+        self.storage: dict[int, np.ndarray] = {}
+        self.bound = 0
+        self.mapped: list[int] = []
+        self.generated = 0
+        self.deleted: list[list[int]] = []
+        monkeypatch.setattr(readback_module, "glGenBuffers", self.generate)
+        monkeypatch.setattr(readback_module, "glBindBuffer", self.bind)
+        monkeypatch.setattr(readback_module, "glBufferData", lambda *_args: None)
+        monkeypatch.setattr(readback_module, "glReadPixels", self.read_pixels)
+        monkeypatch.setattr(readback_module, "glMapBuffer", self.map_buffer)
+        monkeypatch.setattr(readback_module, "glUnmapBuffer", lambda _target: True)
+        monkeypatch.setattr(readback_module, "glDeleteBuffers", self.delete)
+
+    def generate(self, count: int) -> list[int]:
+        self.generated += count
+        return list(range(self.generated - count + 1, self.generated + 1))
+
+    def delete(self, _count: int, buffers: list[int]) -> None:
+        self.deleted.append(list(buffers))
+
+    def bind(self, _target: int, buffer: int) -> None:
+        self.bound = buffer
+
+    def read_pixels(self, *args) -> None:
+        assert args[-1] == 0
+        self.storage[self.bound] = np.ascontiguousarray(self.frames.pop(0))
+
+    def map_buffer(self, _target: int, _access: int) -> int:
+        self.mapped.append(self.bound)
+        return self.storage[self.bound].ctypes.data_as(ctypes.c_void_p).value
+
+
+class TestFramebufferReadback:
+    """Validate readback strategies so GL renderers receive upright frames without per-frame copies."""
+
+    def test_sync_readback_flips_rows_into_reused_surface(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Copy GL's bottom-up rows top-down so the surface can be blitted as is."""
+        pixels = _frame(3, 2, value=10)
+
+        def fake_read_pixels(_x, _y, _width, _height, _fmt, _kind, target) -> None:
+            target[...] = pixels
+
+        monkeypatch.setattr(readback_module, "glReadPixels", fake_read_pixels)
+        readback = FramebufferReadback(GlReadbackStrategy.SYNC)
+
+        surface = readback.read((3, 2))
+
+        assert surface.get_size() == (3, 2)
+        assert surface.get_at((0, 0))[:3] == (11, 0, 254)
+        assert surface.get_at((2, 1))[:3] == (10, 0, 255)
+        assert readback.read((3, 2)) is surface
+
+    def test_pbo_readback_maps_previous_frame_while_queueing_the_next(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Alternate pixel-pack buffers so each call maps the frame queued one call earlier."""
+        frames = [_frame(2, 2, value=value) for value in (10, 20, 30)]
+        buffers = _FakePixelPackBuffers(monkeypatch, list(frames))
+        readback = FramebufferReadback(GlReadbackStrategy.PBO)
+
+        shaded = [readback.read((2, 2)).get_at((0, 1))[0] for _ in frames]
+
+        assert shaded == [10, 10, 20]
+        assert buffers.mapped == [1, 1, 2]
+        assert readback.strategy == GlReadbackStrategy.PBO
+
+    def test_pbo_readback_falls_back_to_sync_when_mapping_fails(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Switch to synchronous reads when the context cannot map pixel-pack buffers."""
+        pixels = _frame(2, 2, value=40)
+        buffers = _FakePixelPackBuffers(monkeypatch, [pixels])
+
+        def fail_map(_target: int, _access: int) -> int:
+            raise GLError(err=1282, baseOperation="glMapBuffer")
+
+        def read_pixels(*args) -> None:
+            if isinstance(args[-1], int):
+                buffers.read_pixels(*args)
+            else:
+                args[-1][...] = pixels
+
+        monkeypatch.setattr(readback_module, "glMapBuffer", fail_map)
+        monkeypatch.setattr(readback_module, "glReadPixels", read_pixels)
+        readback = FramebufferReadback(GlReadbackStrategy.PBO)
+
+        surface = readback.read((2, 2))
+
+        assert readback.strategy == GlReadbackStrategy.SYNC
+        assert surface.get_at((0, 1))[:3] == (40, 0, 255)
+
+    def test_reset_recreates_buffers_and_retries_pixel_pack_reads(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Drop stale buffer names and the sync fallback when the GL context changes."""
+        buffers = _FakePixelPackBuffers(
+            monkeypatch, [_frame(2, 2, value=value) for value in (10, 20)]
+        )
+        readback = FramebufferReadback(GlReadbackStrategy.PBO)
+        readback.read((2, 2))
+        readback.strategy = GlReadbackStrategy.SYNC
+
+        readback.reset()
+        surface = readback.read((2, 2))
+
+        assert buffers.deleted == [[1, 2]]
+        assert buffers.generated == 4
+        assert buffers.mapped[-1] == 3
+        assert readback.strategy == GlReadbackStrategy.PBO
+        assert surface.get_at((0, 1))[0] == 20
+
+    def test_default_strategy_comes_from_configuration(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Honour HEART_GL_READBACK_STRATEGY when no strategy is passed explicitly."""
+        monkeypatch.setenv("HEART_GL_READBACK_STRATEGY", "pbo")
+
+        assert FramebufferReadback().strategy == GlReadbackStrategy.PBO
+
+
+@pytest.mark.slow
+class TestFramebufferReadbackHeadless:
+    """Run the readback benchmark on a software GL context so both strategies are exercised against a real driver."""
+
+    def test_benchmark_reports_stalls_for_both_strategies(self, tmp_path: Path) -> None:
+        """Report sync and PBO stall timings for every shader when EGL is available."""
+        output = tmp_path / "readback.json"
+        completed = subprocess.run(
+            [
+                sys.executable,
+                str(BENCHMARK_SCRIPT),
+                "--width",
+                "32",
+                "--height",
+                "16",
+                "--frames",
+                "2",
+                "--format",
+                "json",
+                "--output",
+                str(output),
+            ],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        if completed.returncode == EGL_UNAVAILABLE_EXIT:
+            pytest.skip("Headless EGL context is unavailable")
+        assert completed.returncode == 0, completed.stderr
+
+        timings = json.loads(output.read_text(encoding="utf-8"))["timings"]
+
+        assert {(row["shader"], row["strategy"]) for row in timings} == {
+            (shader, strategy.value)
+            for shader in ("mandelbulb", "palette_tunnel", "audio_storm")
+            for strategy in GlReadbackStrategy
+        }
+        assert all(row["stall_mean_ms"] >= 0.0 for row in timings)
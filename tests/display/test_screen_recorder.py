@@ -1,15 +1,20 @@
+import tracemalloc
 from dataclasses import dataclass
 from pathlib import Path
 
 import imagehash
+import numpy as np
 import pygame
 import pytest
 from PIL import Image, ImageDraw, ImageSequence
 
-from heart.display.recorder import ScreenRecorder
+from heart.display.recorder import (MANIFEST_NAME, Recording, RecordingWriter,
+                                    ScreenRecorder, export_gif)
 from heart.renderers import StatefulBaseRenderer
 
 HASH_DISTANCE_LIMIT = 16
+STRIP_SIZE = (64, 256)
+LONG_CAPTURE_FRAMES = 3000
 
 
 @dataclass
@@ -144,3 +149,97 @@ class TestDisplayScreenRecorder:
         """Verify ScreenRecorder raises an error when recording with no renderer frames. This prevents silent failures when capture pipelines are misconfigured."""
         with pytest.raises(ValueError):
             screen_recorder.record([], tmp_path / "empty.gif")
+
+    def test_screen_recorder_streams_frames_to_recording_directory(
+        self, screen_recorder: ScreenRecorder, tmp_path: Path
+    ) -> None:
+        """Verify record_stream writes a manifest and chunks that reload the captured colours."""
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        inputs = [[SolidColorRenderer(color)] for color in colors]
+
+        recording = screen_recorder.record_stream(inputs, tmp_path / "capture")
+
+        reopened = Recording.open(tmp_path / "capture")
+        assert reopened == recording
+        assert recording.fps == screen_recorder.fps
+        assert [tuple(frame[0, 0]) for frame in reopened.iter_frames()] == colors
+
+
+def _strip_frame(index: int) -> np.ndarray:
+    frame = np.zeros((*STRIP_SIZE, 3), dtype=np.uint8)
+    frame[..., 0] = index % 256
+    frame[..., 1] = index // 256
+    return frame
+
+
+class TestRecordingWriter:
+    """Validate streamed recordings so long captures stay bounded in memory and lossless."""
+
+    def test_long_capture_keeps_memory_bounded(self, tmp_path: Path) -> None:
+        """Record thousands of strip frames while only the chunk pool stays allocated."""
+        chunk_frames = 32
+        frame = _strip_frame(0)
+        chunk_bytes = chunk_frames * frame.nbytes
+
+        tracemalloc.start()
+        try:
+            with RecordingWriter(
+                tmp_path / "long", fps=30, chunk_frames=chunk_frames
+            ) as writer:
+                for index in range(LONG_CAPTURE_FRAMES):
+                    frame[..., 0] = index % 256
+                    frame[..., 1] = index // 256
+                    writer.append(frame)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        recording = Recording.open(tmp_path / "long")
+        assert recording.frame_count == LONG_CAPTURE_FRAMES
+        assert peak < 5 * chunk_bytes < LONG_CAPTURE_FRAMES * frame.nbytes / 10
+        for index, stored in enumerate(recording.iter_frames()):
+            assert stored[0, 0, 0] == index % 256
+            assert stored[0, 0, 1] == index // 256
+        assert index == LONG_CAPTURE_FRAMES - 1
+
+    def test_export_gif_reads_recording_offline(self, tmp_path: Path) -> None:
+        """Convert a streamed recording into a GIF with the recording's frame timing."""
+        colors = [(10, 20, 30), (200, 100, 50), (0, 128, 255)]
+        with RecordingWriter(tmp_path / "rec", fps=12, chunk_frames=2) as writer:
+            for color in colors:
+                writer.append(np.full((*STRIP_SIZE, 3), color, dtype=np.uint8))
+
+        path = export_gif(tmp_path / "rec", tmp_path / "out.gif")
+
+        with Image.open(path) as image:
+            observed = []
+            durations = []
+            for frame in ImageSequence.Iterator(image):
+                observed.append(frame.convert("RGB").getpixel((0, 0)))
+                durations.append(frame.info.get("duration"))
+        assert observed == colors
+        assert durations == [80] * len(colors)
+
+    def test_writer_rejects_mismatched_frames(self, tmp_path: Path) -> None:
+        """Refuse frames whose size differs from the first one recorded."""
+        writer = RecordingWriter(tmp_path / "rec")
+        writer.append(_strip_frame(0))
+
+        with pytest.raises(ValueError, match="frame size"):
+            writer.append(np.zeros((8, 8, 3), dtype=np.uint8))
+        writer.close()
+
+    def test_failed_capture_leaves_no_manifest(self, tmp_path: Path) -> None:
+        """Abort on errors so a partial recording never looks complete."""
+        directory = tmp_path / "rec"
+
+        with pytest.raises(RuntimeError, match="renderer failed"):
+            with RecordingWriter(directory, chunk_frames=2) as writer:
+                writer.append(_strip_frame(0))
+                raise RuntimeError("renderer failed")
+
+        with pytest.raises(RuntimeError, match="before any frame"):
+            with RecordingWriter(tmp_path / "empty"):
+                raise RuntimeError("before any frame")
+
+        assert not (directory / MANIFEST_NAME).exists()
@@ -1 +1 @@
-"""Shared helpers for tests covering hardware drivers."""
+"""Shared helpers for tests covering hardware drivers and benchmarks."""
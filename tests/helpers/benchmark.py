@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+
+def record_benchmark_stat(
+    benchmark: pytest.BenchmarkFixture,
+    name: str,
+    compute: Callable[[float], float],
+) -> None:
+    """Store ``compute(mean seconds per round)`` as ``extra_info[name]``.
+
+    Does nothing when the benchmark collected no stats, as under
+    ``--benchmark-disable``.
+    """
+
+    stats = getattr(benchmark, "stats", None)
+    if stats is not None:
+        benchmark.extra_info[name] = compute(stats.stats.mean)
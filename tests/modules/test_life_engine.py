@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from helpers.benchmark import record_benchmark_stat
+
+from heart.renderers.life.engine import LifeEngine
+from heart.renderers.life.state import LifeState
+from heart.utilities.env import LifeEdgeMode
+
+GLIDER = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=int)
+PANEL_SIZE = (64, 64)
+LARGE_SIZE = (1024, 1024)
+
+
+def _reference_step(grid: np.ndarray, edge_mode: LifeEdgeMode) -> np.ndarray:
+    """Step ``grid`` with explicit neighbour sums as the engine's oracle."""
+
+    if edge_mode == LifeEdgeMode.TOROIDAL:
+        padded = np.pad(grid, 1, mode="wrap")
+    else:
+        padded = np.pad(grid, 1, mode="constant")
+    rows, cols = grid.shape
+    neighbors = sum(
+        padded[1 + dy : 1 + dy + rows, 1 + dx : 1 + dx + cols]
+        for dy in (-1, 0, 1)
+        for dx in (-1, 0, 1)
+        if dy or dx
+    )
+    return ((neighbors == 3) | ((grid == 1) & (neighbors == 2))).astype(int)
+
+
+def _benchmark_generations(
+    benchmark: pytest.BenchmarkFixture, size: tuple[int, int], generations: int
+) -> None:
+    grid = np.random.default_rng(0).integers(0, 2, size=size)
+    engine = LifeEngine(grid, edge_mode=LifeEdgeMode.TOROIDAL)
+
+    benchmark(engine.step, generations)
+
+    benchmark.extra_info["cells"] = size[0] * size[1]
+    record_benchmark_stat(
+        benchmark, "generations_per_second", lambda mean: generations / mean
+    )
+
+
+class TestLifeEngine:
+    """Validate the bit-packed engine so it steps boards exactly like the cell rules."""
+
+    @pytest.mark.parametrize("edge_mode", list(LifeEdgeMode))
+    @pytest.mark.parametrize(
+        "size",
+        [(1, 1), (5, 3), (17, 130), (64, 64), (40, 128)],
+        ids=["single", "tiny", "ragged-words", "panel", "whole-words"],
+    )
+    def test_generations_match_reference_rules(
+        self, edge_mode: LifeEdgeMode, size: tuple[int, int]
+    ) -> None:
+        """Match explicit neighbour sums across word boundaries, padding bits and both edge modes."""
+        grid = np.random.default_rng(sum(size)).integers(0, 2, size=size)
+        engine = LifeEngine(grid, edge_mode=edge_mode)
+
+        for _ in range(24):
+            grid = _reference_step(grid, edge_mode)
+            engine.step()
+            assert np.array_equal(engine.grid, grid)
+
+    def test_glider_wraps_on_torus_and_dies_at_bounded_edge(self) -> None:
+        """Return a glider to its start after crossing a torus and freeze it against a wall."""
+        grid = np.zeros((8, 8), dtype=int)
+        grid[:3, :3] = GLIDER
+        toroidal = LifeEngine(grid, edge_mode=LifeEdgeMode.TOROIDAL)
+        bounded = LifeEngine(grid, edge_mode=LifeEdgeMode.BOUNDED)
+
+        toroidal.step(32)
+        bounded.step(32)
+
+        assert np.array_equal(toroidal.grid, grid)
+        assert not toroidal.stagnant
+        assert bounded.stagnant
+
+    def test_still_lifes_and_blinkers_count_as_stagnant(self) -> None:
+        """Count consecutive still-life and period-2 generations and reset on change."""
+        block = np.zeros((6, 6), dtype=int)
+        block[2:4, 2:4] = 1
+        blinker = np.zeros((5, 5), dtype=int)
+        blinker[2, 1:4] = 1
+        engines = [LifeEngine(block), LifeEngine(blinker)]
+
+        for engine in engines:
+            engine.step(3)
+
+        assert [engine.stagnant_generations for engine in engines] == [3, 2]
+
+        engines[0].load(np.zeros_like(block))
+        assert engines[0].stagnant_generations == 0
+        assert engines[0].generation == 0
+
+
+class TestLifeStateBitpacked:
+    """Validate the bitpacked update strategy so Life states reuse one engine."""
+
+    def test_bitpacked_strategy_matches_convolution_in_place(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Match convolution results while later states keep stepping the same engine."""
+        grid = np.random.default_rng(3).integers(0, 2, size=(12, 70))
+        monkeypatch.setenv("HEART_LIFE_EDGE_MODE", "toroidal")
+        monkeypatch.setenv("HEART_LIFE_UPDATE_STRATEGY", "convolve")
+        expected_first = LifeState(grid=grid)._update_grid()
+        expected = expected_first._update_grid().grid
+
+        monkeypatch.setenv("HEART_LIFE_UPDATE_STRATEGY", "bitpacked")
+        first = LifeState(grid=grid)._update_grid()
+        second = first._update_grid()
+
+        assert second.engine is first.engine
+        assert np.array_equal(second.grid, expected)
+        assert np.array_equal(first.grid, expected_first.grid)
+
+    def test_stepping_an_earlier_state_does_not_disturb_later_ones(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Branch a new engine from a state that is no longer the engine's latest."""
+        grid = np.random.default_rng(5).integers(0, 2, size=(10, 20))
+        monkeypatch.setenv("HEART_LIFE_UPDATE_STRATEGY", "bitpacked")
+        first = LifeState(grid=grid)._update_grid()
+        second = first._update_grid()
+        snapshot = second.grid.copy()
+
+        replayed = first._update_grid()
+
+        assert replayed.engine is not first.engine
+        assert np.array_equal(replayed.grid, snapshot)
+        assert np.array_equal(second.grid, snapshot)
+        assert np.array_equal(second._update_grid().grid, replayed._update_grid().grid)
+
+    def test_pad_strategy_rejects_toroidal_edges(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Refuse wrapped edges on strategies that can only count bounded neighbours."""
+        monkeypatch.setenv("HEART_LIFE_UPDATE_STRATEGY", "pad")
+        monkeypatch.setenv("HEART_LIFE_EDGE_MODE", "toroidal")
+
+        with pytest.raises(ValueError, match="bounded edges"):
+            LifeState(grid=np.zeros((3, 3), dtype=int))._update_grid()
+
+
+class TestLifeEngineBenchmark:
+    """Measure generations per second so packed stepping stays fast at panel and large sizes."""
+
+    @pytest.mark.benchmark(group="life_engine")
+    def test_panel_generations_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark stepping a 64x64 panel board."""
+        _benchmark_generations(benchmark, PANEL_SIZE, 100)
+
+    @pytest.mark.benchmark(group="life_engine")
+    def test_large_generations_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark stepping a 1024x1024 board."""
+        _benchmark_generations(benchmark, LARGE_SIZE, 10)
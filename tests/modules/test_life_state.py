@@ -10,7 +10,7 @@ class TestLifeUpdateStrategies:
     @pytest.mark.parametrize(
         "strategy",
         ["auto", "pad", "shifted"],
-        ids=["auto-uses-shifted", "pad-uses-padding", "shifted-uses-slices"],
+        ids=["auto-uses-bitpacked", "pad-uses-padding", "shifted-uses-slices"],
     )
     def test_fast_strategies_match_convolution(
         self,
@@ -63,6 +63,34 @@ class TestLifeUpdateStrategies:
             LifeState(grid=grid, kernel=kernel)._update_grid()
 
 
+    @pytest.mark.parametrize("strategy", ["bitpacked", "convolve", "pad", "shifted"])
+    @pytest.mark.parametrize(
+        ("grid", "expected"),
+        [
+            (np.pad(np.ones((2, 2), dtype=int), 2), [1, 2, 3]),
+            (np.pad(np.ones((1, 3), dtype=int), 2), [0, 1, 2]),
+        ],
+        ids=["block", "blinker"],
+    )
+    def test_stagnation_is_counted_on_every_strategy(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        strategy: str,
+        grid: np.ndarray,
+        expected: list[int],
+    ) -> None:
+        """Count still lifes and blinkers on every path so stagnant boards get reseeded."""
+
+        monkeypatch.setenv("HEART_LIFE_UPDATE_STRATEGY", strategy)
+        state = LifeState(grid=grid)
+        counts = []
+        for _ in expected:
+            state = state._update_grid()
+            counts.append(state.stagnant_generations)
+
+        assert counts == expected
+
+
 class TestLifeRuleStrategies:
     """Validate Life rule application options to keep rule selection safe and deterministic."""
 
@@ -1,10 +1,15 @@
-"""Validate Lagom-backed renderer resolution in composed navigation helpers."""
+"""Validate Lagom-backed renderer resolution and surface reuse in composed navigation helpers."""
+
+import pygame
 
 from heart import DeviceDisplayMode
 from heart.device import Device
 from heart.navigation import ComposedRenderer
+from heart.peripheral.core.manager import PeripheralManager
 from heart.renderers import StatefulBaseRenderer
 from heart.runtime.container import build_runtime_container
+from heart.runtime.display_context import DisplayContext
+from heart.runtime.rendering.surface_pool import SurfacePool
 
 
 class _ContainerRenderer(StatefulBaseRenderer[int]):
@@ -25,6 +30,18 @@ class _OpenGlContainerRenderer(_ContainerRenderer):
         self.device_display_mode = DeviceDisplayMode.OPENGL
 
 
+class _FillRenderer(_ContainerRenderer):
+    """Renderer that paints its scratch surface so tiling output can be checked."""
+
+    def __init__(self, color: tuple[int, int, int], mode: DeviceDisplayMode) -> None:
+        super().__init__()
+        self.color = color
+        self.device_display_mode = mode
+
+    def real_process(self, window: DisplayContext, *_args, **_kwargs) -> None:
+        window.fill(self.color)
+
+
 class TestComposedRendererResolution:
     """Ensure composed renderers can resolve classes via Lagom for consistent dependency wiring."""
 
@@ -59,3 +76,60 @@ class TestComposedRendererResolution:
         composed.add_renderer(_OpenGlContainerRenderer)
 
         assert composed.device_display_mode == DeviceDisplayMode.OPENGL
+
+
+class TestComposedRendererSurfacePool:
+    """Ensure composed rendering reuses pooled surfaces so steady-state frames stop allocating."""
+
+    def test_steady_state_frames_allocate_no_surfaces(self, device: Device) -> None:
+        """Verify mirrored tiles land directly in the merged surface and later frames reuse every buffer."""
+        pool = SurfacePool()
+        window = DisplayContext(
+            device=device,
+            screen=pygame.Surface(device.scaled_display_size()),
+            surface_pool=pool,
+        )
+        renderers = [
+            _FillRenderer((255, 0, 0), DeviceDisplayMode.MIRRORED),
+            _FillRenderer((0, 0, 255), DeviceDisplayMode.FULL),
+        ]
+        manager = PeripheralManager()
+
+        results = []
+        for _ in range(3):
+            pool.begin_frame()
+            results.append(
+                ComposedRenderer.render_batch(
+                    renderers,
+                    window=window,
+                    peripheral_manager=manager,
+                    orientation=device.orientation,
+                )
+            )
+
+        assert results[0] is results[1] is results[2]
+        assert pool.stats().frame_allocations == 0
+        assert pool.stats().pooled == 3
+        assert results[2].get_at((0, 0))[:3] == (0, 0, 255)
+
+    def test_single_mirrored_renderer_is_tiled_across_the_layout(
+        self, device: Device
+    ) -> None:
+        """Verify mirrored output still covers every panel after dropping the intermediate tiled surface."""
+        window = DisplayContext(
+            device=device,
+            screen=pygame.Surface(device.scaled_display_size()),
+            surface_pool=SurfacePool(),
+        )
+
+        result = ComposedRenderer.render_batch(
+            [_FillRenderer((0, 255, 0), DeviceDisplayMode.MIRRORED)],
+            window=window,
+            peripheral_manager=PeripheralManager(),
+            orientation=device.orientation,
+        )
+
+        assert result is not None
+        width, height = result.get_size()
+        assert (width, height) == device.scaled_display_size()
+        assert result.get_at((width - 1, height - 1))[:3] == (0, 255, 0)
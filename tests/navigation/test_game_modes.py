@@ -6,7 +6,8 @@ import pytest
 from heart import DeviceDisplayMode
 from heart.navigation import GameModes, GameModeState
 from heart.navigation import game_modes as game_modes_module
-from heart.navigation.game_modes import ModeEntry
+from heart.navigation.game_modes import (GameModeInitializationContext,
+                                         ModeEntry)
 
 
 class DummyRenderer:
@@ -377,5 +378,105 @@ class TestNavigationGameModes:
         )
 
 
+
+class TestLazyRendererWarmup:
+    """Validate lazy renderer warm-up so large playlists reach their first frame without initializing every scene."""
+
+    @pytest.fixture(autouse=True)
+    def _lazy_warmup(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("HEART_RENDERER_WARMUP_STRATEGY", "lazy")
+        monkeypatch.setenv("HEART_RENDERER_WARMUP_NEIGHBORS", "1")
+        monkeypatch.setenv("HEART_RENDERER_RESIDENT_MODES", "2")
+
+    def _initialize(self, game_modes: GameModes) -> Mock:
+        window = _make_window()
+        game_modes._initialization_context = GameModeInitializationContext(
+            window=window,
+            peripheral_manager=Mock(),
+            orientation=Mock(),
+        )
+        with patch.object(game_modes, "_render_initialization_progress"):
+            game_modes._initialize_registered_renderers(
+                window=window,
+                peripheral_manager=Mock(),
+                orientation=Mock(),
+            )
+        return window
+
+    def test_startup_initializes_only_preview_titles_and_post_processors(
+        self,
+    ) -> None:
+        """Verify startup skips gameplay renderers and distant titles so time-to-first-frame stays flat as playlists grow."""
+        game_modes = _make_game_modes(count=6)
+        post_processor = DummyRenderer("post")
+        game_modes.state.post_processors = [post_processor]
+
+        self._initialize(game_modes)
+
+        initialized_titles = [
+            index
+            for index, entry in enumerate(game_modes.state.entries)
+            if entry.title_renderer.initialize_calls
+        ]
+        assert initialized_titles == [0, 1, 5]
+        assert all(
+            entry.renderer.initialize_calls == 0 for entry in game_modes.state.entries
+        )
+        assert post_processor.initialize_calls == 1
+        assert [cost.name for cost in game_modes.renderer_initialization_costs()] == [
+            "title-0",
+            "title-1",
+            "title-5",
+            "post",
+        ]
+
+    def test_idle_browse_frames_warm_one_deferred_title_at_a_time(self) -> None:
+        """Verify deferred titles warm up one per idle frame, nearest first, so browsing never waits on a cold title."""
+        game_modes = _make_game_modes(count=6)
+        self._initialize(game_modes)
+
+        game_modes.get_renderers()
+
+        initialized_titles = [
+            index
+            for index, entry in enumerate(game_modes.state.entries)
+            if entry.title_renderer.initialize_calls
+        ]
+        assert initialized_titles == [0, 1, 2, 5]
+
+    def test_browsing_initializes_new_preview_neighbours(self) -> None:
+        """Verify moving the selection initializes the titles around it before the slide transition renders them."""
+        game_modes = _make_game_modes(count=8)
+        self._initialize(game_modes)
+        game_modes._pending_warmup.clear()
+
+        game_modes.state.mode_offset = 4
+        with (
+            patch("heart.navigation.SlideTransitionProvider"),
+            patch("heart.navigation.SlideTransitionRenderer"),
+        ):
+            game_modes.get_renderers()
+
+        for index in (3, 4, 5):
+            assert game_modes.state.entries[index].title_renderer.initialized
+
+    def test_selecting_modes_evicts_least_recently_used_renderer(self) -> None:
+        """Verify modes beyond the resident budget are reset and rebuilt on demand so long sessions do not hold every scene in memory."""
+        game_modes = _make_game_modes(count=4)
+        self._initialize(game_modes)
+        entries = game_modes.state.entries
+
+        for offset in (0, 1, 1):
+            game_modes.state.in_select_mode = True
+            game_modes.state.mode_offset = offset
+            game_modes._handle_activate("activate")
+
+        assert entries[0].renderer.reset_calls == 1
+        assert not entries[0].renderer.initialized
+        assert entries[1].renderer.initialized
+        assert entries[2].renderer.initialized
+        assert entries[0].renderer.initialize_calls == 1
+
+
 if __name__ == "__main__":
     pytest.main()
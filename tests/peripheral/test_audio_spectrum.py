@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from heart.peripheral.audio_spectrum import AudioRingBuffer, SpectrumAnalyzer
+from heart.peripheral.input_payloads import MicrophoneSpectrum
+from heart.peripheral.microphone import Microphone
+
+SAMPLE_RATE = 16_000
+BLOCK_SIZE = 1_600
+
+
+def _feed(peripheral: Microphone, signal: np.ndarray) -> list[MicrophoneSpectrum]:
+    """Push ``signal`` through the audio callback path in 0.1 s mono blocks."""
+
+    spectra: list[MicrophoneSpectrum] = []
+    for start in range(0, signal.shape[0], BLOCK_SIZE):
+        block = signal[start : start + BLOCK_SIZE].astype(np.float32)[:, None]
+        peripheral._handle_audio_block(block, block.shape[0], None, None)
+        spectra.extend(peripheral._block_spectra)
+    return spectra
+
+
+def _band_index(analyzer: SpectrumAnalyzer, frequency: float) -> int:
+    return int(np.searchsorted(analyzer.band_edges, frequency) - 1)
+
+
+class TestAudioRingBuffer:
+    """Validate the sample ring so spectrum windows read exactly what the callback wrote."""
+
+    def test_reads_wrap_around_the_end_of_the_ring(self) -> None:
+        """Return the samples preceding an index even when they straddle the wrap point."""
+        ring = AudioRingBuffer(8)
+        ring.write(np.arange(6, dtype=np.float32))
+        ring.write(np.arange(6, 11, dtype=np.float32))
+        out = np.empty(5, dtype=np.float32)
+
+        assert ring.written == 11
+        assert ring.read(11, out)
+        assert out.tolist() == [6.0, 7.0, 8.0, 9.0, 10.0]
+
+    def test_overwritten_or_future_spans_are_rejected(self) -> None:
+        """Refuse spans the writer has lapped or not reached so stale audio is never analysed."""
+        ring = AudioRingBuffer(4)
+        ring.write(np.arange(10, dtype=np.float32))
+        out = np.empty(3, dtype=np.float32)
+
+        assert not ring.read(8, out)
+        assert not ring.read(11, out)
+        assert ring.read(10, out)
+        assert out.tolist() == [7.0, 8.0, 9.0]
+
+
+class TestMicrophoneSpectrum:
+    """Feed synthetic audio through the microphone callback so spectra can be checked headless."""
+
+    def test_sine_peaks_in_its_band_at_hop_rate(self) -> None:
+        """Emit one spectrum per hop with a 1 kHz tone landing in its band at its level."""
+        peripheral = Microphone()
+        analyzer = peripheral._spectrum
+        time_s = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+
+        spectra = _feed(peripheral, 0.5 * np.sin(2 * np.pi * 1_000.0 * time_s))
+
+        assert len(spectra) == (SAMPLE_RATE - analyzer.window_size) // analyzer.hop + 1
+        bands = np.asarray(spectra[-1].bands)
+        assert int(np.argmax(bands)) == _band_index(analyzer, 1_000.0)
+        assert bands.max() == pytest.approx(-6.0, abs=1.0)
+        assert peripheral.latest_spectrum is spectra[-1]
+        assert not any(spectrum.onset for spectrum in spectra)
+
+    def test_chirp_moves_the_peak_band_upwards(self) -> None:
+        """Track a rising exponential chirp so band ordering follows frequency."""
+        peripheral = Microphone()
+        time_s = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+        frequency = 100.0 * 60.0**time_s
+        phase = 2 * np.pi * np.cumsum(frequency) / SAMPLE_RATE
+
+        spectra = _feed(peripheral, 0.5 * np.sin(phase))
+
+        peaks = [int(np.argmax(spectrum.bands)) for spectrum in spectra]
+        assert peaks == sorted(peaks)
+        assert peaks[-1] - peaks[0] >= 8
+
+    def test_clicks_raise_one_onset_each(self) -> None:
+        """Flag each click in silence exactly once despite it spanning several windows."""
+        peripheral = Microphone()
+        analyzer = peripheral._spectrum
+        signal = np.zeros(2 * SAMPLE_RATE)
+        clicks = (8_000, 16_000, 24_000)
+        for click in clicks:
+            signal[click : click + 32] = 0.9
+
+        spectra = _feed(peripheral, signal)
+
+        onsets = [index for index, spectrum in enumerate(spectra) if spectrum.onset]
+        assert len(onsets) == len(clicks)
+        for frame, click in zip(onsets, clicks):
+            window_end = analyzer.window_size + frame * analyzer.hop
+            assert window_end - analyzer.window_size <= click < window_end
+
+    def test_low_frequency_hits_in_noise_are_beats(self) -> None:
+        """Mark decaying 60 Hz hits over background noise as beats."""
+        peripheral = Microphone()
+        rng = np.random.default_rng(0)
+        signal = 0.01 * rng.standard_normal(2 * SAMPLE_RATE)
+        decay = np.arange(BLOCK_SIZE)
+        hit = np.sin(2 * np.pi * 60.0 * decay / SAMPLE_RATE) * np.exp(-decay / 400)
+        for start in range(4_000, signal.shape[0], 8_000):
+            signal[start : start + BLOCK_SIZE] += hit
+
+        spectra = _feed(peripheral, signal)
+
+        assert sum(spectrum.beat for spectrum in spectra) == 4
+
+    def test_spectrum_payload_renders_as_input(self) -> None:
+        """Serialise spectrum frames with plain lists so they travel as sensor events."""
+        peripheral = Microphone()
+        time_s = np.arange(2_048) / SAMPLE_RATE
+
+        spectra = _feed(peripheral, 0.25 * np.sin(2 * np.pi * 440.0 * time_s))
+        data = spectra[0].to_input().data
+
+        assert data["bands"] == list(spectra[0].bands)
+        assert len(data["smoothed"]) == len(peripheral._spectrum.band_edges) - 1
+        assert data["samplerate"] == SAMPLE_RATE
+        assert spectra[0].event_type == "peripheral.microphone.spectrum"
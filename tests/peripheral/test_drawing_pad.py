@@ -1,6 +1,9 @@
+import math
 import time
 
+import numpy as np
 import pytest
+from helpers.benchmark import record_benchmark_stat
 from manyfold import Graph
 
 from heart.peripheral.core import Input
@@ -72,6 +75,68 @@ class TestPeripheralDrawingPad:
         y_idx = round(sample.y * (pad.resolution - 1))
         assert grid[y_idx][x_idx] == pytest.approx(1.0)
 
+    def test_canvas_is_a_live_read_only_view(self):
+        """Verify that DrawingPad.canvas shares memory with the grid and rejects writes. This lets renderers sample strokes every frame without copying the canvas."""
+        pad = DrawingPad(resolution=16)
+        canvas = pad.canvas
+
+        pad.apply_stylus(x=0.5, y=0.5, pressure=0.6, radius=0.1)
+
+        assert canvas.dtype == np.float32
+        assert canvas.shape == (16, 16)
+        assert canvas[8, 8] == pytest.approx(0.6)
+        assert pad.canvas is canvas
+        with pytest.raises(ValueError):
+            canvas[0, 0] = 1.0
+
+    def test_fast_motion_fills_the_segment_between_samples(self):
+        """Verify that DrawingPad joins consecutive samples into a continuous line. This keeps quick pen strokes from breaking into dots at high sample rates."""
+        pad = DrawingPad(resolution=64, stroke_timeout=60.0)
+
+        pad.apply_stylus(x=0.0, y=0.5, radius=0.02)
+        pad.apply_stylus(x=1.0, y=0.5, radius=0.02)
+
+        assert np.all(pad.canvas[32] == 1.0)
+        assert not pad.canvas[:28].any()
+        assert not pad.canvas[37:].any()
+
+    def test_lifting_the_pen_starts_a_new_stroke(self):
+        """Verify that DrawingPad.end_stroke separates strokes. This keeps two taps from being bridged by a phantom line."""
+        pad = DrawingPad(resolution=64, stroke_timeout=60.0)
+
+        pad.apply_stylus(x=0.0, y=0.5, radius=0.02)
+        pad.end_stroke()
+        pad.apply_stylus(x=1.0, y=0.5, radius=0.02)
+
+        assert pad.canvas[32, 0] == 1.0
+        assert pad.canvas[32, 63] == 1.0
+        assert pad.canvas[32, 32] == 0.0
+
+    @pytest.mark.benchmark(group="drawing_pad_stamping")
+    def test_stamping_benchmark(self, benchmark):
+        """Benchmark a 10k-sample stroke on a 256x256 canvas. This tracks how much of the input thread each stylus sample costs."""
+        pad = DrawingPad(resolution=256, stroke_timeout=60.0)
+        samples = 10_000
+        points = [
+            (
+                0.5 + 0.45 * math.sin(index * 0.0031),
+                0.5 + 0.45 * math.sin(index * 0.0047),
+            )
+            for index in range(samples)
+        ]
+
+        def stamp_stroke() -> None:
+            for x, y in points:
+                pad.apply_stylus(x=x, y=y, pressure=0.9)
+            pad.end_stroke()
+
+        benchmark(stamp_stroke)
+
+        record_benchmark_stat(
+            benchmark, "samples_per_second", lambda mean: samples / mean
+        )
+        assert pad.canvas.max() == pytest.approx(0.9)
+
 
 class TestDrawingPadManyfoldRuntime:
     """Cover graph-native drawing pad discovery and stylus sample publication."""
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 from typing import Any, cast
 
+import numpy as np
 import pygame
 import pytest
+from helpers.benchmark import record_benchmark_stat
 from manyfold import ConstantNode, Graph, Subscribable
 from manyfold.architecture import NewValues, PubSubObservable
 
 from heart.peripheral.configuration import PeripheralConfiguration
 from heart.peripheral.core import Input, Peripheral, PeripheralInfo
 from heart.peripheral.core.input import (AccelerometerDebugProfile,
-                                         BrowseIntent, ExternalSensorHub,
+                                         BrowseIntent, ColorAnalyzer,
+                                         ColorInputProfile, ExternalSensorHub,
                                          FrameTick, FrameTickController,
                                          GamepadAxis, GamepadButton,
                                          GamepadController, GamepadDpadValue,
@@ -26,7 +30,8 @@ from heart.peripheral.core.input import (AccelerometerDebugProfile,
                                          ToggleDebugCommand)
 from heart.peripheral.core.input.accelerometer import (
     ACCELERATION_ROUTE, DEBUG_ACCELERATION_ROUTE, _debug_acceleration_stream)
-from heart.peripheral.core.input.debug import InputDebugNode
+from heart.peripheral.core.input.debug import (InputDebugEnvelope,
+                                               InputDebugNode)
 from heart.peripheral.core.input.peripheral_inputs import \
     PERIPHERAL_INPUT_DISPATCH_STREAM
 from heart.peripheral.core.input.streams import average_by_frame_window
@@ -52,6 +57,47 @@ class _StubClock:
         return self._fps
 
 
+def _publish_frames(
+    tap: InputDebugTap, stream_name: str, count: int, *, start: int = 0
+) -> None:
+    for payload in range(start, start + count):
+        tap.publish(
+            stage=InputDebugStage.RAW,
+            stream_name=stream_name,
+            source_id="test",
+            payload=payload,
+        )
+
+
+# Gamepad axes and buttons emitted per frame in the tap benchmarks.
+BENCHMARK_EMISSIONS_PER_FRAME = 16
+
+
+def _benchmark_tap_frame(
+    benchmark: pytest.BenchmarkFixture, tap: InputDebugTap
+) -> None:
+    controller = FrameTickController(tap)
+    source: NewValues[GamepadStickValue] = NewValues()
+    InputDebugNode(
+        tap=tap,
+        stage=InputDebugStage.RAW,
+        stream_name="gamepad.stick",
+        source_id="gamepad",
+    ).connect(source).subscribe(lambda value: None)
+    clock = _StubClock(elapsed_ms=2, fps=500.0)
+    stick = GamepadStickValue(x=0.25, y=-0.5)
+
+    def frame() -> None:
+        for _ in range(BENCHMARK_EMISSIONS_PER_FRAME):
+            source.emit(stick)
+        controller.advance(clock)
+
+    benchmark(frame)
+
+    benchmark.extra_info["emissions_per_frame"] = BENCHMARK_EMISSIONS_PER_FRAME + 1
+    record_benchmark_stat(benchmark, "frame_overhead_us", lambda mean: mean * 1e6)
+
+
 class _ConfigurationLoaderStub:
     registry: object = object()
 
@@ -210,6 +256,7 @@ class TestInputDebugTap:
             source_id="navigation",
             upstream_ids=("keyboard.pressed.down",),
         ).connect(ConstantNode(7).observable()).subscribe(observed.append)
+        tap.flush()
 
         history = tap.snapshot()
 
@@ -267,10 +314,111 @@ class TestInputDebugTap:
             payload=object(),
         )
 
+        assert observed == []
+        tap.flush()
         assert len(observed) == 1
         assert tap.snapshot() == ()
         assert tap.latency_snapshot() == {}
 
+    def test_unobserved_tap_drops_emissions_without_queueing(self) -> None:
+        """Skip envelopes entirely while no history, subscriber or event reader exists."""
+        tap = InputDebugTap(history_size=0, latency_history_size=0)
+        observed: list[InputDebugEnvelope] = []
+
+        assert not tap.observed
+        _publish_frames(tap, "frame.tick", 3)
+        tap.observable().subscribe(observed.append)
+        tap.flush()
+
+        assert tap.observed
+        assert observed == []
+
+    def test_gamepad_input_events_mark_the_tap_observed(self) -> None:
+        """Deliver tap emissions to readers of the gamepad's input-event topic."""
+        tap = InputDebugTap(history_size=0, latency_history_size=0)
+        gamepad = GamepadController(manager=object(), debug_tap=tap)
+
+        events = gamepad.input_events()
+        _publish_frames(tap, "frame.tick", 1)
+        tap.flush()
+
+        assert tap.observed
+        assert events.latest() is not None
+
+    def test_sampling_keeps_every_nth_emission_per_stream(self) -> None:
+        """Sample each stream on its own counter so quiet streams still show up."""
+        tap = InputDebugTap(sample_every=3)
+
+        _publish_frames(tap, "gamepad.axis", 7)
+        _publish_frames(tap, "keyboard.key.a", 2)
+
+        assert [
+            (envelope.stream_name, envelope.payload) for envelope in tap.snapshot()
+        ] == [
+            ("gamepad.axis", 0),
+            ("gamepad.axis", 3),
+            ("gamepad.axis", 6),
+            ("keyboard.key.a", 0),
+        ]
+
+    def test_flush_delivers_batches_grouped_by_stream(self) -> None:
+        """Deliver each stream's pending envelopes together, in publish order."""
+        tap = InputDebugTap(history_size=0)
+        observed: list[InputDebugEnvelope] = []
+        tap.observable().subscribe(observed.append)
+
+        for index in range(2):
+            _publish_frames(tap, "gamepad.axis", 1, start=index)
+            _publish_frames(tap, "keyboard.key.a", 1, start=index)
+        tap.flush()
+        tap.flush()
+
+        assert [(envelope.stream_name, envelope.payload) for envelope in observed] == [
+            ("gamepad.axis", 0),
+            ("gamepad.axis", 1),
+            ("keyboard.key.a", 0),
+            ("keyboard.key.a", 1),
+        ]
+        latest = tap.input_events().latest()
+        assert latest is not None
+        assert latest.stream_name == "keyboard.key.a"
+
+    def test_latency_history_keeps_the_most_recent_samples(self) -> None:
+        """Compute percentiles over a fixed ring of the newest latency samples."""
+        tap = InputDebugTap(latency_history_size=4)
+
+        for delay_ms in (90, 80, 1, 2, 3, 4):
+            tap.record_latency("frame.tick", delay_ms / 1000.0)
+        tap.record_latency("keyboard.key.a", -1.0)
+
+        stats = tap.latency_snapshot()
+        assert stats["frame.tick"].count == 4
+        assert stats["frame.tick"].p50_ms == pytest.approx(2.0)
+        assert stats["frame.tick"].p99_ms == pytest.approx(4.0)
+        assert stats["frame.tick"].max_ms == pytest.approx(4.0)
+        assert stats["keyboard.key.a"].max_ms == 0.0
+
+
+class TestInputDebugTapBenchmark:
+    """Measure per-frame tap overhead so idle taps cost nothing on the render loop."""
+
+    @pytest.mark.benchmark(group="input_debug_tap")
+    def test_idle_tap_frame_benchmark(self, benchmark: pytest.BenchmarkFixture) -> None:
+        """Benchmark a frame of input emissions through the production tap with nobody observing."""
+        _benchmark_tap_frame(
+            benchmark, InputDebugTap(history_size=0, latency_history_size=0)
+        )
+
+    @pytest.mark.benchmark(group="input_debug_tap")
+    def test_observed_tap_frame_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark the same frame with history, latency stats and a subscriber."""
+        tap = InputDebugTap()
+        tap.observable().subscribe(lambda envelope: None)
+
+        _benchmark_tap_frame(benchmark, tap)
+
 
 class TestFrameTickController:
     """Group frame-tick tests so providers can trust one canonical per-frame timing snapshot."""
@@ -859,6 +1007,210 @@ class TestColorInputProfile:
         assert saturation == [1.0]
         assert brightness == [1.0]
 
+    def test_subscribers_share_one_analysis_per_frame(self, monkeypatch) -> None:
+        """Analyse a frame once however many colour streams are subscribed."""
+        analyzer = ColorAnalyzer(rate_hz=30.0)
+        analyses: list[pygame.Surface] = []
+        analyze = analyzer.analyze
+        monkeypatch.setattr(
+            analyzer,
+            "analyze",
+            lambda surface: analyses.append(surface) or analyze(surface),
+        )
+        monkeypatch.setattr(
+            "heart.peripheral.core.input.color.time.monotonic", lambda: 5.0
+        )
+        frames: NewValues[pygame.Surface] = NewValues()
+        profile = ColorInputProfile(
+            final_frames=frames, debug_tap=InputDebugTap(), analyzer=analyzer
+        )
+        received: list[object] = []
+        subscriptions = [
+            profile.average_rgb().subscribe(received.append),
+            profile.hue().subscribe(received.append),
+            profile.dominant_rgb().subscribe(received.append),
+            profile.region_rgb().subscribe(received.append),
+        ]
+        try:
+            frames.emit(_solid_surface((4, 4), (0, 0, 255)))
+        finally:
+            for subscription in subscriptions:
+                subscription.dispose()
+
+        assert len(analyses) == 1
+        assert len(received) == 4
+
+
+def _solid_surface(
+    size: tuple[int, int], color: tuple[int, int, int]
+) -> pygame.Surface:
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+
+def _panel_surface(colors: list[tuple[int, int, int]]) -> pygame.Surface:
+    surface = pygame.Surface((64 * len(colors), 64))
+    for index, color in enumerate(colors):
+        surface.fill(color, pygame.Rect(64 * index, 0, 64, 64))
+    return surface
+
+
+class TestColorAnalyzer:
+    """Validate strided colour analysis against synthetic frames with known answers."""
+
+    def test_dominant_colors_are_heaviest_first_with_pixel_shares(self) -> None:
+        """Split a two-colour frame into its colours, weighted by the area each covers."""
+        surface = _solid_surface((40, 10), (0, 0, 200))
+        surface.fill((250, 120, 0), pygame.Rect(0, 0, 30, 10))
+
+        snapshot = ColorAnalyzer(dominant_colors=4).analyze(surface)
+
+        assert snapshot.dominant_rgb == ((250, 120, 0), (0, 0, 200))
+        assert snapshot.dominant_weights == pytest.approx((0.75, 0.25))
+        assert snapshot.average_rgb == (187, 90, 50)
+
+    def test_kmeans_merges_nearby_shades_into_requested_clusters(self) -> None:
+        """Fold close shades into one cluster when fewer colours are requested than bins."""
+        surface = _solid_surface((30, 10), (255, 0, 0))
+        surface.fill((200, 0, 0), pygame.Rect(0, 0, 10, 10))
+        surface.fill((0, 255, 0), pygame.Rect(20, 0, 10, 10))
+
+        snapshot = ColorAnalyzer(dominant_colors=2).analyze(surface)
+
+        assert snapshot.dominant_rgb == ((228, 0, 0), (0, 255, 0))
+        assert snapshot.dominant_weights == pytest.approx((2 / 3, 1 / 3))
+
+    def test_region_averages_follow_panel_layout(self) -> None:
+        """Report one average per panel, row-major, from the strided sample."""
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)]
+
+        snapshot = ColorAnalyzer(stride=4, panel_size=(64, 64)).analyze(
+            _panel_surface(colors)
+        )
+
+        assert snapshot.region_rgb == tuple(colors)
+        assert snapshot.average_rgb == (127, 127, 127)
+
+    def test_brightness_percentile_ignores_dark_majority(self) -> None:
+        """Keep a bright highlight visible where the mean brightness is dragged down."""
+        surface = _solid_surface((10, 10), (0, 0, 0))
+        surface.fill((255, 255, 255), pygame.Rect(0, 0, 10, 2))
+
+        snapshot = ColorAnalyzer(brightness_percentile=0.9).analyze(surface)
+
+        assert snapshot.brightness_percentile == 1.0
+        assert snapshot.brightness == pytest.approx(51 / 255)
+        assert (
+            ColorAnalyzer(brightness_percentile=0.5)
+            .analyze(surface)
+            .brightness_percentile
+            == 0.0
+        )
+
+    def test_stride_samples_every_nth_pixel(self) -> None:
+        """Skip pixels between samples so thin lines off the grid do not count."""
+        surface = _solid_surface((8, 8), (0, 0, 0))
+        surface.fill((255, 255, 255), pygame.Rect(1, 0, 1, 8))
+
+        assert ColorAnalyzer(stride=2).analyze(surface).average_rgb == (0, 0, 0)
+        assert ColorAnalyzer(stride=1).analyze(surface).average_rgb == (31, 31, 31)
+
+    def test_sample_reuses_snapshot_until_interval_elapses(self) -> None:
+        """Return the previous snapshot until a full ``1 / rate_hz`` has passed."""
+        analyzer = ColorAnalyzer(rate_hz=10.0)
+        red = _solid_surface((2, 2), (255, 0, 0))
+        blue = _solid_surface((2, 2), (0, 0, 255))
+
+        first = analyzer.sample(red, now=1.0)
+        assert analyzer.sample(blue, now=1.05) is first
+        assert analyzer.sample(blue, now=1.1).average_rgb == (0, 0, 255)
+
+    def test_zero_rate_analyses_every_frame(self) -> None:
+        """Treat a zero rate as no limit."""
+        analyzer = ColorAnalyzer(rate_hz=0.0)
+
+        analyzer.sample(_solid_surface((2, 2), (255, 0, 0)), now=1.0)
+        snapshot = analyzer.sample(_solid_surface((2, 2), (0, 255, 0)), now=1.0)
+
+        assert snapshot.average_rgb == (0, 255, 0)
+
+    def test_from_configuration_reads_environment(self, monkeypatch) -> None:
+        """Take stride, rate and panel size from the environment."""
+        monkeypatch.setenv("HEART_COLOR_ANALYSIS_STRIDE", "3")
+        monkeypatch.setenv("HEART_COLOR_ANALYSIS_RATE_HZ", "0")
+        monkeypatch.setenv("HEART_PANEL_COLUMNS", "32")
+        monkeypatch.setenv("HEART_PANEL_ROWS", "16")
+
+        analyzer = ColorAnalyzer.from_configuration()
+
+        assert analyzer.stride == 3
+        assert analyzer.rate_hz == 0.0
+        assert analyzer.panel_size == (32, 16)
+
+
+# Panel-sized frames for the colour analysis benchmarks: the 4x1 cube strip
+# and a large square frame.
+COLOR_BENCHMARK_SIZES = [(256, 64), (512, 512)]
+
+
+def _color_benchmark_surface(size: tuple[int, int]) -> pygame.Surface:
+    surface = pygame.Surface(size)
+    pixels = np.random.default_rng(7).integers(0, 256, (*size, 3), dtype=np.uint8)
+    pygame.surfarray.blit_array(surface, pixels)
+    return surface
+
+
+def _record_color_throughput(
+    benchmark: pytest.BenchmarkFixture, size: tuple[int, int]
+) -> None:
+    benchmark.extra_info["pixels"] = size[0] * size[1]
+    record_benchmark_stat(benchmark, "frame_us", lambda mean: mean * 1e6)
+
+
+class TestColorAnalysisBenchmark:
+    """Measure one analysed frame against the full-surface average it replaced."""
+
+    @pytest.mark.benchmark(group="color_analysis")
+    @pytest.mark.parametrize("size", COLOR_BENCHMARK_SIZES)
+    def test_strided_analysis_benchmark(
+        self, benchmark: pytest.BenchmarkFixture, size: tuple[int, int]
+    ) -> None:
+        """Benchmark the default stride with dominant colours, percentile and regions."""
+        surface = _color_benchmark_surface(size)
+        analyzer = ColorAnalyzer(stride=4)
+        analyzer.analyze(surface)
+
+        benchmark(analyzer.analyze, surface)
+
+        _record_color_throughput(benchmark, size)
+
+    @pytest.mark.benchmark(group="color_analysis")
+    @pytest.mark.parametrize("size", COLOR_BENCHMARK_SIZES)
+    def test_rate_limited_sample_benchmark(
+        self, benchmark: pytest.BenchmarkFixture, size: tuple[int, int]
+    ) -> None:
+        """Benchmark the per-frame cost of a 120 fps loop sampling at the default 30 Hz."""
+        surface = _color_benchmark_surface(size)
+        analyzer = ColorAnalyzer(stride=4, rate_hz=30.0)
+        frame_times = itertools.count(step=1 / 120)
+
+        benchmark(lambda: analyzer.sample(surface, now=next(frame_times)))
+
+        _record_color_throughput(benchmark, size)
+
+    @pytest.mark.benchmark(group="color_analysis")
+    @pytest.mark.parametrize("size", COLOR_BENCHMARK_SIZES)
+    def test_full_surface_average_benchmark(
+        self, benchmark: pytest.BenchmarkFixture, size: tuple[int, int]
+    ) -> None:
+        """Benchmark ``pygame.transform.average_color`` over every pixel."""
+        surface = _color_benchmark_surface(size)
+
+        benchmark(pygame.transform.average_color, surface)
+
+        _record_color_throughput(benchmark, size)
+
 
 class TestMandelbrotControlProfile:
     """Group Mandelbrot profile tests so consumers receive direct motion state and command events instead of decoding merged revisions."""
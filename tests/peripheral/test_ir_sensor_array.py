@@ -2,12 +2,20 @@ from __future__ import annotations
 
 import numpy as np
 import pytest
+from helpers.benchmark import record_benchmark_stat
 
 from heart.peripheral.ir_sensor_array import (SPEED_OF_LIGHT, IRArrayDMAQueue,
                                               IRDMAPacket, IRSample,
+                                              IRSensorArray,
                                               MultilaterationSolver,
                                               radial_layout)
 
+SYNTHETIC_FRAMES = 256
+# Two rings at different radii and heights so the system is over-determined.
+STACKED_LAYOUT = radial_layout(radius=0.2) + [
+    [x * 0.5, y * 0.5, 0.05 - z] for x, y, z in radial_layout(radius=0.2)
+]
+
 
 def _make_packet(samples: list[IRSample]) -> IRDMAPacket:
     queue = IRArrayDMAQueue(buffer_size=len(samples))
@@ -19,6 +27,24 @@ def _make_packet(samples: list[IRSample]) -> IRDMAPacket:
     return packet
 
 
+def _synthetic_frames(
+    sensors: list[list[float]],
+    *,
+    frames: int = SYNTHETIC_FRAMES,
+    noise_s: float = 0.0,
+    seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return emitters inside the array volume and their jittered arrival times."""
+
+    rng = np.random.default_rng(seed)
+    positions = np.asarray(sensors)
+    emitters = rng.uniform(-0.3, 0.3, size=(frames, 3))
+    distances = np.linalg.norm(emitters[:, None, :] - positions[None], axis=2)
+    capture_offsets = rng.uniform(0.0, 1e-3, size=(frames, 1))
+    jitter = rng.normal(0.0, noise_s, size=distances.shape)
+    return emitters, distances / SPEED_OF_LIGHT + capture_offsets + jitter
+
+
 class TestPeripheralIrSensorArray:
     """Group Peripheral Ir Sensor Array tests so peripheral ir sensor array behaviour stays reliable. This preserves confidence in peripheral ir sensor array for end-to-end scenarios."""
 
@@ -100,3 +126,157 @@ class TestPeripheralIrSensorArray:
         assert np.allclose(position, emitter, atol=1e-3)
         assert confidence > 0.99
         assert rmse < 1e-10
+
+    def test_batch_matches_single_frame_solves(self) -> None:
+        """Verify solve_batch returns what per-frame solves do. This keeps burst handling consistent with the single-frame path."""
+        emitters, times = _synthetic_frames(STACKED_LAYOUT, frames=16)
+        batch_solver = MultilaterationSolver(STACKED_LAYOUT)
+        frame_solver = MultilaterationSolver(STACKED_LAYOUT)
+
+        positions, confidences, rmses = batch_solver.solve_batch(times)
+        singles = [frame_solver.solve(row) for row in times]
+
+        assert positions.shape == (16, 3)
+        assert np.allclose(positions, [single[0] for single in singles])
+        assert np.allclose(confidences, [single[1] for single in singles])
+        assert np.allclose(positions, emitters, atol=1e-6)
+        assert np.all(rmses < 1e-9)
+
+    def test_refinement_runs_only_above_the_residual_threshold(self) -> None:
+        """Verify exact frames skip least_squares while noisy over-determined frames are refined. This keeps the nonlinear solver off the common path."""
+        _emitters, exact = _synthetic_frames(STACKED_LAYOUT, frames=32)
+        emitters, noisy = _synthetic_frames(STACKED_LAYOUT, frames=32, noise_s=1e-12)
+        solver = MultilaterationSolver(STACKED_LAYOUT)
+        closed_form = MultilaterationSolver(STACKED_LAYOUT, refine_threshold=np.inf)
+
+        solver.solve_batch(exact)
+        assert solver.refinements == 0
+
+        refined, _, refined_rmse = solver.solve_batch(noisy)
+        unrefined, _, unrefined_rmse = closed_form.solve_batch(noisy)
+
+        assert solver.refinements > 0
+        assert closed_form.refinements == 0
+        assert np.all(refined_rmse <= unrefined_rmse + 1e-12)
+        assert np.median(np.linalg.norm(refined - emitters, axis=1)) <= np.median(
+            np.linalg.norm(unrefined - emitters, axis=1)
+        )
+
+    @pytest.mark.parametrize(
+        ("noise_s", "median_error_m"),
+        [(0.0, 1e-9), (1e-12, 5e-3), (1e-11, 5e-2)],
+        ids=("noiseless", "1ps", "10ps"),
+    )
+    def test_accuracy_regression_under_timing_noise(
+        self, noise_s: float, median_error_m: float
+    ) -> None:
+        """Verify position error stays within bounds as timing jitter grows. This catches solver changes that quietly degrade pose accuracy."""
+        emitters, times = _synthetic_frames(STACKED_LAYOUT, noise_s=noise_s, seed=7)
+        solver = MultilaterationSolver(STACKED_LAYOUT)
+
+        positions, _, _ = solver.solve_batch(times)
+
+        errors = np.linalg.norm(positions - emitters, axis=1)
+        assert float(np.median(errors)) < median_error_m
+
+    def test_drain_solves_a_queued_burst_in_one_batch(self, monkeypatch) -> None:
+        """Verify IRSensorArray.drain hands every frame from a DMA burst to one solve_batch call. This keeps backlogs from being solved frame by frame."""
+        sensors = radial_layout(radius=0.2)
+        peripheral = IRSensorArray(sensor_positions=sensors)
+        queue = _queued_burst(sensors, frames=6)
+        batches: list[int] = []
+        solve_batch = peripheral._solver.solve_batch
+
+        def spy(arrival_times):
+            batches.append(len(arrival_times))
+            return solve_batch(arrival_times)
+
+        emitted = []
+        monkeypatch.setattr(peripheral._solver, "solve_batch", spy)
+        monkeypatch.setattr(peripheral, "handle_input", emitted.append)
+
+        peripheral.drain(queue)
+
+        assert batches == [6]
+        assert queue.pop() is None
+        assert [event.data["frame_id"] for event in emitted] == list(range(6))
+        assert all(event.data["bits"] == [1] * len(sensors) for event in emitted)
+
+    def test_unconverged_frame_is_dropped_without_losing_the_burst(
+        self, monkeypatch
+    ) -> None:
+        """Verify a frame whose refinement fails is marked and skipped while the rest of its burst is still emitted. One bad frame must not blank a whole DMA backlog."""
+        sensors = radial_layout(radius=0.2)
+        peripheral = IRSensorArray(sensor_positions=sensors, refine_threshold=-1.0)
+        solver = peripheral._solver
+        refine = solver._refine
+        calls = []
+
+        def refine_failing_third(ranges, estimate):
+            calls.append(len(calls))
+            if len(calls) == 3:
+                raise ValueError("Solver failed to converge: test")
+            return refine(ranges, estimate)
+
+        emitted = []
+        monkeypatch.setattr(solver, "_refine", refine_failing_third)
+        monkeypatch.setattr(peripheral, "handle_input", emitted.append)
+
+        peripheral.drain(_queued_burst(sensors, frames=6))
+
+        assert [event.data["frame_id"] for event in emitted] == [0, 1, 3, 4, 5]
+        assert all(np.isfinite(event.data["position"]).all() for event in emitted)
+        # A single-frame solve still reports the failure.
+        calls.clear()
+        row = _synthetic_frames(sensors, frames=1)[1][0]
+        solver.solve(row)
+        solver.solve(row)
+        with pytest.raises(ValueError, match="failed to converge"):
+            solver.solve(row)
+
+
+def _queued_burst(sensors: list[list[float]], *, frames: int) -> IRArrayDMAQueue:
+    _emitters, times = _synthetic_frames(sensors, frames=frames)
+    queue = IRArrayDMAQueue(buffer_size=len(sensors))
+    for frame_id, row in enumerate(times):
+        for sensor_index, timestamp in enumerate(row):
+            queue.push_sample(
+                IRSample(
+                    frame_id=frame_id,
+                    sensor_index=sensor_index,
+                    timestamp=float(timestamp),
+                    level=1,
+                    duration_us=1200.0,
+                )
+            )
+    return queue
+
+
+class TestIrMultilaterationBenchmark:
+    """Benchmark multilateration over synthetic geometry so the per-frame solve cost stays visible."""
+
+    @pytest.mark.benchmark(group="ir_multilateration")
+    def test_batched_closed_form_benchmark(self, benchmark) -> None:
+        """Benchmark one solve_batch call over a backlog of noiseless frames."""
+        _emitters, times = _synthetic_frames(STACKED_LAYOUT)
+        solver = MultilaterationSolver(STACKED_LAYOUT)
+
+        benchmark(solver.solve_batch, times)
+
+        _record_frames_per_second(benchmark)
+
+    @pytest.mark.benchmark(group="ir_multilateration")
+    def test_per_frame_refined_benchmark(self, benchmark) -> None:
+        """Benchmark per-frame solves of jittered frames that all need refinement."""
+        _emitters, times = _synthetic_frames(STACKED_LAYOUT, noise_s=1e-12)
+        solver = MultilaterationSolver(STACKED_LAYOUT)
+
+        benchmark(lambda: [solver.solve(row) for row in times])
+
+        _record_frames_per_second(benchmark)
+
+
+def _record_frames_per_second(benchmark) -> None:
+    record_benchmark_stat(
+        benchmark, "frames_per_second", lambda mean: SYNTHETIC_FRAMES / mean
+    )
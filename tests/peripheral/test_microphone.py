@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import time
 from typing import Any
 
 import numpy as np
-from manyfold import Graph
+from manyfold import Graph, TypedRoute
 
 from heart.peripheral import microphone
 from heart.peripheral.core import PeripheralTag
 from heart.peripheral.microphone import (Microphone,
                                          microphone_detection_route,
-                                         microphone_level_event_route)
+                                         microphone_level_event_route,
+                                         microphone_spectrum_event_route)
+
+# Spawned sources publish from their node thread, which can still be running
+# when ``loop.run`` returns.
+ROUTE_WAIT_TIMEOUT_SECONDS = 5.0
+
+
+def _wait_for_latest(graph: Graph, route: TypedRoute[Any]) -> Any:
+    deadline = time.monotonic() + ROUTE_WAIT_TIMEOUT_SECONDS
+    latest = graph.latest(route)
+    while latest is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+        latest = graph.latest(route)
+    return latest
 
 
 class _InputStreamStub:
@@ -106,7 +121,7 @@ class TestPeripheralMicrophone:
         spawned.loop_handle.loop.run(spawned.loop_handle.token)
 
         latest_detection = graph.latest(microphone_detection_route())
-        latest_level = graph.latest(microphone_level_event_route())
+        latest_level = _wait_for_latest(graph, microphone_level_event_route())
         assert latest_detection is not None
         assert latest_level is not None
         assert latest_detection.value.identity == latest_level.value.identity
@@ -117,3 +132,26 @@ class TestPeripheralMicrophone:
         assert latest_level.value.event_type == "peripheral.microphone.level"
         assert latest_level.value.data["frames"] == 3
         assert latest_level.value.data["samplerate"] == 16_000
+
+    def test_spawned_source_publishes_spectrum_frames(self, monkeypatch) -> None:
+        """Verify spawned sources publish spectra on their own route so renderers can follow frequency content."""
+
+        time_s = np.arange(2_048) / 16_000
+        block = (0.5 * np.sin(2 * np.pi * 1_000.0 * time_s))[:, None]
+        monkeypatch.setattr(microphone, "sd", _SoundDeviceStub(blocks=(block,)))
+        graph = Graph()
+
+        handle = Microphone.detection_node(
+            start_immediately=False,
+            spawn_sources=True,
+        ).install(graph)
+        handle.loop_handle.loop.run(handle.loop_handle.token)
+        spawned = handle.spawned_handles[0]
+        spawned.loop_handle.token.set()
+        spawned.loop_handle.loop.run(spawned.loop_handle.token)
+
+        latest_spectrum = _wait_for_latest(graph, microphone_spectrum_event_route())
+        assert latest_spectrum is not None
+        assert latest_spectrum.value.event_type == "peripheral.microphone.spectrum"
+        assert latest_spectrum.value.identity.id == "microphone:default"
+        assert len(latest_spectrum.value.data["bands"]) == 16
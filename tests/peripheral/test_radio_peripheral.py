@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+import statistics
+import time
 from collections.abc import Iterator
 from typing import Any
 
@@ -19,8 +22,8 @@ from heart.peripheral.radio import (FLOWTOY_PATTERN_EVENT,
                                     FLOWTOY_SYNC_EVENT, FLOWTOY_WAKE_EVENT,
                                     FlowToyPattern, RadioDriver,
                                     RadioPeripheral, RawRadioPacket,
-                                    SerialRadioDriver, radio_detection_route,
-                                    radio_error_route,
+                                    SerialLineReader, SerialRadioDriver,
+                                    radio_detection_route, radio_error_route,
                                     radio_packet_event_route)
 
 
@@ -99,6 +102,169 @@ class FakeSerialModule:
         return handle
 
 
+class ChunkedSerialHandle(FakeSerialHandle):
+    """Serve queued byte chunks through read/in_waiting like pyserial does."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        super().__init__()
+        self.chunks = list(chunks)
+        self.available = bytearray()
+        self.read_sizes: list[int] = []
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.available)
+
+    def read(self, size: int = 1) -> bytes:
+        # Each chunk arrives while a read is blocked waiting for data.
+        self.read_sizes.append(size)
+        if not self.available and self.chunks:
+            self.available += self.chunks.pop(0)
+        chunk = bytes(self.available[:size])
+        del self.available[:size]
+        return chunk
+
+
+class ReplaySerialHandle(FakeSerialHandle):
+    """Replay captured bridge lines on their original schedule, sped up.
+
+    ``read`` sleeps until the next line is due or the serial timeout expires,
+    like a pyserial port would, so CPU time measured while draining reflects
+    the reader rather than the harness. ``reads`` and ``polls`` count the
+    reader's ``read`` and ``in_waiting`` calls.
+    """
+
+    def __init__(
+        self,
+        capture: list[tuple[float, bytes]],
+        *,
+        speed: float,
+        timeout: float = 0.05,
+    ) -> None:
+        super().__init__()
+        self._capture = [(offset / speed, line) for offset, line in capture]
+        self._timeout = timeout
+        self._pending = bytearray()
+        self._released = 0
+        self.reads = 0
+        self.polls = 0
+        self.started_at = time.monotonic()
+
+    def due_at(self, index: int) -> float:
+        return self.started_at + self._capture[index][0]
+
+    def _release(self) -> None:
+        elapsed = time.monotonic() - self.started_at
+        while (
+            self._released < len(self._capture)
+            and self._capture[self._released][0] <= elapsed
+        ):
+            self._pending += self._capture[self._released][1]
+            self._released += 1
+
+    @property
+    def in_waiting(self) -> int:
+        self.polls += 1
+        self._release()
+        return len(self._pending)
+
+    def read(self, size: int = 1) -> bytes:
+        self.reads += 1
+        self._release()
+        if not self._pending:
+            wait = self._timeout
+            if self._released < len(self._capture):
+                wait = min(wait, self.due_at(self._released) - time.monotonic())
+            time.sleep(max(0.0, wait))
+            self._release()
+        chunk = bytes(self._pending[:size])
+        del self._pending[:size]
+        return chunk
+
+
+def _bridge_packet_line(sequence: int) -> bytes:
+    """Format a packet exactly as the Feather receiver firmware prints it."""
+
+    payload = [sequence >> 8, sequence & 0xFF, *range(19)]
+    return (
+        json.dumps(
+            {
+                "event_type": "peripheral.radio.packet",
+                "data": {
+                    "protocol": "flowtoy",
+                    "channel": 2,
+                    "bitrate_kbps": 250,
+                    "modulation": "nrf24-shockburst",
+                    "crc_ok": True,
+                    "rssi_dbm": -48,
+                    "payload": payload,
+                    "metadata": {
+                        "address": [1, 7, 241],
+                        "address_width_bytes": 3,
+                        "crc_bits": 16,
+                        "packet_size_bytes": len(payload),
+                        "receiver": "nrf52840",
+                        "runtime": "arduino-nrf52",
+                        "radio_backend": "nrf_to_nrf",
+                    },
+                },
+            },
+            separators=(",", ":"),
+        ).encode()
+        + b"\n"
+    )
+
+
+def _bridge_capture(bursts: int) -> list[tuple[float, bytes]]:
+    """Build traffic shaped like a FlowToys sync: three packets every 30 ms."""
+
+    return [
+        (burst * 0.03 + repeat * 0.0005, _bridge_packet_line(burst * 3 + repeat))
+        for burst in range(bursts)
+        for repeat in range(3)
+    ]
+
+
+def _replay_through_driver(
+    capture: list[tuple[float, bytes]],
+    *,
+    speed: float,
+    handles: list[ReplaySerialHandle] | None = None,
+) -> tuple[float, list[float]]:
+    """Drain a replayed capture and return CPU seconds per packet and latencies.
+
+    The replay handle the driver opened is appended to ``handles`` when given.
+    """
+
+    serial_module = FakeSerialModule()
+    driver = SerialRadioDriver(port="/dev/null", serial_module=serial_module)
+    if handles is None:
+        handles = []
+
+    def _serial(*_args: Any, **_kwargs: Any) -> ReplaySerialHandle:
+        handle = ReplaySerialHandle(capture, speed=speed)
+        handles.append(handle)
+        return handle
+
+    serial_module.Serial = _serial  # type: ignore[method-assign]
+
+    latencies: list[float] = []
+    sequences: list[int] = []
+    cpu_start = time.process_time()
+    for packet in driver.packets():
+        received_at = time.monotonic()
+        sequence = packet.payload[0] << 8 | packet.payload[1]
+        sequences.append(sequence)
+        latencies.append(received_at - handles[0].due_at(sequence))
+        if len(sequences) == len(capture):
+            break
+    cpu_seconds = time.process_time() - cpu_start
+    driver.close()
+
+    assert sequences == list(range(len(capture)))
+    return cpu_seconds / len(capture), latencies
+
+
 class ConfigurationLoaderStub:
     registry: object = object()
 
@@ -530,3 +696,108 @@ class TestSerialRadioDriverWrites:
         assert messages[0].packet is not None
         assert messages[0].packet.protocol == "flowtoy"
         assert messages[0].packet.payload == b"\x01\x02\x03"
+
+
+class TestSerialLineReader:
+    """Validate chunked serial reads so bursts decode together and idle ports never spin."""
+
+    def test_lines_split_across_chunks_are_reassembled(self) -> None:
+        """Hold partial lines until their newline arrives and return whole bursts at once."""
+        handle = ChunkedSerialHandle([b'{"a":', b'1}\n{"b"', b":2}\n{", b'"c":3}\n'])
+        reader = SerialLineReader(handle)
+
+        batches = [reader.read_lines() for _ in range(4)]
+
+        assert batches == [[], [b'{"a":1}'], [b'{"b":2}'], [b'{"c":3}']]
+        assert handle.read_sizes[:2] == [1, len(b'{"a":') - 1]
+
+    def test_unterminated_data_is_bounded(self) -> None:
+        """Drop a runaway line instead of growing the buffer without limit."""
+        handle = ChunkedSerialHandle([b"x" * 64, b"y\n{}\n"])
+        reader = SerialLineReader(handle, max_line_bytes=32)
+
+        assert reader.read_lines() == []
+        assert reader.read_lines() == [b"y", b"{}"]
+
+    def test_burst_with_malformed_line_keeps_valid_packets(self) -> None:
+        """Fall back to per-line decoding when one line in a burst is not JSON."""
+        driver = SerialRadioDriver(port="/dev/null", serial_module=FakeSerialModule())
+        lines = [_bridge_packet_line(0).strip(), b"{not json", _bridge_packet_line(1).strip()]
+
+        messages = driver._decode_lines(lines)
+
+        assert [message.packet.payload[1] for message in messages] == [0, 1]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"protocol": "flowtoy", "payload": [1, 2, 3], "rssi_dbm": -42, "crc_ok": True},
+            {"protocol": 7, "payload": "abc", "channel": "2", "crc_ok": "yes"},
+            {"payload": [300, -1], "decoded": {"schema": "x"}, "metadata": [1]},
+        ],
+        ids=["firmware-schema", "stringly-typed", "out-of-range-payload"],
+    )
+    def test_typed_fast_path_matches_lenient_decoding(
+        self, data: dict[str, Any]
+    ) -> None:
+        """Produce the same packet whether the typed fast path or the helpers decode it."""
+        driver = SerialRadioDriver(port="/dev/null", serial_module=FakeSerialModule())
+        lenient = RawRadioPacket(
+            payload=driver._extract_payload(data.get("payload")),
+            protocol=driver._extract_str(data.get("protocol")),
+            frequency_hz=driver._extract_float(data.get("frequency_hz")),
+            channel=driver._extract_float(data.get("channel")),
+            bitrate_kbps=driver._extract_float(data.get("bitrate_kbps")),
+            modulation=driver._extract_str(data.get("modulation")),
+            crc_ok=driver._extract_bool(data.get("crc_ok")),
+            rssi_dbm=driver._extract_float(data.get("rssi_dbm")),
+            decoded=driver._extract_metadata(data.get("decoded")),
+            metadata=driver._extract_metadata(data.get("metadata")),
+        )
+
+        message = driver._message_from_json({"event_type": "x", "data": data})
+
+        assert message is not None
+        assert message.packet == lenient
+
+    def test_replayed_traffic_is_delivered_without_spinning(self) -> None:
+        """Deliver every replayed packet in order with a bounded number of wake-ups.
+
+        Timings depend on machine load, so CPU time and latency are reported by
+        the benchmark below; here the reader must block in ``read`` rather than
+        poll, touching the port at most twice per packet.
+        """
+        capture = _bridge_capture(bursts=100)
+        handles: list[ReplaySerialHandle] = []
+
+        _replay_through_driver(capture, speed=10.0, handles=handles)
+
+        (handle,) = handles
+        assert 0 < handle.reads <= 2 * len(capture)
+        assert handle.polls <= 2 * handle.reads
+
+
+class TestSerialRadioReaderBenchmark:
+    """Measure CPU per packet and latency on replayed bridge traffic at 10x speed."""
+
+    @pytest.mark.benchmark(group="radio_serial_reader")
+    def test_replayed_capture_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark draining a replayed FlowToys capture through SerialRadioDriver."""
+        capture = _bridge_capture(bursts=100)
+        results: list[tuple[float, list[float]]] = []
+
+        def run() -> None:
+            results.append(_replay_through_driver(capture, speed=10.0))
+
+        benchmark.pedantic(run, rounds=3, iterations=1)
+
+        cpu_per_packet = statistics.mean(result[0] for result in results)
+        latencies = sorted(latency for result in results for latency in result[1])
+        benchmark.extra_info["packets"] = len(capture)
+        benchmark.extra_info["cpu_us_per_packet"] = cpu_per_packet * 1e6
+        benchmark.extra_info["latency_p50_ms"] = statistics.median(latencies) * 1e3
+        benchmark.extra_info["latency_p99_ms"] = (
+            latencies[int(len(latencies) * 0.99)] * 1e3
+        )
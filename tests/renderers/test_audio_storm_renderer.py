@@ -205,7 +205,7 @@ def _stub_texture_gl(monkeypatch, *, texture_id: int = 9) -> dict[str, list[obje
 def _stub_tile_gl(monkeypatch) -> list[int]:
     gl_begin_calls: list[int] = []
     monkeypatch.setattr(
-        "heart.renderers.audio_storm.renderer.glReadPixels",
+        "heart.renderers.audio_storm.renderer.glCopyTexSubImage2D",
         lambda *_args: None,
     )
     monkeypatch.setattr(
@@ -7,8 +7,8 @@ from dataclasses import dataclass
 import numpy as np
 from manyfold import ConstantNode
 
-from heart.renderers.hilbert_curve.provider import (compute_zoom_target_scale,
-                                                    hilbert_curve_points_numba)
+from heart.renderers.hilbert_curve.kernels import hilbert_curve_points_numba
+from heart.renderers.hilbert_curve.provider import compute_zoom_target_scale
 from heart.renderers.hilbert_curve.renderer import HilbertScene
 
 
@@ -134,12 +134,12 @@ class TestMandelbrotLifecycle:
         assert renderer.state.view_mode == ViewMode.JULIA
         draw_split.assert_not_called()
 
-    def test_julia_mode_renders_individual_multi_panel_rectangle_panels(
+    def test_julia_mode_refines_once_and_copies_to_every_panel(
         self,
         manager,
         monkeypatch,
     ) -> None:
-        """Verify Julia mode remains per-panel instead of using base Mandelbrot mirroring."""
+        """Verify Julia mode spends one frame budget however many panels show it."""
         orientation = Rectangle.with_layout(columns=4, rows=1)
         device = LocalScreen(width=16, height=8, orientation=orientation)
         window = DisplayContext(
@@ -159,14 +159,50 @@ class TestMandelbrotLifecycle:
         renderer.state.view_mode = ViewMode.JULIA
         renderer.real_process(window, orientation)
 
-        assert drawn_sizes[-4:] == [(16, 8), (16, 8), (16, 8), (16, 8)]
+        assert drawn_sizes == [(16, 8)]
         assert window.screen is not None
         for column in range(4):
-            assert window.screen.get_at((column * 16, 0))[:3] == (
-                41 + column,
-                50,
-                60,
-            )
+            assert window.screen.get_at((column * 16, 0))[:3] == (41, 50, 60)
+
+    def test_split_view_refines_once_across_panel_pairs(
+        self,
+        manager,
+        monkeypatch,
+    ) -> None:
+        """Verify a four-panel split view renders one pair and copies it to the next."""
+        orientation = Rectangle.with_layout(columns=4, rows=1)
+        device = LocalScreen(width=16, height=8, orientation=orientation)
+        window = DisplayContext(
+            device=device,
+            screen=pygame.Surface(device.full_display_size()),
+            clock=pygame.time.Clock(),
+        )
+        renderer = MandelbrotMode()
+        draws: list[str] = []
+
+        def draw(kind: str, color: tuple[int, int, int]):
+            def draw_panel(surface: pygame.Surface) -> None:
+                draws.append(kind)
+                surface.fill(color)
+
+            return draw_panel
+
+        monkeypatch.setattr(
+            renderer, "_draw_mandelbrot_to_surface", draw("mandelbrot", (70, 0, 0))
+        )
+        monkeypatch.setattr(
+            renderer, "_draw_julia_to_surface", draw("julia", (0, 80, 0))
+        )
+        renderer.initialize(window, manager, orientation)
+        renderer.state.view_mode = ViewMode.JULIA_SELECTED
+        renderer.real_process(window, orientation)
+
+        assert sorted(draws) == ["julia", "mandelbrot"]
+        assert window.screen is not None
+        # Sample clear of the centred cursor and the selection perimeter.
+        for column in (0, 2):
+            assert window.screen.get_at((column * 16 + 3, 3))[:3] == (70, 0, 0)
+            assert window.screen.get_at(((column + 1) * 16 + 3, 3))[:3] == (0, 80, 0)
 
     def test_keyboard_controls_use_retained_keyboard_state(self) -> None:
         """Verify Mandelbrot movement reads the centrally retained keyboard state."""
@@ -251,10 +287,9 @@ class TestMandelbrotLifecycle:
             pygame.Surface((32, 32)),
             pygame.Surface((32, 32)),
         )
-        renderer.cached_result = object()
-        renderer.last_params = object()
-        renderer.cached_julia_result = object()
-        renderer.last_julia_params = object()
+        renderer.mandelbrot_fractal = Mock()
+        renderer.julia_fractal = Mock()
+        renderer._color_buffers[(64, 32)] = Mock()
 
         renderer.reset()
 
@@ -269,10 +304,9 @@ class TestMandelbrotLifecycle:
         assert renderer.individual_screen_height is None
         assert renderer.screens == {}
         assert renderer._split_view_surfaces == {}
-        assert renderer.cached_result is None
-        assert renderer.last_params is None
-        assert renderer.cached_julia_result is None
-        assert renderer.last_julia_params is None
+        assert renderer.mandelbrot_fractal is None
+        assert renderer.julia_fractal is None
+        assert renderer._color_buffers == {}
 
     def test_input_grace_period_does_not_reset_renderer(self, monkeypatch) -> None:
         """Verify the startup input grace period does not masquerade as an input-device failure."""
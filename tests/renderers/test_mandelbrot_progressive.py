@@ -0,0 +1,184 @@
+"""Validate progressive Mandelbrot refinement against the full-grid kernels."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from helpers.benchmark import record_benchmark_stat
+
+from heart.renderers.mandelbrot.kernels import (get_julia_converge_time,
+                                                get_mandelbrot_converge_time)
+from heart.renderers.mandelbrot.progressive import (ITERATIONS_PER_OCTAVE,
+                                                    MAX_ADAPTIVE_ITERATIONS,
+                                                    FractalKind, FractalView,
+                                                    ProgressiveFractal,
+                                                    adaptive_max_iterations)
+
+WIDTH = 96
+HEIGHT = 48
+SEAHORSE = FractalView(
+    center_real=-0.7446419526560056,
+    center_imag=0.11883810795259032,
+    zoom=50.0,
+    max_iterations=250,
+)
+ZOOM_PATH_FRAMES = 120
+ZOOM_PATH_BUDGET_SECONDS = 0.004
+
+
+def _full_grid(view: FractalView, kind: FractalKind) -> np.ndarray:
+    """Render ``view`` the way the scene did before refinement became progressive."""
+
+    height_range = view.height_range
+    width_range = height_range * WIDTH / HEIGHT
+    re, im = np.meshgrid(
+        np.linspace(
+            -width_range / 2 + view.center_real,
+            width_range / 2 + view.center_real,
+            WIDTH,
+        ),
+        np.linspace(
+            -height_range / 2 + view.center_imag,
+            height_range / 2 + view.center_imag,
+            HEIGHT,
+        ),
+    )
+    if kind == FractalKind.JULIA:
+        return get_julia_converge_time(
+            re, im, view.constant.real, view.constant.imag, view.max_iterations
+        )
+    return get_mandelbrot_converge_time(
+        re, im, view.constant.real, view.constant.imag, view.max_iterations, True
+    )
+
+
+def _zoom_path(fractal: ProgressiveFractal, budget: float | None) -> int:
+    """Auto-zoom into the seahorse valley like the scene's auto mode."""
+
+    zoom = 1.0
+    for _ in range(ZOOM_PATH_FRAMES):
+        zoom *= 1.05
+        view = FractalView(
+            center_real=SEAHORSE.center_real,
+            center_imag=SEAHORSE.center_imag,
+            zoom=zoom,
+            max_iterations=adaptive_max_iterations(SEAHORSE.max_iterations, zoom),
+        )
+        fractal.render(view, WIDTH, HEIGHT, budget)
+    return ZOOM_PATH_FRAMES
+
+
+def _benchmark_zoom_path(
+    benchmark: pytest.BenchmarkFixture, budget: float | None
+) -> None:
+    def run() -> int:
+        fractal = ProgressiveFractal(FractalKind.MANDELBROT, use_interior_check=True)
+        return _zoom_path(fractal, budget)
+
+    frames = benchmark(run)
+
+    benchmark.extra_info["frames"] = frames
+    record_benchmark_stat(benchmark, "frames_per_second", lambda mean: frames / mean)
+
+
+class TestProgressiveFractal:
+    """Validate pass scheduling and view reuse so refined frames match a full render."""
+
+    @pytest.mark.parametrize("kind", list(FractalKind))
+    def test_unbudgeted_render_matches_full_grid(self, kind: FractalKind) -> None:
+        """Refine to completion in one call and agree with the meshgrid kernels."""
+        view = (
+            FractalView(0.0, 0.0, 2.0, 250, complex(-0.7, 0.27))
+            if kind == FractalKind.JULIA
+            else SEAHORSE
+        )
+        fractal = ProgressiveFractal(kind, use_interior_check=True)
+
+        values = fractal.render(view, WIDTH, HEIGHT)
+
+        assert fractal.complete
+        assert fractal.computed_pixels == WIDTH * HEIGHT
+        np.testing.assert_array_equal(values, _full_grid(view, kind))
+
+    def test_budgeted_passes_converge_without_recomputing_pixels(self) -> None:
+        """Run one chunk per exhausted budget and reach the exact image visiting each pixel once."""
+        fractal = ProgressiveFractal(FractalKind.MANDELBROT, use_interior_check=True)
+
+        first = fractal.render(SEAHORSE, WIDTH, HEIGHT, budget=0.0).copy()
+        calls = 1
+        while not fractal.complete:
+            fractal.render(SEAHORSE, WIDTH, HEIGHT, budget=0.0)
+            calls += 1
+
+        assert calls > 1
+        assert np.count_nonzero(first != fractal.render(SEAHORSE, WIDTH, HEIGHT)) > 0
+        assert fractal.computed_pixels == WIDTH * HEIGHT
+        np.testing.assert_array_equal(
+            fractal.render(SEAHORSE, WIDTH, HEIGHT),
+            _full_grid(SEAHORSE, FractalKind.MANDELBROT),
+        )
+
+    def test_whole_pixel_pan_only_computes_exposed_columns(self) -> None:
+        """Shift exact pixels with the view and iterate only the newly exposed strip."""
+        fractal = ProgressiveFractal(FractalKind.MANDELBROT, use_interior_check=True)
+        fractal.render(SEAHORSE, WIDTH, HEIGHT)
+        pixel = SEAHORSE.height_range * WIDTH / HEIGHT / (WIDTH - 1)
+        panned = FractalView(
+            center_real=SEAHORSE.center_real + 3 * pixel,
+            center_imag=SEAHORSE.center_imag,
+            zoom=SEAHORSE.zoom,
+            max_iterations=SEAHORSE.max_iterations,
+        )
+
+        values = fractal.render(panned, WIDTH, HEIGHT)
+
+        assert fractal.computed_pixels == WIDTH * HEIGHT + 3 * HEIGHT
+        np.testing.assert_array_equal(
+            values, _full_grid(panned, FractalKind.MANDELBROT)
+        )
+
+    def test_zoom_step_keeps_previous_frame_as_preview(self) -> None:
+        """Start a zoomed frame from the resampled previous one rather than coarse blocks."""
+        previous = ProgressiveFractal(FractalKind.MANDELBROT, use_interior_check=True)
+        previous.render(SEAHORSE, WIDTH, HEIGHT)
+        zoomed = FractalView(
+            center_real=SEAHORSE.center_real,
+            center_imag=SEAHORSE.center_imag,
+            zoom=SEAHORSE.zoom * 1.05,
+            max_iterations=SEAHORSE.max_iterations,
+        )
+        exact = _full_grid(zoomed, FractalKind.MANDELBROT)
+
+        reused = previous.render(zoomed, WIDTH, HEIGHT, budget=0.0)
+        fresh = ProgressiveFractal(
+            FractalKind.MANDELBROT, use_interior_check=True
+        ).render(zoomed, WIDTH, HEIGHT, budget=0.0)
+
+        assert not previous.complete
+        assert np.count_nonzero(reused != exact) < np.count_nonzero(fresh != exact) / 2
+
+    def test_adaptive_iterations_step_per_octave_and_cap(self) -> None:
+        """Grow the iteration limit once per zoom doubling and stop at the cap."""
+        assert adaptive_max_iterations(250, 0.5) == 250
+        assert adaptive_max_iterations(250, 1.9) == 250
+        assert adaptive_max_iterations(250, 4.0) == 250 + 2 * ITERATIONS_PER_OCTAVE
+        assert adaptive_max_iterations(250, 1e300) == MAX_ADAPTIVE_ITERATIONS
+        assert adaptive_max_iterations(5000, 1e300) == 5000
+
+
+class TestProgressiveZoomBenchmark:
+    """Measure frames per second along a scripted auto-zoom so refinement cost stays visible."""
+
+    @pytest.mark.benchmark(group="mandelbrot_zoom_path")
+    def test_budgeted_zoom_path_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark the auto-zoom path with the refinement budget a Pi frame allows."""
+        _benchmark_zoom_path(benchmark, ZOOM_PATH_BUDGET_SECONDS)
+
+    @pytest.mark.benchmark(group="mandelbrot_zoom_path")
+    def test_unbudgeted_zoom_path_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark the same path refined to completion every frame as the baseline."""
+        _benchmark_zoom_path(benchmark, None)
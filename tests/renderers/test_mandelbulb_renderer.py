@@ -601,6 +601,7 @@ class TestMandelbulbScene:
         window = _window(width=320, height=80)
         manager = _PeripheralManager()
         gl_begin_calls: list[int] = []
+        tile_copies: list[tuple[int, ...]] = []
         monkeypatch.setattr(
             "heart.renderers.mandelbulb.renderer.glGenTextures",
             lambda _count: 7,
@@ -618,12 +619,8 @@ class TestMandelbulbScene:
             lambda *_args: None,
         )
         monkeypatch.setattr(
-            "heart.renderers.mandelbulb.renderer.glReadPixels",
-            lambda *_args: None,
-        )
-        monkeypatch.setattr(
-            "heart.renderers.mandelbulb.renderer.glTexSubImage2D",
-            lambda *_args: None,
+            "heart.renderers.mandelbulb.renderer.glCopyTexSubImage2D",
+            lambda *args: tile_copies.append(args),
         )
         monkeypatch.setattr(
             "heart.renderers.mandelbulb.renderer.glViewport",
@@ -688,8 +685,7 @@ class TestMandelbulbScene:
         assert scene.render_size == (80, 80)
         assert shader_runtime.draw_calls[-1]["viewport_size"] == (80, 80)
         assert scene.display_texture == 7
-        assert scene.tile_pixels is not None
-        assert scene.tile_pixels.shape == (80, 80, 4)
+        assert [copy[-2:] for copy in tile_copies] == [(80, 80)]
         assert len(gl_begin_calls) == 4
         assert shader_runtime.read_to_surface_sizes == [(320, 80)]
 
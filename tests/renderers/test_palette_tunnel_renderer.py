@@ -233,6 +233,7 @@ class TestPaletteTunnelScene:
         manager = _PeripheralManager()
         window = _window(width=320, height=80)
         gl_begin_calls: list[int] = []
+        tile_copies: list[tuple[int, ...]] = []
         monkeypatch.setattr(
             "heart.renderers.palette_tunnel.renderer.glGenTextures",
             lambda _count: 7,
@@ -250,12 +251,8 @@ class TestPaletteTunnelScene:
             lambda *_args: None,
         )
         monkeypatch.setattr(
-            "heart.renderers.palette_tunnel.renderer.glReadPixels",
-            lambda *_args: None,
-        )
-        monkeypatch.setattr(
-            "heart.renderers.palette_tunnel.renderer.glTexSubImage2D",
-            lambda *_args: None,
+            "heart.renderers.palette_tunnel.renderer.glCopyTexSubImage2D",
+            lambda *args: tile_copies.append(args),
         )
         monkeypatch.setattr(
             "heart.renderers.palette_tunnel.renderer.glViewport",
@@ -321,8 +318,7 @@ class TestPaletteTunnelScene:
         assert shader_runtime.draw_calls[0]["viewport_origin"] == (0, 0)
         assert shader_runtime.draw_calls[0]["uniforms"]["iViewportOrigin"] == (0, 0)
         assert scene.display_texture == 7
-        assert scene.tile_pixels is not None
-        assert scene.tile_pixels.shape == (80, 80, 4)
+        assert [copy[-2:] for copy in tile_copies] == [(80, 80)]
         assert len(gl_begin_calls) == 4
         assert shader_runtime.read_to_surface_sizes == [(320, 80)]
 
@@ -0,0 +1,383 @@
+"""Validate the fused post-processing pipeline against the per-effect numpy code."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+import numpy as np
+import pygame
+import pytest
+from helpers.benchmark import record_benchmark_stat
+
+from heart.renderers.post_processing import (EdgePostProcessor,
+                                             HueShiftPostProcessor,
+                                             PostProcessingChain,
+                                             SaturationPostProcessor,
+                                             flush_post_processing)
+from heart.renderers.post_processing.pipeline import (EDGE_BACKGROUND_DIM,
+                                                      EDGE_GAMMA, EdgeStage,
+                                                      HueShiftStage,
+                                                      PostProcessingPipeline,
+                                                      SaturationStage)
+from heart.utilities import color_conversion
+
+STRIP_SIZE = (256, 64)
+SQUARE_SIZE = (512, 512)
+
+CHAINS: dict[str, tuple[SaturationStage | HueShiftStage | EdgeStage, ...]] = {
+    "saturation": (SaturationStage(1.6),),
+    "hue": (HueShiftStage(0.27),),
+    "edge": (EdgeStage(24),),
+    "saturation+hue+edge": (
+        SaturationStage(1.6),
+        HueShiftStage(0.27),
+        EdgeStage(24),
+    ),
+}
+
+
+def _reference_saturation(image: np.ndarray, factor: float) -> None:
+    img = image.astype(np.float32)
+    lum = (0.299 * img[..., 0] + 0.587 * img[..., 1] + 0.114 * img[..., 2])[
+        ..., None
+    ]
+    image[:] = np.clip(lum + factor * (img - lum), 0, 255).astype(np.uint8)
+
+
+def _reference_hue_shift(image: np.ndarray, hue_delta: float) -> None:
+    hsv = color_conversion.convert_rgb_to_hsv(image).astype(np.float32)
+    hsv[..., 0] = (hsv[..., 0] / 179.0 + hue_delta) % 1.0 * 179.0
+    image[:] = color_conversion.convert_hsv_to_rgb(hsv.astype(np.uint8))
+
+
+def _reference_edges(image: np.ndarray, threshold: int) -> None:
+    lum = (
+        0.299 * image[..., 0] + 0.587 * image[..., 1] + 0.114 * image[..., 2]
+    ).astype(np.int16)
+    gx = np.abs(np.roll(lum, -1, 1) - np.roll(lum, 1, 1))
+    gy = np.abs(np.roll(lum, -1, 0) - np.roll(lum, 1, 0))
+    alpha = np.clip(
+        ((gx + gy).astype(np.float32) - threshold) / max(1, 255 - threshold),
+        0.0,
+        1.0,
+    )
+    alpha **= EDGE_GAMMA
+    out = image.astype(np.float32) * EDGE_BACKGROUND_DIM + alpha[..., None] * 255.0
+    image[:] = np.clip(out, 0, 255).astype(np.uint8)
+
+
+def _reference_chain(image: np.ndarray, stages) -> np.ndarray:
+    image = image.copy()
+    for stage in stages:
+        if isinstance(stage, SaturationStage):
+            _reference_saturation(image, stage.factor)
+        elif isinstance(stage, HueShiftStage):
+            _reference_hue_shift(image, stage.hue_delta)
+        else:
+            _reference_edges(image, stage.threshold)
+    return image
+
+
+def _surface(size: tuple[int, int], seed: int) -> pygame.Surface:
+    """Return a surface of noisy gradients with flat patches and saturated edges."""
+
+    width, height = size
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 255, width)[:, None]
+    y = np.linspace(0, 255, height)[None, :]
+    pixels = np.stack((x + 0 * y, y + 0 * x, (x + y) / 2), axis=-1)
+    pixels += rng.normal(0, 24, pixels.shape)
+    pixels[: width // 4, : height // 4] = (255, 0, 0)
+    pixels[-width // 4 :, -height // 4 :] = (40, 40, 40)
+    surface = pygame.Surface(size)
+    pygame.surfarray.blit_array(
+        surface, np.clip(pixels, 0, 255).astype(np.uint8)
+    )
+    return surface
+
+
+def _image(surface: pygame.Surface) -> np.ndarray:
+    return pygame.surfarray.array3d(surface).swapaxes(0, 1)
+
+
+def _numpy_hsv(monkeypatch: pytest.MonkeyPatch, *, strict: bool) -> None:
+    monkeypatch.setattr(color_conversion, "CV2_MODULE", None)
+    monkeypatch.setattr(color_conversion, "LOOKUP_TABLES", None)
+    monkeypatch.setattr(color_conversion, "HSV_LOOKUP_TABLES_ENABLED", False)
+    monkeypatch.setattr(color_conversion, "HSV_CACHE_ENABLED", strict)
+    monkeypatch.setattr(color_conversion, "HSV_CALIBRATION_ENABLED", True)
+    monkeypatch.setattr(color_conversion, "HSV_CALIBRATION_STRICT", strict)
+    color_conversion.HSV_TO_BGR_CACHE.clear()
+
+
+@pytest.fixture
+def fast_calibrated_hsv(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Route the numpy hue effect through the plain converters with pinned colours."""
+
+    _numpy_hsv(monkeypatch, strict=False)
+
+
+@pytest.fixture
+def strict_calibrated_hsv(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Route the numpy hue effect through the default strict, caching converters."""
+
+    _numpy_hsv(monkeypatch, strict=True)
+    yield
+    color_conversion.HSV_TO_BGR_CACHE.clear()
+
+
+@pytest.fixture
+def opencv_hsv(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Route the numpy hue effect through OpenCV's converters."""
+
+    monkeypatch.setattr(color_conversion, "CV2_MODULE", pytest.importorskip("cv2"))
+
+
+class _Switch:
+    def __init__(self, rotation: int) -> None:
+        self.rotation = rotation
+
+    def get_rotation_since_last_long_button_press(self) -> int:
+        return self.rotation
+
+
+class _PeripheralManager:
+    def __init__(self, saturation: int, hue: int, edge: int) -> None:
+        switches = SimpleNamespace(
+            switch_one=lambda: _Switch(saturation),
+            switch_two=lambda: _Switch(hue),
+            switch_three=lambda: _Switch(edge),
+        )
+        self.bluetooth_switch = lambda: switches
+
+
+class TestPostProcessingPipeline:
+    """Validate fused stages so chained effects match the per-effect numpy results."""
+
+    @pytest.mark.parametrize("factor", [0.0, 0.35, 1.0, 1.6, 5.0])
+    def test_saturation_matches_numpy_effect_exactly(self, factor: float) -> None:
+        """Match the float32 saturation blend bit for bit, including clipping."""
+        surface = _surface(STRIP_SIZE, 0)
+        expected = _reference_chain(_image(surface), [SaturationStage(factor)])
+
+        PostProcessingPipeline().apply(surface, [SaturationStage(factor)])
+
+        np.testing.assert_array_equal(_image(surface), expected)
+
+    @pytest.mark.parametrize("threshold", [1, 24, 200, 255])
+    @pytest.mark.parametrize("size", [STRIP_SIZE, (7, 5)], ids=["strip", "tiny"])
+    def test_edges_match_numpy_effect_exactly(
+        self, threshold: int, size: tuple[int, int]
+    ) -> None:
+        """Match the rolled-gradient edge overlay bit for bit, including wrapped borders."""
+        surface = _surface(size, 1)
+        expected = _reference_chain(_image(surface), [EdgeStage(threshold)])
+
+        PostProcessingPipeline().apply(surface, [EdgeStage(threshold)])
+
+        np.testing.assert_array_equal(_image(surface), expected)
+
+    @pytest.mark.parametrize("hue_delta", [0.03, 0.27, 0.5, 0.97])
+    def test_hue_shift_matches_fast_calibrated_numpy_effect_exactly(
+        self, hue_delta: float, fast_calibrated_hsv: None
+    ) -> None:
+        """Match the numpy converters with pinned pure colours and no strict search."""
+        surface = _surface(STRIP_SIZE, 2)
+        expected = _reference_chain(_image(surface), [HueShiftStage(hue_delta)])
+
+        PostProcessingPipeline().apply(surface, [HueShiftStage(hue_delta)])
+
+        np.testing.assert_array_equal(_image(surface), expected)
+
+    @pytest.mark.parametrize("chain", list(CHAINS), ids=list(CHAINS))
+    def test_chains_match_fast_calibrated_numpy_effects_exactly(
+        self, chain: str, fast_calibrated_hsv: None
+    ) -> None:
+        """Match the effects run one after another, edges seeing the shifted colours."""
+        surface = _surface(SQUARE_SIZE, 3)
+        expected = _reference_chain(_image(surface), CHAINS[chain])
+
+        PostProcessingPipeline().apply(surface, CHAINS[chain])
+
+        np.testing.assert_array_equal(_image(surface), expected)
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_chain_matches_strict_calibrated_numpy_effects_exactly(
+        self, seed: int, strict_calibrated_hsv: None
+    ) -> None:
+        """Shift hues through the default strict, caching converters."""
+        stages = CHAINS["saturation+hue+edge"]
+        surface = _surface(STRIP_SIZE, seed)
+        expected = _reference_chain(_image(surface), stages)
+        color_conversion.HSV_TO_BGR_CACHE.clear()
+
+        PostProcessingPipeline().apply(surface, stages)
+
+        np.testing.assert_array_equal(_image(surface), expected)
+
+    @pytest.mark.parametrize("chain", ["hue", "saturation+hue+edge"])
+    def test_chain_matches_opencv_effects_exactly(
+        self, chain: str, opencv_hsv: None
+    ) -> None:
+        """Shift hues through OpenCV when it is the configured converter."""
+        surface = _surface(STRIP_SIZE, 3)
+        expected = _reference_chain(_image(surface), CHAINS[chain])
+
+        PostProcessingPipeline().apply(surface, CHAINS[chain])
+
+        np.testing.assert_array_equal(_image(surface), expected)
+
+    def test_stages_out_of_kernel_order_run_in_the_given_order(self) -> None:
+        """Split the pass where a stage would otherwise run before an earlier one."""
+        stages = [EdgeStage(24), SaturationStage(1.6), SaturationStage(0.5)]
+        surface = _surface(STRIP_SIZE, 4)
+        expected = _reference_chain(_image(surface), stages)
+
+        PostProcessingPipeline().apply(surface, stages)
+
+        np.testing.assert_array_equal(_image(surface), expected)
+
+
+class TestPostProcessingChain:
+    """Validate chained processors so effects queue until the last one applies them."""
+
+    def _run(
+        self,
+        processors: list,
+        surface: pygame.Surface,
+        manager: _PeripheralManager,
+        after_each: Callable[[int], None] = lambda index: None,
+    ) -> None:
+        window = SimpleNamespace(screen=surface)
+        for index, processor in enumerate(processors):
+            processor.initialize(window, manager, None)
+            processor.real_process(window, None)
+            after_each(index)
+
+    def test_last_processor_applies_every_queued_stage(self) -> None:
+        """Leave the screen alone until the edge processor runs the fused pass."""
+        surface = _surface(STRIP_SIZE, 5)
+        original = _image(surface)
+        stages = [SaturationStage(1.0 + 0.05 * 4), EdgeStage(1)]
+        expected = _reference_chain(original, stages)
+
+        def unchanged_until_last(index: int) -> None:
+            if index < 2:
+                np.testing.assert_array_equal(_image(surface), original)
+
+        self._run(
+            PostProcessingChain.processors(),
+            surface,
+            _PeripheralManager(saturation=4, hue=0, edge=-1),
+            unchanged_until_last,
+        )
+
+        np.testing.assert_array_equal(_image(surface), expected)
+
+    def test_flush_applies_stages_when_the_last_processor_is_missing(self) -> None:
+        """Apply the queued stages at the end of the frame without the edge processor."""
+        surface = _surface(STRIP_SIZE, 9)
+        stages = [SaturationStage(1.0 + 0.05 * 4), HueShiftStage(0.03 * 2)]
+        expected = _reference_chain(_image(surface), stages)
+        processors = PostProcessingChain.processors()[:2]
+
+        self._run(processors, surface, _PeripheralManager(saturation=4, hue=2, edge=0))
+        flush_post_processing(processors)
+
+        np.testing.assert_array_equal(_image(surface), expected)
+
+    def test_reordered_processors_apply_in_the_order_they_ran(self) -> None:
+        """Apply every stage, in run order, when a mode reorders the chain."""
+        surface = _surface(STRIP_SIZE, 10)
+        saturation, hue, edge = PostProcessingChain.processors()
+        stages = [EdgeStage(1), HueShiftStage(0.03 * 2), SaturationStage(0.8)]
+        expected = _reference_chain(_image(surface), stages)
+        processors = [edge, hue, saturation]
+
+        self._run(
+            processors, surface, _PeripheralManager(saturation=-4, hue=2, edge=-1)
+        )
+        flush_post_processing(processors)
+
+        np.testing.assert_array_equal(_image(surface), expected)
+
+    def test_idle_switches_leave_the_screen_untouched(self) -> None:
+        """Skip the pipeline entirely when no switch has been turned."""
+        surface = _surface(STRIP_SIZE, 6)
+        original = _image(surface)
+
+        self._run(
+            PostProcessingChain.processors(),
+            surface,
+            _PeripheralManager(saturation=0, hue=0, edge=0),
+        )
+
+        np.testing.assert_array_equal(_image(surface), original)
+
+    def test_standalone_processors_apply_immediately(self) -> None:
+        """Give processors built on their own a private one-member chain."""
+        surface = _surface(STRIP_SIZE, 7)
+        expected = _reference_chain(_image(surface), [SaturationStage(0.5)])
+
+        self._run(
+            [SaturationPostProcessor()],
+            surface,
+            _PeripheralManager(saturation=-10, hue=0, edge=0),
+        )
+
+        np.testing.assert_array_equal(_image(surface), expected)
+        assert HueShiftPostProcessor()._chain is not EdgePostProcessor()._chain
+
+
+class TestPostProcessingBenchmark:
+    """Measure each chain at strip and square sizes so fused passes stay cheap."""
+
+    @pytest.mark.benchmark(group="post_processing")
+    @pytest.mark.parametrize("chain", list(CHAINS), ids=list(CHAINS))
+    @pytest.mark.parametrize(
+        "size", [STRIP_SIZE, SQUARE_SIZE], ids=["256x64", "512x512"]
+    )
+    def test_fused_chain_benchmark(
+        self,
+        benchmark: pytest.BenchmarkFixture,
+        chain: str,
+        size: tuple[int, int],
+    ) -> None:
+        """Benchmark one fused pipeline pass over the surface."""
+        surface = _surface(size, 8)
+        pipeline = PostProcessingPipeline()
+        pipeline.apply(surface.copy(), CHAINS[chain])
+
+        benchmark(pipeline.apply, surface, CHAINS[chain])
+
+        _record_throughput(benchmark, size)
+
+    @pytest.mark.benchmark(group="post_processing")
+    @pytest.mark.parametrize("chain", list(CHAINS), ids=list(CHAINS))
+    @pytest.mark.parametrize(
+        "size", [STRIP_SIZE, SQUARE_SIZE], ids=["256x64", "512x512"]
+    )
+    def test_numpy_chain_benchmark(
+        self,
+        benchmark: pytest.BenchmarkFixture,
+        chain: str,
+        size: tuple[int, int],
+    ) -> None:
+        """Benchmark the same chain through the per-effect numpy code."""
+        image = _image(_surface(size, 8))
+
+        benchmark(_reference_chain, image, CHAINS[chain])
+
+        color_conversion.HSV_TO_BGR_CACHE.clear()
+        _record_throughput(benchmark, size)
+
+
+def _record_throughput(
+    benchmark: pytest.BenchmarkFixture, size: tuple[int, int]
+) -> None:
+    pixels = size[0] * size[1]
+    benchmark.extra_info["pixels"] = pixels
+    record_benchmark_stat(
+        benchmark, "megapixels_per_second", lambda mean: pixels / mean / 1e6
+    )
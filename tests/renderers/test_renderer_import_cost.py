@@ -0,0 +1,110 @@
+"""Guard renderer import cost so selecting a configuration stays fast on the Pi."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Renderer modules whose numba/scipy kernels are imported on first use.
+DEFERRED_RENDERER_MODULES = (
+    "heart.renderers.hilbert_curve",
+    "heart.renderers.life",
+    "heart.renderers.mandelbrot.cube_renderer",
+    "heart.renderers.mandelbrot.scene",
+    "heart.renderers.multicolor",
+    "heart.renderers.post_processing",
+)
+HEAVY_DEPENDENCIES = ("numba", "scipy")
+CONFIGURATION_PACKAGE = "heart.programs.configurations"
+# Mirrors `heart run` startup: resolve the registry, then load one configuration.
+CONFIGURATION_ENTRY_STATEMENT = (
+    "from heart.programs.registry import ConfigurationRegistry; "
+    "assert ConfigurationRegistry().get('life') is not None"
+)
+
+
+def _import_times(*modules: str) -> list[tuple[int, str, int]]:
+    """Import ``modules`` in a fresh interpreter and return ``(depth, name, cumulative_us)`` rows."""
+
+    statement = "; ".join(f"import {module}" for module in modules)
+    return _statement_import_times(statement)
+
+
+def _statement_import_times(statement: str) -> list[tuple[int, str, int]]:
+    """Run ``statement`` in a fresh interpreter and return its ``-X importtime`` rows."""
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env={
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(sys.path),
+            "SDL_VIDEODRIVER": "dummy",
+        },
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    rows: list[tuple[int, str, int]] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if not total.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip()) - 3) // 2
+        rows.append((depth, name.strip(), int(total)))
+    return rows
+
+
+class TestRendererImportCost:
+    """Ensure heavy numeric dependencies stay out of renderer imports so startup only pays for what the active mode draws."""
+
+    def test_renderer_modules_defer_heavy_dependencies(self) -> None:
+        """Verify importing jit-backed renderers leaves numba and scipy unloaded so configuration discovery stays cheap."""
+        imported = {name for _, name, _ in _import_times(*DEFERRED_RENDERER_MODULES)}
+
+        assert set(DEFERRED_RENDERER_MODULES) <= imported
+        assert not [name for name in HEAVY_DEPENDENCIES if name in imported]
+
+    @pytest.mark.benchmark(group="renderer_import_cost")
+    def test_renderer_import_time_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark a cold import of the jit-backed renderers and record cumulative import time from ``-X importtime``."""
+        rows = benchmark.pedantic(
+            _import_times, args=DEFERRED_RENDERER_MODULES, rounds=3, iterations=1
+        )
+
+        benchmark.extra_info["cumulative_import_ms"] = (
+            sum(total for depth, _, total in rows if depth == 0) / 1000
+        )
+
+    def test_configuration_entry_point_defers_heavy_dependencies(self) -> None:
+        """Verify loading one configuration imports only that module and leaves numba and scipy unloaded."""
+        rows = _statement_import_times(CONFIGURATION_ENTRY_STATEMENT)
+        imported = {name for _, name, _ in rows}
+
+        assert {
+            name for name in imported if name.startswith(f"{CONFIGURATION_PACKAGE}.")
+        } == {f"{CONFIGURATION_PACKAGE}.life"}
+        assert not [name for name in HEAVY_DEPENDENCIES if name in imported]
+
+    @pytest.mark.benchmark(group="renderer_import_cost")
+    def test_configuration_entry_import_time_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark a cold configuration lookup and record cumulative import time from ``-X importtime``."""
+        rows = benchmark.pedantic(
+            _statement_import_times,
+            args=(CONFIGURATION_ENTRY_STATEMENT,),
+            rounds=3,
+            iterations=1,
+        )
+
+        benchmark.extra_info["cumulative_import_ms"] = (
+            sum(total for depth, _, total in rows if depth == 0) / 1000
+        )
@@ -0,0 +1,83 @@
+import threading
+
+import pygame
+import pytest
+
+from heart.device import Device, Rectangle
+from heart.runtime.game_loop.presenter import FramePresenter
+
+
+class _BlockingDevice(Device):
+    def __init__(self) -> None:
+        super().__init__(orientation=Rectangle.with_layout(1, 1))
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+        self.colors: list[tuple[int, int, int, int]] = []
+        self.fail = False
+
+    def individual_display_size(self) -> tuple[int, int]:
+        return (4, 4)
+
+    def set_screen(self, screen: pygame.Surface) -> None:
+        self.started.set()
+        self.release.wait(timeout=5.0)
+        if self.fail:
+            raise ValueError("device unavailable")
+        self.colors.append(tuple(screen.get_at((0, 0))))
+
+
+def _screen(color: tuple[int, int, int]) -> pygame.Surface:
+    surface = pygame.Surface((4, 4))
+    surface.fill(color)
+    return surface
+
+
+class TestFramePresenter:
+    """Validate the pipelined presenter so device submission never stalls rendering."""
+
+    def test_submit_copies_frame_before_render_thread_reuses_screen(self) -> None:
+        """Present the pixels as they were at submit time even if the screen is redrawn immediately."""
+        device = _BlockingDevice()
+        presenter = FramePresenter(device, depth=2)
+        screen = _screen((255, 0, 0))
+
+        presenter.submit(screen)
+        screen.fill((0, 0, 255))
+        presenter.close()
+
+        assert device.colors == [(255, 0, 0, 255)]
+        assert presenter.stats().presented == 1
+
+    def test_full_buffer_drops_oldest_queued_frame(self) -> None:
+        """Keep the newest render when the device falls behind instead of blocking the render thread."""
+        device = _BlockingDevice()
+        device.release.clear()
+        presenter = FramePresenter(device, depth=2)
+
+        presenter.submit(_screen((10, 0, 0)))
+        assert device.started.wait(timeout=5.0)
+        presenter.submit(_screen((20, 0, 0)))
+        presenter.submit(_screen((30, 0, 0)))
+        device.release.set()
+        presenter.close()
+
+        assert [color[0] for color in device.colors] == [10, 30]
+        assert presenter.stats().dropped == 1
+
+    def test_device_failure_is_raised_on_next_submit(self) -> None:
+        """Surface presenter-thread failures on the render thread so broken outputs are not silent."""
+        device = _BlockingDevice()
+        device.fail = True
+        presenter = FramePresenter(device, depth=2)
+
+        presenter.submit(_screen((1, 2, 3)))
+        presenter.close()
+
+        with pytest.raises(RuntimeError, match="failed to submit"):
+            presenter.submit(_screen((1, 2, 3)))
+
+    def test_depth_must_allow_double_buffering(self) -> None:
+        """Reject single-slot buffers because they cannot overlap render and present."""
+        with pytest.raises(ValueError):
+            FramePresenter(_BlockingDevice(), depth=1)
@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+from heart.runtime.frame_profiler import (FrameProfiler, TimingRing,
+                                          get_frame_profiler,
+                                          set_frame_profiler)
+
+
+class TestTimingRing:
+    """Validate the rolling timing window so percentiles track recent frames only."""
+
+    def test_percentiles_cover_only_the_most_recent_window(self) -> None:
+        """Overwrite the oldest samples once full so a slow start does not skew later percentiles."""
+        ring = TimingRing(4)
+        for duration_ms in (100.0, 1.0, 2.0, 3.0, 4.0):
+            ring.record(duration_ms)
+
+        summary = ring.percentiles()
+
+        assert summary is not None
+        assert summary.samples == 4
+        assert summary.max_ms == 4.0
+        assert summary.p50_ms == pytest.approx(2.5)
+        assert 3.0 < summary.p99_ms <= 4.0
+
+    def test_empty_ring_has_no_percentiles(self) -> None:
+        """Report nothing for a stage that never ran instead of inventing zero timings."""
+        assert TimingRing(4).percentiles() is None
+
+
+class TestFrameProfiler:
+    """Validate per-renderer and per-stage profiling so slow modes can be found from a query."""
+
+    def test_snapshot_ranks_renderers_against_a_frame_budget(self) -> None:
+        """Rank renderers by p95 so the mode that blows the budget is listed first."""
+        profiler = FrameProfiler(window=16)
+        for _ in range(10):
+            profiler.record_renderer("Fast", 1.0)
+            profiler.record_renderer("Slow", 20.0)
+
+        snapshot = profiler.snapshot()
+
+        assert [name for name, _ in snapshot.slowest_renderers()] == ["Slow", "Fast"]
+        assert [name for name, _ in snapshot.slowest_renderers(budget_ms=16.6)] == [
+            "Slow"
+        ]
+        assert snapshot.as_dict()["renderers"]["Slow"]["p95_ms"] == 20.0
+
+    def test_record_frame_picks_profiled_stages_from_loop_timings(self) -> None:
+        """Record only the pipeline stages so unrelated loop timings do not appear as stages."""
+        profiler = FrameProfiler(window=8)
+
+        profiler.record_frame(
+            {"render_ms": 5.0, "device_ms": 2.0, "pacing_ms": 9.0, "total_ms": 16.0}
+        )
+
+        assert set(profiler.snapshot().stages) == {"render", "device", "total"}
+        stage = profiler.stage_percentiles("device")
+        assert stage is not None and stage.max_ms == 2.0
+        with pytest.raises(ValueError):
+            profiler.record_stage("pacing", 1.0)
+
+    def test_reset_clears_collected_samples(self) -> None:
+        """Drop collected timings so a new measurement run starts clean."""
+        profiler = FrameProfiler(window=8)
+        profiler.record_renderer("Renderer", 3.0)
+        profiler.record_stage("render", 3.0)
+
+        profiler.reset()
+
+        assert profiler.renderer_percentiles("Renderer") is None
+        assert profiler.snapshot().stages == {}
+
+    def test_snapshot_while_new_renderers_are_recorded(self) -> None:
+        """Snapshot from another thread while the render thread adds renderer names."""
+        profiler = FrameProfiler(window=2)
+        done = threading.Event()
+        errors: list[BaseException] = []
+
+        def take_snapshots() -> None:
+            try:
+                while not done.is_set():
+                    profiler.snapshot()
+            except BaseException as error:
+                errors.append(error)
+
+        reader = threading.Thread(target=take_snapshots)
+        reader.start()
+        try:
+            for index in range(20_000):
+                profiler.record_renderer(f"Renderer{index}", 1.0)
+        finally:
+            done.set()
+            reader.join()
+
+        assert errors == []
+        assert len(profiler.snapshot().renderers) == 20_000
+
+    def test_active_profiler_is_replaceable(self) -> None:
+        """Expose the active profiler globally so renderers can record without a loop reference."""
+        previous = get_frame_profiler()
+        profiler = FrameProfiler(window=2)
+        try:
+            set_frame_profiler(profiler)
+            assert get_frame_profiler() is profiler
+        finally:
+            set_frame_profiler(previous)
@@ -0,0 +1,68 @@
+import pygame
+
+from heart.runtime.game_loop.frame_skip import (IDLE_BACKOFF_AFTER_FRAMES,
+                                                FrameChangeTracker)
+
+
+class _Renderer:
+    def __init__(self, *, unchanged: bool) -> None:
+        self.unchanged = unchanged
+
+    def frame_unchanged(self) -> bool:
+        return self.unchanged
+
+
+class TestFrameChangeTracker:
+    """Validate dirty-frame detection so static scenes skip work without hiding real changes."""
+
+    def test_content_hash_detects_repeated_and_changed_frames(self) -> None:
+        """Report a repeated surface as unchanged and any pixel change as a new frame."""
+        tracker = FrameChangeTracker(idle_fps=30)
+        renderers = [_Renderer(unchanged=False)]
+        surface = pygame.Surface((4, 4))
+
+        assert tracker.frame_changed(surface, renderers, []) is True
+        assert tracker.frame_changed(surface, renderers, []) is False
+        surface.set_at((3, 3), (1, 2, 3))
+        assert tracker.frame_changed(surface, renderers, []) is True
+
+    def test_renderer_selection_change_counts_as_a_new_frame(self) -> None:
+        """Treat a different renderer list as changed even when the pixels happen to match."""
+        tracker = FrameChangeTracker(idle_fps=30)
+        surface = pygame.Surface((4, 4))
+        first, second = _Renderer(unchanged=False), _Renderer(unchanged=False)
+
+        tracker.frame_changed(surface, [first], [])
+
+        assert tracker.frame_changed(surface, [second], []) is True
+
+    def test_render_is_skipped_only_when_every_renderer_declares_unchanged(
+        self,
+    ) -> None:
+        """Skip rendering only after a presented frame and when all renderers and post-processors agree."""
+        tracker = FrameChangeTracker(idle_fps=30)
+        static = _Renderer(unchanged=True)
+        post = _Renderer(unchanged=False)
+
+        assert tracker.can_skip_render([static], []) is False
+        tracker.frame_changed(pygame.Surface((2, 2)), [static], [post])
+
+        assert tracker.can_skip_render([static], [post]) is False
+        post.unchanged = True
+        assert tracker.can_skip_render([static], [post]) is True
+
+    def test_tick_rate_backs_off_while_idle(self) -> None:
+        """Drop to the idle frame rate after a run of unchanged frames and recover on change."""
+        tracker = FrameChangeTracker(idle_fps=30)
+        renderers = [_Renderer(unchanged=False)]
+        surface = pygame.Surface((2, 2))
+
+        tracker.frame_changed(surface, renderers, [])
+        for _ in range(IDLE_BACKOFF_AFTER_FRAMES):
+            assert tracker.tick_rate(120) == 120
+            tracker.frame_changed(surface, renderers, [])
+        assert tracker.tick_rate(120) == 30
+
+        surface.fill((9, 9, 9))
+        tracker.frame_changed(surface, renderers, [])
+        assert tracker.tick_rate(120) == 120
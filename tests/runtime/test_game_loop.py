@@ -70,6 +70,66 @@ class TestGameLoop:
 
         assert presented_screens == [loop.components.display.screen]
 
+    def test_unchanged_frames_skip_device_submission(
+        self,
+        device,
+        resolver,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Skip blit, flip and device submission for repeated frames so static scenes stop burning CPU."""
+        monkeypatch.setenv("HEART_SKIP_UNCHANGED_FRAMES", "true")
+        loop = GameLoop(device=device, resolver=resolver)
+        loop.ensure_screen_initialized()
+        assert loop.components.display.screen is not None
+
+        rendered_surface = pygame.Surface(loop.components.display.screen.get_size())
+        monkeypatch.setattr(loop, "render_frame", lambda renderers: rendered_surface)
+        monkeypatch.setattr(loop, "_apply_post_processors", lambda surface: None)
+        monkeypatch.setattr(
+            loop.components.game_modes, "get_post_processors", lambda: []
+        )
+
+        presented_screens: list[pygame.Surface] = []
+        monkeypatch.setattr(device, "set_screen", presented_screens.append)
+
+        first = loop._one_loop([])
+        repeated = loop._one_loop([])
+        rendered_surface.fill((255, 0, 0))
+        changed = loop._one_loop([])
+
+        assert len(presented_screens) == 2
+        assert "frame_skipped" not in first
+        assert repeated["frame_skipped"] == 1.0
+        assert "device_ms" in changed
+
+    def test_pipelined_presenter_reports_present_timings_separately(
+        self,
+        device,
+        resolver,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Hand frames to the presenter thread so slow devices stop stalling the next render."""
+        monkeypatch.setenv("HEART_FRAME_PRESENT_STRATEGY", "pipelined")
+        loop = GameLoop(device=device, resolver=resolver)
+        loop.ensure_screen_initialized()
+        assert loop.components.display.screen is not None
+
+        rendered_surface = pygame.Surface(loop.components.display.screen.get_size())
+        monkeypatch.setattr(loop, "render_frame", lambda renderers: rendered_surface)
+        monkeypatch.setattr(loop, "_apply_post_processors", lambda surface: None)
+
+        presented_screens: list[pygame.Surface] = []
+        monkeypatch.setattr(device, "set_screen", presented_screens.append)
+
+        timings = loop._one_loop([])
+        assert loop._presenter is not None
+        loop._presenter.close()
+
+        assert len(presented_screens) == 1
+        assert presented_screens[0] is not loop.components.display.screen
+        assert "present_ms" in timings
+        assert "present_latency_ms" in timings
+
     def test_max_fps_can_be_overridden_by_environment(
         self,
         device,
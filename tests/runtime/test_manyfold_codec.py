@@ -0,0 +1,315 @@
+"""Validate the binary ManyFold mesh codec and compare it with JSON envelopes."""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from uuid import uuid4
+
+import pytest
+from helpers.benchmark import record_benchmark_stat
+
+from heart.runtime.manyfold_codec import (MESH_EVENT_SEQUENCE_BITS,
+                                          MeshEventIds, MeshEventWindow,
+                                          StructRecordCodec, decode_mesh_batch,
+                                          encode_mesh_batches,
+                                          encode_mesh_record,
+                                          first_mesh_event_id, is_mesh_batch)
+
+NAVIGATION = "heart.input.navigation"
+SENSOR = "heart.sensor.external.state"
+STATUS = "heart.node.status"
+CODECS = {
+    NAVIGATION: StructRecordCodec(
+        text_fields=("kind", "source"),
+        number_fields=(("step", "i"),),
+    ),
+    SENSOR: StructRecordCodec(
+        text_fields=("sensor_key",),
+        number_fields=(("value", "d"),),
+        optional_fields=("value",),
+    ),
+}
+LOOPBACK_NODES = 4
+LOOPBACK_EVENTS_PER_POLL = 32
+LOOPBACK_SEEN_LIMIT = 4096
+
+
+def _payload(topic: str, index: int) -> dict[str, object]:
+    if topic == NAVIGATION:
+        return {"kind": "browse", "source": "gamepad", "step": index % 3 - 1}
+    if topic == SENSOR:
+        return {"sensor_key": "accelerometer:x", "value": index * 0.125}
+    return {
+        "event_type": "changed",
+        "origin_node_id": "node-a",
+        "authenticated_peers_json": '["node-b"]',
+        "members_json": "[]",
+        "candidate_count": 1,
+        "discovery_failure_count": 0,
+        "last_error": "",
+        "timestamp_monotonic": float(index),
+    }
+
+
+class _LoopbackNode:
+    """Exchange one poll cycle of publications with peers through encoded bytes.
+
+    The JSON mode reproduces the previous envelope: a UUID event id per message and
+    a bounded deque plus set of seen ids on the receiver.
+
+    """
+
+    def __init__(self, node_id: str, *, binary: bool) -> None:
+        self.node_id = node_id
+        self.binary = binary
+        self.event_ids = MeshEventIds(node_id, f"{node_id}-instance")
+        self.window = MeshEventWindow()
+        self.seen_order: deque[str] = deque()
+        self.seen: set[str] = set()
+        self.pending: dict[str, list[bytes]] = {}
+        self.outbox: list[tuple[str, bytes]] = []
+        self.delivered = 0
+
+    def publish(self, topic: str, payload: dict[str, object]) -> None:
+        if self.binary:
+            record = encode_mesh_record(
+                self.event_ids.next(), payload, CODECS.get(topic)
+            )
+            self.pending.setdefault(topic, []).append(record)
+            return
+        encoded = json.dumps(
+            {"event_id": f"{self.node_id}:{uuid4().hex}", "payload": payload},
+            allow_nan=False,
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode("utf-8")
+        self.outbox.append((topic, encoded))
+
+    def flush(self) -> list[tuple[str, bytes]]:
+        for topic, records in self.pending.items():
+            self.outbox.extend(
+                (topic, batch.payload) for batch in encode_mesh_batches(records)
+            )
+        self.pending.clear()
+        outbox, self.outbox = self.outbox, []
+        return outbox
+
+    def receive(self, topic: str, payload: bytes) -> None:
+        if is_mesh_batch(payload):
+            self.delivered += len(
+                decode_mesh_batch(payload, CODECS.get(topic), window=self.window)
+            )
+            return
+        event_id = json.loads(payload)["event_id"]
+        if event_id in self.seen:
+            return
+        while len(self.seen_order) >= LOOPBACK_SEEN_LIMIT:
+            self.seen.remove(self.seen_order.popleft())
+        self.seen_order.append(event_id)
+        self.seen.add(event_id)
+        self.delivered += 1
+
+
+def _loopback_round(nodes: list[_LoopbackNode]) -> int:
+    """Publish one poll cycle from every node and deliver it to every peer."""
+
+    topics = (NAVIGATION, SENSOR, NAVIGATION, STATUS)
+    wire_bytes = 0
+    for node in nodes:
+        for index in range(LOOPBACK_EVENTS_PER_POLL):
+            topic = topics[index % len(topics)]
+            node.publish(topic, _payload(topic, index))
+    for sender in nodes:
+        for topic, payload in sender.flush():
+            wire_bytes += len(payload)
+            for receiver in nodes:
+                if receiver is not sender:
+                    receiver.receive(topic, payload)
+    return wire_bytes
+
+
+def _benchmark_loopback(
+    benchmark: pytest.BenchmarkFixture,
+    *,
+    binary: bool,
+) -> None:
+    nodes = [
+        _LoopbackNode(f"node-{index}", binary=binary)
+        for index in range(LOOPBACK_NODES)
+    ]
+    messages = LOOPBACK_NODES * LOOPBACK_EVENTS_PER_POLL
+    wire_bytes = _loopback_round(nodes)
+
+    benchmark(_loopback_round, nodes)
+
+    benchmark.extra_info["bytes_per_message"] = wire_bytes / messages
+    record_benchmark_stat(
+        benchmark, "messages_per_second", lambda mean: messages / mean
+    )
+    assert all(
+        node.delivered >= (LOOPBACK_NODES - 1) * LOOPBACK_EVENTS_PER_POLL
+        for node in nodes
+    )
+
+
+class TestMeshRecords:
+    """Validate binary mesh records so peers decode exactly what was published."""
+
+    def test_batch_round_trips_struct_and_fallback_bodies(self) -> None:
+        """Encode registered topics as structs and everything else through the peripheral encoder."""
+        ids = MeshEventIds("node-a", "instance-1")
+        records = [
+            (ids.next(), {"kind": "browse", "source": "gamepad", "step": -1}),
+            (ids.next(), {"kind": "activate", "source": "keyboard", "step": 0}),
+        ]
+        batches = encode_mesh_batches(
+            [
+                encode_mesh_record(event_id, payload, CODECS[NAVIGATION])
+                for event_id, payload in records
+            ]
+        )
+
+        assert len(batches) == 1
+        assert batches[0].first_event_id == records[0][0]
+        assert first_mesh_event_id(batches[0].payload) == records[0][0]
+        assert is_mesh_batch(batches[0].payload)
+        assert decode_mesh_batch(batches[0].payload, CODECS[NAVIGATION]) == records
+
+        status = _payload(STATUS, 3)
+        batch = encode_mesh_batches([encode_mesh_record(ids.next(), status)])[0]
+        assert decode_mesh_batch(batch.payload)[0][1] == status
+
+    def test_optional_sensor_value_and_oversized_text_fall_back_cleanly(self) -> None:
+        """Keep None sensor values and route text too long for a struct field through JSON."""
+        codec = CODECS[SENSOR]
+        missing = {"sensor_key": "lux", "value": None}
+        oversized = {"sensor_key": "x" * 300, "value": 1.5}
+        batch = encode_mesh_batches(
+            [
+                encode_mesh_record(1, missing, codec),
+                encode_mesh_record(2, oversized, codec),
+            ]
+        )[0]
+
+        assert decode_mesh_batch(batch.payload, codec) == [(1, missing), (2, oversized)]
+
+    def test_batches_split_on_record_and_byte_limits(self) -> None:
+        """Split queued records so no batch exceeds the configured caps."""
+        payload = {"kind": "browse", "source": "pad", "step": 1}
+        records = [
+            encode_mesh_record(index, payload, CODECS[NAVIGATION])
+            for index in range(1, 6)
+        ]
+
+        by_count = encode_mesh_batches(records, max_records=2)
+        by_bytes = encode_mesh_batches(records, max_bytes=len(records[0]) * 2 + 5)
+
+        assert [batch.first_event_id for batch in by_count] == [1, 3, 5]
+        assert [batch.first_event_id for batch in by_bytes] == [1, 3, 5]
+
+    def test_malformed_batches_raise_value_error(self) -> None:
+        """Reject truncated or foreign payloads so a bad peer cannot break polling."""
+        payload = {"kind": "a", "source": "b", "step": 1}
+        batch = encode_mesh_batches(
+            [encode_mesh_record(1, payload, CODECS[NAVIGATION])]
+        )[0].payload
+
+        for malformed in (b"HB", batch[:-1], batch + b"\x00", b"XX" + batch[2:]):
+            with pytest.raises(ValueError):
+                decode_mesh_batch(malformed, CODECS[NAVIGATION])
+        with pytest.raises(ValueError):
+            decode_mesh_batch(batch)
+
+
+class TestMeshEventWindow:
+    """Validate sequence-window deduplication so repeated mesh deliveries are dropped."""
+
+    def test_duplicates_and_stale_sequences_are_rejected(self) -> None:
+        """Accept each sequence once, tolerate reordering, and drop ids older than the window."""
+        window = MeshEventWindow(width=8)
+        tag = 7 << MESH_EVENT_SEQUENCE_BITS
+
+        assert [window.add(tag | sequence) for sequence in (3, 1, 3, 2, 12)] == [
+            True,
+            True,
+            False,
+            True,
+            True,
+        ]
+        assert window.seen(tag | 4) is True
+        assert window.seen(tag | 5) is False
+        assert window.add(tag | 4) is False
+        assert window.add(tag | 5) is True
+        assert window.seen(tag | 5) is True
+
+    def test_malformed_batch_does_not_mark_its_records_seen(self) -> None:
+        """Record ids only after the whole batch decodes, so a corrupted delivery can be retried."""
+        payload = {"kind": "a", "source": "b", "step": 1}
+        batch = encode_mesh_batches(
+            [
+                encode_mesh_record(index, payload, CODECS[NAVIGATION])
+                for index in (1, 2)
+            ]
+        )[0].payload
+        window = MeshEventWindow()
+
+        with pytest.raises(ValueError, match="trailing bytes"):
+            decode_mesh_batch(batch + b"\x00", CODECS[NAVIGATION], window=window)
+        with pytest.raises(ValueError, match="no codec"):
+            decode_mesh_batch(batch, window=window)
+
+        assert decode_mesh_batch(batch, CODECS[NAVIGATION], window=window) == [
+            (1, payload),
+            (2, payload),
+        ]
+        assert decode_mesh_batch(batch, CODECS[NAVIGATION], window=window) == []
+
+    def test_senders_are_tracked_independently_and_bounded(self) -> None:
+        """Keep one window per sender and forget the least recent sender when full."""
+        window = MeshEventWindow(width=8, max_senders=2)
+        first = MeshEventIds("node-a", "1")
+        second = MeshEventIds("node-b", "1")
+        third = MeshEventIds("node-c", "1")
+        first_id = first.next()
+
+        assert window.add(first_id)
+        assert window.add(second.next())
+        assert window.add(third.next())
+        assert window.add(first_id)
+
+    def test_restarted_sender_is_not_mistaken_for_stale(self) -> None:
+        """Give each start a fresh tag so a restart's low sequences are delivered."""
+        window = MeshEventWindow(width=8)
+        before = MeshEventIds("node-a", "instance-1")
+        for _ in range(20):
+            assert window.add(before.next())
+
+        after = MeshEventIds("node-a", "instance-1")
+
+        assert after.node_tag != before.node_tag
+        assert window.add(after.next())
+
+    def test_colliding_tags_from_different_sources_are_independent(self) -> None:
+        """Key windows by the publishing node so a tag collision drops nothing."""
+        window = MeshEventWindow(width=8)
+        tag = 7 << MESH_EVENT_SEQUENCE_BITS
+
+        assert window.add(tag | 20, "node-a")
+        assert not window.seen(tag | 1, "node-b")
+        assert window.add(tag | 1, "node-b")
+        assert window.seen(tag | 1, "node-a")
+
+
+class TestMeshLoopbackBenchmark:
+    """Compare JSON and binary envelopes across in-process nodes so wire cost stays visible."""
+
+    @pytest.mark.benchmark(group="manyfold_mesh_loopback")
+    def test_binary_loopback_benchmark(self, benchmark: pytest.BenchmarkFixture) -> None:
+        """Benchmark batched binary records exchanged between four nodes."""
+        _benchmark_loopback(benchmark, binary=True)
+
+    @pytest.mark.benchmark(group="manyfold_mesh_loopback")
+    def test_json_loopback_benchmark(self, benchmark: pytest.BenchmarkFixture) -> None:
+        """Benchmark per-event JSON envelopes as the baseline the binary codec replaces."""
+        _benchmark_loopback(benchmark, binary=False)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from heart.runtime.manyfold_node import (EXTERNAL_SENSOR_STATE_TOPIC,
                                          FRAME_TICK_TOPIC,
                                          HEART_MANYFOLD_STATUS_TOPIC,
@@ -11,7 +13,9 @@ from heart.runtime.manyfold_node import (EXTERNAL_SENSOR_STATE_TOPIC,
                                          NAVIGATION_TOPIC,
                                          RENDERED_FRAME_STREAM,
                                          ManyfoldNodeConfig,
-                                         ManyfoldNodeRuntime, TopicDelivery,
+                                         ManyfoldNodeRuntime,
+                                         MeshPayloadEncoding, TopicDelivery,
+                                         _payload_encoding_from_json,
                                          topic_policy_manifest)
 
 
@@ -62,3 +66,21 @@ class TestManyfoldNodeRuntime:
         assert '"delivery": "local"' in encoded
         assert '"delivery": "mesh_best_effort"' in encoded
         assert '"delivery": "mesh_coalesced"' in encoded
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ({}, MeshPayloadEncoding.JSON),
+            ({"mesh_payload_encoding": "json"}, MeshPayloadEncoding.JSON),
+            ({"mesh_payload_encoding": "binary"}, MeshPayloadEncoding.BINARY),
+        ],
+        ids=["default", "json", "binary"],
+    )
+    def test_binary_mesh_payloads_are_opt_in(
+        self, raw: dict[str, object], expected: MeshPayloadEncoding
+    ) -> None:
+        assert _payload_encoding_from_json(raw) is expected
+
+    def test_unknown_mesh_payload_encoding_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="mesh_payload_encoding"):
+            _payload_encoding_from_json({"mesh_payload_encoding": "protobuf"})
@@ -83,6 +83,7 @@ def test_real_process_mesh_story(tmp_path: Path) -> None:
         peer_mesh_port=mesh_port_b,
         peer_swim_key_hex=SWIM_KEY_B,
         mesh_role="connect",
+        payload_encoding="binary",
     )
     _write_node_config(
         config_b,
@@ -856,6 +857,7 @@ def _write_node_config(
     peer_swim_key_hex: str,
     mesh_role: str,
     mesh_listen_port: int | None = None,
+    payload_encoding: str | None = None,
 ) -> None:
     peer = {
         "node_id": peer_node_id,
@@ -869,9 +871,15 @@ def _write_node_config(
     if mesh_listen_port is not None:
         peer["mesh_listen_host"] = LOCAL_HOST
         peer["mesh_listen_port"] = mesh_listen_port
+    # Node a publishes binary batches and node b the default JSON, so the story
+    # covers a cluster part-way through switching encodings.
+    options = {}
+    if payload_encoding is not None:
+        options["mesh_payload_encoding"] = payload_encoding
     path.write_text(
         json.dumps(
             {
+                **options,
                 "cluster_id": CLUSTER_ID,
                 "node_id": node_id,
                 "instance_id": instance_id,
@@ -15,6 +15,7 @@ from heart.peripheral.core.input import (BrowseIntent, GamepadAxis,
                                          InputDebugStage, KeyboardSnapshot)
 from heart.peripheral.core.manager import PeripheralManager
 from heart.peripheral.sensor import Acceleration
+from heart.runtime.frame_profiler import FrameProfiler
 from heart.runtime.peripheral_runtime import (INPUT_DEBUG_STAGE_TAG,
                                               INPUT_DEBUG_STREAM_TAG,
                                               PeripheralRuntime,
@@ -138,6 +139,7 @@ class TestPeripheralRuntimeStreaming:
                 "timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc),
             },
         )
+        manager.input_io.debug_tap.flush()
 
         assert len(websocket.sent) == 1
         kind, envelope = websocket.sent[0]
@@ -163,6 +165,7 @@ class TestPeripheralRuntimeStreaming:
             source_id="switch-1",
             payload={"rotation": 1},
         )
+        manager.input_io.debug_tap.flush()
 
         assert websocket.control_handler is not None
         assert websocket.sent == []
@@ -537,6 +540,34 @@ class TestPeripheralRuntimeStreaming:
         assert loop.floating_emojis == ["heart"]
         assert loop.clear_count == 0
 
+    def test_profile_snapshot_control_publishes_render_profile(
+        self, monkeypatch
+    ) -> None:
+        """Verify profile requests answer over the websocket so Beats can show which renderer blows the frame budget."""
+        manager = PeripheralManager()
+        runtime = PeripheralRuntime(manager)
+        websocket = _WebSocketStub()
+        profiler = FrameProfiler(window=8)
+        profiler.record_renderer("SlowRenderer", 25.0)
+        profiler.record_frame({"render_ms": 25.0, "total_ms": 30.0})
+        monkeypatch.setattr(
+            "heart.runtime.peripheral_runtime.get_frame_profiler",
+            lambda: profiler,
+        )
+
+        runtime.configure_streaming(websocket=websocket)
+        assert websocket.control_handler is not None
+
+        websocket.control_handler(ControlMessage(command="profile_snapshot"))
+        runtime._drain_control_messages()
+
+        assert len(websocket.sent) == 1
+        kind, payload = websocket.sent[0]
+        assert kind == "peripheral"
+        assert payload.peripheral_info.id == "heart.render_profiler"
+        assert payload.data["renderers"]["SlowRenderer"]["max_ms"] == 25.0
+        assert set(payload.data["stages"]) == {"render", "total"}
+
     def test_save_phone_photo_writes_png_to_configured_directory(
         self,
         monkeypatch,
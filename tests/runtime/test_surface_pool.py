@@ -0,0 +1,49 @@
+import pygame
+
+from heart import DeviceDisplayMode
+from heart.runtime.rendering.surface_pool import SurfacePool
+
+
+class TestSurfacePool:
+    """Validate scratch surface reuse so steady-state frames stop allocating pygame surfaces."""
+
+    def test_reuses_surfaces_across_frames_but_not_within_a_frame(self) -> None:
+        """Hand out distinct surfaces per frame and the same ones next frame so layers never alias."""
+        pool = SurfacePool()
+
+        pool.begin_frame()
+        first = pool.acquire((4, 4))
+        second = pool.acquire((4, 4))
+        pool.begin_frame()
+        reused = [pool.acquire((4, 4)), pool.acquire((4, 4))]
+
+        assert first is not second
+        assert reused == [first, second]
+        stats = pool.stats()
+        assert stats.allocations == 2
+        assert stats.frame_allocations == 0
+        assert stats.reuses == 2
+
+    def test_keys_on_size_flags_and_display_mode(self) -> None:
+        """Keep surfaces for different display modes apart so mode switches never share buffers."""
+        pool = SurfacePool()
+
+        mirrored = pool.acquire((4, 4), display_mode=DeviceDisplayMode.MIRRORED)
+        pool.begin_frame()
+        full = pool.acquire((4, 4), display_mode=DeviceDisplayMode.FULL)
+        opaque = pool.acquire((4, 4), 0, display_mode=DeviceDisplayMode.MIRRORED)
+
+        assert len({id(mirrored), id(full), id(opaque)}) == 3
+        assert pool.stats().pooled == 3
+
+    def test_reused_surfaces_are_cleared_to_transparent(self) -> None:
+        """Clear recycled surfaces so renderers see the same blank canvas as a new surface."""
+        pool = SurfacePool()
+        surface = pool.acquire((2, 2))
+        surface.fill((255, 0, 0, 255))
+
+        pool.begin_frame()
+        reused = pool.acquire((2, 2), pygame.SRCALPHA)
+
+        assert reused is surface
+        assert tuple(reused.get_at((0, 0))) == (0, 0, 0, 0)
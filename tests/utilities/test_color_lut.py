@@ -0,0 +1,285 @@
+"""Validate HSV lookup tables against the calibrated numpy converters."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+from helpers.benchmark import record_benchmark_stat
+
+from heart.utilities import color_conversion
+from heart.utilities.color_lut import TABLE_SHAPE, HsvLookupTables, table_paths
+
+FRAME_SHAPE = (64, 256, 3)
+SYNTHETIC_VARIANT = "synthetic"
+# First-channel planes filled with calibrated conversions; 60 and 119 hold the
+# pinned pure colours.
+CALIBRATED_PLANES = (0, 60, 119, 200, 255)
+
+
+def _identity(image: np.ndarray) -> np.ndarray:
+    return image.copy()
+
+
+def _swap_outer(image: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(image[..., ::-1])
+
+
+@pytest.fixture(scope="module")
+def synthetic_table_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    directory = tmp_path_factory.mktemp("synthetic-hsv-tables")
+    _synthetic_tables(directory)
+    return directory
+
+
+@pytest.fixture(scope="module")
+def calibrated_tables() -> HsvLookupTables:
+    """Fill a few planes from the strict converters; a full build takes minutes."""
+    hsv_to_bgr = np.zeros(TABLE_SHAPE, dtype=np.uint8)
+    bgr_to_hsv = np.zeros(TABLE_SHAPE, dtype=np.uint8)
+    plane = np.empty((*TABLE_SHAPE[1:3], 3), dtype=np.uint8)
+    plane[..., 1], plane[..., 2] = np.indices(TABLE_SHAPE[1:3], dtype=np.uint8)
+    for first in CALIBRATED_PLANES:
+        plane[..., 0] = first
+        hsv_to_bgr[first] = color_conversion._calibrated_bgr_from_hsv(plane)
+        bgr_to_hsv[first] = color_conversion._calibrated_hsv_from_bgr(plane)
+    return HsvLookupTables(hsv_to_bgr, bgr_to_hsv, remember_round_trips=False)
+
+
+def _synthetic_tables(directory: Path, **kwargs: bool) -> HsvLookupTables:
+    return HsvLookupTables.load(
+        directory,
+        variant=SYNTHETIC_VARIANT,
+        hsv_to_bgr=_identity,
+        bgr_to_hsv=_swap_outer,
+        **kwargs,
+    )
+
+
+def _frame(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 256, FRAME_SHAPE, dtype=np.uint8)
+
+
+def _calibrated_plane_frame(seed: int) -> np.ndarray:
+    frame = _frame(seed)
+    rng = np.random.default_rng(seed)
+    planes = np.array(CALIBRATED_PLANES, dtype=np.uint8)
+    frame[..., 0] = rng.choice(planes, FRAME_SHAPE[:2])
+    return frame
+
+
+class TestHsvLookupTables:
+    """Validate table building and gathers so conversions stay exact without OpenCV."""
+
+    def test_load_builds_missing_tables_and_reuses_files(
+        self, synthetic_table_dir: Path
+    ) -> None:
+        """Build each table once from its converter and memory-map it afterwards."""
+        paths = table_paths(synthetic_table_dir, SYNTHETIC_VARIANT)
+        modified = [path.stat().st_mtime_ns for path in paths]
+
+        def fail(image: np.ndarray) -> np.ndarray:
+            raise AssertionError("existing tables should not be rebuilt")
+
+        tables = HsvLookupTables.load(
+            synthetic_table_dir,
+            variant=SYNTHETIC_VARIANT,
+            hsv_to_bgr=fail,
+            bgr_to_hsv=fail,
+        )
+        frame = _frame(0)
+
+        np.testing.assert_array_equal(tables.bgr_to_hsv(frame), frame[..., ::-1])
+        assert modified == [path.stat().st_mtime_ns for path in paths]
+        assert not list(synthetic_table_dir.glob("*.partial"))
+
+    def test_table_files_are_named_per_calibration_mode(self, tmp_path: Path) -> None:
+        """Keep tables for different calibration modes from overwriting each other."""
+        strict_paths = table_paths(tmp_path, "strict")
+        fast_paths = table_paths(tmp_path, "fast")
+
+        assert not set(strict_paths) & set(fast_paths)
+        assert all("strict" in path.name for path in strict_paths)
+        assert not HsvLookupTables.built(tmp_path, "fast")
+
+    def test_round_trips_are_remembered_in_memory_only(
+        self, synthetic_table_dir: Path
+    ) -> None:
+        """Return the source pixels after a round trip without writing the table file."""
+        tables = _synthetic_tables(synthetic_table_dir)
+        frame = _frame(1)
+        frame[0, 0] = (255, 255, 60)
+
+        hsv = tables.bgr_to_hsv(frame)
+        restored = tables.hsv_to_bgr(hsv)
+
+        np.testing.assert_array_equal(restored[1:], frame[1:])
+        np.testing.assert_array_equal(restored[0, 0], (60, 255, 255))
+        fresh = _synthetic_tables(synthetic_table_dir)
+        np.testing.assert_array_equal(fresh.hsv_to_bgr(hsv), hsv)
+
+        tables.forget_round_trips()
+        np.testing.assert_array_equal(tables.hsv_to_bgr(hsv), hsv)
+
+    def test_round_trips_are_not_remembered_when_disabled(
+        self, synthetic_table_dir: Path
+    ) -> None:
+        """Leave the HSV -> BGR table untouched when the round-trip cache is off."""
+        tables = _synthetic_tables(synthetic_table_dir, remember_round_trips=False)
+        hsv = tables.bgr_to_hsv(_frame(2))
+
+        np.testing.assert_array_equal(tables.hsv_to_bgr(hsv), hsv)
+
+    @pytest.mark.parametrize("seed", [0, 1, 42])
+    def test_calibrated_tables_match_numpy_converters(
+        self, calibrated_tables: HsvLookupTables, seed: int
+    ) -> None:
+        """Gather exactly what the strict numpy converters compute, including hues past 179."""
+        frame = _calibrated_plane_frame(seed)
+
+        np.testing.assert_array_equal(
+            calibrated_tables.bgr_to_hsv(frame),
+            color_conversion._calibrated_hsv_from_bgr(frame),
+        )
+        np.testing.assert_array_equal(
+            calibrated_tables.hsv_to_bgr(frame),
+            color_conversion._calibrated_bgr_from_hsv(frame),
+        )
+
+    def test_calibrated_tables_pin_pure_colours(
+        self, calibrated_tables: HsvLookupTables
+    ) -> None:
+        """Keep the OpenCV-matching pure colours the numpy converter pins."""
+        hsv = np.array([[[60, 255, 255], [119, 255, 255]]], dtype=np.uint8)
+
+        np.testing.assert_array_equal(
+            calibrated_tables.hsv_to_bgr(hsv), [[[2, 255, 0], [255, 0, 5]]]
+        )
+
+
+class TestLookupTableLoading:
+    """Validate that conversions never wait for a table build."""
+
+    def test_missing_tables_build_in_background(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        synthetic_table_dir: Path,
+    ) -> None:
+        """Return no tables while the build runs, then open the configured mode's files."""
+        self._configure_missing_tables(tmp_path, monkeypatch)
+        release = threading.Event()
+
+        def build(directory: Path, *, variant: str, **_converters: object) -> None:
+            # Link the prebuilt synthetic tables rather than spend minutes building.
+            assert release.wait(timeout=10.0)
+            for source, target in zip(
+                table_paths(synthetic_table_dir, SYNTHETIC_VARIANT),
+                table_paths(directory, variant),
+            ):
+                target.symlink_to(source)
+
+        monkeypatch.setattr(HsvLookupTables, "build", staticmethod(build))
+
+        assert color_conversion._lookup_tables() is None
+        build_thread = color_conversion.LOOKUP_TABLE_BUILD
+        assert build_thread is not None and build_thread.is_alive()
+        assert color_conversion._lookup_tables() is None
+
+        release.set()
+        build_thread.join(timeout=10.0)
+        assert not build_thread.is_alive()
+        tables = color_conversion._lookup_tables()
+
+        assert tables is not None
+        assert HsvLookupTables.built(tmp_path, "fast")
+        assert not HsvLookupTables.built(tmp_path, "strict")
+        frame = _frame(4)
+        np.testing.assert_array_equal(tables.bgr_to_hsv(frame), frame[..., ::-1])
+
+    def test_failed_build_is_not_retried_or_polled(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Stay on numpy after a failed build without checking for table files again."""
+        self._configure_missing_tables(tmp_path, monkeypatch)
+        checks: list[str] = []
+        built = HsvLookupTables.built
+
+        def failing_build(directory: Path, **_options: object) -> None:
+            raise OSError("disk full")
+
+        def counting_built(directory: Path, variant: str) -> bool:
+            checks.append(variant)
+            return built(directory, variant)
+
+        monkeypatch.setattr(HsvLookupTables, "build", staticmethod(failing_build))
+        monkeypatch.setattr(HsvLookupTables, "built", staticmethod(counting_built))
+
+        assert color_conversion._lookup_tables() is None
+        build_thread = color_conversion.LOOKUP_TABLE_BUILD
+        assert build_thread is not None
+        build_thread.join(timeout=10.0)
+        assert not build_thread.is_alive()
+        checks.clear()
+
+        assert color_conversion._lookup_tables() is None
+        assert color_conversion._lookup_tables() is None
+        assert checks == []
+        assert color_conversion.LOOKUP_TABLE_BUILD is build_thread
+
+    @staticmethod
+    def _configure_missing_tables(
+        directory: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("HEART_HSV_LOOKUP_TABLE_DIR", str(directory))
+        monkeypatch.setattr(color_conversion, "HSV_LOOKUP_TABLES_ENABLED", True)
+        monkeypatch.setattr(color_conversion, "HSV_CALIBRATION_MODE", "fast")
+        monkeypatch.setattr(color_conversion, "LOOKUP_TABLES", None)
+        monkeypatch.setattr(color_conversion, "LOOKUP_TABLE_BUILD", None)
+        monkeypatch.setattr(color_conversion, "LOOKUP_TABLE_BUILD_FAILED", False)
+
+
+class TestHsvConversionBenchmark:
+    """Measure strip-sized conversions so the table path stays a single gather."""
+
+    @pytest.mark.benchmark(group="hsv_conversion")
+    def test_lookup_table_round_trip_benchmark(
+        self, benchmark: pytest.BenchmarkFixture, synthetic_table_dir: Path
+    ) -> None:
+        """Benchmark BGR -> HSV -> BGR through the lookup tables."""
+        tables = _synthetic_tables(synthetic_table_dir)
+        frame = _frame(3)
+
+        benchmark(lambda: tables.hsv_to_bgr(tables.bgr_to_hsv(frame)))
+
+        tables.forget_round_trips()
+        _record_throughput(benchmark)
+
+    @pytest.mark.benchmark(group="hsv_conversion")
+    def test_numpy_round_trip_benchmark(
+        self, benchmark: pytest.BenchmarkFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Benchmark the same round trip through the calibrated numpy converters."""
+        monkeypatch.setattr(color_conversion, "CV2_MODULE", None)
+        monkeypatch.setattr(color_conversion, "LOOKUP_TABLES", None)
+        monkeypatch.setattr(color_conversion, "HSV_LOOKUP_TABLES_ENABLED", False)
+        frame = _frame(3)
+
+        benchmark(
+            lambda: color_conversion._convert_hsv_to_bgr(
+                color_conversion._convert_bgr_to_hsv(frame)
+            )
+        )
+
+        color_conversion.HSV_TO_BGR_CACHE.clear()
+        _record_throughput(benchmark)
+
+
+def _record_throughput(benchmark: pytest.BenchmarkFixture) -> None:
+    pixels = FRAME_SHAPE[0] * FRAME_SHAPE[1]
+    benchmark.extra_info["pixels"] = pixels
+    record_benchmark_stat(
+        benchmark, "megapixels_per_second", lambda mean: pixels / mean / 1e6
+    )
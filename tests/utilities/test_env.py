@@ -9,7 +9,8 @@ import pytest
 from heart.device.isolated_render import DEFAULT_SOCKET_PATH
 from heart.utilities.env import (AssetCacheStrategy, BleUartBufferStrategy,
                                  Configuration, FrameExportStrategy,
-                                 get_device_ports)
+                                 FramePresentStrategy, GlReadbackStrategy,
+                                 RendererWarmupStrategy, get_device_ports)
 
 
 @pytest.fixture(autouse=True)
@@ -107,6 +108,27 @@ class TestUtilitiesEnv:
                 "array",
                 FrameExportStrategy.ARRAY,
             ),
+            (
+                "HEART_FRAME_PRESENT_STRATEGY",
+                Configuration.frame_present_strategy,
+                FramePresentStrategy.SYNC,
+                "pipelined",
+                FramePresentStrategy.PIPELINED,
+            ),
+            (
+                "HEART_GL_READBACK_STRATEGY",
+                Configuration.gl_readback_strategy,
+                GlReadbackStrategy.SYNC,
+                "pbo",
+                GlReadbackStrategy.PBO,
+            ),
+            (
+                "HEART_RENDERER_WARMUP_STRATEGY",
+                Configuration.renderer_warmup_strategy,
+                RendererWarmupStrategy.EAGER,
+                "lazy",
+                RendererWarmupStrategy.LAZY,
+            ),
         )
         for name, loader, default, configured, expected in settings:
             monkeypatch.delenv(name, raising=False)
@@ -10,7 +10,9 @@ import stat
 import subprocess
 from pathlib import Path
 
+import numpy as np
 import pytest
+from PIL import Image
 
 from heart.utilities.hub75_lab._backends import (GpioBackend,
                                                  _select_gpio_backend)
@@ -20,6 +22,7 @@ from heart.utilities.hub75_lab.capture import (
     CapturePreflight, CaptureReport, _analyze_capture_data,
     _analyze_capture_with_saleae_module, _saleae_support_available,
     build_probe_toggle_command, capture_report_payload, create_probe_proof,
+    decode_virtual_frames, iter_virtual_frames, render_virtual_image,
     score_complete_similarity)
 from heart.utilities.hub75_lab.cli import _parse_signal_map
 from heart.utilities.hub75_lab.cli import main as hub75_lab_main
@@ -28,7 +31,8 @@ from heart.utilities.hub75_lab.experiments import (APPLIED_SETTING_NAMES,
                                                    build_experiment_command,
                                                    list_experiments)
 from heart.utilities.hub75_lab.memory import validate_sram_buffer
-from heart.utilities.hub75_logic_score import score_hub75_capture_files
+from heart.utilities.hub75_logic_score import (load_hub75_logic_csv,
+                                               score_hub75_capture_files)
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 INVENTORY_PATH = REPO_ROOT / "docs" / "hub75_script_inventory.json"
@@ -955,6 +959,85 @@ class TestHub75CaptureEvidence:
             _parse_signal_map([override])
 
 
+class TestHub75VirtualImage:
+    """Reconstruct panel contents from captures so shifted colour data can be inspected."""
+
+    def test_red_row_pairs_land_in_both_panel_halves(self, tmp_path: Path) -> None:
+        capture_path = tmp_path / "red.csv"
+        _write_capture(capture_path, red_activity=True)
+        capture = load_hub75_logic_csv(capture_path, DEFAULT_CAPTURE_SIGNAL_MAP)
+
+        frames = decode_virtual_frames(capture, cols=4, rows=32, weight_oe=False)
+
+        assert frames.shape == (1, 32, 4, 3)
+        red_rows = np.flatnonzero(frames[0, :, :, 0].sum(axis=1))
+        assert red_rows.tolist() == [1, 3, 5, 17, 19, 21]
+        assert (frames[0, red_rows, :, 0] == 1.0).all()
+        assert frames[..., 1:].sum() == 0.0
+
+    def test_frame_windows_split_commits_into_an_animation(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        capture_path = tmp_path / "red.csv"
+        output_path = tmp_path / "virtual.gif"
+        _write_capture(capture_path, red_activity=True)
+        capture = load_hub75_logic_csv(capture_path, DEFAULT_CAPTURE_SIGNAL_MAP)
+
+        frames = decode_virtual_frames(
+            capture, cols=4, rows=32, weight_oe=True, frame_seconds=7e-7
+        )
+        exit_code = hub75_lab_main(
+            [
+                "render-capture",
+                str(capture_path),
+                "--rows",
+                "32",
+                "--cols",
+                "4",
+                "--frame-seconds",
+                "7e-7",
+                "--output",
+                str(output_path),
+            ]
+        )
+
+        assert frames.shape == (3, 32, 4, 3)
+        for frame_index, row_pair in enumerate((1, 3, 5)):
+            lit_rows = np.flatnonzero(frames[frame_index, :, :, 0].sum(axis=1))
+            assert lit_rows.tolist() == [row_pair, row_pair + 16]
+        assert exit_code == 0
+        assert capsys.readouterr().out.strip() == str(output_path)
+        with Image.open(output_path) as animation:
+            assert animation.n_frames == 3
+
+    def test_frame_windows_iterate_one_frame_at_a_time(self, tmp_path: Path) -> None:
+        capture_path = tmp_path / "red.csv"
+        _write_capture(capture_path, red_activity=True)
+        capture = load_hub75_logic_csv(capture_path, DEFAULT_CAPTURE_SIGNAL_MAP)
+        settings = {"cols": 4, "rows": 32, "weight_oe": True, "frame_seconds": 7e-7}
+
+        frames = decode_virtual_frames(capture, **settings)
+        windows = [frame.copy() for frame in iter_virtual_frames(capture, **settings)]
+
+        np.testing.assert_array_equal(np.stack(windows), frames)
+
+    def test_capture_without_colour_activity_is_rejected(self, tmp_path: Path) -> None:
+        capture_path = tmp_path / "black.csv"
+        _write_capture(capture_path, red_activity=False)
+
+        with pytest.raises(ValueError, match="no decodable color-channel activity"):
+            render_virtual_image(
+                capture_path,
+                tmp_path / "virtual.png",
+                signal_map=DEFAULT_CAPTURE_SIGNAL_MAP,
+                cols=4,
+                rows=32,
+                weight_oe=False,
+            )
+
+
 def _counts(entries: list[dict[str, object]], field: str) -> dict[str, int]:
     counts: dict[str, int] = {}
     for entry in entries:
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import csv
+import os
 from pathlib import Path
 
 import pytest
 
-from heart.utilities.hub75_logic_score import (diagnose_hub75_capture,
+from heart.utilities import hub75_logic_score
+from heart.utilities.hub75_logic_score import (EDGE_CACHE_DIR_ENV_VAR,
+                                               diagnose_hub75_capture,
+                                               file_sha256,
                                                load_hub75_logic_csv,
                                                score_hub75_similarity,
-                                               summarize_hub75_capture)
+                                               summarize_hub75_capture,
+                                               summarize_logic_channels)
 
 DEFAULT_HEADERS = ("Time [s]", "CLK", "LAT", "OE", "A", "B", "C", "D", "E")
+# Set to e.g. 10_000_000 to benchmark a long Saleae export.
+BENCHMARK_ROWS_ENV_VAR = "HEART_HUB75_BENCHMARK_ROWS"
+BENCHMARK_ROWS = 100_000
 
 
 class TestHub75LogicScore:
@@ -294,6 +302,83 @@ class TestHub75LogicScore:
             "static_high_channels_present",
         )
 
+    def test_chunked_parse_matches_single_block_parse(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify edges carry across chunk boundaries so large captures parse identically."""
+
+        capture_path = tmp_path / "baseline.csv"
+        _write_capture_csv(capture_path, _build_capture_rows(extra_clock_row=2))
+        expected = load_hub75_logic_csv(capture_path)
+
+        monkeypatch.setattr(hub75_logic_score, "LOGIC_CSV_CHUNK_BYTES", 37)
+        chunked = load_hub75_logic_csv(capture_path)
+
+        assert chunked == expected
+        assert expected.edges[0][0] == pytest.approx(expected.rises[0][0])
+        assert len(expected.rises[0]) == len(expected.falls[0]) == 21
+        assert expected.level_at("OE", expected.first_timestamp) == 1
+
+    def test_malformed_capture_is_rejected(self, tmp_path: Path) -> None:
+        """Verify ragged rows raise instead of silently shifting channels."""
+
+        capture_path = tmp_path / "ragged.csv"
+        capture_path.write_text("Time [s],CLK,LAT\n0.0,0,1\n2e-08,1\n")
+
+        with pytest.raises(ValueError, match="malformed"):
+            load_hub75_logic_csv(capture_path, {"OE": 0, "A": 0, "B": 0, "C": 0, "D": 0})
+
+    def test_signal_map_beyond_capture_width_is_rejected(self, tmp_path: Path) -> None:
+        """Verify a column map wider than the capture fails instead of reading empty edges."""
+
+        capture_path = tmp_path / "narrow.csv"
+        capture_path.write_text("Time [s],CLK,LAT\n0.0,0,1\n2e-08,1,1\n")
+
+        with pytest.raises(ValueError, match="outside the 2 captured channels"):
+            load_hub75_logic_csv(capture_path)
+
+    def test_edge_cache_is_keyed_by_capture_sha256(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify parsed edges are cached by content hash so rescoring skips the CSV parse."""
+
+        capture_path = tmp_path / "baseline.csv"
+        cache_dir = tmp_path / "edge-cache"
+        _write_capture_csv(capture_path, _build_capture_rows())
+        expected = load_hub75_logic_csv(capture_path)
+        expected_activity = summarize_logic_channels(capture_path)
+
+        monkeypatch.setenv(EDGE_CACHE_DIR_ENV_VAR, os.fspath(cache_dir))
+        assert load_hub75_logic_csv(capture_path) == expected
+        assert [path.name for path in cache_dir.iterdir()] == [
+            f"{file_sha256(capture_path)}.npz"
+        ]
+
+        def fail_parse(path: str | Path) -> None:
+            raise AssertionError(f"{path} should have been served from the cache")
+
+        monkeypatch.setattr(hub75_logic_score, "_parse_logic_csv", fail_parse)
+        assert load_hub75_logic_csv(capture_path) == expected
+        assert summarize_logic_channels(capture_path) == expected_activity
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="hub75_logic_csv_load")
+    def test_load_large_capture_benchmark(
+        self, benchmark: pytest.BenchmarkFixture, tmp_path: Path
+    ) -> None:
+        """Benchmark loading a synthetic capture; raise ``HEART_HUB75_BENCHMARK_ROWS`` for long Saleae exports."""
+
+        row_count = int(os.environ.get(BENCHMARK_ROWS_ENV_VAR, BENCHMARK_ROWS))
+        capture_path = tmp_path / "large.csv"
+        _write_synthetic_capture_csv(capture_path, row_count)
+
+        capture = benchmark.pedantic(
+            load_hub75_logic_csv, args=(capture_path,), rounds=1, iterations=1
+        )
+
+        assert capture.sample_count == row_count
+        assert len(capture.edges[0]) == row_count - 1
+
 
 def _write_capture_csv(
     path: Path,
@@ -308,6 +393,21 @@ def _write_capture_csv(
             writer.writerow([f"{timestamp:.9f}", *state])
 
 
+def _write_synthetic_capture_csv(path: Path, row_count: int) -> None:
+    """Write a capture where CLK toggles every sample and address bits count rows."""
+
+    with path.open("w") as handle:
+        handle.write(",".join(DEFAULT_HEADERS) + "\n")
+        chunk_rows = 100_000
+        for start in range(0, row_count, chunk_rows):
+            handle.writelines(
+                f"{index * 20e-9:.9f},{index & 1},0,1,"
+                f"{(index >> 6) & 1},{(index >> 7) & 1},{(index >> 8) & 1},"
+                f"{(index >> 9) & 1},{(index >> 10) & 1}\n"
+                for index in range(start, min(start + chunk_rows, row_count))
+            )
+
+
 def _build_capture_rows(
     *,
     rows: int = 5,
@@ -0,0 +1,148 @@
+"""Validate the queued logging backend and measure per-call overhead."""
+
+from __future__ import annotations
+
+import io
+import logging
+from pathlib import Path
+
+import pytest
+
+from heart.utilities import logging as heart_logging
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def _queued_logger(
+    name: str, writer: heart_logging.LogWriter, handler: logging.Handler
+) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(heart_logging._QueuedHandler(writer, [handler]))
+    return logger
+
+
+class TestLogWriter:
+    """Validate the background writer so render threads never block on log I/O."""
+
+    def test_records_reach_handlers_on_writer_thread(self) -> None:
+        """Write queued records in order once the writer is flushed."""
+        writer = heart_logging.LogWriter(maxsize=16)
+        handler = _ListHandler()
+        logger = _queued_logger("heart.tests.logging.order", writer, handler)
+
+        for index in range(5):
+            logger.info("frame %d", index)
+        writer.flush()
+        writer.close()
+
+        assert handler.messages == [f"frame {index}" for index in range(5)]
+        assert writer.dropped == 0
+
+    def test_records_are_formatted_before_queueing(self) -> None:
+        """Freeze arguments and tracebacks on the calling thread."""
+        writer = heart_logging.LogWriter(maxsize=16)
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = _queued_logger("heart.tests.logging.prepare", writer, handler)
+        # Hold the writer back so the record waits in the queue.
+        writer._thread = object()  # type: ignore[assignment]
+
+        state = ["before"]
+        logger.info("state %s", state)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("failed")
+        state[0] = "after"
+        queued = [writer._queue.get_nowait()[0] for _ in range(2)]
+        writer._thread = None
+
+        assert [record.args for record in queued] == [None, None]
+        assert queued[1].exc_info is None
+        for record in queued:
+            handler.handle(record)
+        assert stream.getvalue().splitlines()[0] == "state ['before']"
+        assert "RuntimeError: boom" in stream.getvalue()
+
+    def test_full_queue_drops_and_reports_records(self) -> None:
+        """Count records refused by a full queue and report them with the next write."""
+        writer = heart_logging.LogWriter(maxsize=2)
+        handler = _ListHandler()
+        record = logging.LogRecord("heart", logging.INFO, __file__, 0, "x", (), None)
+        # Fill the queue before the writer thread exists so nothing drains it.
+        writer._thread = object()  # type: ignore[assignment]
+
+        accepted = [writer.submit(record, (handler,)) for _ in range(5)]
+        writer._thread = None
+        writer._start()
+        writer.submit(record, (handler,))
+        writer.flush()
+        writer.close()
+
+        assert accepted == [True, True, False, False, False]
+        assert writer.dropped == 3
+        assert handler.messages.count("x") == 3
+        assert (
+            "Dropped 3 log records because the log queue was full" in handler.messages
+        )
+
+    def test_zero_queue_size_keeps_synchronous_handlers(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Attach the stream and file handlers directly when queueing is disabled."""
+        monkeypatch.setenv(heart_logging.LOG_QUEUE_SIZE_ENV_VAR, "0")
+        monkeypatch.setenv(heart_logging.LOG_DIR_ENV_VAR, str(tmp_path))
+        logger = logging.getLogger("heart.tests.logging.sync")
+        logger.handlers.clear()
+
+        heart_logging._configure_logger(logger, "INFO")
+
+        assert not any(
+            isinstance(handler, heart_logging._QueuedHandler)
+            for handler in logger.handlers
+        )
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers.clear()
+
+
+class TestLoggingCallBenchmark:
+    """Measure hot-path log call cost so disabled and queued logging stay cheap."""
+
+    @pytest.mark.benchmark(group="logging_call_overhead")
+    def test_disabled_debug_call_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark a debug call below the logger's level."""
+        writer = heart_logging.LogWriter(maxsize=16)
+        logger = _queued_logger("heart.tests.logging.disabled", writer, _ListHandler())
+
+        benchmark(logger.debug, "renderer.frame", extra={"duration_ms": 1.0})
+
+        writer.close()
+
+    @pytest.mark.benchmark(group="logging_call_overhead")
+    def test_queued_info_call_benchmark(
+        self, benchmark: pytest.BenchmarkFixture
+    ) -> None:
+        """Benchmark an enabled call that only enqueues for a formatting stream handler."""
+        writer = heart_logging.LogWriter()
+        handler = logging.StreamHandler(io.StringIO())
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger = _queued_logger("heart.tests.logging.queued", writer, handler)
+
+        benchmark(logger.info, "renderer.frame %s", "life")
+
+        writer.close()
+        benchmark.extra_info["dropped"] = writer.dropped
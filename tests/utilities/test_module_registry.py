@@ -1,4 +1,4 @@
-"""Validate module discovery ignores metadata stubs that cannot be imported."""
+"""Validate module discovery ignores metadata stubs and defers imports until lookup."""
 
 from __future__ import annotations
 
@@ -6,7 +6,8 @@ import importlib
 import sys
 from pathlib import Path
 
-from heart.utilities.module_registry import discover_registry
+from heart.utilities.module_registry import (LazyModuleRegistry,
+                                             discover_registry)
 
 
 class TestDiscoverRegistry:
@@ -45,3 +46,55 @@ class TestDiscoverRegistry:
                 sys.modules.pop(module_name, None)
 
         assert list(registry) == ["valid"]
+
+
+class TestLazyModuleRegistry:
+    """Exercise lazy registry lookups so selecting one configuration does not import every other one."""
+
+    def test_indexes_names_and_imports_only_requested_modules(
+        self,
+        tmp_path: Path,
+        monkeypatch,
+    ) -> None:
+        """Verify only the looked-up module is imported so startup skips unused renderer stacks, while iteration lists only modules with ``configure``."""
+
+        package_dir = tmp_path / "lazy_registry_pkg"
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text("", encoding="utf-8")
+        (package_dir / "wanted.py").write_text(
+            "def configure() -> str:\n    return 'ok'\n",
+            encoding="utf-8",
+        )
+        (package_dir / "unused.py").write_text(
+            "def configure() -> str:\n    return 'unused'\n",
+            encoding="utf-8",
+        )
+        (package_dir / "helpers.py").write_text("VALUE = 1\n", encoding="utf-8")
+        (package_dir / "._wanted.py").write_text("", encoding="utf-8")
+
+        monkeypatch.syspath_prepend(str(tmp_path))
+        importlib.invalidate_caches()
+
+        try:
+            registry = LazyModuleRegistry(package_dir, "lazy_registry_pkg")
+            configure = registry.get("wanted")
+            missing_attribute = registry.get("helpers")
+            imported = {
+                name for name in sys.modules if name.startswith("lazy_registry_pkg.")
+            }
+            names = list(registry)
+            count = len(registry)
+        finally:
+            for module_name in [
+                name for name in sys.modules if name.startswith("lazy_registry_pkg")
+            ]:
+                sys.modules.pop(module_name, None)
+
+        assert names == ["unused", "wanted"]
+        assert count == 2
+        assert "helpers" not in registry
+        assert configure is not None and configure() == "ok"
+        assert missing_attribute is None
+        assert registry.get("absent") is None
+        assert registry.loaded() == ("wanted", "unused")
+        assert imported == {"lazy_registry_pkg.helpers", "lazy_registry_pkg.wanted"}